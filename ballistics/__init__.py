@@ -0,0 +1,58 @@
+"""
+Ballistics Module - Point-mass trajectory solver.
+
+Computes drop, windage, time of flight and remaining velocity from the data
+ChronoLog already stores: bullet G1/G7 ballistic coefficients, chronograph
+muzzle velocities, rifle sight offsets and measured atmospherics. All
+functions work on NumPy arrays, so many distances, loads or atmospheres are
+solved in one call.
+
+Public API:
+    solve_trajectories: Vectorized G1/G7 point-mass solver
+    zero_angle: Launch angles that zero trajectories at a distance
+    TrajectoryBatch: Solver output (N trajectories x D distances)
+    BallisticProfile: Solver inputs for one load, built from stored records
+    DopeCard / compute_dope_card: Elevation and windage holds in MIL and MOA
+    true_profile / TruingResult: Fit effective MV and BC to observed holds
+    simulate_hits / ShotDispersion: Monte Carlo hit probability
+    miller_stability: Vectorized Miller twist-rule stability factor
+
+Example:
+    >>> from ballistics import BallisticProfile
+    >>>
+    >>> profile = BallisticProfile(muzzle_velocity_mps=823.0,
+    ...                            ballistic_coefficient=0.243, drag_model="G7")
+    >>> batch = profile.solve([100, 300, 600, 1000])
+    >>> batch.drop_m[0]
+
+For detailed documentation, see:
+    - docs/modules/ballistics/README.md
+"""
+
+from .card import DopeCard, compute_dope_card
+from .hit_probability import HitProbability, ShotDispersion, simulate_hits
+from .models import BallisticProfile
+from .solver import TrajectoryBatch, solve_trajectories, zero_angle
+from .stability import miller_stability, stability_status
+from .truing import TruingResult, true_profile
+
+# Public exports
+__all__ = [
+    "BallisticProfile",
+    "DopeCard",
+    "HitProbability",
+    "ShotDispersion",
+    "TrajectoryBatch",
+    "TruingResult",
+    "compute_dope_card",
+    "miller_stability",
+    "simulate_hits",
+    "solve_trajectories",
+    "stability_status",
+    "true_profile",
+    "zero_angle",
+]
+
+# Module metadata
+__version__ = "1.0.0"
+__author__ = "ChronoLog Team"
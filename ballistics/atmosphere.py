@@ -0,0 +1,115 @@
+"""
+Atmosphere helpers for the trajectory solver.
+
+Air density follows from station temperature, pressure and relative
+humidity through the virtual temperature (the temperature dry air would
+need to have the same density; Buck saturation vapour pressure). Density
+altitude is the ICAO standard-atmosphere altitude with that density.
+``atmosphere`` computes every derived quantity in one call. All functions
+accept scalars or NumPy arrays; NaN inputs give NaN outputs.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .solver import GRAVITY_MPS2, STANDARD_AIR_DENSITY_KG_M3
+
+R_DRY_AIR = 287.058  # J/(kg K)
+R_WATER_VAPOUR = 461.495  # J/(kg K)
+HEAT_CAPACITY_RATIO = 1.4
+
+# ICAO standard atmosphere (troposphere)
+ISA_SEA_LEVEL_TEMPERATURE_K = 288.15
+ISA_LAPSE_RATE_K_PER_M = 0.0065
+_ISA_EXPONENT = ISA_LAPSE_RATE_K_PER_M * R_DRY_AIR / (
+    GRAVITY_MPS2 - ISA_LAPSE_RATE_K_PER_M * R_DRY_AIR
+)
+
+
+def saturation_vapour_pressure_hpa(temperature_c):
+    """Saturation vapour pressure over water (Buck 1981)"""
+    t = np.asarray(temperature_c, dtype=float)
+    return 6.1121 * np.exp((18.678 - t / 234.5) * (t / (257.14 + t)))
+
+
+def virtual_temperature_c(temperature_c, pressure_hpa, humidity_pct=0.0):
+    """Virtual temperature: dry air at this temperature has the moist density"""
+    t_k = np.asarray(temperature_c, dtype=float) + 273.15
+    vapour_hpa = (
+        np.asarray(humidity_pct, dtype=float) / 100.0
+        * saturation_vapour_pressure_hpa(temperature_c)
+    )
+    vapour_fraction = vapour_hpa / np.asarray(pressure_hpa, dtype=float)
+    return t_k / (1.0 - vapour_fraction * (1.0 - R_DRY_AIR / R_WATER_VAPOUR)) - 273.15
+
+
+def air_density(temperature_c, pressure_hpa, humidity_pct=0.0):
+    """Moist air density in kg/m^3 from station pressure"""
+    t_virtual_c = virtual_temperature_c(temperature_c, pressure_hpa, humidity_pct)
+    return np.asarray(pressure_hpa, dtype=float) * 100.0 / (
+        R_DRY_AIR * (t_virtual_c + 273.15)
+    )
+
+
+def speed_of_sound(temperature_c):
+    """Speed of sound in dry air in m/s"""
+    t_k = np.asarray(temperature_c, dtype=float) + 273.15
+    return np.sqrt(HEAT_CAPACITY_RATIO * R_DRY_AIR * t_k)
+
+
+def density_altitude_m(density_kg_m3):
+    """ICAO altitude (m) at which the standard atmosphere has this density"""
+    ratio = np.asarray(density_kg_m3, dtype=float) / STANDARD_AIR_DENSITY_KG_M3
+    return (
+        ISA_SEA_LEVEL_TEMPERATURE_K / ISA_LAPSE_RATE_K_PER_M
+        * (1.0 - ratio**_ISA_EXPONENT)
+    )
+
+
+def station_pressure_hpa(sea_level_pressure_hpa, altitude_m):
+    """Station pressure from altimeter-corrected (sea level) pressure"""
+    ratio = 1.0 - ISA_LAPSE_RATE_K_PER_M * np.asarray(altitude_m, dtype=float) / (
+        ISA_SEA_LEVEL_TEMPERATURE_K
+    )
+    return np.asarray(sea_level_pressure_hpa, dtype=float) * ratio ** (
+        1.0 + 1.0 / _ISA_EXPONENT
+    )
+
+
+@dataclass(frozen=True)
+class Atmosphere:
+    """Derived air properties, each shaped like the broadcast inputs"""
+
+    air_density_kg_m3: np.ndarray
+    virtual_temperature_c: np.ndarray
+    density_altitude_m: np.ndarray
+    speed_of_sound_mps: np.ndarray
+
+
+def atmosphere(temperature_c, pressure_hpa, humidity_pct=0.0) -> Atmosphere:
+    """Air density, virtual temperature, density altitude and speed of sound
+
+    Pressure is station pressure; missing humidity (NaN) counts as dry air.
+    Speed of sound uses the virtual temperature.
+    """
+    humidity = np.nan_to_num(np.asarray(humidity_pct, dtype=float), nan=0.0)
+    t_virtual_c = virtual_temperature_c(temperature_c, pressure_hpa, humidity)
+    t_virtual_k = t_virtual_c + 273.15
+    density = np.asarray(pressure_hpa, dtype=float) * 100.0 / (R_DRY_AIR * t_virtual_k)
+    return Atmosphere(
+        air_density_kg_m3=density,
+        virtual_temperature_c=t_virtual_c,
+        density_altitude_m=density_altitude_m(density),
+        speed_of_sound_mps=np.sqrt(HEAT_CAPACITY_RATIO * R_DRY_AIR * t_virtual_k),
+    )
+
+
+def standard_atmosphere(altitude_m):
+    """(air density, speed of sound) of the ICAO atmosphere at an altitude"""
+    altitude = np.asarray(altitude_m, dtype=float)
+    t_k = ISA_SEA_LEVEL_TEMPERATURE_K - ISA_LAPSE_RATE_K_PER_M * altitude
+    density = STANDARD_AIR_DENSITY_KG_M3 * (
+        t_k / ISA_SEA_LEVEL_TEMPERATURE_K
+    ) ** (1.0 / _ISA_EXPONENT)
+    return density, np.sqrt(HEAT_CAPACITY_RATIO * R_DRY_AIR * t_k)
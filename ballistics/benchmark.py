@@ -0,0 +1,177 @@
+"""
+Accuracy and speed benchmark for the trajectory solver.
+
+Run ``python -m ballistics.benchmark`` to time a full DOPE card (100 m to
+1000 m every 25 m, zeroing included), a 1,000-trajectory batch and a
+100,000-sample hit-probability simulation at 20 distances, and to check the
+solver against the closed-form vacuum trajectory and a 0.25 m step solution.
+
+The solver is also compared against ``REFERENCE_TABLE``, a published table
+for a documented load. Pass ``--reference table.csv`` to compare against
+another table (e.g. exported from a commercial or online calculator). One
+row per distance with columns: drag_model, ballistic_coefficient,
+muzzle_velocity_mps, zero_distance_m, sight_height_m, air_density_kg_m3,
+speed_of_sound_mps, distance_m, drop_m and optionally crosswind_mps,
+windage_m, velocity_mps and time_s. Rows sharing the inputs are solved as
+one trajectory.
+"""
+
+import argparse
+import time
+from typing import Callable, Dict
+
+import numpy as np
+import pandas as pd
+
+from .hit_probability import ShotDispersion, simulate_hits
+from .models import BallisticProfile
+from .solver import GRAVITY_MPS2, solve_trajectories
+
+CARD_DISTANCES_M = np.arange(100.0, 1001.0, 25.0)
+
+_REFERENCE_INPUTS = [
+    "drag_model",
+    "ballistic_coefficient",
+    "muzzle_velocity_mps",
+    "zero_distance_m",
+    "sight_height_m",
+    "air_density_kg_m3",
+    "speed_of_sound_mps",
+]
+
+# .308 Win, 175 gr Sierra MatchKing (G7 BC 0.243) at 823 m/s, 1.5 in sight
+# height, 100 m zero, ICAO standard atmosphere, 4 m/s full-value crosswind
+# from the left. Computed with py-ballisticcalc 2.1.0 (point-mass solver
+# ported from JBM's published code) with spin drift and Coriolis disabled.
+# Columns: distance_m, drop_m, windage_m, velocity_mps, time_s
+REFERENCE_LOAD = {
+    "drag_model": "G7",
+    "ballistic_coefficient": 0.243,
+    "muzzle_velocity_mps": 823.0,
+    "zero_distance_m": 100.0,
+    "sight_height_m": 0.0381,
+    "air_density_kg_m3": 1.2250,
+    "speed_of_sound_mps": 340.294,
+    "crosswind_mps": 4.0,
+}
+REFERENCE_TABLE = (
+    (100.0, 0.0001, 0.0195, 760.8, 0.1264),
+    (200.0, -0.1317, 0.0812, 701.2, 0.2633),
+    (300.0, -0.4635, 0.1902, 644.5, 0.4121),
+    (400.0, -1.0321, 0.3526, 590.5, 0.5742),
+    (500.0, -1.8829, 0.5757, 538.9, 0.7515),
+    (600.0, -3.0728, 0.8687, 489.3, 0.9462),
+    (700.0, -4.6742, 1.2431, 441.8, 1.1613),
+    (800.0, -6.7807, 1.7130, 396.6, 1.4003),
+    (900.0, -9.5143, 2.2948, 354.3, 1.6673),
+    (1000.0, -13.0315, 2.9984, 323.3, 1.9647),
+)
+
+
+def _best_of(function: Callable[[], object], repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def time_solver() -> Dict[str, float]:
+    """Best-of-5 wall times in seconds: card, 1,000 loads, 100k x 20 hit odds"""
+    dispersion = ShotDispersion(
+        muzzle_velocity_sd_mps=4.0,
+        crosswind_mps=1.0,
+        crosswind_sd_mps=1.5,
+        headwind_sd_mps=1.0,
+        range_error_sd_m=5.0,
+        aim_sd_mil=0.1,
+    )
+    profile = BallisticProfile(muzzle_velocity_mps=823.0, ballistic_coefficient=0.243)
+    return {
+        "dope_card_s": _best_of(
+            lambda: solve_trajectories(CARD_DISTANCES_M, 823.0, 0.243, "G7")
+        ),
+        "batch_1000_s": _best_of(
+            lambda: solve_trajectories(
+                CARD_DISTANCES_M, np.linspace(750.0, 900.0, 1000), 0.243, "G7"
+            )
+        ),
+        "hit_probability_100k_x20_s": _best_of(
+            lambda: simulate_hits(
+                profile, np.linspace(100.0, 1000.0, 20), dispersion, 0.5, 0.5, seed=0
+            )
+        ),
+    }
+
+
+def check_accuracy() -> Dict[str, float]:
+    """Largest drop errors (m) against vacuum and fine-step solutions"""
+    # A huge BC removes drag; with zero sight height the vacuum trajectory is
+    # y = x tan(a) - g x^2 / (2 v^2 cos^2(a))
+    vacuum = solve_trajectories(
+        CARD_DISTANCES_M, 800.0, 1e12, "G7", zero_distance_m=100.0, sight_height_m=0.0
+    )
+    angle = vacuum.launch_angle_rad[:, None]
+    expected = CARD_DISTANCES_M * np.tan(angle) - GRAVITY_MPS2 * CARD_DISTANCES_M**2 / (
+        2.0 * 800.0**2 * np.cos(angle) ** 2
+    )
+
+    loads = dict(muzzle_velocity_mps=[790.0, 823.0, 860.0], ballistic_coefficient=0.243)
+    coarse = solve_trajectories(CARD_DISTANCES_M, drag_model="G7", **loads)
+    fine = solve_trajectories(CARD_DISTANCES_M, drag_model="G7", step_m=0.25, **loads)
+    return {
+        "vacuum_max_error_m": float(np.abs(vacuum.drop_m - expected).max()),
+        "step_max_error_m": float(np.abs(coarse.drop_m - fine.drop_m).max()),
+    }
+
+
+def reference_table() -> pd.DataFrame:
+    """``REFERENCE_TABLE`` in the ``--reference`` CSV layout"""
+    table = pd.DataFrame(
+        REFERENCE_TABLE,
+        columns=["distance_m", "drop_m", "windage_m", "velocity_mps", "time_s"],
+    )
+    return table.assign(**REFERENCE_LOAD)
+
+
+def compare_reference(reference: pd.DataFrame) -> pd.DataFrame:
+    """Solve every reference trajectory and add solver columns and errors"""
+    if "crosswind_mps" not in reference:
+        reference = reference.assign(crosswind_mps=0.0)
+    inputs_columns = _REFERENCE_INPUTS + ["crosswind_mps"]
+    results = []
+    for inputs, rows in reference.groupby(inputs_columns, sort=False):
+        arguments = dict(zip(inputs_columns, inputs))
+        solved = solve_trajectories(rows["distance_m"].to_numpy(), **arguments)
+        rows = rows.copy()
+        rows["solver_drop_m"] = solved.drop_m[0]
+        rows["drop_error_m"] = rows["solver_drop_m"] - rows["drop_m"]
+        if "windage_m" in rows:
+            rows["windage_error_m"] = solved.windage_m[0] - rows["windage_m"]
+        if "velocity_mps" in rows:
+            rows["velocity_error_mps"] = solved.velocity_mps[0] - rows["velocity_mps"]
+        if "time_s" in rows:
+            rows["time_error_s"] = solved.time_s[0] - rows["time_s"]
+        results.append(rows)
+    return pd.concat(results, ignore_index=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--reference", help="CSV reference table to compare against")
+    args = parser.parse_args()
+
+    for name, seconds in time_solver().items():
+        print(f"{name}: {seconds * 1000:.1f} ms")
+    for name, error in check_accuracy().items():
+        print(f"{name}: {error:.2e}")
+
+    reference = pd.read_csv(args.reference) if args.reference else reference_table()
+    compared = compare_reference(reference)
+    print(compared.to_string(index=False))
+    print(f"max |drop error|: {compared['drop_error_m'].abs().max():.4f} m")
+
+
+if __name__ == "__main__":
+    main()
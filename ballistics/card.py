@@ -0,0 +1,100 @@
+"""
+DOPE cards: elevation and windage holds over a distance grid.
+
+``compute_dope_card`` solves a profile twice in one batch (still air and a
+1 m/s full-value crosswind) and converts drop and drift to holds in MIL and
+MOA. Wind drift is close to linear in crosswind speed, so windage for any
+wind is the per-m/s hold scaled by the wind speed.
+"""
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from .models import BallisticProfile
+from .solver import STANDARD_AIR_DENSITY_KG_M3, STANDARD_SPEED_OF_SOUND_MPS
+
+MIL_PER_RAD = 1000.0
+MOA_PER_RAD = 60.0 * 180.0 / np.pi
+
+HOLD_UNITS = ("mil", "moa")
+
+DEFAULT_CARD_DISTANCES_M = tuple(float(d) for d in range(100, 1001, 25))
+
+
+def per_radian(unit: str) -> float:
+    """Hold units per radian ("mil" or "moa")"""
+    if unit == "mil":
+        return MIL_PER_RAD
+    if unit == "moa":
+        return MOA_PER_RAD
+    raise ValueError(f"Unknown hold unit '{unit}' (expected one of {', '.join(HOLD_UNITS)})")
+
+
+@dataclass(frozen=True)
+class DopeCard:
+    """Holds per distance; positive elevation dials up, positive windage right"""
+
+    distance_m: np.ndarray
+    drop_m: np.ndarray
+    elevation_rad: np.ndarray
+    windage_rad_per_mps: np.ndarray  # for 1 m/s wind blowing left to right
+    velocity_mps: np.ndarray
+    time_s: np.ndarray
+
+    def elevation(self, distance_m, unit: str = "mil") -> np.ndarray:
+        """Elevation hold at any distance(s) within the card, interpolated"""
+        hold = np.interp(distance_m, self.distance_m, self.elevation_rad)
+        return hold * per_radian(unit)
+
+    def windage(self, distance_m, crosswind_mps, unit: str = "mil") -> np.ndarray:
+        """Windage hold for a left-to-right crosswind at any distance(s)"""
+        per_mps = np.interp(distance_m, self.distance_m, self.windage_rad_per_mps)
+        return per_mps * np.asarray(crosswind_mps, dtype=float) * per_radian(unit)
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per distance with holds in MIL and MOA"""
+        return pd.DataFrame(
+            {
+                "distance_m": self.distance_m,
+                "drop_m": self.drop_m,
+                "elevation_mil": self.elevation_rad * MIL_PER_RAD,
+                "elevation_moa": self.elevation_rad * MOA_PER_RAD,
+                "windage_mil_per_mps": self.windage_rad_per_mps * MIL_PER_RAD,
+                "windage_moa_per_mps": self.windage_rad_per_mps * MOA_PER_RAD,
+                "velocity_mps": self.velocity_mps,
+                "time_s": self.time_s,
+            }
+        )
+
+
+def compute_dope_card(
+    profile: BallisticProfile,
+    distances_m: Sequence[float] = DEFAULT_CARD_DISTANCES_M,
+    air_density_kg_m3: float = STANDARD_AIR_DENSITY_KG_M3,
+    speed_of_sound_mps: float = STANDARD_SPEED_OF_SOUND_MPS,
+) -> DopeCard:
+    """Compute a DOPE card for a profile under one atmosphere
+
+    The rifle is zeroed under the same atmosphere. Distances must be positive.
+    """
+    distances = np.asarray(sorted(distances_m), dtype=float)
+    if distances.size == 0 or distances[0] <= 0:
+        raise ValueError("DOPE card distances must be positive")
+
+    batch = profile.solve(
+        distances,
+        air_density_kg_m3=air_density_kg_m3,
+        speed_of_sound_mps=speed_of_sound_mps,
+        crosswind_mps=[0.0, 1.0],
+    )
+    return DopeCard(
+        distance_m=distances,
+        drop_m=batch.drop_m[0],
+        elevation_rad=np.arctan2(-batch.drop_m[0], distances),
+        windage_rad_per_mps=np.arctan2(-batch.windage_m[1], distances),
+        velocity_mps=batch.velocity_mps[0],
+        time_s=batch.time_s[0],
+    )
@@ -0,0 +1,277 @@
+"""
+Monte Carlo hit probability from velocity, wind and range dispersion.
+
+Each simulated shot draws a muzzle velocity (chronograph mean and SD), a
+crosswind and a headwind (mean and SD from weather logs), a range-estimation
+error and an aiming/rifle error. The shooter holds for the nominal solution
+(mean velocity, mean winds, estimated distance); the shot's impact relative
+to the target centre is then compared with the target size.
+
+Running the solver per sample would be far too slow for 100k samples, so
+``simulate_hits`` solves a small table instead: trajectories at a few
+velocities spanning +-5 SD, in still air, with 1 m/s of crosswind and with
+1 m/s of headwind, all with the rifle's fixed launch angle. Samples
+interpolate the table in velocity and distance; drift and headwind effects
+are linear in wind speed. Samples are evaluated in blocks of
+(samples x distances) arrays.
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .models import BallisticProfile
+from .solver import (
+    STANDARD_AIR_DENSITY_KG_M3,
+    STANDARD_SPEED_OF_SOUND_MPS,
+    solve_trajectories,
+    zero_angle,
+)
+
+DEFAULT_SAMPLES = 100_000
+VELOCITY_NODES = 9
+_SPAN_SD = 5.0  # velocity and range tables cover +-5 SD
+_TABLE_STEP_M = 5.0
+_BLOCK_SAMPLES = 8192
+
+
+def _mean_and_sd(values: Iterable[Optional[float]]) -> Tuple[float, float]:
+    array = np.array([v for v in values if v is not None], dtype=float)
+    array = array[np.isfinite(array)]
+    if array.size == 0:
+        return 0.0, 0.0
+    sd = float(array.std(ddof=1)) if array.size > 1 else 0.0
+    return float(array.mean()), sd
+
+
+@dataclass(frozen=True)
+class ShotDispersion:
+    """Per-shot uncertainty; SDs are one standard deviation"""
+
+    muzzle_velocity_sd_mps: float = 0.0
+    crosswind_mps: float = 0.0  # mean, blowing toward the right
+    crosswind_sd_mps: float = 0.0
+    headwind_mps: float = 0.0  # mean, blowing toward the shooter
+    headwind_sd_mps: float = 0.0
+    range_error_sd_m: float = 0.0
+    aim_sd_mil: float = 0.0  # rifle and shooter precision, per axis
+
+    @classmethod
+    def from_records(
+        cls,
+        chrono_session=None,
+        weather_measurements: Sequence = (),
+        range_error_sd_m: float = 0.0,
+        aim_sd_mil: float = 0.0,
+    ) -> "ShotDispersion":
+        """Dispersion from a chronograph session and weather measurements
+
+        Uses the session's velocity SD and the mean and SD of the weather
+        measurements' crosswind and headwind components.
+        """
+        crosswind, crosswind_sd = _mean_and_sd(
+            getattr(m, "crosswind_mps", None) for m in weather_measurements
+        )
+        headwind, headwind_sd = _mean_and_sd(
+            getattr(m, "headwind_mps", None) for m in weather_measurements
+        )
+        return cls(
+            muzzle_velocity_sd_mps=float(
+                getattr(chrono_session, "std_dev_mps", None) or 0.0
+            ),
+            crosswind_mps=crosswind,
+            crosswind_sd_mps=crosswind_sd,
+            headwind_mps=headwind,
+            headwind_sd_mps=headwind_sd,
+            range_error_sd_m=range_error_sd_m,
+            aim_sd_mil=aim_sd_mil,
+        )
+
+
+@dataclass(frozen=True)
+class HitProbability:
+    """Simulated impacts per distance, relative to the target centre"""
+
+    distance_m: np.ndarray
+    hit_probability: np.ndarray
+    vertical_mean_m: np.ndarray
+    vertical_sd_m: np.ndarray
+    horizontal_mean_m: np.ndarray
+    horizontal_sd_m: np.ndarray
+    target_width_m: float
+    target_height_m: float
+    samples: int
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "distance_m": self.distance_m,
+                "hit_probability": self.hit_probability,
+                "vertical_mean_m": self.vertical_mean_m,
+                "vertical_sd_m": self.vertical_sd_m,
+                "horizontal_mean_m": self.horizontal_mean_m,
+                "horizontal_sd_m": self.horizontal_sd_m,
+            }
+        )
+
+
+class _ImpactTable:
+    """Drop, drift per m/s of crosswind and drop per m/s of headwind
+
+    Tabulated on a uniform (velocity, distance) grid for a fixed launch angle
+    and interpolated bilinearly; values are stacked in the last axis.
+    """
+
+    def __init__(self, profile, velocities, start_m, count, angle, conditions):
+        self.velocity0 = velocities[0]
+        self.velocity_step = velocities[1] - velocities[0]
+        self.start_m = start_m
+        self.shape = (velocities.shape[0], count)
+        k = velocities.shape[0]
+        grid = start_m + _TABLE_STEP_M * np.arange(count)
+        solved = solve_trajectories(
+            grid,
+            np.tile(velocities, 3),
+            profile.ballistic_coefficient,
+            profile.drag_model,
+            sight_height_m=profile.sight_height_m,
+            crosswind_mps=np.repeat([0.0, 1.0, 0.0], k),
+            headwind_mps=np.repeat([0.0, 0.0, 1.0], k),
+            launch_angle_rad=np.full(3 * k, angle),
+            **conditions,
+        )
+        drop = solved.drop_m[:k]
+        self.values = np.stack(
+            (drop, solved.windage_m[k : 2 * k], solved.drop_m[2 * k :] - drop),
+            axis=-1,
+        ).reshape(-1, 3)
+
+    @staticmethod
+    def _cell(position, count):
+        index = np.clip(np.floor(position).astype(np.intp), 0, count - 2)
+        return index, np.clip(position - index, 0.0, 1.0)
+
+    def lookup(self, velocity, distance):
+        """(drop, drift per m/s, headwind drop per m/s) stacked as (..., 3)"""
+        k, x = self.shape
+        k_index, k_weight = self._cell(
+            (velocity - self.velocity0) / self.velocity_step, k
+        )
+        x_index, x_weight = self._cell((distance - self.start_m) / _TABLE_STEP_M, x)
+        flat = k_index * x + x_index
+        x_weight = x_weight[..., None]
+        values = self.values
+        low = values[flat] * (1 - x_weight) + values[flat + 1] * x_weight
+        high = values[flat + x] * (1 - x_weight) + values[flat + x + 1] * x_weight
+        return low + (high - low) * k_weight[..., None]
+
+
+def simulate_hits(
+    profile: BallisticProfile,
+    distances_m,
+    dispersion: ShotDispersion,
+    target_width_m: float,
+    target_height_m: float,
+    samples: int = DEFAULT_SAMPLES,
+    seed: Optional[int] = None,
+    air_density_kg_m3: float = STANDARD_AIR_DENSITY_KG_M3,
+    speed_of_sound_mps: float = STANDARD_SPEED_OF_SOUND_MPS,
+) -> HitProbability:
+    """Estimate hit probability on a rectangular target at each distance
+
+    Args:
+        profile: Load and rifle; the rifle is zeroed at the mean velocity
+        distances_m: Estimated (dialed) target distances, (D,)
+        dispersion: Velocity, wind, range and aiming uncertainty
+        target_width_m: Target width
+        target_height_m: Target height
+        samples: Simulated shots (the same shots are fired at every distance)
+        seed: Seed for numpy's default generator, for reproducible results
+
+    Raises:
+        ValueError: If distances, target size or samples are not positive
+    """
+    distances = np.atleast_1d(np.asarray(distances_m, dtype=float))
+    if distances.ndim != 1 or np.any(distances <= 0):
+        raise ValueError("Distances must be a 1-D array of positive values")
+    if target_width_m <= 0 or target_height_m <= 0 or samples <= 0:
+        raise ValueError("Target size and sample count must be positive")
+
+    conditions = dict(
+        air_density_kg_m3=air_density_kg_m3, speed_of_sound_mps=speed_of_sound_mps
+    )
+    mv0, mv_sd = profile.muzzle_velocity_mps, dispersion.muzzle_velocity_sd_mps
+    velocities = (
+        mv0 + mv_sd * np.linspace(-_SPAN_SD, _SPAN_SD, VELOCITY_NODES)
+        if mv_sd > 0
+        else np.array([mv0, mv0 + 1.0])
+    )
+    range_span = _SPAN_SD * dispersion.range_error_sd_m
+    start = max(distances.min() - range_span - _TABLE_STEP_M, _TABLE_STEP_M)
+    count = int(np.ceil((distances.max() + range_span - start) / _TABLE_STEP_M)) + 2
+    angle = zero_angle(
+        mv0,
+        profile.ballistic_coefficient,
+        profile.drag_model,
+        zero_distance_m=profile.zero_distance_m,
+        sight_height_m=profile.sight_height_m,
+        **conditions,
+    )[0]
+    table = _ImpactTable(profile, velocities, start, count, angle, conditions)
+
+    # The shooter holds for mean velocity and winds at the estimated distance
+    nominal = table.lookup(np.full(distances.shape, mv0), distances)
+    drop, drift, headwind_drop = nominal.T
+    elevation_rad = -(drop + dispersion.headwind_mps * headwind_drop) / distances
+    windage_rad = -dispersion.crosswind_mps * drift / distances
+
+    rng = np.random.default_rng(seed)
+    normal = rng.standard_normal((6, samples))
+    mv = np.clip(mv0 + mv_sd * normal[0], velocities[0], velocities[-1])
+    crosswind = dispersion.crosswind_mps + dispersion.crosswind_sd_mps * normal[1]
+    headwind = dispersion.headwind_mps + dispersion.headwind_sd_mps * normal[2]
+    range_error = np.clip(
+        dispersion.range_error_sd_m * normal[3], -range_span, range_span
+    )
+    aim = dispersion.aim_sd_mil / 1000.0 * normal[4:]
+
+    # Accumulate per-distance sums over blocks of samples to bound memory
+    hits = np.zeros(distances.shape)
+    sums = np.zeros((4, distances.shape[0]))  # v, v^2, h, h^2
+    for block in range(0, samples, _BLOCK_SAMPLES):
+        rows = slice(block, block + _BLOCK_SAMPLES)
+        x = distances[None, :] + range_error[rows, None]
+        values = table.lookup(mv[rows, None], x)
+        vertical = (
+            values[..., 0]
+            + headwind[rows, None] * values[..., 2]
+            + x * (elevation_rad + aim[0, rows, None])
+        )
+        horizontal = crosswind[rows, None] * values[..., 1] + x * (
+            windage_rad + aim[1, rows, None]
+        )
+        hits += (
+            (np.abs(vertical) <= target_height_m / 2)
+            & (np.abs(horizontal) <= target_width_m / 2)
+        ).sum(axis=0)
+        sums += (
+            vertical.sum(axis=0),
+            (vertical**2).sum(axis=0),
+            horizontal.sum(axis=0),
+            (horizontal**2).sum(axis=0),
+        )
+
+    means = sums / samples
+    return HitProbability(
+        distance_m=distances,
+        hit_probability=hits / samples,
+        vertical_mean_m=means[0],
+        vertical_sd_m=np.sqrt(np.maximum(means[1] - means[0] ** 2, 0.0)),
+        horizontal_mean_m=means[2],
+        horizontal_sd_m=np.sqrt(np.maximum(means[3] - means[2] ** 2, 0.0)),
+        target_width_m=float(target_width_m),
+        target_height_m=float(target_height_m),
+        samples=int(samples),
+    )
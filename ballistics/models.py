@@ -0,0 +1,158 @@
+"""
+Ballistic profiles built from stored ChronoLog data.
+
+A ``BallisticProfile`` holds what the solver needs for one load: muzzle
+velocity, ballistic coefficient and drag model, sight height and zero. It
+can be assembled from a DOPE session (session median velocity and the
+bullet BCs joined onto it) or from a bullet and rifle record. Rifle fields
+are free text, so ``parse_length_m`` and ``parse_twist_in_per_rev`` read
+values such as "1.5 inches", "38 mm" or "1:8".
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from .solver import (
+    DEFAULT_SIGHT_HEIGHT_M,
+    DEFAULT_ZERO_DISTANCE_M,
+    TrajectoryBatch,
+    solve_trajectories,
+)
+
+_LENGTH_UNITS_M = {
+    "mm": 0.001,
+    "millimeter": 0.001,
+    "millimeters": 0.001,
+    "cm": 0.01,
+    "centimeter": 0.01,
+    "centimeters": 0.01,
+    "m": 1.0,
+    "in": 0.0254,
+    "inch": 0.0254,
+    "inches": 0.0254,
+    '"': 0.0254,
+}
+
+_NUMBER = r"(\d+(?:\.\d+)?|\.\d+)"
+
+
+def _optional_positive_float(value: Any) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 else None
+
+
+def parse_length_m(text: Any, default_unit: str = "in") -> Optional[float]:
+    """Parse a free-text length ("1.5", "1.5 inches", "38 mm") to meters"""
+    if text is None:
+        return None
+    match = re.fullmatch(
+        rf"\s*{_NUMBER}\s*([a-zA-Z\"]*)\.?\s*", str(text)
+    )
+    if not match:
+        return None
+    unit = (match.group(2) or default_unit).lower()
+    if unit not in _LENGTH_UNITS_M:
+        return None
+    return float(match.group(1)) * _LENGTH_UNITS_M[unit]
+
+
+def parse_twist_in_per_rev(text: Any) -> Optional[float]:
+    """Parse a twist rate ("1:8", "1 in 8", "8") to inches per revolution"""
+    if text is None:
+        return None
+    match = re.fullmatch(
+        rf"\s*(?:1\s*(?::|in)\s*)?{_NUMBER}\s*(?:\"|in|inch|inches)?\s*",
+        str(text),
+        flags=re.IGNORECASE,
+    )
+    return _optional_positive_float(match.group(1)) if match else None
+
+
+@dataclass(frozen=True)
+class BallisticProfile:
+    """Solver inputs for one load (bullet, muzzle velocity, rifle setup)"""
+
+    muzzle_velocity_mps: float
+    ballistic_coefficient: float
+    drag_model: str = "G7"
+    sight_height_m: float = DEFAULT_SIGHT_HEIGHT_M
+    zero_distance_m: float = DEFAULT_ZERO_DISTANCE_M
+
+    @classmethod
+    def from_dope_session(
+        cls,
+        session,
+        sight_offset: Optional[str] = None,
+        zero_distance_m: float = DEFAULT_ZERO_DISTANCE_M,
+    ) -> "BallisticProfile":
+        """Build a profile from a DOPE session and its rifle's sight offset
+
+        Uses the session's average velocity and the G7 BC of its bullet,
+        falling back to the G1 BC.
+
+        Raises:
+            ValueError: If the session has no velocity or no usable BC
+        """
+        return cls._build(
+            muzzle_velocity_mps=session.speed_mps_avg,
+            bc_g7=session.ballistic_coefficient_g7,
+            bc_g1=session.ballistic_coefficient_g1,
+            sight_offset=sight_offset,
+            zero_distance_m=zero_distance_m,
+        )
+
+    @classmethod
+    def from_bullet(
+        cls,
+        bullet,
+        muzzle_velocity_mps: float,
+        rifle=None,
+        zero_distance_m: float = DEFAULT_ZERO_DISTANCE_M,
+    ) -> "BallisticProfile":
+        """Build a profile from a bullet record, a velocity and optional rifle"""
+        return cls._build(
+            muzzle_velocity_mps=muzzle_velocity_mps,
+            bc_g7=bullet.ballistic_coefficient_g7,
+            bc_g1=bullet.ballistic_coefficient_g1,
+            sight_offset=rifle.sight_offset if rifle is not None else None,
+            zero_distance_m=zero_distance_m,
+        )
+
+    @classmethod
+    def _build(
+        cls, muzzle_velocity_mps, bc_g7, bc_g1, sight_offset, zero_distance_m
+    ) -> "BallisticProfile":
+        velocity = _optional_positive_float(muzzle_velocity_mps)
+        if velocity is None:
+            raise ValueError("A muzzle velocity is required to solve trajectories")
+        g7 = _optional_positive_float(bc_g7)
+        g1 = _optional_positive_float(bc_g1)
+        if g7 is None and g1 is None:
+            raise ValueError("The bullet has no G1 or G7 ballistic coefficient")
+        return cls(
+            muzzle_velocity_mps=velocity,
+            ballistic_coefficient=g7 if g7 is not None else g1,
+            drag_model="G7" if g7 is not None else "G1",
+            sight_height_m=parse_length_m(sight_offset) or DEFAULT_SIGHT_HEIGHT_M,
+            zero_distance_m=zero_distance_m,
+        )
+
+    def solve(self, distances_m, **conditions) -> TrajectoryBatch:
+        """Solve this load at the given distances
+
+        Keyword arguments are passed to ``solve_trajectories`` (air density,
+        speed of sound, winds, ...); array values solve many variants at once.
+        """
+        arguments = {
+            "muzzle_velocity_mps": self.muzzle_velocity_mps,
+            "ballistic_coefficient": self.ballistic_coefficient,
+            "drag_model": self.drag_model,
+            "zero_distance_m": self.zero_distance_m,
+            "sight_height_m": self.sight_height_m,
+            **conditions,
+        }
+        return solve_trajectories(distances_m, **arguments)
@@ -0,0 +1,303 @@
+"""
+Vectorized point-mass trajectory solver.
+
+Trajectories are integrated with classical RK4 using downrange distance as
+the independent variable, so every trajectory in a batch shares one
+distance grid and each step is a handful of NumPy operations over arrays of
+shape (N,). Inputs broadcast against each other: pass arrays of muzzle
+velocities, ballistic coefficients, air densities or winds to solve N
+trajectories in one call, and an array of distances to sample each of them.
+
+Coordinates: x downrange, y up, z right. The line of sight is horizontal at
+y = 0 and the bore starts sight_height_m below it. Drag follows the standard
+G1/G7 functions in ``ballistics.drag``; spin drift, Coriolis and aerodynamic
+jump are not modelled.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .drag import BC_LB_PER_IN2_TO_KG_PER_M2, drag_table
+
+GRAVITY_MPS2 = 9.80665
+
+# ICAO standard atmosphere at sea level (15 °C, 1013.25 hPa, dry air)
+STANDARD_AIR_DENSITY_KG_M3 = 1.2250
+STANDARD_SPEED_OF_SOUND_MPS = 340.294
+
+# Integration step along the downrange axis (requested distances are always
+# hit exactly; they are added to the grid)
+DEFAULT_STEP_M = 5.0
+
+DEFAULT_SIGHT_HEIGHT_M = 0.0381  # 1.5 in
+DEFAULT_ZERO_DISTANCE_M = 100.0
+
+ZERO_ITERATIONS = 10
+ZERO_TOLERANCE_M = 1e-5
+
+
+@dataclass(frozen=True)
+class TrajectoryBatch:
+    """Solved trajectories sampled at a shared set of distances
+
+    Arrays are shaped (N, D) for N trajectories and D distances; distance_m
+    is (D,) and launch_angle_rad is (N,).
+    """
+
+    distance_m: np.ndarray
+    drop_m: np.ndarray  # height relative to the line of sight (negative = low)
+    windage_m: np.ndarray  # lateral offset (positive = right)
+    time_s: np.ndarray
+    velocity_mps: np.ndarray
+    launch_angle_rad: np.ndarray
+
+    def __len__(self) -> int:
+        return self.drop_m.shape[0]
+
+
+@dataclass(frozen=True)
+class _Conditions:
+    """Per-trajectory solver inputs broadcast to shape (N,)"""
+
+    muzzle_velocity_mps: np.ndarray
+    drag_factor: np.ndarray  # rho * pi / (8 * BC in kg/m^2)
+    speed_of_sound_mps: np.ndarray
+    sight_height_m: np.ndarray
+    crosswind_mps: np.ndarray
+    headwind_mps: np.ndarray
+    mach_points: np.ndarray
+    cd_points: np.ndarray
+
+
+def _conditions(
+    muzzle_velocity_mps,
+    ballistic_coefficient,
+    drag_model: str,
+    sight_height_m,
+    air_density_kg_m3,
+    speed_of_sound_mps,
+    crosswind_mps,
+    headwind_mps,
+    extra=(),
+) -> Tuple[_Conditions, Tuple[np.ndarray, ...]]:
+    arrays = np.broadcast_arrays(
+        *(
+            np.atleast_1d(np.asarray(value, dtype=float))
+            for value in (
+                muzzle_velocity_mps,
+                ballistic_coefficient,
+                sight_height_m,
+                air_density_kg_m3,
+                speed_of_sound_mps,
+                crosswind_mps,
+                headwind_mps,
+                *extra,
+            )
+        )
+    )
+    mv, bc, sight, density, sound, crosswind, headwind = arrays[:7]
+    if arrays[0].ndim != 1:
+        raise ValueError("Trajectory inputs must be scalars or 1-D arrays")
+    if np.any(mv <= 0) or np.any(bc <= 0):
+        raise ValueError("Muzzle velocity and ballistic coefficient must be positive")
+
+    mach_points, cd_points = drag_table(drag_model)
+    conditions = _Conditions(
+        muzzle_velocity_mps=mv,
+        drag_factor=density * np.pi / (8.0 * bc * BC_LB_PER_IN2_TO_KG_PER_M2),
+        speed_of_sound_mps=sound,
+        sight_height_m=sight,
+        crosswind_mps=crosswind,
+        headwind_mps=headwind,
+        mach_points=mach_points,
+        cd_points=cd_points,
+    )
+    return conditions, tuple(arrays[7:])
+
+
+def _derivative(state: np.ndarray, c: _Conditions) -> np.ndarray:
+    """d(state)/dx for state rows (y, z, vx, vy, vz, t)"""
+    _, _, vx, vy, vz, _ = state
+    # Air-relative velocity: a headwind blows toward the shooter (-x), a
+    # crosswind toward +z
+    rx = vx + c.headwind_mps
+    rz = vz - c.crosswind_mps
+    speed = np.sqrt(rx * rx + vy * vy + rz * rz)
+    cd = np.interp(speed / c.speed_of_sound_mps, c.mach_points, c.cd_points)
+    k = c.drag_factor * cd * speed
+    inv_vx = 1.0 / vx
+    return np.stack(
+        (
+            vy * inv_vx,
+            vz * inv_vx,
+            -k * rx * inv_vx,
+            (-k * vy - GRAVITY_MPS2) * inv_vx,
+            -k * rz * inv_vx,
+            inv_vx,
+        )
+    )
+
+
+def _integrate(
+    distances_m: np.ndarray,
+    launch_angle_rad: np.ndarray,
+    c: _Conditions,
+    step_m: float,
+) -> np.ndarray:
+    """Integrate all trajectories; returns states shaped (6, N, D)"""
+    mv = c.muzzle_velocity_mps
+    state = np.stack(
+        (
+            -c.sight_height_m,
+            np.zeros_like(mv),
+            mv * np.cos(launch_angle_rad),
+            mv * np.sin(launch_angle_rad),
+            np.zeros_like(mv),
+            np.zeros_like(mv),
+        )
+    )
+
+    nodes = np.union1d(np.arange(0.0, distances_m.max(), step_m), distances_m)
+    nodes = np.union1d(nodes, [0.0])
+    output_index = np.searchsorted(nodes, distances_m)
+    samples = np.empty((6, mv.shape[0], distances_m.shape[0]))
+    samples[:, :, output_index == 0] = state[:, :, None]
+
+    for i in range(1, nodes.shape[0]):
+        h = nodes[i] - nodes[i - 1]
+        k1 = _derivative(state, c)
+        k2 = _derivative(state + 0.5 * h * k1, c)
+        k3 = _derivative(state + 0.5 * h * k2, c)
+        k4 = _derivative(state + h * k3, c)
+        state = state + (h / 6.0) * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+        hits = output_index == i
+        if hits.any():
+            samples[:, :, hits] = state[:, :, None]
+    return samples
+
+
+def _zero_angle(
+    zero_distance_m: np.ndarray, c: _Conditions, step_m: float
+) -> np.ndarray:
+    """Launch angles that put each trajectory on the line of sight at its zero"""
+    zero_distances, zero_column = np.unique(zero_distance_m, return_inverse=True)
+    if np.any(zero_distances <= 0):
+        raise ValueError("Zero distance must be positive")
+    rows = np.arange(zero_distance_m.shape[0])
+
+    # Flat-fire guess, then Newton steps using dy/dangle ~= zero distance
+    angle = (
+        c.sight_height_m
+        + 0.5 * GRAVITY_MPS2 * (zero_distance_m / c.muzzle_velocity_mps) ** 2
+    ) / zero_distance_m
+    for _ in range(ZERO_ITERATIONS):
+        height = _integrate(zero_distances, angle, c, step_m)[0][rows, zero_column]
+        angle = angle - height / zero_distance_m
+        if np.max(np.abs(height)) < ZERO_TOLERANCE_M:
+            break
+    return angle
+
+
+def zero_angle(
+    muzzle_velocity_mps,
+    ballistic_coefficient,
+    drag_model: str = "G7",
+    zero_distance_m=DEFAULT_ZERO_DISTANCE_M,
+    sight_height_m=DEFAULT_SIGHT_HEIGHT_M,
+    air_density_kg_m3=STANDARD_AIR_DENSITY_KG_M3,
+    speed_of_sound_mps=STANDARD_SPEED_OF_SOUND_MPS,
+    step_m: float = DEFAULT_STEP_M,
+) -> np.ndarray:
+    """Bore elevation angle (radians) that zeroes each trajectory, shape (N,)
+
+    Use it to zero under one atmosphere (e.g. where the rifle was zeroed) and
+    pass the result as launch_angle_rad when solving under another.
+    """
+    c, (zero,) = _conditions(
+        muzzle_velocity_mps,
+        ballistic_coefficient,
+        drag_model,
+        sight_height_m,
+        air_density_kg_m3,
+        speed_of_sound_mps,
+        0.0,
+        0.0,
+        extra=(zero_distance_m,),
+    )
+    return _zero_angle(zero, c, step_m)
+
+
+def solve_trajectories(
+    distances_m,
+    muzzle_velocity_mps,
+    ballistic_coefficient,
+    drag_model: str = "G7",
+    zero_distance_m=DEFAULT_ZERO_DISTANCE_M,
+    sight_height_m=DEFAULT_SIGHT_HEIGHT_M,
+    air_density_kg_m3=STANDARD_AIR_DENSITY_KG_M3,
+    speed_of_sound_mps=STANDARD_SPEED_OF_SOUND_MPS,
+    crosswind_mps=0.0,
+    headwind_mps=0.0,
+    launch_angle_rad: Optional[np.ndarray] = None,
+    step_m: float = DEFAULT_STEP_M,
+) -> TrajectoryBatch:
+    """Solve N point-mass trajectories and sample them at D distances
+
+    Args:
+        distances_m: Downrange distances to report (any order, >= 0)
+        muzzle_velocity_mps: Muzzle velocity, scalar or (N,)
+        ballistic_coefficient: BC in lb/in^2 for drag_model, scalar or (N,)
+        drag_model: "G1" or "G7"
+        zero_distance_m: Distance where the trajectory crosses the line of
+            sight, scalar or (N,); ignored when launch_angle_rad is given
+        sight_height_m: Sight height over bore, scalar or (N,)
+        air_density_kg_m3: Air density, scalar or (N,)
+        speed_of_sound_mps: Speed of sound, scalar or (N,)
+        crosswind_mps: Wind blowing toward the right, scalar or (N,)
+        headwind_mps: Wind blowing toward the shooter, scalar or (N,)
+        launch_angle_rad: Bore elevation angle; zeroed under the same
+            conditions (without wind) when omitted
+        step_m: Integration step along the downrange axis
+
+    Returns:
+        TrajectoryBatch: drop, windage, time of flight and velocity (N, D)
+    """
+    distances = np.atleast_1d(np.asarray(distances_m, dtype=float))
+    if distances.ndim != 1 or np.any(distances < 0):
+        raise ValueError("Distances must be a 1-D array of non-negative values")
+
+    extra = (zero_distance_m,) if launch_angle_rad is None else (launch_angle_rad,)
+    c, (per_trajectory,) = _conditions(
+        muzzle_velocity_mps,
+        ballistic_coefficient,
+        drag_model,
+        sight_height_m,
+        air_density_kg_m3,
+        speed_of_sound_mps,
+        crosswind_mps,
+        headwind_mps,
+        extra=extra,
+    )
+    if launch_angle_rad is None:
+        still_air = _Conditions(
+            **{
+                **c.__dict__,
+                "crosswind_mps": np.zeros_like(c.crosswind_mps),
+                "headwind_mps": np.zeros_like(c.headwind_mps),
+            }
+        )
+        angle = _zero_angle(per_trajectory, still_air, step_m)
+    else:
+        angle = per_trajectory
+
+    y, z, vx, vy, vz, t = _integrate(distances, angle, c, step_m)
+    return TrajectoryBatch(
+        distance_m=distances,
+        drop_m=y,
+        windage_m=z,
+        time_s=t,
+        velocity_mps=np.sqrt(vx * vx + vy * vy + vz * vz),
+        launch_angle_rad=angle,
+    )
@@ -0,0 +1,120 @@
+"""
+Gyroscopic stability from the Miller twist rule.
+
+Miller's rule estimates the gyroscopic stability factor of a bullet from its
+weight, diameter and length and the barrel's twist rate:
+
+    Sg = 30 m / (t^2 d^3 l (1 + l^2))
+
+with m in grains, d in inches, and twist t and length l in calibers. The
+rule is calibrated at 2800 ft/s in the standard atmosphere (59 F, 29.92
+inHg); Sg grows with the cube root of velocity and inversely with air
+density. Every function takes scalars or arrays, so a whole bullet catalog is
+rated against one rifle in a single call.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from .atmosphere import ISA_SEA_LEVEL_TEMPERATURE_K, air_density
+
+MILLER_REFERENCE_VELOCITY_MPS = 2800.0 * 0.3048
+MILLER_REFERENCE_TEMPERATURE_C = ISA_SEA_LEVEL_TEMPERATURE_K - 273.15
+MILLER_REFERENCE_PRESSURE_HPA = 1013.25
+
+STABLE_SG = 1.5  # fully stabilized in any conditions
+MARGINAL_SG = 1.0  # below this the bullet tumbles
+
+STABILITY_STATUSES = ("stable", "marginal", "unstable", "unknown")
+
+_MM_PER_IN = 25.4
+
+
+def miller_stability(
+    weight_grains,
+    diameter_mm,
+    length_mm,
+    twist_in_per_rev,
+    muzzle_velocity_mps=MILLER_REFERENCE_VELOCITY_MPS,
+    temperature_c=MILLER_REFERENCE_TEMPERATURE_C,
+    pressure_hpa=MILLER_REFERENCE_PRESSURE_HPA,
+    humidity_pct=0.0,
+) -> np.ndarray:
+    """Miller gyroscopic stability factor (NaN where an input is missing)
+
+    Args:
+        weight_grains: Bullet weight
+        diameter_mm: Bullet (groove) diameter
+        length_mm: Bullet length
+        twist_in_per_rev: Barrel twist, inches per revolution
+        muzzle_velocity_mps: Velocity the stability is evaluated at
+        temperature_c, pressure_hpa, humidity_pct: Air at the muzzle
+    """
+    weight = np.asarray(weight_grains, dtype=float)
+    diameter_in = np.asarray(diameter_mm, dtype=float) / _MM_PER_IN
+    length = np.asarray(length_mm, dtype=float) / _MM_PER_IN / diameter_in
+    twist = np.asarray(twist_in_per_rev, dtype=float) / diameter_in
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sg = 30.0 * weight / (twist**2 * diameter_in**3 * length * (1.0 + length**2))
+        velocity = np.asarray(muzzle_velocity_mps, dtype=float)
+        density_ratio = air_density(
+            MILLER_REFERENCE_TEMPERATURE_C, MILLER_REFERENCE_PRESSURE_HPA
+        ) / air_density(temperature_c, pressure_hpa, humidity_pct)
+        sg = sg * np.cbrt(velocity / MILLER_REFERENCE_VELOCITY_MPS) * density_ratio
+    valid = (weight > 0) & (diameter_in > 0) & (length > 0) & (twist > 0)
+    return np.where(valid & np.isfinite(sg), sg, np.nan)
+
+
+def required_twist_in_per_rev(
+    weight_grains,
+    diameter_mm,
+    length_mm,
+    target_sg: float = STABLE_SG,
+    muzzle_velocity_mps=MILLER_REFERENCE_VELOCITY_MPS,
+    temperature_c=MILLER_REFERENCE_TEMPERATURE_C,
+    pressure_hpa=MILLER_REFERENCE_PRESSURE_HPA,
+    humidity_pct=0.0,
+) -> np.ndarray:
+    """Slowest twist (inches per revolution) that reaches ``target_sg``
+
+    Sg scales with 1 / twist^2, so this inverts ``miller_stability``.
+    """
+    sg_one_inch = miller_stability(
+        weight_grains,
+        diameter_mm,
+        length_mm,
+        1.0,
+        muzzle_velocity_mps,
+        temperature_c,
+        pressure_hpa,
+        humidity_pct,
+    )
+    return np.sqrt(sg_one_inch / target_sg)
+
+
+def stability_status(
+    sg, twist_in_per_rev=None, min_twist_in_per_rev: Optional[object] = None
+) -> np.ndarray:
+    """Label stability factors "stable", "marginal", "unstable" or "unknown"
+
+    Where Sg is missing (no bullet length), a manufacturer minimum twist is
+    used instead when both it and the barrel twist are known: a barrel at
+    least that fast is "stable", a slower one "unstable".
+    """
+    sg = np.asarray(sg, dtype=float)
+    status = np.select(
+        [sg >= STABLE_SG, sg >= MARGINAL_SG, sg < MARGINAL_SG],
+        ["stable", "marginal", "unstable"],
+        default="unknown",
+    ).astype(object)
+    if twist_in_per_rev is not None and min_twist_in_per_rev is not None:
+        twist = np.broadcast_to(np.asarray(twist_in_per_rev, dtype=float), sg.shape)
+        minimum = np.broadcast_to(
+            np.asarray(min_twist_in_per_rev, dtype=float), sg.shape
+        )
+        fallback = np.isnan(sg) & np.isfinite(twist) & (minimum > 0)
+        status = np.where(
+            fallback, np.where(twist <= minimum, "stable", "unstable"), status
+        ).astype(object)
+    return status
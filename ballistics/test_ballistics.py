@@ -0,0 +1,444 @@
+import os
+import sys
+import time
+import unittest
+
+import numpy as np
+
+# Add the root directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ballistics.atmosphere import (
+    air_density,
+    atmosphere,
+    density_altitude_m,
+    speed_of_sound,
+    standard_atmosphere,
+    station_pressure_hpa,
+    virtual_temperature_c,
+)
+from ballistics.benchmark import compare_reference, reference_table
+from ballistics.card import MOA_PER_RAD, compute_dope_card
+from ballistics.drag import drag_coefficient
+from ballistics.hit_probability import ShotDispersion, simulate_hits
+from ballistics.models import BallisticProfile, parse_length_m, parse_twist_in_per_rev
+from ballistics.solver import GRAVITY_MPS2, solve_trajectories, zero_angle
+from ballistics.stability import (
+    miller_stability,
+    required_twist_in_per_rev,
+    stability_status,
+)
+from ballistics.truing import true_profile
+
+
+class TestDragTables(unittest.TestCase):
+    """Test the standard G1/G7 drag functions"""
+
+    def test_table_points_and_interpolation(self):
+        """Test exact table values, interpolation and clamping"""
+        self.assertAlmostEqual(float(drag_coefficient("G7", 1.0)), 0.3803)
+        self.assertAlmostEqual(float(drag_coefficient("g1", 2.0)), 0.5934)
+        self.assertAlmostEqual(float(drag_coefficient("G7", 0.9125)), (0.1464 + 0.1660) / 2)
+        self.assertAlmostEqual(float(drag_coefficient("G1", 9.0)), 0.4988)
+
+    def test_unknown_drag_model(self):
+        """Test that unknown drag models are rejected"""
+        with self.assertRaises(ValueError):
+            drag_coefficient("G8", 1.0)
+
+
+class TestTrajectorySolver(unittest.TestCase):
+    """Test the vectorized point-mass solver"""
+
+    def setUp(self):
+        self.distances = np.arange(0.0, 1001.0, 100.0)
+
+    def test_vacuum_matches_closed_form(self):
+        """Test that a drag-free trajectory matches the analytic parabola"""
+        batch = solve_trajectories(
+            self.distances, 800.0, 1e12, "G7", zero_distance_m=100.0, sight_height_m=0.0
+        )
+        angle = batch.launch_angle_rad[0]
+        expected = self.distances * np.tan(angle) - GRAVITY_MPS2 * self.distances**2 / (
+            2 * 800.0**2 * np.cos(angle) ** 2
+        )
+        np.testing.assert_allclose(batch.drop_m[0], expected, atol=1e-6)
+        np.testing.assert_allclose(batch.velocity_mps[0][1:], 800.0, rtol=1e-3)
+
+    def test_zero_and_output_shapes(self):
+        """Test zeroing, starting state and (N, D) output shapes"""
+        batch = solve_trajectories(
+            [300.0, 0.0, 100.0], [790.0, 823.0, 860.0], 0.243, "G7",
+            sight_height_m=0.05,
+        )
+        self.assertEqual(batch.drop_m.shape, (3, 3))
+        self.assertEqual(len(batch), 3)
+        np.testing.assert_allclose(batch.drop_m[:, 1], -0.05)
+        np.testing.assert_allclose(batch.drop_m[:, 2], 0.0, atol=1e-4)
+        np.testing.assert_allclose(batch.time_s[:, 1], 0.0)
+        # Faster loads drop less past the zero
+        self.assertTrue(np.all(np.diff(batch.drop_m[:, 0]) > 0))
+
+    def test_drag_and_atmosphere_effects(self):
+        """Test that drag slows the bullet and denser air slows it more"""
+        batch = solve_trajectories(
+            self.distances, 823.0, 0.243, "G7", air_density_kg_m3=[1.0, 1.225, 1.3]
+        )
+        self.assertTrue(np.all(np.diff(batch.velocity_mps, axis=1) < 0))
+        self.assertTrue(np.all(np.diff(batch.velocity_mps[:, -1]) < 0))
+        self.assertTrue(np.all(np.diff(batch.drop_m[:, -1]) < 0))
+        self.assertTrue(np.all(np.diff(batch.time_s, axis=1) > 0))
+
+    def test_wind_and_explicit_launch_angle(self):
+        """Test crosswind drift direction and reuse of a zero angle"""
+        angle = zero_angle(823.0, 0.243, "G7", zero_distance_m=100.0)
+        batch = solve_trajectories(
+            self.distances, 823.0, 0.243, "G7",
+            crosswind_mps=[-4.0, 0.0, 4.0], launch_angle_rad=angle,
+        )
+        np.testing.assert_allclose(batch.launch_angle_rad, angle[0])
+        self.assertLess(batch.windage_m[0, -1], 0.0)
+        self.assertAlmostEqual(batch.windage_m[1, -1], 0.0)
+        self.assertAlmostEqual(batch.windage_m[2, -1], -batch.windage_m[0, -1])
+        # Lag rule: drift ~= crosswind x (time of flight - vacuum time)
+        lag = 4.0 * (batch.time_s[2, -1] - 1000.0 / 823.0)
+        self.assertAlmostEqual(batch.windage_m[2, -1], lag, delta=0.05 * lag)
+
+    def test_step_size_convergence(self):
+        """Test that the default step agrees with a fine step"""
+        coarse = solve_trajectories(self.distances, 823.0, 0.243, "G7")
+        fine = solve_trajectories(self.distances, 823.0, 0.243, "G7", step_m=0.5)
+        np.testing.assert_allclose(coarse.drop_m, fine.drop_m, atol=1e-4)
+
+    def test_invalid_inputs(self):
+        """Test validation of velocities and distances"""
+        with self.assertRaises(ValueError):
+            solve_trajectories(self.distances, 0.0, 0.243)
+        with self.assertRaises(ValueError):
+            solve_trajectories([-10.0], 823.0, 0.243)
+
+    def test_matches_published_reference_table(self):
+        """Test drop, windage, velocity and time against the G7 reference load"""
+        compared = compare_reference(reference_table())
+
+        self.assertEqual(len(compared), 10)
+        self.assertLess(compared["drop_error_m"].abs().max(), 0.005)
+        self.assertLess(compared["windage_error_m"].abs().max(), 0.002)
+        self.assertLess(compared["velocity_error_mps"].abs().max(), 0.5)
+        self.assertLess(compared["time_error_s"].abs().max(), 0.001)
+
+    def test_batch_is_fast(self):
+        """Test a 1,000-load DOPE card batch solves well under a second"""
+        start = time.perf_counter()
+        solve_trajectories(
+            np.arange(100.0, 1001.0, 25.0), np.linspace(750.0, 900.0, 1000), 0.243
+        )
+        self.assertLess(time.perf_counter() - start, 1.0)
+
+
+class TestBallisticProfile(unittest.TestCase):
+    """Test building solver inputs from stored records"""
+
+    def test_parsers(self):
+        """Test free-text sight offset and twist parsing"""
+        self.assertAlmostEqual(parse_length_m("1.5 inches"), 0.0381)
+        self.assertAlmostEqual(parse_length_m("38 mm"), 0.038)
+        self.assertAlmostEqual(parse_length_m("1.75"), 0.04445)
+        self.assertIsNone(parse_length_m("high"))
+        self.assertEqual(parse_twist_in_per_rev("1:8"), 8.0)
+        self.assertEqual(parse_twist_in_per_rev("1 in 7.5"), 7.5)
+        self.assertEqual(parse_twist_in_per_rev("10"), 10.0)
+        self.assertIsNone(parse_twist_in_per_rev("fast"))
+
+    def test_from_dope_session(self):
+        """Test G7 preference, G1 fallback and missing data"""
+        from dope.models import DopeSessionModel
+
+        session = DopeSessionModel(
+            speed_mps_avg=823.0,
+            ballistic_coefficient_g1="0.462",
+            ballistic_coefficient_g7="0.243",
+        )
+        profile = BallisticProfile.from_dope_session(session, sight_offset="2 in")
+        self.assertEqual((profile.drag_model, profile.ballistic_coefficient), ("G7", 0.243))
+        self.assertAlmostEqual(profile.sight_height_m, 0.0508)
+
+        session.ballistic_coefficient_g7 = "None"
+        profile = BallisticProfile.from_dope_session(session)
+        self.assertEqual((profile.drag_model, profile.ballistic_coefficient), ("G1", 0.462))
+
+        session.ballistic_coefficient_g1 = ""
+        with self.assertRaises(ValueError):
+            BallisticProfile.from_dope_session(session)
+
+    def test_solve(self):
+        """Test solving a profile with per-call conditions"""
+        profile = BallisticProfile(muzzle_velocity_mps=823.0, ballistic_coefficient=0.243)
+        batch = profile.solve([100.0, 500.0], crosswind_mps=[0.0, 3.0])
+        self.assertEqual(batch.drop_m.shape, (2, 2))
+        self.assertGreater(batch.windage_m[1, 1], 0.0)
+
+
+class TestAtmosphere(unittest.TestCase):
+    """Test air density and density altitude"""
+
+    def test_standard_sea_level(self):
+        """Test the ICAO sea-level density and speed of sound"""
+        self.assertAlmostEqual(float(air_density(15.0, 1013.25)), 1.2250, places=3)
+        self.assertAlmostEqual(float(speed_of_sound(15.0)), 340.29, places=1)
+        self.assertAlmostEqual(float(density_altitude_m(1.2250)), 0.0, delta=0.1)
+
+    def test_density_altitude_round_trip(self):
+        """Test density altitude inverts the standard atmosphere"""
+        altitudes = np.array([-300.0, 0.0, 1000.0, 3000.0])
+        density, sound = standard_atmosphere(altitudes)
+        np.testing.assert_allclose(density_altitude_m(density), altitudes, atol=1e-6)
+        self.assertAlmostEqual(float(density[2]), 1.1117, places=3)
+        self.assertTrue(np.all(np.diff(sound) < 0))
+
+    def test_humidity_and_heat_thin_the_air(self):
+        """Test that humid or hot air is less dense"""
+        self.assertLess(float(air_density(30.0, 1013.25, 80.0)), float(air_density(30.0, 1013.25)))
+        self.assertLess(float(air_density(35.0, 1013.25)), float(air_density(5.0, 1013.25)))
+
+    def test_virtual_temperature(self):
+        """Test virtual temperature in dry and humid air"""
+        self.assertAlmostEqual(float(virtual_temperature_c(20.0, 1013.25)), 20.0)
+        # Tv ~= T (1 + 0.61 q): ~3.9 K warmer at 30 °C and 80% RH
+        self.assertAlmostEqual(float(virtual_temperature_c(30.0, 1013.25, 80.0)), 33.9, delta=0.1)
+
+    def test_vectorized_atmosphere(self):
+        """Test the all-in-one call over arrays, with missing humidity as dry air"""
+        air = atmosphere([15.0, 8.5, 30.0, np.nan], [1013.25, 898.75, 1000.0, 1000.0],
+                         [np.nan, 0.0, 80.0, 50.0])
+        self.assertEqual(air.air_density_kg_m3.shape, (4,))
+        self.assertAlmostEqual(air.density_altitude_m[0], 0.0, delta=1.0)
+        self.assertAlmostEqual(air.density_altitude_m[1], 1000.0, delta=2.0)
+        self.assertAlmostEqual(air.speed_of_sound_mps[0], 340.29, places=1)
+        np.testing.assert_allclose(
+            air.air_density_kg_m3[2], air_density(30.0, 1000.0, 80.0)
+        )
+        self.assertTrue(np.isnan(air.density_altitude_m[3]))
+        self.assertAlmostEqual(float(station_pressure_hpa(1013.25, 1000.0)), 898.75, places=1)
+
+
+class TestDopeCard(unittest.TestCase):
+    """Test elevation and windage holds"""
+
+    def setUp(self):
+        self.profile = BallisticProfile(muzzle_velocity_mps=823.0, ballistic_coefficient=0.243)
+        self.card = compute_dope_card(self.profile, [300.0, 100.0, 600.0, 1000.0])
+
+    def test_holds_and_units(self):
+        """Test holds are zero at the zero, grow with distance and convert"""
+        np.testing.assert_allclose(self.card.distance_m, [100.0, 300.0, 600.0, 1000.0])
+        self.assertAlmostEqual(float(self.card.elevation(100.0)), 0.0, places=3)
+        self.assertTrue(np.all(np.diff(self.card.elevation_rad) > 0))
+        expected_mil = -self.card.drop_m[-1] / 1000.0 * 1000.0
+        self.assertAlmostEqual(float(self.card.elevation(1000.0)), expected_mil, places=2)
+        self.assertAlmostEqual(
+            float(self.card.elevation(600.0, "moa")),
+            float(self.card.elevation_rad[2]) * MOA_PER_RAD,
+        )
+        with self.assertRaises(ValueError):
+            self.card.elevation(600.0, "clicks")
+
+    def test_windage_scales_with_wind(self):
+        """Test windage holds left for a left-to-right wind, linear in speed"""
+        one = float(self.card.windage(600.0, 1.0))
+        self.assertLess(one, 0.0)
+        self.assertAlmostEqual(float(self.card.windage(600.0, 4.0)), 4.0 * one)
+        frame = self.card.to_frame()
+        self.assertEqual(len(frame), 4)
+        self.assertIn("windage_moa_per_mps", frame.columns)
+
+    def test_invalid_distances(self):
+        """Test that cards need positive distances"""
+        with self.assertRaises(ValueError):
+            compute_dope_card(self.profile, [0.0, 100.0])
+
+
+class TestTruing(unittest.TestCase):
+    """Test fitting effective muzzle velocity and BC to observed holds"""
+
+    def setUp(self):
+        self.truth = BallisticProfile(muzzle_velocity_mps=805.0, ballistic_coefficient=0.255)
+        grid = np.arange(200.0, 1001.0, 100.0)
+        batch = self.truth.solve(grid, air_density_kg_m3=[1.10, 1.18, 1.22])
+        self.distances = np.tile(grid, 3)
+        self.densities = np.repeat([1.10, 1.18, 1.22], len(grid))
+        self.holds = (np.arctan2(-batch.drop_m, grid) * 1000.0).ravel()
+
+    def test_recovers_true_profile(self):
+        """Test exact holds recover the true MV and BC from a wrong start"""
+        result = true_profile(
+            BallisticProfile(muzzle_velocity_mps=823.0, ballistic_coefficient=0.243),
+            self.distances, self.holds, air_density_kg_m3=self.densities,
+        )
+        self.assertTrue(result.converged)
+        self.assertAlmostEqual(result.profile.muzzle_velocity_mps, 805.0, delta=0.01)
+        self.assertAlmostEqual(result.profile.ballistic_coefficient, 0.255, delta=1e-4)
+        self.assertLess(result.rms_residual, 1e-4)
+        self.assertEqual(result.n_observations, 27)
+
+    def test_noisy_holds_report_fit_quality(self):
+        """Test noisy holds give standard errors covering the truth"""
+        rng = np.random.default_rng(3)
+        noisy = self.holds + rng.normal(0.0, 0.05, self.holds.shape)
+        result = true_profile(
+            BallisticProfile(muzzle_velocity_mps=823.0, ballistic_coefficient=0.243),
+            self.distances, noisy, air_density_kg_m3=self.densities,
+        )
+        self.assertAlmostEqual(result.rms_residual, 0.05, delta=0.02)
+        self.assertGreater(result.r_squared, 0.99)
+        self.assertLess(
+            abs(result.profile.muzzle_velocity_mps - 805.0),
+            4 * result.muzzle_velocity_se_mps,
+        )
+        self.assertEqual(result.residuals.shape, (27,))
+
+    def test_fit_one_parameter_and_validation(self):
+        """Test fixing MV, converting MOA holds and rejecting bad input"""
+        start = BallisticProfile(muzzle_velocity_mps=805.0, ballistic_coefficient=0.23)
+        result = true_profile(
+            start, self.distances, self.holds * MOA_PER_RAD / 1000.0, unit="moa",
+            air_density_kg_m3=self.densities, fit_muzzle_velocity=False,
+        )
+        self.assertEqual(result.profile.muzzle_velocity_mps, 805.0)
+        self.assertAlmostEqual(result.profile.ballistic_coefficient, 0.255, delta=1e-4)
+        self.assertIsNone(result.muzzle_velocity_se_mps)
+        with self.assertRaises(ValueError):
+            true_profile(start, self.distances, self.holds,
+                         fit_muzzle_velocity=False, fit_ballistic_coefficient=False)
+        with self.assertRaises(ValueError):
+            true_profile(start, [500.0, np.nan], [3.0, 4.0])
+
+
+class TestHitProbability(unittest.TestCase):
+    """Test the Monte Carlo hit-probability engine"""
+
+    def setUp(self):
+        self.profile = BallisticProfile(muzzle_velocity_mps=823.0, ballistic_coefficient=0.243)
+        self.distances = np.array([300.0, 600.0, 900.0])
+
+    def test_no_dispersion_always_hits_centre(self):
+        """Test that a perfect shooter in a known wind hits the centre"""
+        result = simulate_hits(
+            self.profile, self.distances, ShotDispersion(crosswind_mps=3.0, headwind_mps=2.0),
+            0.1, 0.1, samples=100,
+        )
+        np.testing.assert_allclose(result.hit_probability, 1.0)
+        np.testing.assert_allclose(result.vertical_mean_m, 0.0, atol=1e-9)
+        np.testing.assert_allclose(result.horizontal_mean_m, 0.0, atol=1e-9)
+
+    def test_seeded_runs_are_reproducible(self):
+        """Test the same seed gives identical results"""
+        dispersion = ShotDispersion(muzzle_velocity_sd_mps=5.0, crosswind_sd_mps=1.0)
+        first = simulate_hits(self.profile, self.distances, dispersion, 0.3, 0.3,
+                              samples=20_000, seed=42)
+        second = simulate_hits(self.profile, self.distances, dispersion, 0.3, 0.3,
+                               samples=20_000, seed=42)
+        np.testing.assert_array_equal(first.hit_probability, second.hit_probability)
+        self.assertEqual(len(first.to_frame()), 3)
+
+    def test_dispersion_matches_linearized_sensitivities(self):
+        """Test vertical SD from MV SD and horizontal SD from wind SD"""
+        angle = zero_angle(823.0, 0.243)[0]
+        batch = solve_trajectories(
+            self.distances, [818.0, 828.0, 823.0], 0.243,
+            crosswind_mps=[0.0, 0.0, 1.0], launch_angle_rad=np.full(3, angle),
+        )
+        drop_per_mps = (batch.drop_m[1] - batch.drop_m[0]) / 10.0
+        result = simulate_hits(
+            self.profile, self.distances,
+            ShotDispersion(muzzle_velocity_sd_mps=4.0, crosswind_mps=2.0, crosswind_sd_mps=1.5),
+            1.0, 1.0, samples=50_000, seed=1,
+        )
+        np.testing.assert_allclose(result.vertical_sd_m, 4.0 * drop_per_mps, rtol=0.03)
+        np.testing.assert_allclose(result.horizontal_sd_m, 1.5 * batch.windage_m[2], rtol=0.03)
+        np.testing.assert_allclose(result.horizontal_mean_m, 0.0, atol=0.01)
+
+    def test_aim_error_matches_normal_probability(self):
+        """Test hit odds against the analytic probability for aiming error alone"""
+        from math import erf, sqrt
+
+        result = simulate_hits(self.profile, self.distances, ShotDispersion(aim_sd_mil=0.3),
+                               0.3, 0.3, samples=100_000, seed=5)
+        sigma = self.distances * 0.3e-3
+        expected = np.array([erf(0.15 / (s * sqrt(2))) ** 2 for s in sigma])
+        np.testing.assert_allclose(result.hit_probability, expected, atol=0.01)
+        self.assertTrue(np.all(np.diff(result.hit_probability) < 0))
+
+    def test_dispersion_from_records(self):
+        """Test MV SD from a chrono session and wind statistics from weather"""
+        from types import SimpleNamespace
+
+        weather = [SimpleNamespace(crosswind_mps=v, headwind_mps=None) for v in (1.0, 2.0, 3.0)]
+        dispersion = ShotDispersion.from_records(
+            SimpleNamespace(std_dev_mps=6.5), weather, range_error_sd_m=4.0
+        )
+        self.assertEqual(dispersion.muzzle_velocity_sd_mps, 6.5)
+        self.assertEqual((dispersion.crosswind_mps, dispersion.crosswind_sd_mps), (2.0, 1.0))
+        self.assertEqual((dispersion.headwind_mps, dispersion.headwind_sd_mps), (0.0, 0.0))
+        self.assertEqual(dispersion.range_error_sd_m, 4.0)
+
+    def test_invalid_inputs(self):
+        """Test validation of distances and target size"""
+        with self.assertRaises(ValueError):
+            simulate_hits(self.profile, [0.0], ShotDispersion(), 0.3, 0.3)
+        with self.assertRaises(ValueError):
+            simulate_hits(self.profile, [300.0], ShotDispersion(), 0.0, 0.3)
+
+    def test_100k_samples_at_20_distances_is_fast(self):
+        """Test 100,000 samples x 20 distances run well under a second"""
+        dispersion = ShotDispersion(
+            muzzle_velocity_sd_mps=4.0, crosswind_sd_mps=1.5, headwind_sd_mps=1.0,
+            range_error_sd_m=5.0, aim_sd_mil=0.1,
+        )
+        start = time.perf_counter()
+        simulate_hits(self.profile, np.linspace(100.0, 1000.0, 20), dispersion,
+                      0.5, 0.5, seed=0)
+        self.assertLess(time.perf_counter() - start, 1.0)
+
+
+class TestStability(unittest.TestCase):
+    """Test the Miller twist-rule stability calculator"""
+
+    def test_miller_reference_value(self):
+        """Test Sg against a hand calculation at Miller's reference conditions"""
+        # 175 gr .308 bullet, 1.24 in long, 1:10 twist
+        d, l, t = 0.308, 1.24 / 0.308, 10.0 / 0.308
+        expected = 30 * 175 / (t**2 * d**3 * l * (1 + l**2))
+        sg = miller_stability(175.0, 0.308 * 25.4, 1.24 * 25.4, 10.0)
+        self.assertAlmostEqual(float(sg), expected, places=2)
+
+    def test_velocity_and_air_corrections(self):
+        """Test Sg rises with velocity and thinner air, falls with slower twist"""
+        base = miller_stability(140.0, 6.71, 35.0, 8.0)
+        self.assertGreater(miller_stability(140.0, 6.71, 35.0, 8.0, muzzle_velocity_mps=950.0), base)
+        self.assertGreater(miller_stability(140.0, 6.71, 35.0, 8.0, pressure_hpa=850.0), base)
+        self.assertAlmostEqual(float(miller_stability(140.0, 6.71, 35.0, 9.0) / base),
+                               (8.0 / 9.0) ** 2, places=9)
+
+    def test_vectorized_catalog_with_missing_values(self):
+        """Test arrays of bullets rate at once and missing inputs give NaN"""
+        sg = miller_stability([140.0, 140.0, np.nan], [6.71, 6.71, 6.71],
+                              [35.0, np.nan, 35.0], 8.0)
+        self.assertTrue(np.isfinite(sg[0]))
+        self.assertTrue(np.all(np.isnan(sg[1:])))
+
+    def test_required_twist_inverts_stability(self):
+        """Test the required twist gives exactly the target Sg"""
+        twist = required_twist_in_per_rev(140.0, 6.71, 35.0, target_sg=1.5)
+        self.assertAlmostEqual(float(miller_stability(140.0, 6.71, 35.0, twist)), 1.5, places=9)
+
+    def test_stability_status(self):
+        """Test thresholds and the minimum-twist fallback when Sg is unknown"""
+        status = stability_status([2.0, 1.2, 0.8, np.nan, np.nan], 8.0,
+                                  [np.nan, np.nan, np.nan, 8.5, 7.0])
+        self.assertEqual(list(status), ["stable", "marginal", "unstable", "stable", "unstable"])
+        self.assertEqual(list(stability_status([np.nan])), ["unknown"])
+
+
+if __name__ == "__main__":
+    unittest.main()
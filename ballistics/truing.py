@@ -0,0 +1,193 @@
+"""
+Ballistic truing: fit effective muzzle velocity and BC to observed holds.
+
+Recorded DOPE elevation adjustments are the holds that put shots on target,
+so they measure the real trajectory. ``true_profile`` fits the muzzle
+velocity and/or ballistic coefficient of a profile so that predicted holds
+match the observed ones in the least-squares sense (Levenberg-Marquardt on
+the log of each parameter, which keeps both positive).
+
+Every residual evaluation is one batched solver call: observations are
+grouped by atmosphere, and each group is one trajectory per parameter set
+(current estimate plus one finite-difference perturbation per fitted
+parameter), sampled at all observed distances. Air densities are rounded to
+1e-4 kg/m^3 and speeds of sound to 0.1 m/s for grouping, so shots in similar
+air share a trajectory.
+"""
+
+from dataclasses import dataclass, replace
+from typing import Optional
+
+import numpy as np
+
+from .card import per_radian
+from .models import BallisticProfile
+from .solver import STANDARD_AIR_DENSITY_KG_M3, STANDARD_SPEED_OF_SOUND_MPS
+
+TRUING_MAX_ITERATIONS = 25
+TRUING_TOLERANCE = 1e-6  # relative parameter change
+_FD_STEP = 1e-4  # finite-difference step in log-parameter space
+
+
+@dataclass(frozen=True)
+class TruingResult:
+    """Fitted profile and fit quality; residuals are observed - predicted"""
+
+    profile: BallisticProfile
+    initial_profile: BallisticProfile
+    unit: str
+    n_observations: int
+    iterations: int
+    converged: bool
+    rms_residual: float
+    r_squared: float
+    residuals: np.ndarray
+    muzzle_velocity_se_mps: Optional[float] = None
+    ballistic_coefficient_se: Optional[float] = None
+
+
+class _HoldModel:
+    """Predicted elevation holds for observations under their atmospheres"""
+
+    def __init__(self, profile, distances, densities, sounds, per_rad):
+        self.profile = profile
+        self.per_rad = per_rad
+        self.grid, self.column = np.unique(distances, return_inverse=True)
+        atmospheres, self.atmosphere = np.unique(
+            np.column_stack((np.round(densities, 4), np.round(sounds, 1))),
+            axis=0,
+            return_inverse=True,
+        )
+        self.atmosphere = self.atmosphere.ravel()
+        self.densities, self.sounds = atmospheres[:, 0], atmospheres[:, 1]
+
+    def holds(self, muzzle_velocities, ballistic_coefficients) -> np.ndarray:
+        """Holds for K parameter sets, shaped (K, n observations)"""
+        k, a = len(muzzle_velocities), len(self.densities)
+        batch = self.profile.solve(
+            self.grid,
+            muzzle_velocity_mps=np.repeat(muzzle_velocities, a),
+            ballistic_coefficient=np.repeat(ballistic_coefficients, a),
+            air_density_kg_m3=np.tile(self.densities, k),
+            speed_of_sound_mps=np.tile(self.sounds, k),
+        )
+        drop = batch.drop_m.reshape(k, a, -1)[:, self.atmosphere, self.column]
+        return np.arctan2(-drop, self.grid[self.column]) * self.per_rad
+
+
+def true_profile(
+    profile: BallisticProfile,
+    distances_m,
+    elevation_holds,
+    unit: str = "mil",
+    air_density_kg_m3=STANDARD_AIR_DENSITY_KG_M3,
+    speed_of_sound_mps=STANDARD_SPEED_OF_SOUND_MPS,
+    fit_muzzle_velocity: bool = True,
+    fit_ballistic_coefficient: bool = True,
+    max_iterations: int = TRUING_MAX_ITERATIONS,
+) -> TruingResult:
+    """Fit a profile's muzzle velocity and/or BC to observed elevation holds
+
+    Args:
+        profile: Starting profile (drag model, sight height and zero are kept)
+        distances_m: Observed distances, (n,)
+        elevation_holds: Elevation holds used at those distances, in unit
+        unit: "mil" or "moa"
+        air_density_kg_m3: Air density per observation, scalar or (n,)
+        speed_of_sound_mps: Speed of sound per observation, scalar or (n,)
+        fit_muzzle_velocity: Fit MV (otherwise kept at the profile value)
+        fit_ballistic_coefficient: Fit BC (otherwise kept)
+        max_iterations: Levenberg-Marquardt iteration limit
+
+    Raises:
+        ValueError: If nothing is fitted or there are too few observations
+    """
+    distances = np.asarray(distances_m, dtype=float).ravel()
+    observed = np.asarray(elevation_holds, dtype=float).ravel()
+    densities = np.broadcast_to(
+        np.asarray(air_density_kg_m3, dtype=float), distances.shape
+    )
+    sounds = np.broadcast_to(
+        np.asarray(speed_of_sound_mps, dtype=float), distances.shape
+    )
+    usable = (
+        np.isfinite(distances)
+        & np.isfinite(observed)
+        & np.isfinite(densities)
+        & np.isfinite(sounds)
+        & (distances > 0)
+    )
+    distances, observed = distances[usable], observed[usable]
+    densities, sounds = densities[usable], sounds[usable]
+
+    free = np.array([fit_muzzle_velocity, fit_ballistic_coefficient])
+    n, p = distances.shape[0], int(free.sum())
+    if p == 0:
+        raise ValueError("Nothing to fit: enable muzzle velocity and/or BC")
+    if n < p:
+        raise ValueError(f"Truing needs at least {p} observations, got {n}")
+
+    model = _HoldModel(profile, distances, densities, sounds, per_radian(unit))
+    theta = np.log([profile.muzzle_velocity_mps, profile.ballistic_coefficient])
+    offsets = np.vstack((np.zeros(2), np.eye(2)[free] * _FD_STEP))
+
+    def evaluate(theta):
+        params = np.exp(theta + offsets)
+        holds = model.holds(params[:, 0], params[:, 1])
+        residuals = observed - holds[0]
+        jacobian = (holds[1:] - holds[0]).T / _FD_STEP  # d(predicted)/d(theta)
+        return residuals, jacobian
+
+    residuals, jacobian = evaluate(theta)
+    cost = float(residuals @ residuals)
+    damping, converged, iterations = 1e-3, False, 0
+    while iterations < max_iterations and not converged:
+        iterations += 1
+        normal = jacobian.T @ jacobian
+        gradient = jacobian.T @ residuals
+        while True:
+            scaled = normal + damping * np.diag(np.diag(normal) + 1e-12)
+            step = np.zeros(2)
+            step[free] = np.linalg.solve(scaled, gradient)
+            trial_residuals, trial_jacobian = evaluate(theta + step)
+            trial_cost = float(trial_residuals @ trial_residuals)
+            if trial_cost <= cost or damping > 1e8:
+                break
+            damping *= 4.0
+        if trial_cost > cost:
+            break
+        theta, residuals, jacobian = theta + step, trial_residuals, trial_jacobian
+        converged = np.max(np.abs(step)) < TRUING_TOLERANCE or (
+            cost - trial_cost <= TRUING_TOLERANCE * cost
+        )
+        cost = trial_cost
+        damping = max(damping / 3.0, 1e-9)
+
+    mv, bc = np.where(
+        free,
+        np.exp(theta),
+        [profile.muzzle_velocity_mps, profile.ballistic_coefficient],
+    )
+    se = np.full(2, np.nan)
+    if n > p:
+        try:
+            covariance = np.linalg.inv(jacobian.T @ jacobian) * cost / (n - p)
+            se[free] = np.sqrt(np.diag(covariance)) * np.exp(theta)[free]
+        except np.linalg.LinAlgError:
+            pass
+    total = float(((observed - observed.mean()) ** 2).sum())
+    return TruingResult(
+        profile=replace(
+            profile, muzzle_velocity_mps=float(mv), ballistic_coefficient=float(bc)
+        ),
+        initial_profile=profile,
+        unit=unit,
+        n_observations=n,
+        iterations=iterations,
+        converged=bool(converged),
+        rms_residual=float(np.sqrt(cost / n)),
+        r_squared=1.0 - cost / total if total > 0 else float("nan"),
+        residuals=residuals,
+        muzzle_velocity_se_mps=float(se[0]) if np.isfinite(se[0]) else None,
+        ballistic_coefficient_se=float(se[1]) if np.isfinite(se[1]) else None,
+    )
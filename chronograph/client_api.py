@@ -306,7 +306,7 @@ class ChronographAPI:
             session_ids_to_update = set()
 
             for measurement_data in measurements_data:
-                measurement = ChronographMeasurement(
+                created_measurements.append(ChronographMeasurement(
                     id=str(uuid.uuid4()),
                     user_id=user_id,
                     chrono_session_id=measurement_data["chrono_session_id"],
@@ -319,13 +319,13 @@ class ChronographAPI:
                     clean_bore=measurement_data.get("clean_bore", False),
                     cold_bore=measurement_data.get("cold_bore", False),
                     shot_notes=measurement_data.get("shot_notes"),
-                )
-
-                measurement_id = self._service.save_chronograph_measurement(measurement)
-                measurement.id = measurement_id
-                created_measurements.append(measurement)
+                ))
                 session_ids_to_update.add(measurement_data["chrono_session_id"])
 
+            # One bulk write instead of an insert per shot
+            if created_measurements:
+                self._service.save_chronograph_measurements(created_measurements)
+
             # Update statistics for all affected sessions
             for session_id in session_ids_to_update:
                 self._service.calculate_and_update_session_stats(user_id, session_id)
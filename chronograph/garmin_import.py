@@ -88,13 +88,13 @@ class GarminExcelProcessor:
         session_id = self.chrono_service.save_chronograph_session(
             session_model)
 
-        # Convert and save measurements
-        valid_measurements = 0
+        # Convert measurements, then save them in one bulk write
+        measurement_models = []
         skipped_measurements = 0
 
         for measurement_entity in ingest_result.measurements:
             try:
-                measurement_model = ChronographMeasurement(
+                measurement_models.append(ChronographMeasurement(
                     id=str(
                         uuid.uuid4()),
                     user_id=user_id,
@@ -107,11 +107,7 @@ class GarminExcelProcessor:
                     power_factor_kgms=measurement_entity.power_factor_kgms,
                     clean_bore=measurement_entity.clean_bore,
                     cold_bore=measurement_entity.cold_bore,
-                    shot_notes=measurement_entity.shot_notes)
-
-                self.chrono_service.save_chronograph_measurement(
-                    measurement_model)
-                valid_measurements += 1
+                    shot_notes=measurement_entity.shot_notes))
 
             except Exception as e:
                 try:
@@ -121,6 +117,18 @@ class GarminExcelProcessor:
                     pass  # Silently ignore if not in Streamlit context
                 skipped_measurements += 1
 
+        valid_measurements = 0
+        if measurement_models:
+            try:
+                valid_measurements = len(
+                    self.chrono_service.save_chronograph_measurements(measurement_models))
+            except Exception as e:
+                try:
+                    st.warning(f"Failed to save measurements: {e}")
+                except Exception:
+                    pass  # Silently ignore if not in Streamlit context
+                skipped_measurements += len(measurement_models)
+
         # Calculate and update session statistics
         if valid_measurements > 0:
             self.chrono_service.calculate_and_update_session_stats(
@@ -1,6 +1,8 @@
 from datetime import datetime, timedelta
 from typing import List, Optional, Tuple
 
+from utils.bulk_writer import BulkWriter
+
 from .business_logic import SessionStatisticsCalculator
 from .chronograph_session_models import ChronographMeasurement, ChronographSession
 from .chronograph_source_models import ChronographSource
@@ -254,24 +256,29 @@ class ChronographService:
         except Exception as e:
             raise Exception(f"Error saving session: {str(e)}")
 
+    @staticmethod
+    def _measurement_record(measurement: ChronographMeasurement) -> dict:
+        """chrono_measurements row for a ChronographMeasurement entity"""
+        return {
+            "id": measurement.id,
+            "user_id": measurement.user_id,
+            "chrono_session_id": measurement.chrono_session_id,
+            "shot_number": measurement.shot_number,
+            "speed_mps": measurement.speed_mps,
+            "delta_avg_mps": measurement.delta_avg_mps,
+            "ke_j": measurement.ke_j,
+            "power_factor_kgms": measurement.power_factor_kgms,
+            "datetime_local": measurement.datetime_local.isoformat() if measurement.datetime_local else None,
+            "clean_bore": measurement.clean_bore,
+            "cold_bore": measurement.cold_bore,
+            "shot_notes": measurement.shot_notes,
+        }
+
     def save_chronograph_measurement(
             self, measurement: ChronographMeasurement) -> str:
         """Save a ChronographMeasurement entity to Supabase"""
         try:
-            measurement_data = {
-                "id": measurement.id,
-                "user_id": measurement.user_id,
-                "chrono_session_id": measurement.chrono_session_id,
-                "shot_number": measurement.shot_number,
-                "speed_mps": measurement.speed_mps,
-                "delta_avg_mps": measurement.delta_avg_mps,
-                "ke_j": measurement.ke_j,
-                "power_factor_kgms": measurement.power_factor_kgms,
-                "datetime_local": measurement.datetime_local.isoformat() if measurement.datetime_local else None,
-                "clean_bore": measurement.clean_bore,
-                "cold_bore": measurement.cold_bore,
-                "shot_notes": measurement.shot_notes,
-            }
+            measurement_data = self._measurement_record(measurement)
 
             response = self.supabase.table(
                 "chrono_measurements").insert(measurement_data).execute()
@@ -284,6 +291,55 @@ class ChronographService:
         except Exception as e:
             raise Exception(f"Error saving measurement: {str(e)}")
 
+    def save_chronograph_measurements(
+            self,
+            measurements: List[ChronographMeasurement],
+            writer: Optional[BulkWriter] = None) -> List[str]:
+        """Save many ChronographMeasurement entities with the bulk writer
+
+        Batches are upserted on the client-generated ``id``, so a batch that
+        committed but timed out on the way back is rewritten, not duplicated,
+        when the writer retries it. If any batch fails, the batches already
+        written are deleted, so a session is never left half-imported.
+
+        Returns:
+            List[str]: IDs of the saved measurements, in input order
+
+        Raises:
+            Exception: If any batch could not be written
+        """
+        writer = writer or BulkWriter()
+        records = [self._measurement_record(m) for m in measurements]
+
+        def upsert(batch):
+            return (
+                self.supabase.table("chrono_measurements")
+                .upsert(batch, on_conflict="id")
+                .execute()
+                .data
+            )
+
+        result = writer.write(records, upsert)
+        if not result.succeeded:
+            written_ids = [record["id"] for record in result.returned]
+            cleanup_error = ""
+            try:
+                # IDs travel in the request URL, so delete in slices
+                for start in range(0, len(written_ids), 100):
+                    self.supabase.table("chrono_measurements").delete().in_(
+                        "id", written_ids[start:start + 100]
+                    ).execute()
+            except Exception as e:
+                cleanup_error = (
+                    f"; removing the {len(written_ids)} measurements already "
+                    f"saved also failed, so orphaned rows may remain ({str(e)})"
+                )
+            raise Exception(
+                f"Error saving measurements: {result.rows_failed} of {result.rows_total} "
+                f"failed ({'; '.join(result.errors)}){cleanup_error}"
+            )
+        return [record["id"] for record in records]
+
     def calculate_and_update_session_stats(
             self, user_id: str, session_id: str) -> None:
         """Calculate and update session statistics"""
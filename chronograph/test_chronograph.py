@@ -214,6 +214,78 @@ class TestChronographService(unittest.TestCase):
         self.assertIn("Error fetching bullet types", str(context.exception))
 
 
+    def _measurements(self, count):
+        return [
+            ChronographMeasurement(
+                id=str(uuid.uuid4()),
+                user_id=self.user_id,
+                chrono_session_id="session-1",
+                shot_number=i + 1,
+                speed_mps=800.0 + i,
+                datetime_local=datetime(2025, 6, 1, 10, 0, i, tzinfo=timezone.utc),
+            )
+            for i in range(count)
+        ]
+
+    def test_save_measurements_retries_with_idempotent_upserts(self):
+        """Test a batch that timed out after committing is upserted again by id"""
+        from utils.bulk_writer import BulkWriter
+
+        attempts = []
+
+        def execute_upsert(batch):
+            attempts.append([row["id"] for row in batch])
+            if len(attempts) == 1:
+                raise TimeoutError("read timed out")
+            return Mock(data=batch)
+
+        table = self.mock_supabase.table.return_value
+        table.upsert.side_effect = lambda batch, on_conflict: Mock(
+            execute=lambda: execute_upsert(batch))
+        measurements = self._measurements(3)
+
+        ids = self.service.save_chronograph_measurements(
+            measurements, BulkWriter(sleep=lambda seconds: None))
+
+        self.assertEqual(ids, [m.id for m in measurements])
+        self.assertEqual(attempts[0], attempts[1])
+        self.assertEqual(table.upsert.call_args.kwargs["on_conflict"], "id")
+        table.insert.assert_not_called()
+
+    def test_save_measurements_removes_written_batches_on_failure(self):
+        """Test a failed batch rolls back the batches already written"""
+        from utils.bulk_writer import BulkWriter
+
+        def execute_upsert(batch):
+            if batch[0]["shot_number"] == 3:
+                raise Exception("400 Bad Request")
+            return Mock(data=batch)
+
+        table = self.mock_supabase.table.return_value
+        table.upsert.side_effect = lambda batch, on_conflict: Mock(
+            execute=lambda: execute_upsert(batch))
+        measurements = self._measurements(4)
+
+        with self.assertRaises(Exception) as context:
+            self.service.save_chronograph_measurements(
+                measurements, BulkWriter(max_batch_rows=2, max_in_flight=1))
+
+        self.assertIn("2 of 4 failed", str(context.exception))
+        table.delete.return_value.in_.assert_called_once_with(
+            "id", [measurements[0].id, measurements[1].id])
+        self.assertNotIn("orphaned", str(context.exception))
+
+        table.delete.return_value.in_.return_value.execute.side_effect = Exception(
+            "503 Service Unavailable")
+        with self.assertRaises(Exception) as context:
+            self.service.save_chronograph_measurements(
+                measurements, BulkWriter(max_batch_rows=2, max_in_flight=1))
+
+        self.assertIn("2 of 4 failed", str(context.exception))
+        self.assertIn("orphaned rows may remain", str(context.exception))
+        self.assertIn("503 Service Unavailable", str(context.exception))
+
+
 class TestChronographModels(unittest.TestCase):
 
     def setUp(self):
@@ -0,0 +1,385 @@
+"""
+DOPE Analytics Engine
+
+Computes muzzle-velocity analytics for one selection (cartridge type, rifle
+and one or more of the cartridges fired from it):
+
+- Linear regressions of muzzle velocity against temperature, barometric
+  pressure and humidity, overall and per cartridge, with 95% confidence
+  bands for the fitted mean. Temperature sensitivity is also reported in
+  fps/°F, the unit powder makers publish.
+- Binned aggregates (shot count, mean and SD of velocity per weather bin).
+- Truing: effective muzzle velocity and BC fitted to the recorded elevation
+  adjustments (see ``dope.analytics.truing``).
+
+All shots of the selection are loaded with one columnar
+``get_measurement_frame`` call and every statistic is computed with grouped
+sums over the whole frame, never per shot. Results are memoized per
+(user, selection, data version) so switching tabs or re-running the page
+reuses them; the data version covers the selected sessions and the user's
+measurement revision, so any write through the DOPE service recomputes.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ballistics.solver import DEFAULT_ZERO_DISTANCE_M
+from ballistics.truing import TruingResult
+from dope.analytics.truing import compute_truing
+from dope.cache import UserLRUCache, dope_measurement_cache
+from dope.filters import sessions_data_version
+from dope.models import DopeSessionModel
+
+MPS_TO_FPS = 3.28084
+
+# Group key for the fit over all selected cartridges
+ALL_CARTRIDGES = "__all__"
+
+# Weather series plotted against muzzle velocity:
+# frame column -> (label, session median used when the shot has no reading,
+#                  bin width, sensitivity factor, sensitivity unit)
+WEATHER_SERIES: Dict[str, Tuple[str, str, float, float, str]] = {
+    "temperature_c": (
+        "Temperature (°C)",
+        "temperature_c_median",
+        5.0,
+        MPS_TO_FPS / 1.8,
+        "fps/°F",
+    ),
+    "pressure_hpa": (
+        "Barometric Pressure (hPa)",
+        "barometric_pressure_hpa_median",
+        5.0,
+        MPS_TO_FPS,
+        "fps/hPa",
+    ),
+    "humidity_pct": (
+        "Humidity (%)",
+        "relative_humidity_pct_median",
+        10.0,
+        MPS_TO_FPS,
+        "fps/%RH",
+    ),
+}
+
+VELOCITY_FIELD = "speed_mps"
+
+# Two-sided 95% Student t critical values for small degrees of freedom
+_T95_SMALL_DF = {1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571}
+_Z95 = 1.959964
+
+
+def t_critical_95(df: np.ndarray) -> np.ndarray:
+    """Two-sided 95% Student t critical values (Cornish-Fisher above df=5)"""
+    df = np.asarray(df, dtype=float)
+    z = _Z95
+    with np.errstate(divide="ignore", invalid="ignore"):
+        approx = (
+            z
+            + (z**3 + z) / (4 * df)
+            + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * df**2)
+            + (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / (384 * df**3)
+        )
+    small = np.array([_T95_SMALL_DF.get(int(d), np.nan) for d in df.ravel()])
+    result = np.where(df <= 5, small.reshape(df.shape), approx)
+    return np.where(df >= 1, result, np.nan)
+
+
+@dataclass(frozen=True)
+class AnalyticsSelection:
+    """Sessions to analyze; empty cartridge_ids selects every cartridge"""
+
+    cartridge_type: str
+    rifle_id: str
+    cartridge_ids: Tuple[str, ...] = ()
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "cartridge_ids", tuple(sorted(set(self.cartridge_ids)))
+        )
+
+    def matches(self, session: DopeSessionModel) -> bool:
+        return (
+            session.cartridge_type == self.cartridge_type
+            and session.rifle_id == self.rifle_id
+            and (not self.cartridge_ids or session.cartridge_id in self.cartridge_ids)
+        )
+
+
+@dataclass
+class RegressionSeries:
+    """Least-squares fit of velocity against one weather series"""
+
+    x_field: str
+    group: str
+    label: str
+    n: int
+    slope: float
+    intercept: float
+    r_squared: float
+    slope_ci: Tuple[float, float]
+    sensitivity: float
+    sensitivity_ci: Tuple[float, float]
+    sensitivity_unit: str
+    x: np.ndarray = field(default_factory=lambda: np.empty(0))
+    fit: np.ndarray = field(default_factory=lambda: np.empty(0))
+    band_lower: np.ndarray = field(default_factory=lambda: np.empty(0))
+    band_upper: np.ndarray = field(default_factory=lambda: np.empty(0))
+
+
+@dataclass
+class DopeAnalyticsResult:
+    """Figure-ready analytics for one selection"""
+
+    selection: AnalyticsSelection
+    session_count: int = 0
+    shot_count: int = 0
+    # Shots with velocity, weather (gaps filled from session medians) and group
+    points: pd.DataFrame = field(default_factory=pd.DataFrame)
+    group_labels: Dict[str, str] = field(default_factory=dict)
+    # x_field -> group -> fit (groups with fewer than 3 usable shots omitted)
+    regressions: Dict[str, Dict[str, RegressionSeries]] = field(default_factory=dict)
+    # x_field -> bin_start, bin_center, group, shots, speed_mps_mean, speed_mps_sd
+    bins: Dict[str, pd.DataFrame] = field(default_factory=dict)
+
+    def regression(
+        self, x_field: str, group: str = ALL_CARTRIDGES
+    ) -> Optional[RegressionSeries]:
+        return self.regressions.get(x_field, {}).get(group)
+
+
+def _cartridge_labels(frame: pd.DataFrame) -> pd.Series:
+    make = frame["cartridge_make"].fillna("")
+    model = frame["cartridge_model"].fillna("")
+    lot = frame["cartridge_lot_number"].fillna("")
+    label = (make + " " + model).str.strip()
+    label = label.where(label != "", "Unknown cartridge")
+    return label.where(lot == "", label + " (lot " + lot + ")")
+
+
+def build_points(frame: pd.DataFrame) -> pd.DataFrame:
+    """Shots with velocity, weather series and cartridge group columns"""
+    points = pd.DataFrame(
+        {
+            "dope_session_id": frame["dope_session_id"],
+            "group": frame["cartridge_id"].fillna("unknown").astype(str),
+            "group_label": _cartridge_labels(frame),
+            VELOCITY_FIELD: frame[VELOCITY_FIELD],
+        }
+    )
+    for x_field, (_, median_field, _, _, _) in WEATHER_SERIES.items():
+        points[x_field] = frame[x_field].fillna(frame[median_field])
+    return points.dropna(subset=[VELOCITY_FIELD]).reset_index(drop=True)
+
+
+def fit_regressions(
+    points: pd.DataFrame, x_field: str, grid_size: int = 50
+) -> Dict[str, RegressionSeries]:
+    """Fit velocity against x_field per group and over all points
+
+    Uses grouped sums (n, Σx, Σy, Σx², Σxy, Σy²) so all groups are solved
+    in one pass; confidence bands are evaluated on a shared x grid.
+    """
+    label, _, _, factor, unit = WEATHER_SERIES[x_field]
+    data = points.dropna(subset=[x_field, VELOCITY_FIELD])
+    if data.empty:
+        return {}
+
+    x = data[x_field].to_numpy(dtype=float)
+    y = data[VELOCITY_FIELD].to_numpy(dtype=float)
+    terms = pd.DataFrame(
+        {"n": 1.0, "sx": x, "sy": y, "sxx": x * x, "sxy": x * y, "syy": y * y},
+        index=data.index,
+    )
+    sums = terms.groupby(data["group"].to_numpy()).sum()
+    sums.loc[ALL_CARTRIDGES] = terms.sum()
+
+    n = sums["n"].to_numpy()
+    mean_x = sums["sx"].to_numpy() / n
+    mean_y = sums["sy"].to_numpy() / n
+    ss_xx = sums["sxx"].to_numpy() - n * mean_x**2
+    ss_xy = sums["sxy"].to_numpy() - n * mean_x * mean_y
+    ss_yy = sums["syy"].to_numpy() - n * mean_y**2
+
+    valid = (n >= 3) & (ss_xx > 1e-12)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = np.where(valid, ss_xy / ss_xx, np.nan)
+        intercept = mean_y - slope * mean_x
+        sse = np.clip(ss_yy - slope * ss_xy, 0.0, None)
+        r_squared = np.where(ss_yy > 0, 1.0 - sse / ss_yy, 1.0)
+        resid_sd = np.sqrt(sse / (n - 2))
+        t_crit = t_critical_95(n - 2)
+        slope_half = t_crit * resid_sd / np.sqrt(ss_xx)
+
+    grid = np.linspace(x.min(), x.max(), grid_size)
+    # (groups, grid) arrays of fitted means and confidence half-widths
+    fit = intercept[:, None] + slope[:, None] * grid[None, :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        band_half = (t_crit * resid_sd)[:, None] * np.sqrt(
+            1.0 / n[:, None] + (grid[None, :] - mean_x[:, None]) ** 2 / ss_xx[:, None]
+        )
+
+    fits: Dict[str, RegressionSeries] = {}
+    for i, group in enumerate(sums.index):
+        if not valid[i]:
+            continue
+        slope_ci = (slope[i] - slope_half[i], slope[i] + slope_half[i])
+        fits[group] = RegressionSeries(
+            x_field=x_field,
+            group=group,
+            label=label,
+            n=int(n[i]),
+            slope=float(slope[i]),
+            intercept=float(intercept[i]),
+            r_squared=float(r_squared[i]),
+            slope_ci=(float(slope_ci[0]), float(slope_ci[1])),
+            sensitivity=float(slope[i] * factor),
+            sensitivity_ci=(float(slope_ci[0] * factor), float(slope_ci[1] * factor)),
+            sensitivity_unit=unit,
+            x=grid,
+            fit=fit[i],
+            band_lower=fit[i] - band_half[i],
+            band_upper=fit[i] + band_half[i],
+        )
+    return fits
+
+
+def bin_velocity(points: pd.DataFrame, x_field: str) -> pd.DataFrame:
+    """Shot count, mean and SD of velocity per weather bin and group"""
+    width = WEATHER_SERIES[x_field][2]
+    data = points.dropna(subset=[x_field])
+    columns = [
+        "bin_start", "bin_center", "group", "shots",
+        "speed_mps_mean", "speed_mps_sd",
+    ]
+    if data.empty:
+        return pd.DataFrame(columns=columns)
+
+    bin_start = np.floor(data[x_field].to_numpy(dtype=float) / width) * width
+    frames = []
+    for group_values in (data["group"].to_numpy(), np.full(len(data), ALL_CARTRIDGES)):
+        frames.append(
+            data.groupby([bin_start, group_values])[VELOCITY_FIELD]
+            .agg(["count", "mean", "std"])
+            .rename_axis(["bin_start", "group"])
+            .reset_index()
+        )
+    binned = pd.concat(frames, ignore_index=True).rename(
+        columns={"count": "shots", "mean": "speed_mps_mean", "std": "speed_mps_sd"}
+    )
+    binned["bin_center"] = binned["bin_start"] + width / 2
+    return binned[columns].sort_values(["group", "bin_start"]).reset_index(drop=True)
+
+
+def compute_analytics(
+    selection: AnalyticsSelection, frame: pd.DataFrame
+) -> DopeAnalyticsResult:
+    """Compute all analytics for a selection from its measurement frame"""
+    points = build_points(frame)
+    labels = dict(zip(points["group"], points["group_label"]))
+    labels[ALL_CARTRIDGES] = "All cartridges"
+    return DopeAnalyticsResult(
+        selection=selection,
+        session_count=int(frame["dope_session_id"].nunique()),
+        shot_count=len(frame),
+        points=points,
+        group_labels=labels,
+        regressions={x: fit_regressions(points, x) for x in WEATHER_SERIES},
+        bins={x: bin_velocity(points, x) for x in WEATHER_SERIES},
+    )
+
+
+def selection_options(
+    sessions: Sequence[DopeSessionModel],
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Selectable cartridge types -> rifles -> cartridges present in sessions
+
+    Returns:
+        {cartridge_type: {rifle_id: {"rifle_name": str,
+                                     "cartridges": {cartridge_id: label}}}}
+    """
+    options: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for s in sessions:
+        if not (s.cartridge_type and s.rifle_id and s.cartridge_id):
+            continue
+        rifle = options.setdefault(s.cartridge_type, {}).setdefault(
+            s.rifle_id, {"rifle_name": s.rifle_name or "Unknown", "cartridges": {}}
+        )
+        label = f"{s.cartridge_make or ''} {s.cartridge_model or ''}".strip()
+        rifle["cartridges"][s.cartridge_id] = label or "Unknown cartridge"
+    return options
+
+
+class DopeAnalyticsEngine:
+    """Memoized analytics per (user, selection, data version)"""
+
+    def __init__(self, max_results: int = 32):
+        self._results: UserLRUCache[DopeAnalyticsResult] = UserLRUCache(
+            max_entries=max_results, ttl_seconds=None
+        )
+        self._truing: UserLRUCache[TruingResult] = UserLRUCache(
+            max_entries=max_results, ttl_seconds=None
+        )
+
+    def data_version(
+        self, user_id: str, sessions: Sequence[DopeSessionModel]
+    ) -> Hashable:
+        return (
+            sessions_data_version(sessions),
+            dope_measurement_cache.revision(user_id),
+        )
+
+    def analyze(
+        self, dope_api, user_id: str, selection: AnalyticsSelection
+    ) -> DopeAnalyticsResult:
+        """Return analytics for the selection, computing them on a cache miss"""
+        sessions = [
+            s for s in dope_api.get_sessions_for_user(user_id) if selection.matches(s)
+        ]
+        key = (user_id, selection, self.data_version(user_id, sessions))
+        cached = self._results.get(key)
+        if cached is not None:
+            return cached
+
+        frame = dope_api.get_measurement_frame([s.id for s in sessions], user_id)
+        result = compute_analytics(selection, frame)
+        self._results.put(key, result)
+        return result
+
+    def true_profile(
+        self,
+        dope_api,
+        user_id: str,
+        selection: AnalyticsSelection,
+        zero_distance_m: float = DEFAULT_ZERO_DISTANCE_M,
+    ) -> TruingResult:
+        """Effective MV and BC fitted to the selection's elevation holds
+
+        Raises:
+            ValueError: If the selection has no single load to start from or
+                too few shots with a distance and elevation adjustment
+        """
+        sessions = [
+            s for s in dope_api.get_sessions_for_user(user_id) if selection.matches(s)
+        ]
+        key = (
+            user_id,
+            selection,
+            zero_distance_m,
+            self.data_version(user_id, sessions),
+        )
+        cached = self._truing.get(key)
+        if cached is not None:
+            return cached
+
+        frame = dope_api.get_measurement_frame([s.id for s in sessions], user_id)
+        result = compute_truing(sessions, frame, zero_distance_m)
+        self._truing.put(key, result)
+        return result
+
+
+# Process-wide engine shared by all page reruns
+analytics_engine = DopeAnalyticsEngine()
@@ -0,0 +1,117 @@
+"""
+DOPE truing: calibrate a ballistic profile from recorded elevation holds.
+
+Every shot with a distance and an elevation adjustment is one observation of
+the real trajectory. ``truing_observations`` turns a measurement frame into
+distances, holds and per-shot air (shot weather, else the session medians,
+else the standard atmosphere at the range altitude) in one vectorized pass;
+``compute_truing`` fits the effective muzzle velocity and BC over all of them
+with ``ballistics.truing.true_profile``.
+
+Scope adjustments are recorded in MIL (mrad), as in the sample data.
+"""
+
+from dataclasses import replace
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from ballistics.atmosphere import atmosphere, standard_atmosphere
+from ballistics.models import BallisticProfile
+from ballistics.solver import DEFAULT_ZERO_DISTANCE_M
+from ballistics.truing import TruingResult, true_profile
+from dope.models import DopeSessionModel
+
+ADJUSTMENT_UNIT = "mil"
+
+# Shot weather column -> session median used when the shot has no reading
+_TRUING_WEATHER = {
+    "temperature_c": "temperature_c_median",
+    "pressure_hpa": "barometric_pressure_hpa_median",
+    "humidity_pct": "relative_humidity_pct_median",
+}
+
+
+def truing_observations(frame: pd.DataFrame) -> pd.DataFrame:
+    """Shots usable for truing with distance_m, elevation_hold and their air"""
+    weather = {
+        shot: frame[shot].fillna(frame[median])
+        for shot, median in _TRUING_WEATHER.items()
+    }
+    measured = weather["temperature_c"].notna() & weather["pressure_hpa"].notna()
+    standard_density, standard_sound = standard_atmosphere(
+        frame["start_altitude"].fillna(0.0).to_numpy()
+    )
+    air = atmosphere(
+        weather["temperature_c"].to_numpy(dtype=float),
+        weather["pressure_hpa"].to_numpy(dtype=float),
+        weather["humidity_pct"].to_numpy(dtype=float),
+    )
+    observations = pd.DataFrame(
+        {
+            "dope_session_id": frame["dope_session_id"],
+            "distance_m": frame["distance_m"],
+            "elevation_hold": frame["elevation_adjustment"],
+            "air_density_kg_m3": np.where(
+                measured, air.air_density_kg_m3, standard_density
+            ),
+            "speed_of_sound_mps": np.where(
+                measured, air.speed_of_sound_mps, standard_sound
+            ),
+        }
+    )
+    usable = (observations["distance_m"] > 0) & observations["elevation_hold"].notna()
+    return observations[usable].reset_index(drop=True)
+
+
+def initial_profile(
+    sessions: Sequence[DopeSessionModel],
+    frame: pd.DataFrame,
+    zero_distance_m: float = DEFAULT_ZERO_DISTANCE_M,
+) -> BallisticProfile:
+    """Starting profile: the sessions' load with the mean chronographed velocity
+
+    Raises:
+        ValueError: If the shots mix bullets or no session has a BC and velocity
+    """
+    if frame["bullet_id"].nunique() > 1:
+        raise ValueError("Truing needs shots of a single bullet")
+    profile = None
+    for session in sessions:
+        try:
+            profile = BallisticProfile.from_dope_session(
+                session,
+                sight_offset=session.rifle_sight_offset,
+                zero_distance_m=zero_distance_m,
+            )
+            break
+        except ValueError:
+            continue
+    if profile is None:
+        raise ValueError("No session has a muzzle velocity and a BC to start from")
+    mean_speed = frame["speed_mps"].mean()
+    if pd.notna(mean_speed) and mean_speed > 0:
+        profile = replace(profile, muzzle_velocity_mps=float(mean_speed))
+    return profile
+
+
+def compute_truing(
+    sessions: Sequence[DopeSessionModel],
+    frame: pd.DataFrame,
+    zero_distance_m: float = DEFAULT_ZERO_DISTANCE_M,
+) -> TruingResult:
+    """Fit effective muzzle velocity and BC to every recorded elevation hold
+
+    Raises:
+        ValueError: If there is no starting profile or too few observations
+    """
+    observations = truing_observations(frame)
+    return true_profile(
+        initial_profile(sessions, frame, zero_distance_m),
+        observations["distance_m"].to_numpy(),
+        observations["elevation_hold"].to_numpy(),
+        unit=ADJUSTMENT_UNIT,
+        air_density_kg_m3=observations["air_density_kg_m3"].to_numpy(),
+        speed_of_sound_mps=observations["speed_of_sound_mps"].to_numpy(),
+    )
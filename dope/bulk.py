@@ -0,0 +1,145 @@
+"""
+Helpers for bulk DOPE writes.
+
+``diff_measurement_frames`` compares an original and an edited measurements
+frame column by column (NaN-aware, with a float tolerance) and returns only
+the changed cells per measurement, ready for
+``DopeService.update_measurements_bulk``. ``chunked`` splits bulk payloads
+and ID lists (for ``in_`` filters) into statement-sized batches.
+"""
+
+from typing import Any, Dict, Iterator, List, Sequence, TypeVar
+
+import numpy as np
+import pandas as pd
+
+T = TypeVar("T")
+
+# Default number of rows sent per bulk statement
+BULK_CHUNK_SIZE = 200
+
+# IDs per ``in_`` filter (set-based deletes and multi-session reads); the
+# filter travels in the request URL
+ID_CHUNK_SIZE = 100
+
+# Editable measurement fields compared as numbers
+MEASUREMENT_NUMERIC_FIELDS = (
+    "shot_number",
+    "speed_mps",
+    "ke_j",
+    "power_factor_kgms",
+    "azimuth_deg",
+    "elevation_angle_deg",
+    "temperature_c",
+    "pressure_hpa",
+    "humidity_pct",
+    "distance_m",
+)
+
+# Adjustments are stored as text but compared numerically when both parse
+MEASUREMENT_NUMERIC_TEXT_FIELDS = ("elevation_adjustment", "windage_adjustment")
+
+MEASUREMENT_TEXT_FIELDS = ("clean_bore", "cold_bore", "shot_notes")
+
+MEASUREMENT_EDITABLE_FIELDS = (
+    MEASUREMENT_NUMERIC_FIELDS
+    + MEASUREMENT_NUMERIC_TEXT_FIELDS
+    + MEASUREMENT_TEXT_FIELDS
+)
+
+_FLOAT_TOLERANCE = 1e-6
+
+
+def chunked(items: Sequence[T], size: int = BULK_CHUNK_SIZE) -> Iterator[List[T]]:
+    """Yield consecutive lists of at most size items"""
+    size = max(1, int(size))
+    for start in range(0, len(items), size):
+        yield list(items[start:start + size])
+
+
+def _blank_to_nan(column: pd.Series) -> pd.Series:
+    """Treat None and empty/whitespace strings as missing"""
+    column = column.astype(object)
+    blank = column.map(lambda v: isinstance(v, str) and not v.strip())
+    return column.mask(blank | column.isna(), np.nan)
+
+
+def _numeric_changed(original: pd.Series, edited: pd.Series) -> pd.Series:
+    left = pd.to_numeric(_blank_to_nan(original), errors="coerce").astype(float)
+    right = pd.to_numeric(_blank_to_nan(edited), errors="coerce").astype(float)
+    same = np.isclose(left, right, rtol=0.0, atol=_FLOAT_TOLERANCE, equal_nan=True)
+    return pd.Series(~same, index=original.index)
+
+
+def _text_changed(original: pd.Series, edited: pd.Series) -> pd.Series:
+    left = _blank_to_nan(original)
+    right = _blank_to_nan(edited)
+    both_missing = left.isna() & right.isna()
+    return ~both_missing & (left.astype(str) != right.astype(str))
+
+
+def _python_value(value: Any, field: str) -> Any:
+    """Convert a frame cell to the value stored in the database"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if isinstance(value, str) and not value.strip():
+        return None
+    if field in MEASUREMENT_NUMERIC_FIELDS:
+        number = float(value)
+        return int(round(number)) if field == "shot_number" else number
+    if field in MEASUREMENT_NUMERIC_TEXT_FIELDS:
+        return str(value)
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def diff_measurement_frames(
+    original: pd.DataFrame, edited: pd.DataFrame
+) -> Dict[str, Dict[str, Any]]:
+    """Return changed measurement fields keyed by measurement ID
+
+    Both frames must be indexed by measurement ID and use measurement field
+    names (metric units) as columns. Only rows present in both frames and
+    columns in MEASUREMENT_EDITABLE_FIELDS are compared.
+
+    Args:
+        original: Measurement values before editing
+        edited: Measurement values after editing
+
+    Returns:
+        Dict[str, Dict[str, Any]]: {measurement_id: {field: new_value}} for
+            rows with at least one changed field
+    """
+    columns = [
+        c for c in MEASUREMENT_EDITABLE_FIELDS
+        if c in original.columns and c in edited.columns
+    ]
+    rows = original.index.intersection(edited.index)
+    if not columns or rows.empty:
+        return {}
+
+    left = original.loc[rows, columns]
+    right = edited.loc[rows, columns]
+
+    changed = pd.DataFrame(False, index=rows, columns=columns)
+    for column in columns:
+        if column in MEASUREMENT_TEXT_FIELDS:
+            changed[column] = _text_changed(left[column], right[column])
+            continue
+        numeric = _numeric_changed(left[column], right[column])
+        if column in MEASUREMENT_NUMERIC_TEXT_FIELDS:
+            # Non-numeric adjustment text falls back to a string comparison
+            unparsed = pd.to_numeric(
+                _blank_to_nan(right[column]), errors="coerce"
+            ).isna() & _blank_to_nan(right[column]).notna()
+            numeric = numeric.where(
+                ~unparsed, _text_changed(left[column], right[column])
+            )
+        changed[column] = numeric
+
+    changes: Dict[str, Dict[str, Any]] = {}
+    stacked = changed.stack()
+    for measurement_id, column in stacked[stacked].index:
+        changes.setdefault(str(measurement_id), {})[column] = _python_value(
+            right.at[measurement_id, column], column
+        )
+    return changes
@@ -0,0 +1,254 @@
+"""
+Per-user caching for DOPE session reads.
+
+``DopeService.get_sessions_for_user`` runs a five-table nested join. The view
+page, autocomplete values, the create wizard and filtering all need the same
+list, so it is cached per user in a bounded LRU shared by every
+``DopeService`` instance in the process. Writes made through the DOPE service
+invalidate the owning user's entry (write-through invalidation); a TTL bounds
+staleness from writes made by other processes. Each cached list carries a
+revision that caches of data derived from it (filter frames, sort orders, the
+search index) use as their key instead of fingerprinting the sessions.
+
+Measurement lists are cached per (user, DOPE session) the same way. Updates
+patch the cached list in place so the shots editor does not refetch after a
+save. Per-session summaries are cached per user and patched when the
+service refreshes them; aggregate session statistics are cached per user and
+dropped on any session write. Every measurement write also bumps a per-user
+revision, which caches of data derived from measurements (analytics) include
+in their keys.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from .models import DopeMeasurementModel, DopeSessionModel, DopeSessionSummaryModel
+
+T = TypeVar("T")
+
+
+class UserLRUCache(Generic[T]):
+    """Thread-safe LRU cache of one value per key with an optional TTL"""
+
+    def __init__(self, max_entries: int = 64, ttl_seconds: Optional[float] = 300.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, T]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._clock: Callable[[], float] = time.monotonic
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[T]:
+        """Return the cached value or None if missing/expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, value = entry
+            if self.ttl_seconds is not None and (
+                self._clock() - stored_at > self.ttl_seconds
+            ):
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: T) -> None:
+        """Store a value, evicting the least recently used entries if full"""
+        with self._lock:
+            self._entries[key] = (self._clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], T]) -> T:
+        """Return the cached value, calling loader and caching it on a miss"""
+        value = self.get(key)
+        if value is None:
+            value = loader()
+            self.put(key, value)
+        return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one entry, or every entry when key is None"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
+class DopeSessionCache(UserLRUCache[Tuple[int, List[DopeSessionModel]]]):
+    """Cache of each user's joined DOPE session list
+
+    Every stored list is stamped with a process-wide revision, so the revision
+    returned with a list identifies exactly that cache entry.
+    """
+
+    def __init__(self, max_entries: int = 64, ttl_seconds: Optional[float] = 300.0):
+        super().__init__(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._next_revision = 0
+
+    def get_sessions(self, user_id: str) -> Optional[List[DopeSessionModel]]:
+        """Return a copy of the cached session list for a user, if present"""
+        entry = self.get_versioned(user_id)
+        return entry[0] if entry is not None else None
+
+    def get_versioned(
+        self, user_id: str
+    ) -> Optional[Tuple[List[DopeSessionModel], int]]:
+        """Return a copy of the cached session list and its revision, if present"""
+        entry = self.get(user_id)
+        if entry is None:
+            return None
+        revision, sessions = entry
+        return list(sessions), revision
+
+    def put_sessions(self, user_id: str, sessions: List[DopeSessionModel]) -> None:
+        """Cache a user's session list under a new revision"""
+        with self._lock:
+            self._next_revision += 1
+            revision = self._next_revision
+        self.put(user_id, (revision, list(sessions)))
+
+
+class DopeMeasurementCache(UserLRUCache[List[DopeMeasurementModel]]):
+    """Cache of measurement lists keyed by (user_id, dope_session_id)"""
+
+    def __init__(self, max_entries: int = 64, ttl_seconds: Optional[float] = 300.0):
+        super().__init__(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._revisions: Dict[str, int] = {}
+        self._generation = 0
+
+    def revision(self, user_id: str) -> Tuple[int, int]:
+        """Version of a user's measurements; changes on every write or invalidation"""
+        with self._lock:
+            return (self._generation, self._revisions.get(user_id, 0))
+
+    def _bump(self, user_id: str) -> None:
+        self._revisions[user_id] = self._revisions.get(user_id, 0) + 1
+
+    def get_measurements(
+        self, user_id: str, dope_session_id: str
+    ) -> Optional[List[DopeMeasurementModel]]:
+        """Return a copy of the cached measurements for a session, if present"""
+        measurements = self.get((user_id, dope_session_id))
+        return list(measurements) if measurements is not None else None
+
+    def put_measurements(
+        self,
+        user_id: str,
+        dope_session_id: str,
+        measurements: List[DopeMeasurementModel],
+    ) -> None:
+        """Cache a session's measurement list"""
+        self.put((user_id, dope_session_id), list(measurements))
+
+    def patch_measurements(
+        self,
+        user_id: str,
+        dope_session_id: str,
+        updated: List[DopeMeasurementModel],
+    ) -> int:
+        """Replace cached measurements by ID in place
+
+        Returns:
+            int: Number of cached measurements replaced (0 if not cached)
+        """
+        by_id = {m.id: m for m in updated}
+        with self._lock:
+            self._bump(user_id)
+            entry = self._entries.get((user_id, dope_session_id))
+            if entry is None:
+                return 0
+            measurements = entry[1]
+            replaced = 0
+            for position, measurement in enumerate(measurements):
+                if measurement.id in by_id:
+                    measurements[position] = by_id[measurement.id]
+                    replaced += 1
+            return replaced
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Drop every cached measurement list for a user"""
+        with self._lock:
+            self._bump(user_id)
+            for key in [k for k in self._entries if k[0] == user_id]:
+                del self._entries[key]
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one entry, or every entry when key is None"""
+        super().invalidate(key)
+        with self._lock:
+            if key is None:
+                self._generation += 1
+            else:
+                self._bump(key[0])
+
+
+class DopeSummaryCache(UserLRUCache[Dict[str, DopeSessionSummaryModel]]):
+    """Cache of each user's session summaries keyed by DOPE session ID"""
+
+    def get_summaries(
+        self, user_id: str
+    ) -> Optional[Dict[str, DopeSessionSummaryModel]]:
+        """Return a copy of the cached summaries for a user, if present"""
+        summaries = self.get(user_id)
+        return dict(summaries) if summaries is not None else None
+
+    def put_summaries(
+        self, user_id: str, summaries: Dict[str, DopeSessionSummaryModel]
+    ) -> None:
+        """Cache a user's summaries"""
+        self.put(user_id, dict(summaries))
+
+    def patch_summaries(
+        self, user_id: str, summaries: List[DopeSessionSummaryModel]
+    ) -> bool:
+        """Replace or add summaries in a cached entry
+
+        Returns:
+            bool: True if the user had a cached entry to patch
+        """
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return False
+            for summary in summaries:
+                entry[1][summary.dope_session_id] = summary
+            return True
+
+    def drop_summaries(self, user_id: str, session_ids: List[str]) -> None:
+        """Remove sessions from a cached entry so the next read reloads them"""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return
+            for session_id in session_ids:
+                entry[1].pop(session_id, None)
+
+
+# Process-wide caches shared by all DopeService instances (one per rerun)
+dope_session_cache = DopeSessionCache()
+dope_measurement_cache = DopeMeasurementCache(max_entries=256)
+dope_summary_cache = DopeSummaryCache()
+dope_statistics_cache: UserLRUCache[Dict[str, Any]] = UserLRUCache()
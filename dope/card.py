@@ -0,0 +1,174 @@
+"""
+Cached DOPE cards for DOPE sessions.
+
+A DOPE card depends only on the bullet (drag model and BC), muzzle velocity,
+sight height, zero distance and the air. The shots tab reruns on every
+range-day edit, so ``DopeCardGenerator`` memoizes cards in a bounded LRU keyed
+by those inputs, with muzzle velocity and density altitude bucketed. Each card
+is computed at its bucket centres in the standard atmosphere, so sessions
+shot with the same load in similar air share one card. A card is a pure
+function of its key, so entries never expire. Windage for a session is read
+from the card's per-m/s drift at the session's median crosswind.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Iterable, Optional, Sequence, Tuple
+
+from ballistics.atmosphere import atmosphere, standard_atmosphere
+from ballistics.card import DEFAULT_CARD_DISTANCES_M, DopeCard, compute_dope_card
+from ballistics.models import BallisticProfile
+from ballistics.solver import DEFAULT_ZERO_DISTANCE_M
+
+from .cache import UserLRUCache
+from .models import DopeSessionModel
+
+MV_BUCKET_MPS = 2.0
+DENSITY_ALTITUDE_BUCKET_M = 100.0
+CARD_DISTANCE_STEP_M = 25.0
+
+
+@dataclass(frozen=True)
+class DopeCardKey:
+    """Bucketed inputs that identify one cached DOPE card"""
+
+    drag_model: str
+    ballistic_coefficient: float
+    muzzle_velocity_mps: float  # bucket centre
+    sight_height_mm: float
+    zero_distance_m: float
+    density_altitude_m: float  # bucket centre
+    distances_m: Tuple[float, ...]
+
+
+def _bucket(value: float, width: float) -> float:
+    return round(value / width) * width
+
+
+def session_density_altitude_m(session: DopeSessionModel) -> float:
+    """Density altitude of a session's median weather
+
+    Falls back to the range's start altitude, then to sea level, when the
+    session has no temperature or pressure.
+    """
+    if (
+        session.temperature_c_median is not None
+        and session.barometric_pressure_hpa_median
+    ):
+        air = atmosphere(
+            session.temperature_c_median,
+            session.barometric_pressure_hpa_median,
+            session.relative_humidity_pct_median or 0.0,
+        )
+        return float(air.density_altitude_m)
+    return float(session.start_altitude or 0.0)
+
+
+def session_crosswind_mps(session: DopeSessionModel) -> Optional[float]:
+    """Full-value crosswind of a session's median wind, positive left to right
+
+    The wind direction is where the wind blows from and the range azimuth is
+    the line of fire, both in compass degrees. None when either is missing.
+    """
+    if (
+        session.wind_speed_mps_median is None
+        or session.wind_direction_deg_median is None
+        or session.azimuth_deg is None
+    ):
+        return None
+    relative = math.radians(session.wind_direction_deg_median - session.azimuth_deg)
+    return -session.wind_speed_mps_median * math.sin(relative)
+
+
+def card_distances_for(distances_m: Iterable[Optional[float]]) -> Tuple[float, ...]:
+    """Distance grid covering the given distances out to at least 1000 m
+
+    The grid only grows in whole 100 m steps, so editing a shot's distance
+    rarely changes the card key.
+    """
+    farthest = max((d for d in distances_m if d), default=0.0)
+    end = max(1000.0, math.ceil(farthest / 100.0) * 100.0)
+    steps = int(end // CARD_DISTANCE_STEP_M)
+    return tuple(CARD_DISTANCE_STEP_M * i for i in range(1, steps + 1))
+
+
+class DopeCardGenerator:
+    """Bounded, process-wide memo of DOPE cards"""
+
+    def __init__(self, max_cards: int = 256):
+        self._cards: UserLRUCache[DopeCard] = UserLRUCache(
+            max_entries=max_cards, ttl_seconds=None
+        )
+
+    @property
+    def hits(self) -> int:
+        return self._cards.hits
+
+    @property
+    def misses(self) -> int:
+        return self._cards.misses
+
+    def card_key(
+        self,
+        profile: BallisticProfile,
+        density_altitude: float = 0.0,
+        distances_m: Sequence[float] = DEFAULT_CARD_DISTANCES_M,
+    ) -> DopeCardKey:
+        return DopeCardKey(
+            drag_model=profile.drag_model,
+            ballistic_coefficient=round(profile.ballistic_coefficient, 4),
+            muzzle_velocity_mps=_bucket(profile.muzzle_velocity_mps, MV_BUCKET_MPS),
+            sight_height_mm=round(profile.sight_height_m * 1000.0, 1),
+            zero_distance_m=float(profile.zero_distance_m),
+            density_altitude_m=_bucket(density_altitude, DENSITY_ALTITUDE_BUCKET_M),
+            distances_m=tuple(sorted(float(d) for d in distances_m)),
+        )
+
+    def card(
+        self,
+        profile: BallisticProfile,
+        density_altitude: float = 0.0,
+        distances_m: Sequence[float] = DEFAULT_CARD_DISTANCES_M,
+    ) -> DopeCard:
+        """Cached card for a profile at a density altitude"""
+        key = self.card_key(profile, density_altitude, distances_m)
+        return self._cards.get_or_load(key, lambda: self._compute(key))
+
+    def card_for_session(
+        self,
+        session: DopeSessionModel,
+        zero_distance_m: float = DEFAULT_ZERO_DISTANCE_M,
+        distances_m: Sequence[float] = DEFAULT_CARD_DISTANCES_M,
+    ) -> DopeCard:
+        """Cached card for a DOPE session's load, rifle and median weather
+
+        Raises:
+            ValueError: If the session has no average velocity or usable BC
+        """
+        profile = BallisticProfile.from_dope_session(
+            session,
+            sight_offset=session.rifle_sight_offset,
+            zero_distance_m=zero_distance_m,
+        )
+        return self.card(profile, session_density_altitude_m(session), distances_m)
+
+    def clear(self) -> None:
+        self._cards.invalidate()
+
+    @staticmethod
+    def _compute(key: DopeCardKey) -> DopeCard:
+        profile = BallisticProfile(
+            muzzle_velocity_mps=key.muzzle_velocity_mps,
+            ballistic_coefficient=key.ballistic_coefficient,
+            drag_model=key.drag_model,
+            sight_height_m=key.sight_height_mm / 1000.0,
+            zero_distance_m=key.zero_distance_m,
+        )
+        density, sound = standard_atmosphere(key.density_altitude_m)
+        return compute_dope_card(
+            profile, key.distances_m, float(density), float(sound)
+        )
+
+
+# Process-wide generator shared by every page
+dope_card_generator = DopeCardGenerator()
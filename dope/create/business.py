@@ -5,16 +5,20 @@ Handles the business logic and data processing for DOPE session creation.
 """
 
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
+from bullets.api import BulletsAPI
 from cartridges.api import CartridgesAPI
 from cartridges.models import CartridgeModel, CartridgeTypeModel
 from chronograph.chronograph_session_models import (
     ChronographSession,
 )
 from chronograph.client_api import ChronographAPI
-from dope.service import DopeService
+from dope.cache import dope_session_cache
 from dope.models import DopeSessionModel
+from dope.options import options_loader
+from dope.service import UNUSED_CHRONO_PAGE_SIZE, DopeService
+from dope.stability import RifleStabilityIndex, bullet_stability_indexer
 from dope.weather_associator import WeatherSessionAssociator
 from mapping.submission.submission_model import SubmissionModel
 from rifles.api import RiflesAPI
@@ -36,42 +40,39 @@ class DopeCreateBusiness:
         self.weather_associator = WeatherSessionAssociator(supabase)
         self.submission_model = SubmissionModel()
 
-    def get_unused_chrono_sessions(self, user_id: str) -> List[ChronographSession]:
-        """Get chronograph sessions not yet used in any DOPE session"""
+    def _get_option(self, user_id: str, source: str) -> list:
+        """Get one option list from the shared loader
+
+        Only this source is read on a miss; its list is memoized per user.
+        """
+        options = options_loader.load(self.supabase, user_id, sources=(source,))
+        error = options.error_for(source)
+        if error:
+            raise Exception(error)
+        return options.get(source)
+
+    def get_unused_chrono_sessions(
+        self, user_id: str, limit: int = UNUSED_CHRONO_PAGE_SIZE, offset: int = 0
+    ) -> List[ChronographSession]:
+        """Get one page of chronograph sessions not yet used in any DOPE session"""
         try:
-            # Get all chrono sessions for user
-            all_chrono_sessions = self.chrono_api.get_all_sessions(user_id)
-
-            # Get all DOPE sessions to find used chrono session IDs
-            all_dope_sessions = self.dope_service.get_sessions_for_user(user_id)
-            used_chrono_ids = {
-                session.chrono_session_id
-                for session in all_dope_sessions
-                if session.chrono_session_id
-            }
-
-            # Filter out already used sessions
-            unused_sessions = [
-                session
-                for session in all_chrono_sessions
-                if session.id not in used_chrono_ids
-            ]
-
-            return unused_sessions
+            return self.dope_service.get_unused_chrono_sessions(
+                user_id, limit=limit, offset=offset
+            )
         except Exception as e:
             raise Exception(f"Error loading chronograph sessions: {str(e)}")
 
     def get_rifles_for_user(self, user_id: str) -> List[RifleModel]:
         """Get rifles for user"""
         try:
-            return self.rifle_api.get_all_rifles(user_id)
+            return self._get_option(user_id, "rifles")
         except Exception as e:
             raise Exception(f"Error loading rifles: {str(e)}")
 
     def get_cartridges_for_user(self, user_id: str) -> List[CartridgeModel]:
         """Get cartridges for user"""
         try:
-            return self.cartridge_api.get_all_cartridges(user_id)
+            return self._get_option(user_id, "cartridges")
         except Exception as e:
             raise Exception(f"Error loading cartridges: {str(e)}")
 
@@ -86,14 +87,14 @@ class DopeCreateBusiness:
         """Get ranges for user"""
         try:
             # TODO - return type is not a model but a dict
-            return self.submission_model.get_user_ranges(user_id, self.supabase)
+            return self._get_option(user_id, "ranges")
         except Exception as e:
             raise Exception(f"Error loading ranges: {str(e)}")
 
     def get_weather_sources_for_user(self, user_id: str) -> List[WeatherSource]:
         """Get weather sources for user"""
         try:
-            return self.weather_api.get_all_sources(user_id)
+            return self._get_option(user_id, "weather_sources")
         except Exception as e:
             raise Exception(f"Error loading weather sources: {str(e)}")
 
@@ -106,6 +107,16 @@ class DopeCreateBusiness:
         except Exception as e:
             raise Exception(f"Error getting time window: {str(e)}")
 
+    def get_stability_index(self, rifle) -> Optional[RifleStabilityIndex]:
+        """Cached stability of the bullet catalog in a rifle, or None on error"""
+        try:
+            return bullet_stability_indexer.index_for_rifle(
+                rifle, BulletsAPI(self.supabase).get_all_bullets
+            )
+        except Exception as e:
+            print(f"Error computing bullet stability: {str(e)}")
+            return None
+
     def filter_cartridges_by_rifle_type(
         self, cartridges, rifle_cartridge_type: str
     ) -> List[CartridgeModel]:
@@ -159,6 +170,14 @@ class DopeCreateBusiness:
 
         return filtered
 
+    def filter_stabilized_cartridges(
+        self, cartridges, stability_index: Optional[RifleStabilityIndex]
+    ) -> List[CartridgeModel]:
+        """Drop cartridges whose bullet the rifle may not stabilize"""
+        if stability_index is None:
+            return cartridges
+        return stability_index.filter_stabilized(cartridges, lambda c: c.bullet_id)
+
     def create_dope_session(self, session_data: dict, user_id: str):
         """Create a new DOPE session"""
         try:
@@ -183,7 +202,10 @@ class DopeCreateBusiness:
             raise Exception(f"Weather association failed: {str(e)}")
 
     def update_session_with_weather_data(
-        self, session_id: str, weather_association_results: dict
+        self,
+        session_id: str,
+        weather_association_results: dict,
+        user_id: Optional[str] = None,
     ):
         """Update DOPE session with median weather values"""
         try:
@@ -217,6 +239,12 @@ class DopeCreateBusiness:
                     "id", session_id
                 ).execute()
 
+                # Cached session lists still hold the pre-weather values
+                if user_id:
+                    self.dope_service.invalidate_cache(user_id)
+                else:
+                    dope_session_cache.invalidate()
+
         except Exception as e:
             raise Exception(f"Error updating session with weather data: {str(e)}")
 
@@ -8,6 +8,9 @@ using a wizard-style workflow. It coordinates between the business logic and UI
 
 import streamlit as st
 
+from dope.options import options_loader
+from dope.service import UNUSED_CHRONO_PAGE_SIZE
+
 from .business import DopeCreateBusiness
 from .view import DopeCreateView
 
@@ -32,8 +35,11 @@ def render_create_page(user, supabase):
     
     # Reset state when navigating from another page (detect fresh page load)
     if "dope_create_initialized" not in dope_create_state:
+        # Fresh wizard: reload option lists once, then reuse them per step
+        options_loader.invalidate(user["id"])
         dope_create_state["wizard_step"] = 1
         dope_create_state["wizard_data"] = {}
+        dope_create_state.pop("chrono_session_limit", None)
         dope_create_state["dope_create_initialized"] = True
     
     # Initialize wizard state if missing
@@ -82,8 +88,14 @@ def render_create_page(user, supabase):
 
 def _handle_chrono_selection_step(business, view, dope_create_state, user_id):
     """Handle chronograph session selection step"""
-    unused_sessions = business.get_unused_chrono_sessions(user_id)
-    result = view.render_chrono_selection(unused_sessions)
+    # Fetch one row past the shown page to know whether older sessions exist
+    limit = dope_create_state.get("chrono_session_limit", UNUSED_CHRONO_PAGE_SIZE)
+    unused_sessions = business.get_unused_chrono_sessions(user_id, limit=limit + 1)
+    result = view.render_chrono_selection(unused_sessions[:limit])
+
+    if len(unused_sessions) > limit and view.render_load_more_chrono_sessions():
+        dope_create_state["chrono_session_limit"] = limit + UNUSED_CHRONO_PAGE_SIZE
+        st.rerun()
     
     if result:
         dope_create_state["wizard_data"]["chrono_session"] = result
@@ -104,7 +116,9 @@ def _handle_chrono_selection_step(business, view, dope_create_state, user_id):
 def _handle_rifle_selection_step(business, view, dope_create_state, user_id):
     """Handle rifle selection step"""
     rifles = business.get_rifles_for_user(user_id)
-    result = view.render_rifle_selection(rifles)
+    result = view.render_rifle_selection(
+        rifles, stability_for=business.get_stability_index
+    )
     
     if result:
         dope_create_state["wizard_data"]["rifle"] = result
@@ -147,8 +161,10 @@ def _handle_cartridge_selection_step(business, view, dope_create_state, user_id)
         cartridge_makes = business.get_unique_cartridge_makes(compatible_cartridges)
         bullet_grains = business.get_unique_bullet_grains(compatible_cartridges)
         
+        stability_index = business.get_stability_index(rifle)
         filters = view.render_cartridge_filters(
-            cartridge_types, cartridge_makes, bullet_grains, rifle_cartridge_type or ""
+            cartridge_types, cartridge_makes, bullet_grains, rifle_cartridge_type or "",
+            show_stability_filter=stability_index is not None
         )
         
         # Apply filters
@@ -158,9 +174,15 @@ def _handle_cartridge_selection_step(business, view, dope_create_state, user_id)
             filters["cartridge_make"], 
             filters["bullet_grain"]
         )
+        if filters.get("stabilized_only"):
+            filtered_cartridges = business.filter_stabilized_cartridges(
+                filtered_cartridges, stability_index
+            )
         
         # Render cartridge selection
-        selected_cartridge = view.render_cartridge_options(filtered_cartridges)
+        selected_cartridge = view.render_cartridge_options(
+            filtered_cartridges, stability_index
+        )
         
         if selected_cartridge:
             dope_create_state["wizard_data"]["cartridge"] = selected_cartridge
@@ -280,7 +302,7 @@ def _handle_confirmation_step(business, view, dope_create_state, user_id):
                         else:
                             # Update DOPE session with median weather values
                             business.update_session_with_weather_data(
-                                new_session.id, weather_association_results
+                                new_session.id, weather_association_results, user_id
                             )
                             st.success(f"🌤️ Weather data processed: {weather_association_results['weather_measurement_count']} measurements")
                             st.success(f"🎯 Shot associations: {weather_association_results['associations_made']} of {weather_association_results['dope_measurement_count']} shots")
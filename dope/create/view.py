@@ -73,8 +73,17 @@ class DopeCreateView:
         
         return selected_session
     
-    def render_rifle_selection(self, rifles) -> Optional[Any]:
-        """Render rifle selection step"""
+    def render_load_more_chrono_sessions(self) -> bool:
+        """Render the button that extends the chronograph session list"""
+        st.caption("Only your most recent unused sessions are listed.")
+        return st.button("Show older sessions")
+    
+    def render_rifle_selection(self, rifles, stability_for=None) -> Optional[Any]:
+        """Render rifle selection step
+
+        ``stability_for`` maps a rifle to its bullet stability index; when
+        given, the details show how much of the bullet catalog it stabilizes.
+        """
         st.subheader("Step 2: Select Rifle")
         st.write("Choose the rifle used for this session.")
         
@@ -133,8 +142,28 @@ class DopeCreateView:
                 
                 st.write(f"**Barrel Length:** {barrel_length or 'Not specified'}")
                 st.write(f"**Twist Rate:** {barrel_twist or 'Not specified'}")
+
+            if stability_for is not None:
+                self._render_stability_summary(stability_for(selected_rifle))
         
         return selected_rifle
+
+    def _render_stability_summary(self, stability_index) -> None:
+        """Summarize how many catalog bullets a rifle's twist stabilizes"""
+        if stability_index is None:
+            return
+        if stability_index.twist_in_per_rev is None:
+            st.caption("Add a twist rate to this rifle to check bullet stability.")
+            return
+        counts = stability_index.counts()
+        rated = counts["stable"] + counts["marginal"] + counts["unstable"]
+        if not rated:
+            return
+        st.caption(
+            f"Stabilizes {counts['stable']} of {rated} catalog bullets "
+            f"(Miller Sg ≥ 1.5); ⚠️ {counts['marginal']} marginal, "
+            f"❌ {counts['unstable']} unstable."
+        )
     
     def render_cartridge_selection(
         self,
@@ -174,7 +203,8 @@ class DopeCreateView:
         cartridge_types: List[str],
         cartridge_makes: List[str],
         bullet_grains: List[float],
-        rifle_cartridge_type: str
+        rifle_cartridge_type: str,
+        show_stability_filter: bool = False
     ) -> Dict[str, Any]:
         """Render cartridge filter controls"""
         col1, col2, col3 = st.columns(3)
@@ -207,6 +237,11 @@ class DopeCreateView:
                 help="Filter by bullet grain weight"
             )
         
+        stabilized_only = show_stability_filter and st.checkbox(
+            "Hide bullets this rifle may not stabilize",
+            help="Hides bullets with a Miller stability factor below 1.5 for the rifle's twist rate"
+        )
+
         # Convert bullet grain filter to numeric value
         bullet_grain_value = (None if bullet_grain_filter == "All" 
                              else float(bullet_grain_filter.replace("gr", "")))
@@ -214,11 +249,16 @@ class DopeCreateView:
         return {
             "cartridge_type": cartridge_type_filter if cartridge_type_filter != "All" else None,
             "cartridge_make": cartridge_make_filter if cartridge_make_filter != "All" else None,
-            "bullet_grain": bullet_grain_value
+            "bullet_grain": bullet_grain_value,
+            "stabilized_only": stabilized_only
         }
     
-    def render_cartridge_options(self, filtered_cartridges) -> Optional[Any]:
-        """Render cartridge selection dropdown"""
+    def render_cartridge_options(self, filtered_cartridges, stability_index=None) -> Optional[Any]:
+        """Render cartridge selection dropdown
+
+        With a rifle's ``stability_index``, options whose bullet is marginal
+        or unstable in that rifle are badged.
+        """
         if not filtered_cartridges:
             st.warning("⚠️ No cartridges match your filter criteria.")
             st.write("Try adjusting your filters or create a new cartridge.")
@@ -236,6 +276,8 @@ class DopeCreateView:
             bullet_weight = cartridge.bullet_weight_grains or "Unknown"
             
             display_name = f"{make} {model} - {bullet_make} {bullet_model} ({bullet_weight}gr)"
+            if stability_index is not None:
+                display_name = stability_index.badge(cartridge.bullet_id) + display_name
             cartridge_options[display_name] = cartridge
         
         selected_cartridge_display = st.selectbox(
@@ -261,6 +303,14 @@ class DopeCreateView:
                     st.write(f"**Weight:** {selected_cartridge.bullet_weight_grains or 'Unknown'} gr")
                 else:
                     st.write("**Bullet:** Not specified")
+
+                if stability_index is not None:
+                    sg = stability_index.stability_factor(selected_cartridge.bullet_id)
+                    status = stability_index.status(selected_cartridge.bullet_id)
+                    if sg is not None:
+                        st.write(f"**Stability (Sg):** {sg:.2f} ({status})")
+                    elif status != "unknown":
+                        st.write(f"**Stability:** {status} (from minimum twist)")
         
         return selected_cartridge
     
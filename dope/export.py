@@ -0,0 +1,113 @@
+"""
+Streaming multi-session DOPE export.
+
+``DopeService.iter_measurement_frames`` yields the selected sessions a chunk
+at a time together with their typed measurement frame (see ``dope.frames``).
+The writers here consume those chunks and write them straight to a binary
+file object, so memory holds at most one chunk of shots however many
+sessions are exported:
+
+- ``zip``: one CSV of shots per session plus ``sessions.csv`` with one row
+  per session
+- ``parquet``: a single file with one row per shot (session attributes
+  joined), one row group per chunk
+"""
+
+import io
+import re
+import zipfile
+from typing import Any, BinaryIO, Dict, Iterable, List, Tuple
+
+import pandas as pd
+
+from .frames import MEASUREMENT_FRAME_SOURCE_COLUMNS, build_measurement_frame
+from .models import DopeSessionModel
+
+EXPORT_FORMATS = ("zip", "parquet")
+
+# Sessions whose shots are loaded and written per chunk
+EXPORT_SESSION_CHUNK_SIZE = 25
+
+SESSIONS_CSV_NAME = "sessions.csv"
+
+MeasurementBatch = Tuple[List[DopeSessionModel], pd.DataFrame]
+
+
+def session_csv_name(session: DopeSessionModel) -> str:
+    """File name of a session's shot CSV inside the ZIP archive"""
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", session.session_name or "").strip("_")
+    return f"{slug or 'session'}_{(session.id or '')[:8]}.csv"
+
+
+def write_sessions_zip(fileobj: BinaryIO, batches: Iterable[MeasurementBatch]) -> Dict[str, int]:
+    """Write one shot CSV per session and sessions.csv into a ZIP archive"""
+    session_rows: List[Dict[str, Any]] = []
+    shot_count = 0
+    with zipfile.ZipFile(fileobj, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for sessions, frame in batches:
+            shots_by_session = dict(tuple(frame.groupby("dope_session_id", sort=False)))
+            for session in sessions:
+                shots = shots_by_session.get(session.id, frame.iloc[0:0])
+                with archive.open(session_csv_name(session), "w") as member:
+                    with io.TextIOWrapper(member, encoding="utf-8", newline="") as text:
+                        shots[list(MEASUREMENT_FRAME_SOURCE_COLUMNS)].to_csv(
+                            text, index=False
+                        )
+                session_rows.append({"id": session.id, **session.to_dict()})
+                shot_count += len(shots)
+
+        with archive.open(SESSIONS_CSV_NAME, "w") as member:
+            with io.TextIOWrapper(member, encoding="utf-8", newline="") as text:
+                pd.DataFrame(session_rows).to_csv(text, index=False)
+
+    return {"sessions": len(session_rows), "shots": shot_count}
+
+
+def write_sessions_parquet(
+    fileobj: BinaryIO, batches: Iterable[MeasurementBatch]
+) -> Dict[str, int]:
+    """Write every shot, joined to its session, into one Parquet file"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise Exception("Parquet export requires the pyarrow package")
+
+    writer = None
+    session_count = 0
+    shot_count = 0
+    try:
+        for sessions, frame in batches:
+            if writer is None:
+                schema = pa.Schema.from_pandas(frame, preserve_index=False)
+                writer = pq.ParquetWriter(fileobj, schema)
+            writer.write_table(
+                pa.Table.from_pandas(frame, schema=writer.schema, preserve_index=False)
+            )
+            session_count += len(sessions)
+            shot_count += len(frame)
+
+        if writer is None:
+            empty = build_measurement_frame([], [])
+            writer = pq.ParquetWriter(
+                fileobj, pa.Schema.from_pandas(empty, preserve_index=False)
+            )
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return {"sessions": session_count, "shots": shot_count}
+
+
+def write_sessions_export(
+    fileobj: BinaryIO, batches: Iterable[MeasurementBatch], export_format: str
+) -> Dict[str, int]:
+    """Write batches in the given format; returns session and shot counts"""
+    if export_format == "zip":
+        return write_sessions_zip(fileobj, batches)
+    if export_format == "parquet":
+        return write_sessions_parquet(fileobj, batches)
+    raise ValueError(
+        f"Unsupported export format '{export_format}' "
+        f"(expected one of {', '.join(EXPORT_FORMATS)})"
+    )
@@ -0,0 +1,202 @@
+"""
+Facet index for DOPE filter widgets and autocomplete.
+
+One pass over a user's sessions collects, for every filterable text field,
+the distinct values with their session counts, and for every numeric field
+the min/max range. The index is kept per user and updated incrementally:
+``sync`` only removes and re-adds sessions whose faceted fields changed, so
+a write followed by a reload touches just the affected sessions.
+"""
+
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .cache import UserLRUCache
+from .models import DopeSessionModel
+
+# Text fields offered as dropdowns / autocomplete values
+FACET_TEXT_FIELDS = (
+    "rifle_name",
+    "cartridge_type",
+    "cartridge_make",
+    "cartridge_model",
+    "bullet_make",
+    "bullet_model",
+    "range_name",
+    "weather_source_name",
+)
+
+# Numeric fields offered as range sliders
+FACET_NUMERIC_FIELDS = (
+    "range_distance_m",
+    "bullet_weight",
+    "temperature_c_median",
+    "relative_humidity_pct_median",
+    "wind_speed_mps_median",
+)
+
+
+def _text_value(value) -> Optional[str]:
+    """Return a faceted text value, or None when empty"""
+    if value and isinstance(value, str) and value.strip():
+        return value
+    return None
+
+
+def _numeric_value(value) -> Optional[float]:
+    """Return a faceted numeric value, or None when missing/non-numeric"""
+    if value is None or value == "":
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if pd.isna(number) else number
+
+
+def _facet_signature(session: DopeSessionModel) -> Tuple:
+    """Faceted field values of a session, used to detect changes"""
+    return tuple(
+        getattr(session, name, None)
+        for name in FACET_TEXT_FIELDS + FACET_NUMERIC_FIELDS
+    )
+
+
+@dataclass
+class DopeFacets:
+    """Snapshot of distinct values, counts and numeric ranges for a user"""
+
+    total_sessions: int = 0
+    values: Dict[str, List[str]] = field(default_factory=dict)
+    counts: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    ranges: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+
+    def values_for(self, field_name: str) -> List[str]:
+        """Sorted distinct values for a text field (empty list if none)"""
+        return list(self.values.get(field_name, []))
+
+    def count_for(self, field_name: str, value: str) -> int:
+        """Number of sessions with the given value"""
+        return self.counts.get(field_name, {}).get(value, 0)
+
+    def range_for(
+        self, field_name: str, default: Optional[Tuple[float, float]] = None
+    ) -> Optional[Tuple[float, float]]:
+        """(min, max) for a numeric field, or default when no values exist"""
+        return self.ranges.get(field_name, default)
+
+
+class DopeFacetIndex:
+    """Incrementally maintained facet counts for one user's sessions"""
+
+    def __init__(self):
+        self._text_counts: Dict[str, Counter] = {
+            name: Counter() for name in FACET_TEXT_FIELDS
+        }
+        self._numeric_counts: Dict[str, Counter] = {
+            name: Counter() for name in FACET_NUMERIC_FIELDS
+        }
+        # session_id -> faceted values counted for it (for removal)
+        self._signatures: Dict[str, Tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def add(self, session: DopeSessionModel) -> None:
+        """Add a session's values to the facet counts, replacing any previous"""
+        if not session.id:
+            return
+        self.remove(session.id)
+        signature = _facet_signature(session)
+        self._apply(signature, 1)
+        self._signatures[session.id] = signature
+
+    def remove(self, session_id: str) -> None:
+        """Remove a previously added session from the facet counts"""
+        signature = self._signatures.pop(session_id, None)
+        if signature is not None:
+            self._apply(signature, -1)
+
+    def _apply(self, signature: Tuple, delta: int) -> None:
+        values = dict(zip(FACET_TEXT_FIELDS + FACET_NUMERIC_FIELDS, signature))
+        for name, counter in self._text_counts.items():
+            self._bump(counter, _text_value(values[name]), delta)
+        for name, counter in self._numeric_counts.items():
+            self._bump(counter, _numeric_value(values[name]), delta)
+
+    @staticmethod
+    def _bump(counter: Counter, value, delta: int) -> None:
+        if value is None:
+            return
+        counter[value] += delta
+        if counter[value] <= 0:
+            del counter[value]
+
+    def sync(self, sessions: Sequence[DopeSessionModel]) -> int:
+        """Update counts for added, changed and removed sessions
+
+        Returns:
+            int: Number of sessions added, updated or removed
+        """
+        changes = 0
+        current_ids = set()
+        for session in sessions:
+            if not session.id:
+                continue
+            current_ids.add(session.id)
+            if self._signatures.get(session.id) != _facet_signature(session):
+                self.add(session)
+                changes += 1
+
+        for stale_id in [sid for sid in self._signatures if sid not in current_ids]:
+            self.remove(stale_id)
+            changes += 1
+        return changes
+
+    def snapshot(self) -> DopeFacets:
+        """Build an immutable facet snapshot from the current counts"""
+        return DopeFacets(
+            total_sessions=len(self._signatures),
+            values={
+                name: sorted(counter) for name, counter in self._text_counts.items()
+            },
+            counts={
+                name: dict(counter) for name, counter in self._text_counts.items()
+            },
+            ranges={
+                name: (min(counter), max(counter))
+                for name, counter in self._numeric_counts.items()
+                if counter
+            },
+        )
+
+
+class DopeFacetRegistry:
+    """Per-user facet indexes with bounded LRU retention"""
+
+    def __init__(self, max_users: int = 32):
+        self._indexes: UserLRUCache[DopeFacetIndex] = UserLRUCache(
+            max_entries=max_users, ttl_seconds=None
+        )
+        self._lock = threading.Lock()
+
+    def get_facets(
+        self, user_id: str, sessions: Sequence[DopeSessionModel]
+    ) -> DopeFacets:
+        """Sync the user's facet index with sessions and return a snapshot"""
+        with self._lock:
+            index = self._indexes.get_or_load(user_id, DopeFacetIndex)
+            index.sync(sessions)
+            return index.snapshot()
+
+    def invalidate(self, user_id: Optional[str] = None) -> None:
+        """Drop the facet index for one user, or all when user_id is None"""
+        self._indexes.invalidate(user_id)
+
+
+# Process-wide registry shared by all DopeService instances (one per rerun)
+facet_registry = DopeFacetRegistry()
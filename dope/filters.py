@@ -1,10 +1,50 @@
 """
 Filter helpers for DOPE sessions to reduce complexity in service layer.
+
+``DopeSessionFilter`` keeps the chainable per-field API. ``DopeSessionFrame``
+holds the same sessions as columns so that a whole filter set is evaluated as
+one boolean mask, and ``DopeSessionFrameCache`` memoizes frames and filter
+results per (user, data version, filter set) across Streamlit reruns.
 """
 
-from typing import Any, Dict, List
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
 
 from .models import DopeSessionModel
+from .search import SEARCH_FIELD_WEIGHTS, tokenize
+
+# Value used by the view page dropdowns to select sessions with an empty field
+NOT_DEFINED = "Not Defined"
+
+# Filter keys compared by exact text match, mapped to the session attribute
+TEXT_FILTER_FIELDS = {
+    "cartridge_type": "cartridge_type",
+    "rifle_name": "rifle_name",
+    "cartridge_make": "cartridge_make",
+    "bullet_make": "bullet_make",
+    "range_name": "range_name",
+}
+
+# Filter keys compared by inclusive numeric range, mapped to the frame column
+RANGE_FILTER_FIELDS = {
+    "distance_range": "range_distance_m",
+    "bullet_weight_range": "bullet_weight",
+    "temperature_range": "temperature_c_median",
+    "humidity_range": "relative_humidity_pct_median",
+    "wind_speed_range": "wind_speed_mps_median",
+}
+
+# Frame columns where 0 means "not recorded", matching the falsy checks of
+# DopeSessionFilter (e.g. apply_bullet_weight_filter)
+ZERO_MEANS_MISSING_FIELDS = ("range_distance_m", "bullet_weight")
+
+# Text fields covered by the free-text "search" filter; the same fields as the
+# search index, so both paths match the same sessions
+SEARCH_TEXT_FIELDS = tuple(SEARCH_FIELD_WEIGHTS)
 
 
 class DopeSessionFilter:
@@ -162,7 +202,14 @@ class DopeSessionFilter:
         return self
     
     def apply_all_filters(self, filters: Dict[str, Any]) -> 'DopeSessionFilter':
-        """Apply all filters using method chaining"""
+        """Apply all filters in a single vectorized pass over a session frame"""
+        self.sessions = DopeSessionFrame(self.sessions).select(filters)
+        return self
+
+    def apply_all_filters_chained(
+        self, filters: Dict[str, Any]
+    ) -> 'DopeSessionFilter':
+        """Apply all filters using method chaining (reference implementation)"""
         return (self
                 .apply_status_filter(filters.get("status"))  # Deprecated
                 .apply_cartridge_type_filter(filters.get("cartridge_type"))
@@ -179,4 +226,261 @@ class DopeSessionFilter:
     
     def get_results(self) -> List[DopeSessionModel]:
         """Get filtered results"""
-        return self.sessions
\ No newline at end of file
+        return self.sessions
+
+
+def _naive_timestamp(value) -> Optional[pd.Timestamp]:
+    """Convert a datetime/date to a timezone-naive Timestamp for comparisons"""
+    if value is None:
+        return None
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_localize(None)
+    return ts
+
+
+def make_filter_key(
+    filters: Optional[Dict[str, Any]]
+) -> Tuple[Tuple[str, Hashable], ...]:
+    """Build a hashable, order-independent key for a filter dictionary
+
+    Inactive entries (None, empty strings, empty tuples) are dropped so that
+    equivalent filter sets share a cache entry.
+    """
+    if not filters:
+        return ()
+    items = []
+    for key, value in filters.items():
+        if value is None or value == "" or value == () or value == []:
+            continue
+        if isinstance(value, list):
+            value = tuple(value)
+        items.append((key, value))
+    return tuple(sorted(items, key=lambda item: item[0]))
+
+
+class DopeSessionFrame:
+    """Columnar view of DOPE sessions for single-pass filtering
+
+    Text fields are held as object arrays together with a precomputed
+    "is defined" mask, and each session's search fields as one string of
+    tokens for prefix matching; numeric fields are float arrays
+    with NaN for missing values. ``mask`` combines every active filter into a
+    single boolean array instead of rebuilding a Python list per filter.
+    """
+
+    def __init__(self, sessions: Sequence[DopeSessionModel]):
+        self.sessions = list(sessions)
+        self.size = len(self.sessions)
+
+        self.text: Dict[str, np.ndarray] = {}
+        self.text_defined: Dict[str, np.ndarray] = {}
+        for field in set(TEXT_FILTER_FIELDS.values()):
+            values = np.array(
+                [getattr(s, field, None) for s in self.sessions], dtype=object
+            )
+            defined = np.array(
+                [isinstance(v, str) and v.strip() != "" for v in values], dtype=bool
+            )
+            self.text[field] = values
+            self.text_defined[field] = defined
+
+        # "\n"-delimited tokens, so "\n" + term matches tokens starting with term
+        self.search_text = np.array(
+            [
+                "".join(
+                    f"\n{token}"
+                    for field in SEARCH_TEXT_FIELDS
+                    for token in tokenize(getattr(s, field, None))
+                )
+                for s in self.sessions
+            ],
+            dtype=object,
+        )
+
+        self.numeric: Dict[str, np.ndarray] = {
+            "range_distance_m": self._float_column("range_distance_m"),
+            "bullet_weight": self._float_column("bullet_weight"),
+            "temperature_c_median": self._float_column("temperature_c_median"),
+            "relative_humidity_pct_median": self._float_column(
+                "relative_humidity_pct_median"
+            ),
+            "wind_speed_mps_median": self._float_column("wind_speed_mps_median"),
+        }
+
+        self.datetime_local = pd.Series(
+            [_naive_timestamp(s.datetime_local) for s in self.sessions],
+            dtype="datetime64[ns]",
+        ).to_numpy()
+
+    def _float_column(self, field: str) -> np.ndarray:
+        """Extract a session attribute as floats, NaN where missing/non-numeric"""
+        raw = pd.Series([getattr(s, field, None) for s in self.sessions], dtype=object)
+        return pd.to_numeric(raw, errors="coerce").to_numpy(dtype=float)
+
+    def mask(self, filters: Optional[Dict[str, Any]]) -> np.ndarray:
+        """Evaluate all active filters as one boolean mask"""
+        result = np.ones(self.size, dtype=bool)
+        if not filters or self.size == 0:
+            return result
+
+        for key, field in TEXT_FILTER_FIELDS.items():
+            wanted = filters.get(key)
+            if not wanted:
+                continue
+            if wanted == NOT_DEFINED:
+                result &= ~self.text_defined[field]
+            else:
+                result &= self.text[field] == wanted
+
+        date_from = _naive_timestamp(filters.get("date_from"))
+        date_to = _naive_timestamp(filters.get("date_to"))
+        if date_from is not None:
+            result &= self.datetime_local >= date_from.to_datetime64()
+        if date_to is not None:
+            result &= self.datetime_local <= date_to.to_datetime64()
+
+        for key, column in RANGE_FILTER_FIELDS.items():
+            bounds = filters.get(key)
+            if not bounds:
+                continue
+            low, high = bounds
+            values = self.numeric[column]
+            with np.errstate(invalid="ignore"):
+                in_range = (values >= low) & (values <= high)
+            if column in ZERO_MEANS_MISSING_FIELDS:
+                in_range &= values != 0
+            result &= in_range
+
+        # Same rule as DopeSearchIndex: every query term must be a prefix of
+        # some token of the session's search fields
+        for term in dict.fromkeys(tokenize(filters.get("search"))):
+            needle = f"\n{term}"
+            result &= np.fromiter(
+                (needle in text for text in self.search_text),
+                dtype=bool,
+                count=self.size,
+            )
+
+        return result
+
+    def select(self, filters: Optional[Dict[str, Any]]) -> List[DopeSessionModel]:
+        """Return the sessions matching all filters, preserving order"""
+        return self.take(np.flatnonzero(self.mask(filters)))
+
+    def take(self, indices: Sequence[int]) -> List[DopeSessionModel]:
+        """Return sessions at the given row positions"""
+        return [self.sessions[i] for i in indices]
+
+
+_VERSION_FIELDS = tuple(
+    dict.fromkeys(
+        ("id", "updated_at", "datetime_local")
+        + tuple(TEXT_FILTER_FIELDS.values())
+        + SEARCH_TEXT_FIELDS
+        + tuple(RANGE_FILTER_FIELDS.values())
+    )
+)
+
+
+def sessions_data_version(sessions: Sequence[DopeSessionModel]) -> int:
+    """Fingerprint a session list so cached frames are rebuilt when data changes
+
+    Covers the row identity plus every field a filter can read, so edits made
+    without touching ``updated_at`` (e.g. weather medians) still change it.
+    This reads every session, so it is only the fallback for lists that do not
+    come from ``dope_session_cache``; cached lists are keyed by their revision.
+    """
+    return hash(
+        tuple(
+            tuple(getattr(s, field, None) for field in _VERSION_FIELDS)
+            for s in sessions
+        )
+    )
+
+
+class DopeSessionFrameCache:
+    """Bounded LRU cache of session frames and filter results
+
+    Frames are keyed by (user_id, data version) and filter results by
+    (user_id, data version, filter key), so repeated widget interactions on the
+    view page reuse the frame and the computed row indices. The data version is
+    the session cache revision when the caller has one, otherwise a fingerprint
+    of the sessions.
+    """
+
+    def __init__(self, max_frames: int = 16, max_results: int = 128):
+        self.max_frames = max_frames
+        self.max_results = max_results
+        self._frames: "OrderedDict[Tuple[str, Hashable], DopeSessionFrame]" = (
+            OrderedDict()
+        )
+        self._results: "OrderedDict[Tuple[str, Hashable, tuple], np.ndarray]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get_frame(
+        self,
+        user_id: str,
+        sessions: Sequence[DopeSessionModel],
+        version: Optional[Hashable] = None,
+    ) -> DopeSessionFrame:
+        """Return the cached frame for this user's current data, building it if needed"""
+        if version is None:
+            version = sessions_data_version(sessions)
+        key = (user_id, version)
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is not None:
+                self._frames.move_to_end(key)
+                return frame
+
+        frame = DopeSessionFrame(sessions)
+        with self._lock:
+            self._frames[key] = frame
+            self._frames.move_to_end(key)
+            while len(self._frames) > self.max_frames:
+                self._frames.popitem(last=False)
+        return frame
+
+    def filter(
+        self,
+        user_id: str,
+        sessions: Sequence[DopeSessionModel],
+        filters: Optional[Dict[str, Any]],
+        version: Optional[Hashable] = None,
+    ) -> List[DopeSessionModel]:
+        """Filter sessions, reusing cached masks for identical filter sets"""
+        if version is None:
+            version = sessions_data_version(sessions)
+        frame = self.get_frame(user_id, sessions, version)
+        key = (user_id, version, make_filter_key(filters))
+        with self._lock:
+            indices = self._results.get(key)
+            if indices is not None:
+                self._results.move_to_end(key)
+        if indices is None:
+            indices = np.flatnonzero(frame.mask(filters))
+            with self._lock:
+                self._results[key] = indices
+                while len(self._results) > self.max_results:
+                    self._results.popitem(last=False)
+        # Index into the caller's list so fresh model objects are returned
+        return [sessions[i] for i in indices]
+
+    def invalidate(self, user_id: Optional[str] = None) -> None:
+        """Drop cached entries for one user, or everything when user_id is None"""
+        with self._lock:
+            if user_id is None:
+                self._frames.clear()
+                self._results.clear()
+                return
+            for key in [k for k in self._frames if k[0] == user_id]:
+                del self._frames[key]
+            for key in [k for k in self._results if k[0] == user_id]:
+                del self._results[key]
+
+
+# Process-wide cache shared by all DopeService instances (one per rerun)
+session_frame_cache = DopeSessionFrameCache()
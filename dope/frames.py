@@ -0,0 +1,187 @@
+"""
+Columnar DOPE measurement frames.
+
+``build_measurement_frame`` turns raw ``dope_measurements`` records into a
+typed pandas frame in one vectorized pass: metric numeric columns as floats,
+shot timestamps as UTC datetimes, scope adjustments parsed from text to
+floats and bore-condition text decoded to nullable booleans. Each row is
+joined to the attributes of its DOPE session (rifle, cartridge, bullet,
+range and session weather medians) so analytics can group and regress on
+columns without touching per-row model objects.
+"""
+
+from typing import Any, Dict, List, Sequence
+
+import pandas as pd
+
+from .models import DopeSessionModel
+
+# Measurement columns loaded from the database (narrow projection)
+MEASUREMENT_FRAME_SOURCE_COLUMNS = (
+    "id",
+    "dope_session_id",
+    "shot_number",
+    "datetime_shot",
+    "speed_mps",
+    "ke_j",
+    "power_factor_kgms",
+    "azimuth_deg",
+    "elevation_angle_deg",
+    "temperature_c",
+    "pressure_hpa",
+    "humidity_pct",
+    "distance_m",
+    "elevation_adjustment",
+    "windage_adjustment",
+    "clean_bore",
+    "cold_bore",
+    "shot_notes",
+)
+
+_FLOAT_COLUMNS = (
+    "speed_mps",
+    "ke_j",
+    "power_factor_kgms",
+    "azimuth_deg",
+    "elevation_angle_deg",
+    "temperature_c",
+    "pressure_hpa",
+    "humidity_pct",
+    "distance_m",
+    "elevation_adjustment",
+    "windage_adjustment",
+)
+
+_BORE_COLUMNS = ("clean_bore", "cold_bore")
+
+# Session attributes joined onto every shot (frame column -> session field)
+SESSION_FRAME_COLUMNS: Dict[str, str] = {
+    "session_name": "session_name",
+    "session_datetime_local": "datetime_local",
+    "rifle_id": "rifle_id",
+    "rifle_name": "rifle_name",
+    "rifle_barrel_length_cm": "rifle_barrel_length_cm",
+    "rifle_barrel_twist_in_per_rev": "rifle_barrel_twist_in_per_rev",
+    "cartridge_id": "cartridge_id",
+    "cartridge_type": "cartridge_type",
+    "cartridge_make": "cartridge_make",
+    "cartridge_model": "cartridge_model",
+    "cartridge_lot_number": "cartridge_lot_number",
+    "bullet_id": "bullet_id",
+    "bullet_make": "bullet_make",
+    "bullet_model": "bullet_model",
+    "bullet_weight": "bullet_weight",
+    "ballistic_coefficient_g1": "ballistic_coefficient_g1",
+    "ballistic_coefficient_g7": "ballistic_coefficient_g7",
+    "range_name": "range_name",
+    "range_distance_m": "range_distance_m",
+    "start_altitude": "start_altitude",
+    "temperature_c_median": "temperature_c_median",
+    "relative_humidity_pct_median": "relative_humidity_pct_median",
+    "barometric_pressure_hpa_median": "barometric_pressure_hpa_median",
+    "wind_speed_mps_median": "wind_speed_mps_median",
+}
+
+# Session attributes stored as text (or nullable reals) that are numeric
+_SESSION_FLOAT_COLUMNS = (
+    "rifle_barrel_length_cm",
+    "rifle_barrel_twist_in_per_rev",
+    "bullet_weight",
+    "ballistic_coefficient_g1",
+    "ballistic_coefficient_g7",
+    "range_distance_m",
+    "start_altitude",
+    "temperature_c_median",
+    "relative_humidity_pct_median",
+    "barometric_pressure_hpa_median",
+    "wind_speed_mps_median",
+)
+
+# Bore-condition text -> boolean ("fouled" means the bore is not clean)
+BORE_CONDITION_VALUES: Dict[str, bool] = {
+    "yes": True,
+    "y": True,
+    "true": True,
+    "1": True,
+    "clean": True,
+    "cold": True,
+    "no": False,
+    "n": False,
+    "false": False,
+    "0": False,
+    "fouled": False,
+    "dirty": False,
+    "warm": False,
+    "hot": False,
+}
+
+
+def decode_bore_condition(values: pd.Series) -> pd.Series:
+    """Decode bore-condition text to a nullable boolean series"""
+    normalized = values.astype("string").str.strip().str.lower()
+    return normalized.map(BORE_CONDITION_VALUES).astype("boolean")
+
+
+def _session_frame(sessions: Sequence[DopeSessionModel]) -> pd.DataFrame:
+    """One row of joined attributes per DOPE session"""
+    frame = pd.DataFrame(
+        {
+            "dope_session_id": [s.id for s in sessions],
+            **{
+                column: [getattr(s, field, None) for s in sessions]
+                for column, field in SESSION_FRAME_COLUMNS.items()
+            },
+        }
+    )
+    for column in _SESSION_FLOAT_COLUMNS:
+        frame[column] = pd.to_numeric(frame[column], errors="coerce").astype(float)
+    frame["session_datetime_local"] = pd.to_datetime(
+        frame["session_datetime_local"], utc=True, errors="coerce"
+    )
+    text_columns = [
+        c for c in frame.columns
+        if c not in _SESSION_FLOAT_COLUMNS and c != "session_datetime_local"
+    ]
+    frame[text_columns] = frame[text_columns].astype("string")
+    return frame.drop_duplicates("dope_session_id")
+
+
+def build_measurement_frame(
+    records: List[Dict[str, Any]], sessions: Sequence[DopeSessionModel]
+) -> pd.DataFrame:
+    """Build a typed measurement frame joined to session attributes
+
+    Args:
+        records: Raw dope_measurements records (dicts keyed by column name)
+        sessions: DOPE sessions the measurements belong to
+
+    Returns:
+        pd.DataFrame: One row per shot with MEASUREMENT_FRAME_SOURCE_COLUMNS
+            (floats, UTC datetimes, nullable booleans for bore conditions)
+            followed by SESSION_FRAME_COLUMNS, ordered by session and shot
+    """
+    frame = pd.DataFrame.from_records(
+        records, columns=list(MEASUREMENT_FRAME_SOURCE_COLUMNS)
+    )
+
+    for column in _FLOAT_COLUMNS:
+        frame[column] = pd.to_numeric(frame[column], errors="coerce").astype(float)
+    frame["shot_number"] = pd.to_numeric(
+        frame["shot_number"], errors="coerce"
+    ).astype("Int64")
+    frame["datetime_shot"] = pd.to_datetime(
+        frame["datetime_shot"], utc=True, errors="coerce", format="ISO8601"
+    )
+    for column in _BORE_COLUMNS:
+        frame[column] = decode_bore_condition(frame[column])
+    frame[["id", "dope_session_id", "shot_notes"]] = frame[
+        ["id", "dope_session_id", "shot_notes"]
+    ].astype("string")
+
+    frame = frame.merge(
+        _session_frame(sessions), on="dope_session_id", how="left"
+    )
+    return frame.sort_values(
+        ["dope_session_id", "shot_number"], kind="stable", na_position="last"
+    ).reset_index(drop=True)
+
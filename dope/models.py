@@ -1,7 +1,40 @@
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, fields
 from datetime import datetime
 from typing import List, Optional
 
+# Offset without minutes ("+00") and fractional seconds of any length, as
+# Postgres writes them
+_SHORT_UTC_OFFSET = re.compile(r"(:\d{2}(?:\.\d+)?[+-]\d{2})$")
+_FRACTIONAL_SECONDS = re.compile(r"\.(\d+)")
+
+
+def parse_supabase_datetime(value):
+    """Parse a timestamp returned by Supabase; None if empty or unparseable
+
+    Before Python 3.11 ``datetime.fromisoformat`` rejects a "Z" suffix, a
+    "+00" offset and fractional seconds that are not 3 or 6 digits, all of
+    which PostgREST returns ("2025-08-10 14:00:46.12+00").
+    """
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    if not isinstance(value, str):
+        raise TypeError(f"Expected a timestamp string, got {type(value).__name__}")
+    text = value.strip()
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    text = _SHORT_UTC_OFFSET.sub(r"\1:00", text)
+    text = _FRACTIONAL_SECONDS.sub(
+        lambda match: "." + (match.group(1) + "000000")[:6], text, count=1
+    )
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError as e:
+        print(f"Warning: Could not parse datetime '{value}': {e}")
+        return None
+
 
 @dataclass
 class DopeSessionModel:
@@ -47,6 +80,7 @@ class DopeSessionModel:
     rifle_name: str = ""  # NOT NULL
     rifle_barrel_length_cm: Optional[float] = None  # real type
     rifle_barrel_twist_in_per_rev: Optional[float] = None  # real type
+    rifle_sight_offset: Optional[str] = None  # text type, e.g. "1.5 inches"
 
     # Cartridge information (mandatory fields)
     cartridge_make: str = ""  # NOT NULL
@@ -92,33 +126,11 @@ class DopeSessionModel:
     @classmethod
     def from_supabase_record(cls, record: dict) -> "DopeSessionModel":
         """Create a DopeSessionModel from a Supabase record"""
-        def parse_datetime(dt_str):
-            """Parse datetime string from various Supabase formats"""
-            if not dt_str:
-                return None
-            try:
-                # Handle different datetime formats from Supabase
-                if dt_str.endswith('Z'):
-                    # ISO format with Z suffix: "2025-08-10T14:00:46Z"
-                    return datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
-                elif dt_str.endswith('+00'):
-                    # Postgres format with +00 suffix: "2025-08-10 14:00:46+00"
-                    return datetime.fromisoformat(dt_str + ':00')
-                elif '+00:00' in dt_str:
-                    # ISO format with +00:00 suffix: "2025-08-10T14:00:46+00:00"
-                    return datetime.fromisoformat(dt_str)
-                else:
-                    # Try direct parsing as fallback
-                    return datetime.fromisoformat(dt_str)
-            except ValueError as e:
-                print(f"Warning: Could not parse datetime '{dt_str}': {e}")
-                return None
-
-        start_time_dt = parse_datetime(record.get("start_time"))
-        end_time_dt = parse_datetime(record.get("end_time"))
-        datetime_local_dt = parse_datetime(record.get("datetime_local"))
-        created_at_dt = parse_datetime(record.get("created_at"))
-        updated_at_dt = parse_datetime(record.get("updated_at"))
+        start_time_dt = parse_supabase_datetime(record.get("start_time"))
+        end_time_dt = parse_supabase_datetime(record.get("end_time"))
+        datetime_local_dt = parse_supabase_datetime(record.get("datetime_local"))
+        created_at_dt = parse_supabase_datetime(record.get("created_at"))
+        updated_at_dt = parse_supabase_datetime(record.get("updated_at"))
         return cls(
             id=record.get("id"),
             user_id=record.get("user_id"),
@@ -148,6 +160,7 @@ class DopeSessionModel:
             rifle_name=record.get("rifle_name", ""),
             rifle_barrel_length_cm=record.get("rifle_barrel_length_cm"),
             rifle_barrel_twist_in_per_rev=record.get("rifle_barrel_twist_in_per_rev"),
+            rifle_sight_offset=record.get("rifle_sight_offset"),
             cartridge_make=record.get("cartridge_make", ""),
             cartridge_model=record.get("cartridge_model", ""),
             cartridge_type=record.get("cartridge_type", ""),
@@ -183,6 +196,19 @@ class DopeSessionModel:
         """Create a list of DopeSessionModel from Supabase records"""
         return [cls.from_supabase_record(record) for record in records]
 
+    @classmethod
+    def from_flat_record(cls, record: dict) -> "DopeSessionModel":
+        """Create a DopeSessionModel from a dope_sessions_flat row
+
+        The view returns exactly DOPE_SESSION_FLAT_COLUMNS in their final
+        types, so only the timestamps need converting.
+        """
+        values = {name: record.get(name) for name in DOPE_SESSION_FLAT_COLUMNS}
+        for name in DOPE_SESSION_DATETIME_FIELDS:
+            if values[name] is not None:
+                values[name] = parse_supabase_datetime(values[name])
+        return cls(**values)
+
     def to_dict(self) -> dict:
         """Convert DopeSessionModel to dictionary for database operations"""
         return {
@@ -209,6 +235,7 @@ class DopeSessionModel:
             "rifle_name": self.rifle_name,
             "rifle_barrel_length_cm": self.rifle_barrel_length_cm,
             "rifle_barrel_twist_in_per_rev": self.rifle_barrel_twist_in_per_rev,
+            "rifle_sight_offset": self.rifle_sight_offset,
             "cartridge_make": self.cartridge_make,
             "cartridge_model": self.cartridge_model,
             "cartridge_type": self.cartridge_type,
@@ -315,6 +342,17 @@ class DopeSessionModel:
         return missing
 
 
+
+# Columns of the dope_sessions_flat view, one per DopeSessionModel field
+DOPE_SESSION_FLAT_COLUMNS = tuple(f.name for f in fields(DopeSessionModel))
+DOPE_SESSION_DATETIME_FIELDS = (
+    "datetime_local",
+    "start_time",
+    "end_time",
+    "created_at",
+    "updated_at",
+)
+
 @dataclass
 class DopeMeasurementModel:
     """Entity representing a DOPE measurement (individual shot data)"""
@@ -361,31 +399,9 @@ class DopeMeasurementModel:
     @classmethod
     def from_supabase_record(cls, record: dict) -> "DopeMeasurementModel":
         """Create a DopeMeasurementModel from a Supabase record"""
-        def parse_datetime(dt_str):
-            """Parse datetime string from various Supabase formats"""
-            if not dt_str:
-                return None
-            try:
-                # Handle different datetime formats from Supabase
-                if dt_str.endswith('Z'):
-                    # ISO format with Z suffix: "2025-08-10T14:00:46Z"
-                    return datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
-                elif dt_str.endswith('+00'):
-                    # Postgres format with +00 suffix: "2025-08-10 14:00:46+00"
-                    return datetime.fromisoformat(dt_str + ':00')
-                elif '+00:00' in dt_str:
-                    # ISO format with +00:00 suffix: "2025-08-10T14:00:46+00:00"
-                    return datetime.fromisoformat(dt_str)
-                else:
-                    # Try direct parsing as fallback
-                    return datetime.fromisoformat(dt_str)
-            except ValueError as e:
-                print(f"Warning: Could not parse datetime '{dt_str}': {e}")
-                return None
-
-        datetime_shot_dt = parse_datetime(record.get("datetime_shot"))
-        created_at_dt = parse_datetime(record.get("created_at"))
-        updated_at_dt = parse_datetime(record.get("updated_at"))
+        datetime_shot_dt = parse_supabase_datetime(record.get("datetime_shot"))
+        created_at_dt = parse_supabase_datetime(record.get("created_at"))
+        updated_at_dt = parse_supabase_datetime(record.get("updated_at"))
 
         return cls(
             id=record.get("id"),
@@ -542,3 +558,73 @@ class DopeMeasurementModel:
         # Import here to avoid circular imports
         from utils.ui_formatters import format_power_factor
         return format_power_factor(self.power_factor_kgms, user_unit_system)
+
+
+@dataclass
+class DopeSessionSummaryModel:
+    """Entity representing the maintained per-session summary of measurements"""
+
+    dope_session_id: str = ""  # Primary key - foreign key to dope_sessions
+    user_id: str = ""  # NOT NULL - for user isolation
+
+    # Velocity statistics (metric only)
+    shot_count: int = 0
+    speed_mps_avg: Optional[float] = None
+    speed_mps_sd: Optional[float] = None  # Sample standard deviation
+    speed_mps_min: Optional[float] = None
+    speed_mps_max: Optional[float] = None
+    speed_mps_es: Optional[float] = None  # Extreme spread (max - min)
+
+    # Median shot weather (metric only)
+    temperature_c_median: Optional[float] = None
+    pressure_hpa_median: Optional[float] = None
+    humidity_pct_median: Optional[float] = None
+
+    # Velocity of the lowest-numbered shot marked cold bore
+    cold_bore_first_shot_mps: Optional[float] = None
+
+    # Timestamps
+    first_shot_at: Optional[datetime] = None
+    last_shot_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None  # When the summary was last refreshed
+
+    @classmethod
+    def from_supabase_record(cls, record: dict) -> "DopeSessionSummaryModel":
+        """Create a DopeSessionSummaryModel from a Supabase record"""
+        return cls(
+            dope_session_id=record.get("dope_session_id", ""),
+            user_id=record.get("user_id", ""),
+            shot_count=record.get("shot_count") or 0,
+            speed_mps_avg=record.get("speed_mps_avg"),
+            speed_mps_sd=record.get("speed_mps_sd"),
+            speed_mps_min=record.get("speed_mps_min"),
+            speed_mps_max=record.get("speed_mps_max"),
+            speed_mps_es=record.get("speed_mps_es"),
+            temperature_c_median=record.get("temperature_c_median"),
+            pressure_hpa_median=record.get("pressure_hpa_median"),
+            humidity_pct_median=record.get("humidity_pct_median"),
+            cold_bore_first_shot_mps=record.get("cold_bore_first_shot_mps"),
+            first_shot_at=parse_supabase_datetime(record.get("first_shot_at")),
+            last_shot_at=parse_supabase_datetime(record.get("last_shot_at")),
+            updated_at=parse_supabase_datetime(record.get("updated_at")),
+        )
+
+    def to_dict(self) -> dict:
+        """Convert DopeSessionSummaryModel to dictionary for database operations"""
+        return {
+            "dope_session_id": self.dope_session_id,
+            "user_id": self.user_id,
+            "shot_count": self.shot_count,
+            "speed_mps_avg": self.speed_mps_avg,
+            "speed_mps_sd": self.speed_mps_sd,
+            "speed_mps_min": self.speed_mps_min,
+            "speed_mps_max": self.speed_mps_max,
+            "speed_mps_es": self.speed_mps_es,
+            "temperature_c_median": self.temperature_c_median,
+            "pressure_hpa_median": self.pressure_hpa_median,
+            "humidity_pct_median": self.humidity_pct_median,
+            "cold_bore_first_shot_mps": self.cold_bore_first_shot_mps,
+            "first_shot_at": self.first_shot_at.isoformat() if self.first_shot_at else None,
+            "last_shot_at": self.last_shot_at.isoformat() if self.last_shot_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
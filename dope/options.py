@@ -0,0 +1,156 @@
+"""
+Concurrent loading of DOPE source options.
+
+Editing a DOPE session and the create wizard both need the user's
+chronograph sessions, rifles, cartridges, cartridge types, weather sources
+and ranges. These reads are independent, so ``DopeOptionsLoader`` fans them
+out on a thread pool with a per-call timeout instead of paying one round trip
+after another. Callers name the sources they need, and only those are read.
+Each loaded list is memoized per (user, source) until ``invalidate`` (called
+when a DOPE session is created or edited) or the TTL expires.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .cache import UserLRUCache
+
+OPTION_SOURCES = (
+    "chrono_sessions",
+    "rifles",
+    "cartridges",
+    "cartridge_types",
+    "weather_sources",
+    "ranges",
+)
+
+
+def source_readers(
+    supabase, user_id: str, sources: Iterable[str] = OPTION_SOURCES
+) -> Dict[str, Callable[[], List[Any]]]:
+    """Independent reads for the requested option sources"""
+    from cartridges.api import CartridgesAPI
+    from chronograph.client_api import ChronographAPI
+    from mapping.submission.submission_model import SubmissionModel
+    from rifles.api import RiflesAPI
+    from weather.api import WeatherAPI
+
+    cartridge_api = CartridgesAPI(supabase)
+    readers = {
+        "chrono_sessions": lambda: ChronographAPI(supabase).get_all_sessions(user_id),
+        "rifles": lambda: RiflesAPI(supabase).get_all_rifles(user_id),
+        "cartridges": lambda: cartridge_api.get_all_cartridges(user_id),
+        "cartridge_types": cartridge_api.get_cartridge_types,
+        "weather_sources": lambda: WeatherAPI(supabase).get_all_sources(user_id),
+        "ranges": lambda: SubmissionModel().get_user_ranges(user_id, supabase),
+    }
+    return {name: readers[name] for name in sources}
+
+
+@dataclass
+class DopeSourceOptions:
+    """Loaded option lists; sources that failed or timed out are empty"""
+
+    values: Dict[str, List[Any]] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    def get(self, source: str) -> List[Any]:
+        return list(self.values.get(source) or [])
+
+    def error_for(self, source: str) -> Optional[str]:
+        return self.errors.get(source)
+
+
+class DopeOptionsLoader:
+    """Thread-pool fan-out of option reads with per-source memoization"""
+
+    def __init__(
+        self,
+        max_users: int = 32,
+        ttl_seconds: Optional[float] = 300.0,
+        timeout_seconds: float = 10.0,
+        max_workers: int = len(OPTION_SOURCES),
+    ):
+        self.timeout_seconds = timeout_seconds
+        self._results: UserLRUCache[List[Any]] = UserLRUCache(
+            max_entries=max_users * len(OPTION_SOURCES), ttl_seconds=ttl_seconds
+        )
+        self._sources = set(OPTION_SOURCES)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="dope-options"
+        )
+
+    def load(
+        self,
+        supabase,
+        user_id: str,
+        sources: Optional[Iterable[str]] = None,
+        readers: Optional[Dict[str, Callable[[], List[Any]]]] = None,
+    ) -> DopeSourceOptions:
+        """Return the user's option lists for sources, reading misses concurrently
+
+        Args:
+            supabase: Supabase client used by the default readers
+            user_id: Owner of the options
+            sources: Sources to return; all of ``OPTION_SOURCES`` (or every
+                key of ``readers``) when None
+            readers: Replacement readers by source name (for tests)
+
+        The timeout applies to the whole call. A failed or timed out source is
+        returned empty with its error and not memoized, so the next call
+        retries it; the other sources are memoized.
+        """
+        if sources is None:
+            sources = readers.keys() if readers is not None else OPTION_SOURCES
+        sources = list(dict.fromkeys(sources))
+
+        options = DopeSourceOptions()
+        missing = []
+        for name in sources:
+            cached = self._results.get((user_id, name))
+            if cached is None:
+                missing.append(name)
+            else:
+                options.values[name] = list(cached)
+        if not missing:
+            return options
+
+        if readers is None:
+            readers = source_readers(supabase, user_id, missing)
+        futures = {name: self._executor.submit(readers[name]) for name in missing}
+        deadline = time.monotonic() + self.timeout_seconds
+
+        for name, future in futures.items():
+            try:
+                remaining = max(0.0, deadline - time.monotonic())
+                options.values[name] = list(future.result(timeout=remaining) or [])
+                self._sources.add(name)
+                self._results.put((user_id, name), list(options.values[name]))
+            except FutureTimeoutError:
+                future.cancel()
+                options.values[name] = []
+                options.errors[name] = (
+                    f"Timed out after {self.timeout_seconds:g}s loading {name}"
+                )
+            except Exception as e:
+                options.values[name] = []
+                options.errors[name] = str(e)
+
+        for name, error in options.errors.items():
+            print(f"Error loading DOPE options ({name}): {error}")
+        return options
+
+    def invalidate(self, user_id: Optional[str] = None) -> None:
+        """Drop memoized options for one user, or all when user_id is None"""
+        if user_id is None:
+            self._results.invalidate()
+            return
+        for name in list(self._sources):
+            self._results.invalidate((user_id, name))
+
+
+# Process-wide loader shared by the view page and the create wizard
+options_loader = DopeOptionsLoader()
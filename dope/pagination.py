@@ -0,0 +1,409 @@
+"""
+Keyset pagination for the DOPE sessions table.
+
+A page is addressed by an opaque cursor holding the sort key of the row at
+the page boundary (sort value + session ID), not by an offset, so pages stay
+stable when sessions are added or removed while a user is paging. The sorted
+order of a filtered session list is memoized per (user, data version, sort
+column, direction); each request only locates the cursor by binary search
+and builds display rows for the sessions on the requested page.
+
+When the session list is not cached, ``keyset_condition`` turns the same
+cursor into a PostgREST filter, so ``DopeService.get_sessions_page`` can
+fetch one page and a count from the database instead of every session.
+"""
+
+import base64
+import json
+import threading
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from functools import total_ordering
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .cache import UserLRUCache
+from .filters import _naive_timestamp, sessions_data_version
+from .models import DopeSessionModel
+
+
+def _text(value: Any) -> Optional[str]:
+    return value.casefold() if isinstance(value, str) and value.strip() else None
+
+
+def _number(value: Any) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if pd.isna(number) else number
+
+
+def _timestamp(value: Any) -> Optional[float]:
+    timestamp = _naive_timestamp(value)
+    return None if timestamp is None else float(timestamp.value)
+
+
+def _duration(session: DopeSessionModel) -> Optional[float]:
+    if session.start_time and session.end_time:
+        return (session.end_time - session.start_time).total_seconds()
+    return None
+
+
+def _joined(first: Optional[str], second: Optional[str]) -> Optional[str]:
+    return f"{first} {second}" if first else None
+
+
+# Table column -> sort key extractor (None sorts last in either direction)
+SESSION_TABLE_SORT_KEYS: Dict[str, Callable[[DopeSessionModel], Any]] = {
+    "Session Name": lambda s: _text(s.session_name),
+    "Start Time": lambda s: _timestamp(s.start_time),
+    "End Time": lambda s: _timestamp(s.end_time),
+    "Duration": _duration,
+    "Rifle": lambda s: _text(s.rifle_name),
+    "Cartridge": lambda s: _text(_joined(s.cartridge_make, s.cartridge_model)),
+    "Cartridge Type": lambda s: _text(s.cartridge_type),
+    "Bullet": lambda s: _text(_joined(s.bullet_make, s.bullet_model)),
+    "Bullet Weight (gr)": lambda s: _number(s.bullet_weight),
+    "Distance (m)": lambda s: _number(s.range_distance_m) or None,
+    "Range": lambda s: _text(s.range_name),
+    "Temperature (°C)": lambda s: _number(s.temperature_c_median),
+    "Humidity (%)": lambda s: _number(s.relative_humidity_pct_median),
+    "Wind Speed (m/s)": lambda s: _number(s.wind_speed_mps_median),
+    "Notes": lambda s: _text(s.notes),
+}
+
+SESSION_TABLE_COLUMNS = tuple(SESSION_TABLE_SORT_KEYS)
+
+# Sort columns whose key is a plain dope_sessions_flat column, so a page can
+# be fetched with a keyset query (text keys are case-folded and computed keys
+# combine columns, so those are only sorted in memory)
+SESSION_TABLE_VIEW_COLUMNS: Dict[str, str] = {
+    "Start Time": "start_time",
+    "End Time": "end_time",
+    "Temperature (°C)": "temperature_c_median",
+    "Humidity (%)": "relative_humidity_pct_median",
+    "Wind Speed (m/s)": "wind_speed_mps_median",
+}
+
+_TIMESTAMP_SORT_COLUMNS = ("Start Time", "End Time")
+
+
+def session_table_row(
+    session: DopeSessionModel, columns: Optional[Sequence[str]] = None
+) -> Dict[str, Any]:
+    """Build the display row for a session, limited to the given columns"""
+    row = {
+        "Session Name": session.session_name or "Unnamed Session",
+        "Start Time": (
+            session.start_time.strftime("%Y-%m-%d %H:%M")
+            if session.start_time
+            else "N/A"
+        ),
+        "End Time": (
+            session.end_time.strftime("%Y-%m-%d %H:%M")
+            if session.end_time
+            else "N/A"
+        ),
+        "Duration": (
+            str(session.end_time - session.start_time)
+            if session.start_time and session.end_time
+            else "N/A"
+        ),
+        "Rifle": session.rifle_name or "Unknown",
+        "Cartridge": (
+            f"{session.cartridge_make} {session.cartridge_model}"
+            if session.cartridge_make
+            else "Unknown"
+        ),
+        "Cartridge Type": session.cartridge_type or "Unknown",
+        "Bullet": (
+            f"{session.bullet_make} {session.bullet_model}"
+            if session.bullet_make
+            else "Unknown"
+        ),
+        "Bullet Weight (gr)": (
+            float(session.bullet_weight) if session.bullet_weight else None
+        ),
+        "Distance (m)": (
+            session.range_distance_m if session.range_distance_m else None
+        ),
+        "Range": session.range_name or "Unknown",
+        "Temperature (°C)": session.temperature_c_median,
+        "Humidity (%)": session.relative_humidity_pct_median,
+        "Wind Speed (m/s)": session.wind_speed_mps_median,
+        "Notes": (
+            (session.notes[:50] + "...")
+            if session.notes and len(session.notes) > 50
+            else (session.notes or "")
+        ),
+    }
+    if columns is None:
+        return row
+    return {column: row[column] for column in columns}
+
+
+@total_ordering
+class _Descending:
+    """Wrapper that inverts ordering so descending keys sort ascending"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.value == other.value
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.value < self.value
+
+
+def _order_key(raw_key: Tuple[Any, str], ascending: bool) -> Tuple:
+    """Comparable key placing rows in display order, missing values last
+
+    Ties, including rows with a missing value, are ordered by session ID in
+    the same direction, matching ``ORDER BY value, id ... NULLS LAST``.
+    """
+    value, session_id = raw_key
+    if value is None:
+        return (1, 0, session_id if ascending else _Descending(session_id))
+    if ascending:
+        return (0, value, session_id)
+    return (0, _Descending(value), _Descending(session_id))
+
+
+def encode_cursor(
+    sort_column: str, ascending: bool, raw_key: Tuple[Any, str], direction: str
+) -> str:
+    """Encode a page boundary as an opaque, URL-safe cursor string"""
+    payload = json.dumps(
+        {"c": sort_column, "a": ascending, "k": list(raw_key), "d": direction}
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Decode a cursor produced by encode_cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return {
+            "sort_column": payload["c"],
+            "ascending": bool(payload["a"]),
+            "key": (payload["k"][0], payload["k"][1]),
+            "direction": payload["d"],
+        }
+    except (ValueError, KeyError, IndexError, TypeError) as e:
+        raise ValueError(f"Invalid page cursor: {e}") from e
+
+
+def _view_literal(sort_column: str, value: Any) -> str:
+    """Quoted PostgREST literal for a sort key value"""
+    if sort_column in _TIMESTAMP_SORT_COLUMNS:
+        # Keys are naive UTC nanoseconds; round away float noise to whole
+        # microseconds, the database's resolution
+        nanoseconds = int(round(value / 1000.0)) * 1000
+        value = pd.Timestamp(nanoseconds, tz="UTC").isoformat()
+    return f'"{value}"'
+
+
+def keyset_condition(
+    sort_column: str, ascending: bool, raw_key: Tuple[Any, str], direction: str
+) -> str:
+    """PostgREST ``or`` filter selecting the rows after/before a page boundary
+
+    Mirrors ``_order_key``: rows are ordered by the view column (missing
+    values last), then by ID, both in the sort direction.
+    """
+    column = SESSION_TABLE_VIEW_COLUMNS[sort_column]
+    value, session_id = raw_key
+    forward = direction != "prev"
+    op = "gt" if ascending == forward else "lt"
+    same_value = (
+        f"{column}.is.null" if value is None
+        else f"{column}.eq.{_view_literal(sort_column, value)}"
+    )
+    tie = f'and({same_value},id.{op}."{session_id}")'
+    if value is None:
+        return tie if forward else f"{column}.not.is.null,{tie}"
+    beyond = f"{column}.{op}.{_view_literal(sort_column, value)}"
+    if forward:
+        return f"{beyond},{tie},{column}.is.null"
+    return f"{beyond},{tie}"
+
+
+def validate_page_request(
+    sort_column: str, columns: Optional[Sequence[str]] = None
+) -> None:
+    """Raise ValueError for an unknown sort column or table column"""
+    if sort_column not in SESSION_TABLE_SORT_KEYS:
+        raise ValueError(f"Unknown sort column: {sort_column}")
+    unknown = [c for c in columns or () if c not in SESSION_TABLE_SORT_KEYS]
+    if unknown:
+        raise ValueError(f"Unknown table columns: {unknown}")
+
+
+def resolve_cursor(
+    cursor: Optional[str], sort_column: str, ascending: bool
+) -> Optional[Dict[str, Any]]:
+    """Decoded cursor, or None when there is none or it is for another order
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not cursor:
+        return None
+    decoded = decode_cursor(cursor)
+    # Cursors from another sort order restart at the first page
+    if decoded["sort_column"] != sort_column or decoded["ascending"] != ascending:
+        return None
+    return decoded
+
+
+@dataclass
+class DopeSessionPage:
+    """One page of the DOPE sessions table"""
+
+    sessions: List[DopeSessionModel] = field(default_factory=list)
+    rows: List[Dict[str, Any]] = field(default_factory=list)
+    total_count: int = 0
+    offset: int = 0
+    page_size: int = 50
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_prev(self) -> bool:
+        return self.prev_cursor is not None
+
+
+def build_page(
+    page_sessions: List[DopeSessionModel],
+    sort_column: str,
+    ascending: bool,
+    total: int,
+    offset: int,
+    page_size: int,
+    columns: Optional[Sequence[str]] = None,
+) -> DopeSessionPage:
+    """Assemble a page with display rows and boundary cursors"""
+    extract = SESSION_TABLE_SORT_KEYS[sort_column]
+
+    def boundary_cursor(session: DopeSessionModel, direction: str) -> str:
+        raw_key = (extract(session), session.id or "")
+        return encode_cursor(sort_column, ascending, raw_key, direction)
+
+    end = offset + len(page_sessions)
+    return DopeSessionPage(
+        sessions=page_sessions,
+        rows=[session_table_row(s, columns) for s in page_sessions],
+        total_count=total,
+        offset=offset,
+        page_size=page_size,
+        next_cursor=(
+            boundary_cursor(page_sessions[-1], "next")
+            if end < total and page_sessions
+            else None
+        ),
+        prev_cursor=(
+            boundary_cursor(page_sessions[0], "prev")
+            if offset > 0 and page_sessions
+            else None
+        ),
+    )
+
+
+class DopeSessionPager:
+    """Memoized sort orders and cursor-based page slicing"""
+
+    def __init__(self, max_orders: int = 64):
+        self._orders: UserLRUCache[Tuple[List[int], List[Tuple]]] = UserLRUCache(
+            max_entries=max_orders, ttl_seconds=None
+        )
+        self._lock = threading.Lock()
+
+    def _sorted(
+        self,
+        user_id: str,
+        sessions: Sequence[DopeSessionModel],
+        sort_column: str,
+        ascending: bool,
+        version: Optional[Hashable] = None,
+    ) -> Tuple[List[int], List[Tuple]]:
+        """Return (row order, order keys) for sessions, memoized per data version"""
+        if version is None:
+            version = sessions_data_version(sessions)
+        key = (user_id, version, sort_column, ascending)
+
+        def build() -> Tuple[List[int], List[Tuple]]:
+            extract = SESSION_TABLE_SORT_KEYS[sort_column]
+            keys = [
+                _order_key((extract(s), s.id or ""), ascending) for s in sessions
+            ]
+            order = sorted(range(len(sessions)), key=keys.__getitem__)
+            return order, [keys[i] for i in order]
+
+        with self._lock:
+            return self._orders.get_or_load(key, build)
+
+    def page(
+        self,
+        user_id: str,
+        sessions: Sequence[DopeSessionModel],
+        sort_column: str = "Start Time",
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+        page_size: int = 50,
+        columns: Optional[Sequence[str]] = None,
+        version: Optional[Hashable] = None,
+    ) -> DopeSessionPage:
+        """Return the page of sessions after/before cursor in the given order
+
+        ``version`` identifies this exact session list (e.g. the session cache
+        revision plus the filter key); without it the list is fingerprinted.
+
+        Raises:
+            ValueError: If sort_column, columns or cursor are invalid
+        """
+        validate_page_request(sort_column, columns)
+        page_size = max(1, int(page_size))
+
+        order, order_keys = self._sorted(
+            user_id, sessions, sort_column, ascending, version)
+        total = len(order)
+
+        start = 0
+        decoded = resolve_cursor(cursor, sort_column, ascending)
+        if decoded:
+            boundary = _order_key(decoded["key"], ascending)
+            if decoded["direction"] == "prev":
+                end = bisect_left(order_keys, boundary)
+                start = max(0, end - page_size)
+            else:
+                start = bisect_right(order_keys, boundary)
+        end = min(total, start + page_size)
+
+        return build_page(
+            [sessions[i] for i in order[start:end]],
+            sort_column,
+            ascending,
+            total,
+            start,
+            page_size,
+            columns,
+        )
+
+
+# Process-wide pager shared by all DopeService instances (one per rerun)
+session_pager = DopeSessionPager()
@@ -12,10 +12,14 @@ DOPE is the convergence point that aggregates data from all other modules:
 - Ranges (location and distance)
 """
 
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, BinaryIO, Dict, List, Optional, Protocol
 
+import pandas as pd
+
+from .facets import DopeFacets
 from .filters import DopeSessionFilter
-from .models import DopeMeasurementModel, DopeSessionModel
+from .models import DopeMeasurementModel, DopeSessionModel, DopeSessionSummaryModel
+from .pagination import DopeSessionPage
 
 
 class DopeAPIProtocol(Protocol):
@@ -196,6 +200,9 @@ class DopeAPIProtocol(Protocol):
         """
         Delete multiple DOPE sessions in bulk.
 
+        IDs are deleted in chunks with one set-based statement for their
+        measurements and one for the sessions, rather than per session.
+
         Args:
             session_ids: List of session UUIDs to delete
             user_id: Auth0 user ID (security check)
@@ -203,7 +210,10 @@ class DopeAPIProtocol(Protocol):
         Returns:
             Dict with:
                 - deleted_count: int - Number of sessions deleted
-                - failed_ids: List[str] - IDs that failed to delete
+                - failed_sessions: List[str] - IDs that were not deleted
+                - total_requested: int - Number of IDs passed in
+                - results: List[Dict] - id, success and error for each unique ID
+                  (error is "Session not found" for missing/unowned IDs)
 
         Raises:
             Exception: If bulk delete fails
@@ -216,6 +226,19 @@ class DopeAPIProtocol(Protocol):
         """
         ...
 
+    def invalidate_cache(self, user_id: str) -> None:
+        """
+        Drop cached DOPE session data for a user.
+
+        Session lists are cached per user and invalidated automatically by
+        writes made through this API. Call this after writing DOPE data by
+        other means, or to force a reload from the database.
+
+        Args:
+            user_id: Auth0 user ID whose cached data should be dropped
+        """
+        ...
+
     # -------------------------------------------------------------------------
     # Session Querying & Filtering
     # -------------------------------------------------------------------------
@@ -229,15 +252,22 @@ class DopeAPIProtocol(Protocol):
         """
         Search DOPE sessions by text across multiple fields.
 
+        Uses the per-user search index, so text from joined cartridge, bullet,
+        rifle, range and weather source data is searchable. Every search word
+        must match, either exactly or as a word prefix ("sier" matches "Sierra").
+
         Args:
             user_id: Auth0 user ID to filter sessions
             search_term: Text to search for (case-insensitive)
             search_fields: Optional list of field names to search in.
-                Defaults to: session_name, notes, cartridge_make, cartridge_model,
-                bullet_make, bullet_model, rifle_name
+                Defaults to all indexed fields: session_name, notes,
+                cartridge_make, cartridge_model, cartridge_type, bullet_make,
+                bullet_model, bullet_weight, rifle_name, range_name,
+                range_display_name, weather_source_name
 
         Returns:
-            List[DopeSessionModel]: Matching sessions (empty list if no matches)
+            List[DopeSessionModel]: Matching sessions ranked by relevance
+                (all sessions if the search term is empty)
 
         Raises:
             Exception: If search fails
@@ -250,6 +280,36 @@ class DopeAPIProtocol(Protocol):
         """
         ...
 
+    def search_session_ids(
+        self,
+        user_id: str,
+        search_term: str,
+        search_fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[str]:
+        """
+        Search DOPE sessions and return only the ranked matching IDs.
+
+        Intended for paginated result lists: callers fetch one page of IDs and
+        resolve only those sessions.
+
+        Args:
+            user_id: Auth0 user ID to filter sessions
+            search_term: Text to search for (case-insensitive, prefix matching)
+            search_fields: Optional list of field names to search in
+            limit: Maximum number of IDs to return (None for all)
+            offset: Number of ranked IDs to skip
+
+        Returns:
+            List[str]: Matching session IDs, best match first
+
+        Example:
+            >>> api = DopeAPI(supabase_client)
+            >>> page = api.search_session_ids("auth0|123456", "hornady eld", limit=25)
+        """
+        ...
+
     def filter_sessions(
         self,
         user_id: str,
@@ -279,6 +339,79 @@ class DopeAPIProtocol(Protocol):
         """
         ...
 
+    def get_sessions_page(
+        self,
+        user_id: str,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_column: str = "Start Time",
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+        page_size: int = 50,
+        columns: Optional[List[str]] = None,
+    ) -> DopeSessionPage:
+        """
+        Get one sorted page of the sessions table using keyset pagination.
+
+        Sessions are filtered and sorted in the service; only the requested
+        page is materialized as display rows. Pages are addressed by opaque
+        cursors holding the boundary row's sort key, so they stay stable when
+        sessions are added or deleted between requests.
+
+        Args:
+            user_id: Auth0 user ID to filter sessions
+            filters: Optional filter dict (same keys as filter_sessions)
+            sort_column: Table column to sort by (see SESSION_TABLE_COLUMNS)
+            ascending: Sort direction; missing values always sort last
+            cursor: next_cursor/prev_cursor of a previous page, or None for
+                the first page
+            page_size: Maximum number of sessions on the page
+            columns: Table columns to include in each row (None for all)
+
+        Returns:
+            DopeSessionPage: Sessions and display rows for the page, the total
+                number of matching sessions, the page offset and the cursors
+                for the neighbouring pages (None at either end)
+
+        Raises:
+            ValueError: If sort_column, columns or cursor are invalid
+
+        Example:
+            >>> api = DopeAPI(supabase_client)
+            >>> page = api.get_sessions_page("auth0|123456", page_size=25)
+            >>> page.total_count, len(page.rows)
+            (120, 25)
+            >>> next_page = api.get_sessions_page(
+            ...     "auth0|123456", page_size=25, cursor=page.next_cursor
+            ... )
+        """
+        ...
+
+    def get_filter_facets(self, user_id: str) -> DopeFacets:
+        """
+        Get distinct values, counts and numeric ranges for all filter fields.
+
+        Built in one pass over the user's sessions and kept in a per-user
+        facet index that is updated incrementally as sessions change, so all
+        filter dropdowns and range sliders can be populated from one call.
+
+        Args:
+            user_id: Auth0 user ID to filter sessions
+
+        Returns:
+            DopeFacets: Sorted distinct values and per-value session counts for
+                text fields (e.g. "rifle_name", "cartridge_type") and (min, max)
+                ranges for numeric fields (e.g. "range_distance_m")
+
+        Example:
+            >>> api = DopeAPI(supabase_client)
+            >>> facets = api.get_filter_facets("auth0|123456")
+            >>> facets.values_for("rifle_name")
+            ['Custom 6.5 PRC', 'Remington 700']
+            >>> facets.range_for("range_distance_m")
+            (100.0, 600.0)
+        """
+        ...
+
     def get_unique_values(self, user_id: str, field_name: str) -> List[str]:
         """
         Get unique values for a specific field across user's sessions.
@@ -309,13 +442,19 @@ class DopeAPIProtocol(Protocol):
         """
         Get aggregate statistics across all user's DOPE sessions.
 
+        Computed by the dope_session_statistics database function, so one row
+        is transferred regardless of session count; cached until the next write.
+
         Returns:
             Dict with statistics including:
                 - total_sessions: int
-                - total_measurements: int
-                - unique_rifles: int
-                - unique_cartridges: int
-                - date_range: Dict[str, datetime]
+                - active_sessions: int
+                - archived_sessions: int
+                - unique_cartridge_types: int
+                - unique_bullet_makes: int
+                - unique_ranges: int
+                - average_distance_m: float
+                - distance_range: str ("min-maxm" or "No data")
 
         Raises:
             Exception: If statistics calculation fails
@@ -358,6 +497,126 @@ class DopeAPIProtocol(Protocol):
         """
         ...
 
+    def get_measurement_frame(
+        self, session_ids: List[str], user_id: str
+    ) -> pd.DataFrame:
+        """
+        Get measurements for many DOPE sessions as one typed pandas DataFrame.
+
+        Loads the measurements of all requested sessions in one query (chunked
+        ``in_`` filters) and joins each shot to its session attributes, so
+        analytics can work on columns instead of per-row models.
+
+        Args:
+            session_ids: UUIDs of the DOPE sessions to load
+            user_id: Auth0 user ID (security check; other users' sessions are ignored)
+
+        Returns:
+            pd.DataFrame: One row per shot ordered by session and shot_number.
+                Metric measurement columns are floats, datetime_shot is a UTC
+                datetime, elevation/windage adjustments are parsed to floats and
+                clean_bore/cold_bore are nullable booleans. Session columns
+                (session_name, rifle_name, cartridge_type, bullet_weight,
+                range_distance_m, weather medians, ...) are appended.
+
+        Raises:
+            Exception: If database query fails
+
+        Example:
+            >>> api = DopeAPI(supabase_client)
+            >>> frame = api.get_measurement_frame([id_a, id_b], "auth0|123456")
+            >>> frame.groupby("cartridge_type")["speed_mps"].mean()
+        """
+        ...
+
+    def export_sessions(
+        self,
+        session_ids: List[str],
+        user_id: str,
+        fileobj: BinaryIO,
+        export_format: str = "zip",
+    ) -> Dict[str, int]:
+        """
+        Stream many DOPE sessions with their measurements into a file.
+
+        Sessions are read in chunks (one measurement query per chunk) and each
+        chunk is written before the next is loaded, so memory stays bounded
+        by the chunk size rather than the number of sessions exported.
+
+        Args:
+            session_ids: UUIDs of the DOPE sessions to export
+            user_id: Auth0 user ID (security check; other users' sessions are ignored)
+            fileobj: Writable binary file object (e.g. a temporary file)
+            export_format: "zip" (one shot CSV per session plus sessions.csv)
+                or "parquet" (one row per shot with session columns)
+
+        Returns:
+            Dict[str, int]: Number of "sessions" and "shots" written
+
+        Raises:
+            ValueError: If export_format is not supported
+            Exception: If database query or writing fails
+
+        Example:
+            >>> api = DopeAPI(supabase_client)
+            >>> with open("dope.zip", "wb") as f:
+            ...     api.export_sessions([id_a, id_b], "auth0|123456", f, "zip")
+            {'sessions': 2, 'shots': 30}
+        """
+        ...
+
+    def get_session_summaries(
+        self, user_id: str, session_ids: Optional[List[str]] = None
+    ) -> Dict[str, DopeSessionSummaryModel]:
+        """
+        Get the maintained per-session summaries (one narrow row per session).
+
+        Summaries are refreshed whenever a session's measurements are written
+        through this API. Sessions that have no summary row yet are summarized
+        and stored on first read. If the summary table cannot be read or
+        written, summaries are computed from the measurements instead.
+
+        Args:
+            user_id: Auth0 user ID (security check)
+            session_ids: Sessions to return (all of the user's sessions if None)
+
+        Returns:
+            Dict[str, DopeSessionSummaryModel]: Summaries keyed by DOPE session ID
+                (shot_count, speed_mps_avg/sd/es, median shot weather,
+                cold_bore_first_shot_mps, first/last shot and refresh times)
+
+        Raises:
+            Exception: If loading the measurements for the fallback fails
+
+        Example:
+            >>> api = DopeAPI(supabase_client)
+            >>> summaries = api.get_session_summaries("auth0|123456")
+            >>> summaries[session_id].speed_mps_es
+            9.4
+        """
+        ...
+
+    def refresh_session_summaries(
+        self, session_ids: Optional[List[str]], user_id: str
+    ) -> List[DopeSessionSummaryModel]:
+        """
+        Recompute and store summaries from the sessions' measurements.
+
+        Used by the write path and for periodic backfills (pass None to
+        refresh every session of the user).
+
+        Args:
+            session_ids: Sessions to refresh (all of the user's sessions if None)
+            user_id: Auth0 user ID (security check)
+
+        Returns:
+            List[DopeSessionSummaryModel]: The stored summaries
+
+        Raises:
+            Exception: If loading measurements or storing summaries fails
+        """
+        ...
+
     def create_measurement(
         self, measurement_data: Dict[str, Any], user_id: str
     ) -> DopeMeasurementModel:
@@ -416,6 +675,42 @@ class DopeAPIProtocol(Protocol):
         """
         ...
 
+    def update_measurements_bulk(
+        self,
+        dope_session_id: str,
+        changes: Dict[str, Dict[str, Any]],
+        user_id: str,
+    ) -> Dict[str, Any]:
+        """
+        Update many measurements of a DOPE session, sending only changed columns.
+
+        Intended for grid editors: compute ``changes`` with
+        ``dope.bulk.diff_measurement_frames(original_df, edited_df)`` and save
+        them in one call instead of one update per shot. The cached
+        measurement list for the session is patched in place, so re-reading
+        it does not hit the database.
+
+        Args:
+            dope_session_id: UUID of the DOPE session owning the measurements
+            changes: {measurement_id: {field: new_value}} (metric units)
+            user_id: Auth0 user ID (security check)
+
+        Returns:
+            Dict with:
+                - updated_count: int
+                - failed_count: int
+                - results: List[Dict] with id, success and error per measurement
+                - measurements: List[DopeMeasurementModel] updated records
+
+        Example:
+            >>> api = DopeAPI(supabase_client)
+            >>> changes = diff_measurement_frames(original_df, edited_df)
+            >>> result = api.update_measurements_bulk(session_id, changes, "auth0|123456")
+            >>> result["updated_count"]
+            40
+        """
+        ...
+
     def delete_measurement(self, measurement_id: str, user_id: str) -> bool:
         """
         Delete a DOPE measurement.
@@ -445,6 +740,8 @@ class DopeAPIProtocol(Protocol):
         Get dropdown options for editing DOPE sessions.
 
         Returns options for rifles, cartridges, chronograph sessions, weather sources, and ranges.
+        The sources are read concurrently and memoized per user until the
+        next write or edit session.
 
         Args:
             user_id: Auth0 user ID to filter user-owned data
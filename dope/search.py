@@ -0,0 +1,273 @@
+"""
+Full-text search index for DOPE sessions.
+
+Each session is tokenized into a search document built from its own text
+fields and the text joined in from cartridges, bullets, rifles, ranges and
+weather sources. Tokens are kept in an inverted index with a sorted
+vocabulary so that queries support prefix matching, results are ranked by
+field weight, and only matching session IDs are returned for pagination.
+
+Indexes are maintained per user and updated incrementally: ``sync`` only
+re-tokenizes sessions whose searchable content changed since the last call.
+"""
+
+import re
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+from .models import DopeSessionModel
+
+# Searchable session fields and their ranking weight
+SEARCH_FIELD_WEIGHTS: Dict[str, float] = {
+    "session_name": 3.0,
+    "cartridge_make": 2.0,
+    "cartridge_model": 2.0,
+    "cartridge_type": 2.0,
+    "bullet_make": 2.0,
+    "bullet_model": 2.0,
+    "bullet_weight": 1.0,
+    "rifle_name": 2.0,
+    "range_name": 2.0,
+    "range_display_name": 1.5,
+    "weather_source_name": 1.0,
+    "notes": 1.0,
+}
+
+# Score multiplier for a query term that only matches a longer token
+PREFIX_MATCH_WEIGHT = 0.5
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into lowercase alphanumeric tokens"""
+    if not text:
+        return []
+    return _TOKEN_PATTERN.findall(str(text).lower())
+
+
+def _document_signature(session: DopeSessionModel) -> Tuple:
+    """Values of all searchable fields, used to detect changed documents"""
+    return tuple(getattr(session, field, None) for field in SEARCH_FIELD_WEIGHTS)
+
+
+class DopeSearchIndex:
+    """Inverted index over the search documents of one user's sessions"""
+
+    def __init__(self):
+        # token -> {session_id: {field: occurrences}}
+        self._postings: Dict[str, Dict[str, Dict[str, int]]] = {}
+        # session_id -> tokens indexed for it (for removal)
+        self._doc_tokens: Dict[str, Tuple[str, ...]] = {}
+        self._signatures: Dict[str, Tuple] = {}
+        self._order: Dict[str, int] = {}
+        self._vocabulary: List[str] = []
+        self._vocabulary_dirty = False
+        # Revision of the session list last synced, to skip unchanged lists
+        self._synced_version: Optional[Hashable] = None
+
+    def __len__(self) -> int:
+        return len(self._doc_tokens)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._doc_tokens
+
+    def add_or_update(self, session: DopeSessionModel) -> None:
+        """Index a session, replacing any previous document with the same ID"""
+        if not session.id:
+            return
+        self._synced_version = None
+        if session.id in self._doc_tokens:
+            self.remove(session.id)
+
+        tokens = set()
+        for field in SEARCH_FIELD_WEIGHTS:
+            for token in tokenize(getattr(session, field, None)):
+                doc_fields = self._postings.setdefault(token, {}).setdefault(
+                    session.id, {}
+                )
+                doc_fields[field] = doc_fields.get(field, 0) + 1
+                if token not in tokens:
+                    tokens.add(token)
+                    self._vocabulary_dirty = True
+
+        self._doc_tokens[session.id] = tuple(tokens)
+        self._signatures[session.id] = _document_signature(session)
+
+    def remove(self, session_id: str) -> None:
+        """Remove a session document from the index"""
+        self._synced_version = None
+        for token in self._doc_tokens.pop(session_id, ()):
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(session_id, None)
+            if not postings:
+                del self._postings[token]
+                self._vocabulary_dirty = True
+        self._signatures.pop(session_id, None)
+        self._order.pop(session_id, None)
+
+    def sync(
+        self,
+        sessions: Sequence[DopeSessionModel],
+        version: Optional[Hashable] = None,
+    ) -> int:
+        """Bring the index in line with the given sessions
+
+        Only new or changed sessions are re-tokenized and sessions that are no
+        longer present are removed. The list order is kept as the tie-breaker
+        for equally ranked results. When ``version`` (the session cache
+        revision) matches the last synced list, nothing is re-checked.
+
+        Returns:
+            int: Number of documents added, updated or removed
+        """
+        if version is not None and version == self._synced_version:
+            return 0
+        changes = 0
+        current_ids = set()
+        for position, session in enumerate(sessions):
+            if not session.id:
+                continue
+            current_ids.add(session.id)
+            self._order[session.id] = position
+            if self._signatures.get(session.id) != _document_signature(session):
+                self.add_or_update(session)
+                self._order[session.id] = position
+                changes += 1
+
+        for stale_id in [sid for sid in self._doc_tokens if sid not in current_ids]:
+            self.remove(stale_id)
+            changes += 1
+
+        self._synced_version = version
+        return changes
+
+    def _tokens_with_prefix(self, prefix: str) -> Iterable[str]:
+        """Yield vocabulary tokens starting with prefix"""
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+        start = bisect_left(self._vocabulary, prefix)
+        for token in self._vocabulary[start:]:
+            if not token.startswith(prefix):
+                break
+            yield token
+
+    def search(
+        self,
+        query: str,
+        fields: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[str]:
+        """Return ranked IDs of sessions matching every query term
+
+        Each query term matches index tokens it is a prefix of; exact token
+        matches score higher than prefix matches, and matches are weighted by
+        the field they occur in.
+
+        Args:
+            query: Free-text query
+            fields: Optional subset of searchable fields to match against
+            limit: Maximum number of IDs to return (None for all)
+            offset: Number of ranked IDs to skip
+
+        Returns:
+            List[str]: Matching session IDs, best match first
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        weights = (
+            {f: w for f, w in SEARCH_FIELD_WEIGHTS.items() if f in fields}
+            if fields
+            else SEARCH_FIELD_WEIGHTS
+        )
+
+        scores: Optional[Dict[str, float]] = None
+        for term in terms:
+            term_scores: Dict[str, float] = {}
+            for token in self._tokens_with_prefix(term):
+                multiplier = 1.0 if token == term else PREFIX_MATCH_WEIGHT
+                for session_id, doc_fields in self._postings[token].items():
+                    score = sum(
+                        weights[field] * count
+                        for field, count in doc_fields.items()
+                        if field in weights
+                    )
+                    if score:
+                        term_scores[session_id] = (
+                            term_scores.get(session_id, 0.0) + score * multiplier
+                        )
+
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {
+                    sid: scores[sid] + term_scores[sid]
+                    for sid in scores
+                    if sid in term_scores
+                }
+            if not scores:
+                return []
+
+        ranked = sorted(
+            scores, key=lambda sid: (-scores[sid], self._order.get(sid, 0))
+        )
+        end = None if limit is None else offset + limit
+        return ranked[offset:end]
+
+
+class DopeSearchIndexRegistry:
+    """Per-user search indexes with bounded LRU retention"""
+
+    def __init__(self, max_users: int = 32):
+        self.max_users = max_users
+        self._indexes: "OrderedDict[str, DopeSearchIndex]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_index(self, user_id: str) -> DopeSearchIndex:
+        """Return the index for a user, creating an empty one if needed"""
+        with self._lock:
+            index = self._indexes.get(user_id)
+            if index is None:
+                index = DopeSearchIndex()
+                self._indexes[user_id] = index
+                while len(self._indexes) > self.max_users:
+                    self._indexes.popitem(last=False)
+            else:
+                self._indexes.move_to_end(user_id)
+            return index
+
+    def search(
+        self,
+        user_id: str,
+        sessions: Sequence[DopeSessionModel],
+        query: str,
+        fields: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        version: Optional[Hashable] = None,
+    ) -> List[str]:
+        """Sync the user's index with sessions and return ranked matching IDs"""
+        index = self.get_index(user_id)
+        with self._lock:
+            index.sync(sessions, version)
+            return index.search(query, fields=fields, limit=limit, offset=offset)
+
+    def invalidate(self, user_id: Optional[str] = None) -> None:
+        """Drop the index for one user, or all indexes when user_id is None"""
+        with self._lock:
+            if user_id is None:
+                self._indexes.clear()
+            else:
+                self._indexes.pop(user_id, None)
+
+
+# Process-wide registry shared by all DopeService instances (one per rerun)
+search_index_registry = DopeSearchIndexRegistry()
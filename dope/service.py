@@ -1,12 +1,68 @@
 import uuid
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
 
-from chronograph.service import ChronographService
-
-from .filters import DopeSessionFilter
-from .models import DopeMeasurementModel, DopeSessionModel
+import pandas as pd
 
+from chronograph.chronograph_session_models import ChronographSession
+from chronograph.service import ChronographService
+from utils.bulk_writer import BulkWriter
+
+from .bulk import ID_CHUNK_SIZE, chunked
+from .cache import (
+    dope_measurement_cache,
+    dope_session_cache,
+    dope_statistics_cache,
+    dope_summary_cache,
+)
+from .export import EXPORT_SESSION_CHUNK_SIZE, write_sessions_export
+from .facets import FACET_TEXT_FIELDS, DopeFacetIndex, DopeFacets, facet_registry
+from .filters import DopeSessionFilter, make_filter_key, session_frame_cache
+from .frames import MEASUREMENT_FRAME_SOURCE_COLUMNS, build_measurement_frame
+from .models import (
+    DOPE_SESSION_FLAT_COLUMNS,
+    DopeMeasurementModel,
+    DopeSessionModel,
+    DopeSessionSummaryModel,
+)
+from .options import options_loader
+from .pagination import (
+    SESSION_TABLE_VIEW_COLUMNS,
+    DopeSessionPage,
+    build_page,
+    keyset_condition,
+    resolve_cursor,
+    session_pager,
+    validate_page_request,
+)
+from .search import search_index_registry, tokenize
+from .summary import SUMMARY_COLUMNS, summarize_measurements
+
+# Chronograph session columns shown by the create wizard's session picker
+UNUSED_CHRONO_SESSION_COLUMNS = (
+    "id",
+    "user_id",
+    "tab_name",
+    "session_name",
+    "datetime_local",
+    "uploaded_at",
+    "chronograph_source_id",
+    "shot_count",
+    "avg_speed_mps",
+    "std_dev_mps",
+    "min_speed_mps",
+    "max_speed_mps",
+)
+UNUSED_CHRONO_PAGE_SIZE = 50
+
+# Option sources shown by the edit form (cartridge types are not needed)
+EDIT_OPTION_SOURCES = (
+    "chrono_sessions",
+    "rifles",
+    "cartridges",
+    "weather_sources",
+    "ranges",
+)
 
 class DopeService:
     """Service class for DOPE sessions database operations"""
@@ -20,68 +76,25 @@ class DopeService:
                 type(self.supabase).__name__) == "MagicMock":
             return self._get_mock_sessions(user_id)
 
+        cached_sessions = dope_session_cache.get_sessions(user_id)
+        if cached_sessions is not None:
+            return cached_sessions
+
         try:
-            # Query dope_sessions with joins to get related data
+            # One flat row per session from the denormalized read model
             response = (
-                self.supabase.table("dope_sessions")
-                .select(
-                    """
-                    *,
-                    cartridges!cartridge_id (
-                        make,
-                        model,
-                        cartridge_type,
-                        bullets!bullet_id (
-                            manufacturer,
-                            model,
-                            weight_grains,
-                            bullet_length_mm,
-                            ballistic_coefficient_g1,
-                            ballistic_coefficient_g7,
-                            sectional_density,
-                            bullet_diameter_groove_mm,
-                            bore_diameter_land_mm
-                        )
-                    ),
-                    rifles!rifle_id (
-                        name,
-                        barrel_length,
-                        barrel_twist_ratio
-                    ),
-                    ranges_submissions!range_submission_id (
-                        range_name,
-                        range_description,
-                        display_name,
-                        start_lat,
-                        start_lon,
-                        end_lat,
-                        end_lon,
-                        start_altitude_m,
-                        distance_m,
-                        azimuth_deg,
-                        elevation_angle_deg
-                    ),
-                    weather_source!weather_source_id (
-                        name
-                    ),
-                    chrono_sessions!chrono_session_id (
-                        session_name,
-                        datetime_local
-                    )
-                """
-                )
+                self.supabase.table("dope_sessions_flat")
+                .select(",".join(DOPE_SESSION_FLAT_COLUMNS))
                 .eq("user_id", user_id)
                 .order("created_at", desc=True)
                 .execute()
             )
 
-            # Convert the joined data to DopeSessionModel instances
-            sessions = []
-            for record in response.data:
-                session_data = self._flatten_joined_record(record)
-                sessions.append(
-                    DopeSessionModel.from_supabase_record(session_data))
+            sessions = [
+                DopeSessionModel.from_flat_record(record) for record in response.data
+            ]
 
+            dope_session_cache.put_sessions(user_id, sessions)
             return sessions
 
         except Exception as e:
@@ -89,59 +102,41 @@ class DopeService:
             # Fallback to mock data for development
             return self._get_mock_sessions(user_id)
 
+    def _get_sessions_versioned(
+        self, user_id: str
+    ) -> Tuple[List[DopeSessionModel], Optional[int]]:
+        """Get the user's sessions plus the session cache revision they came from
+
+        The revision keys the derived filter, sort and search caches. Mock and
+        fallback lists are not cached and get None, so they are fingerprinted.
+        """
+        if not self.supabase or str(
+                type(self.supabase).__name__) == "MagicMock":
+            return self._get_mock_sessions(user_id), None
+
+        cached = dope_session_cache.get_versioned(user_id)
+        if cached is not None:
+            return cached
+        sessions = self.get_sessions_for_user(user_id)
+        cached = dope_session_cache.get_versioned(user_id)
+        return cached if cached is not None else (sessions, None)
+
+    def invalidate_cache(self, user_id: str) -> None:
+        """Drop cached DOPE session data for a user so the next read hits the database"""
+        dope_session_cache.invalidate(user_id)
+        dope_measurement_cache.invalidate_user(user_id)
+        dope_summary_cache.invalidate(user_id)
+        dope_statistics_cache.invalidate(user_id)
+        options_loader.invalidate(user_id)
+
     def get_session_by_id(
         self, session_id: str, user_id: str
     ) -> Optional[DopeSessionModel]:
-        """Get a specific DOPE session by ID with joined data"""
+        """Get a specific DOPE session by ID from the flat read model"""
         try:
             response = (
-                self.supabase.table("dope_sessions")
-                .select(
-                    """
-                    *,
-                    cartridges!cartridge_id (
-                        make,
-                        model,
-                        cartridge_type,
-                        bullets!bullet_id (
-                            manufacturer,
-                            model,
-                            weight_grains,
-                            bullet_length_mm,
-                            ballistic_coefficient_g1,
-                            ballistic_coefficient_g7,
-                            sectional_density,
-                            bullet_diameter_groove_mm,
-                            bore_diameter_land_mm
-                        )
-                    ),
-                    rifles!rifle_id (
-                        name,
-                        barrel_length,
-                        barrel_twist_ratio
-                    ),
-                    ranges_submissions!range_submission_id (
-                        range_name,
-                        range_description,
-                        display_name,
-                        start_lat,
-                        start_lon,
-                        end_lat,
-                        end_lon,
-                        start_altitude_m,
-                        distance_m,
-                        azimuth_deg,
-                        elevation_angle_deg
-                    ),
-                    weather_source!weather_source_id (
-                        name
-                    ),
-                    chrono_sessions!chrono_session_id (
-                        session_name,
-                        datetime_local
-                    )
-                """
-                )
+                self.supabase.table("dope_sessions_flat")
+                .select(",".join(DOPE_SESSION_FLAT_COLUMNS))
                 .eq("id", session_id)
                 .eq("user_id", user_id)
                 .single()
@@ -149,8 +144,7 @@ class DopeService:
             )
 
             if response.data:
-                session_data = self._flatten_joined_record(response.data)
-                return DopeSessionModel.from_supabase_record(session_data)
+                return DopeSessionModel.from_flat_record(response.data)
             return None
 
         except Exception as e:
@@ -169,6 +163,12 @@ class DopeService:
                     type(self.supabase).__name__) == "MagicMock":
                 return self._get_mock_measurements(dope_session_id, user_id)
 
+            cached = dope_measurement_cache.get_measurements(
+                user_id, dope_session_id
+            )
+            if cached is not None:
+                return cached
+
             response = (
                 self.supabase.table("dope_measurements")
                 .select("*")
@@ -178,16 +178,263 @@ class DopeService:
                 .execute()
             )
 
-            if response.data:
+            measurements = (
                 # Convert database records directly to models (field names now aligned)
-                return DopeMeasurementModel.from_supabase_records(response.data)
-            return []
+                DopeMeasurementModel.from_supabase_records(response.data)
+                if response.data
+                else []
+            )
+            dope_measurement_cache.put_measurements(
+                user_id, dope_session_id, measurements
+            )
+            return measurements
 
         except Exception as e:
             print(
                 f"Error fetching DOPE measurements for session {dope_session_id}: {e}")
             return self._get_mock_measurements(dope_session_id, user_id)
 
+    def get_measurement_frame(
+        self,
+        session_ids: List[str],
+        user_id: str,
+        chunk_size: int = ID_CHUNK_SIZE,
+    ) -> pd.DataFrame:
+        """Get measurements for many sessions as one typed, session-joined frame
+
+        Sessions that do not belong to the user contribute no rows. Session
+        IDs are sent as ``in_`` filters of at most chunk_size IDs each.
+        """
+        sessions = self._owned_sessions(session_ids, user_id)
+        if not sessions:
+            return build_measurement_frame([], [])
+        records = self._load_measurement_records(
+            [s.id for s in sessions], user_id, chunk_size
+        )
+        return build_measurement_frame(records, sessions)
+
+    def iter_measurement_frames(
+        self,
+        session_ids: List[str],
+        user_id: str,
+        chunk_size: int = EXPORT_SESSION_CHUNK_SIZE,
+    ) -> Iterator[Tuple[List[DopeSessionModel], pd.DataFrame]]:
+        """Yield (sessions, measurement frame) for chunk_size sessions at a time
+
+        Like get_measurement_frame, but only one chunk of sessions and their
+        shots is held in memory, for exports of any number of sessions.
+        Sessions keep the order of session_ids.
+        """
+        for sessions in chunked(self._owned_sessions(session_ids, user_id), chunk_size):
+            records = self._load_measurement_records(
+                [s.id for s in sessions], user_id, chunk_size
+            )
+            yield sessions, build_measurement_frame(records, sessions)
+
+    def export_sessions(
+        self,
+        session_ids: List[str],
+        user_id: str,
+        fileobj: BinaryIO,
+        export_format: str = "zip",
+        chunk_size: int = EXPORT_SESSION_CHUNK_SIZE,
+    ) -> Dict[str, int]:
+        """Stream sessions and their measurements into fileobj (see dope.export)"""
+        try:
+            return write_sessions_export(
+                fileobj,
+                self.iter_measurement_frames(session_ids, user_id, chunk_size),
+                export_format,
+            )
+        except ValueError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error exporting DOPE sessions: {str(e)}")
+
+    def _owned_sessions(
+        self, session_ids: List[str], user_id: str
+    ) -> List[DopeSessionModel]:
+        """The user's sessions among session_ids, in request order"""
+        by_id = {s.id: s for s in self.get_sessions_for_user(user_id)}
+        return [
+            by_id[sid]
+            for sid in dict.fromkeys(sid for sid in session_ids if sid)
+            if sid in by_id
+        ]
+
+    def _load_measurement_records(
+        self, session_ids: List[str], user_id: str, chunk_size: int
+    ) -> List[Dict[str, Any]]:
+        """Frame records for the given owned sessions (mock data in mock mode)"""
+        if not self.supabase or str(type(self.supabase).__name__) == "MagicMock":
+            return [
+                {"id": m.id, **m.to_dict()}
+                for sid in session_ids
+                for m in self._get_mock_measurements(sid, user_id)
+            ]
+        return self._fetch_measurement_records(session_ids, user_id, chunk_size)
+
+    def _fetch_measurement_records(
+        self,
+        session_ids: List[str],
+        user_id: str,
+        chunk_size: int = ID_CHUNK_SIZE,
+    ) -> List[Dict[str, Any]]:
+        """Load frame columns of the user's measurements for many sessions"""
+        records: List[Dict[str, Any]] = []
+        try:
+            for chunk in chunked(session_ids, chunk_size):
+                response = (
+                    self.supabase.table("dope_measurements")
+                    .select(", ".join(MEASUREMENT_FRAME_SOURCE_COLUMNS))
+                    .in_("dope_session_id", chunk)
+                    .eq("user_id", user_id)
+                    .execute()
+                )
+                records.extend(response.data or [])
+        except Exception as e:
+            raise Exception(f"Error fetching DOPE measurement frame: {str(e)}")
+        return records
+
+    def get_session_summaries(
+        self, user_id: str, session_ids: Optional[List[str]] = None
+    ) -> Dict[str, DopeSessionSummaryModel]:
+        """Get per-session summaries keyed by session ID
+
+        Reads the narrow dope_session_summary rows (cached per user). Sessions
+        without a summary row yet are summarized and written on first read.
+        If the summary table cannot be read or written, the summaries are
+        computed from the sessions' measurements instead.
+        """
+        if session_ids is None:
+            session_ids = [s.id for s in self.get_sessions_for_user(user_id)]
+        session_ids = list(dict.fromkeys(sid for sid in session_ids if sid))
+
+        if not self.supabase or str(type(self.supabase).__name__) == "MagicMock":
+            return self._summarize_from_measurements(session_ids, user_id)
+
+        cached = dope_summary_cache.get_summaries(user_id)
+        if cached is None:
+            try:
+                response = (
+                    self.supabase.table("dope_session_summary")
+                    .select(", ".join(SUMMARY_COLUMNS))
+                    .eq("user_id", user_id)
+                    .execute()
+                )
+            except Exception as e:
+                print(f"Error fetching DOPE session summaries: {e}")
+                return self._summarize_from_measurements(session_ids, user_id)
+            cached = {
+                record["dope_session_id"]: DopeSessionSummaryModel.from_supabase_record(record)
+                for record in response.data or []
+            }
+            dope_summary_cache.put_summaries(user_id, cached)
+
+        summaries = {sid: cached[sid] for sid in session_ids if sid in cached}
+        missing = [sid for sid in session_ids if sid not in cached]
+        if missing:
+            try:
+                for summary in self.refresh_session_summaries(missing, user_id):
+                    summaries[summary.dope_session_id] = summary
+            except Exception as e:
+                print(f"Warning: could not backfill DOPE session summaries: {e}")
+                summaries.update(self._summarize_from_measurements(missing, user_id))
+
+        return {sid: summaries[sid] for sid in session_ids if sid in summaries}
+
+    def _summarize_from_measurements(
+        self, session_ids: List[str], user_id: str
+    ) -> Dict[str, DopeSessionSummaryModel]:
+        """Summaries computed in memory from the sessions' measurements
+
+        Measurements already in the measurement cache are reused; the rest
+        are loaded in chunked queries. Nothing is written.
+        """
+        records: List[Dict[str, Any]] = []
+        uncached = []
+        for sid in session_ids:
+            measurements = dope_measurement_cache.get_measurements(user_id, sid)
+            if measurements is None:
+                uncached.append(sid)
+            else:
+                records.extend({"id": m.id, **m.to_dict()} for m in measurements)
+        if uncached:
+            records.extend(
+                self._load_measurement_records(uncached, user_id, ID_CHUNK_SIZE)
+            )
+        summaries = summarize_measurements(
+            build_measurement_frame(records, []), session_ids, user_id
+        )
+        return {s.dope_session_id: s for s in summaries}
+
+    def refresh_session_summaries(
+        self,
+        session_ids: Optional[List[str]],
+        user_id: str,
+        chunk_size: int = ID_CHUNK_SIZE,
+    ) -> List[DopeSessionSummaryModel]:
+        """Recompute and store summaries for sessions (all of the user's if None)
+
+        Suitable for a periodic backfill job as well as the write path.
+        """
+        if session_ids is None:
+            session_ids = [s.id for s in self.get_sessions_for_user(user_id)]
+        session_ids = list(dict.fromkeys(sid for sid in session_ids if sid))
+        if not session_ids:
+            return []
+
+        records = self._fetch_measurement_records(session_ids, user_id, chunk_size)
+        summaries = summarize_measurements(
+            build_measurement_frame(records, []), session_ids, user_id
+        )
+        try:
+            for chunk in chunked(summaries, chunk_size):
+                (
+                    self.supabase.table("dope_session_summary")
+                    .upsert([s.to_dict() for s in chunk], on_conflict="dope_session_id")
+                    .execute()
+                )
+        except Exception as e:
+            raise Exception(f"Error storing DOPE session summaries: {str(e)}")
+
+        dope_summary_cache.patch_summaries(user_id, summaries)
+        return summaries
+
+    def _refresh_summaries_after_write(
+        self, session_ids: List[str], user_id: str
+    ) -> None:
+        """Refresh summaries of written sessions without failing the write"""
+        try:
+            self.refresh_session_summaries(session_ids, user_id)
+        except Exception as e:
+            print(f"Warning: could not refresh DOPE session summaries: {e}")
+            dope_summary_cache.invalidate(user_id)
+
+    def _expire_summaries_after_write(
+        self, session_ids: List[str], user_id: str
+    ) -> None:
+        """Mark summaries of sessions changed by a single-row write as stale
+
+        Deletes their dope_session_summary rows instead of recomputing them,
+        so a one-shot edit costs one statement. ``get_session_summaries``
+        backfills every expired session in one refresh on the next read.
+        """
+        session_ids = list(dict.fromkeys(sid for sid in session_ids if sid))
+        if not session_ids:
+            return
+        dope_summary_cache.drop_summaries(user_id, session_ids)
+        try:
+            (
+                self.supabase.table("dope_session_summary")
+                .delete()
+                .in_("dope_session_id", session_ids)
+                .eq("user_id", user_id)
+                .execute()
+            )
+        except Exception as e:
+            print(f"Warning: could not expire DOPE session summaries: {e}")
+
     def create_measurement(self, measurement_data: Dict[str, Any], user_id: str) -> DopeMeasurementModel:
         """Create a new DOPE measurement"""
         if not self.supabase or str(type(self.supabase).__name__) == "MagicMock":
@@ -217,10 +464,13 @@ class DopeService:
                 .insert(insert_data)
                 .execute()
             )
+            self.invalidate_cache(user_id)
 
             if response.data:
                 # Convert back to model (field names now aligned)
-                return DopeMeasurementModel.from_supabase_record(response.data[0])
+                created = DopeMeasurementModel.from_supabase_record(response.data[0])
+                self._expire_summaries_after_write([created.dope_session_id], user_id)
+                return created
             else:
                 raise Exception("Failed to create measurement")
 
@@ -260,10 +510,16 @@ class DopeService:
                 .eq("user_id", user_id)
                 .execute()
             )
+            dope_session_cache.invalidate(user_id)
 
             if response.data:
                 # Convert back to model (field names now aligned)
-                return DopeMeasurementModel.from_supabase_record(response.data[0])
+                updated = DopeMeasurementModel.from_supabase_record(response.data[0])
+                dope_measurement_cache.patch_measurements(
+                    user_id, updated.dope_session_id, [updated]
+                )
+                self._expire_summaries_after_write([updated.dope_session_id], user_id)
+                return updated
             else:
                 raise Exception(f"Measurement {measurement_id} not found")
 
@@ -271,6 +527,89 @@ class DopeService:
             print(f"Error updating DOPE measurement: {e}")
             raise Exception(f"Failed to update measurement {measurement_id}: {str(e)}")
 
+    def update_measurements_bulk(
+        self,
+        dope_session_id: str,
+        changes: Dict[str, Dict[str, Any]],
+        user_id: str,
+        chunk_size: int = ID_CHUNK_SIZE,
+    ) -> Dict[str, Any]:
+        """Apply changed fields to many measurements of a session
+
+        Only the changed columns are sent, so columns the user did not touch
+        are never written back from a possibly stale cache. Measurements
+        sharing the same change set (e.g. a column filled down the grid) are
+        updated by one ``update(...).in_("id", ids)`` statement per chunk.
+        """
+        results: Dict[str, Dict[str, Any]] = {
+            measurement_id: {"id": measurement_id, "success": False, "error": None}
+            for measurement_id in changes
+        }
+        now = datetime.now().isoformat()
+
+        groups: Dict[Tuple, List[str]] = {}
+        for measurement_id, fields in changes.items():
+            key = tuple(sorted(fields.items()))
+            groups.setdefault(key, []).append(measurement_id)
+
+        updated: List[DopeMeasurementModel] = []
+        is_mock = not self.supabase or str(
+            type(self.supabase).__name__) == "MagicMock"
+        by_id = (
+            {m.id: m for m in self.get_measurements_for_dope_session(
+                dope_session_id, user_id)}
+            if is_mock else {}
+        )
+        for key, group_ids in groups.items():
+            fields = dict(key)
+            for chunk in chunked(group_ids, chunk_size):
+                if is_mock:
+                    # Mock implementation - echo the changed rows back
+                    saved = [
+                        {**by_id[i].to_dict(), "id": i, **fields}
+                        for i in chunk if i in by_id
+                    ]
+                else:
+                    try:
+                        response = (
+                            self.supabase.table("dope_measurements")
+                            .update({**fields, "updated_at": now})
+                            .in_("id", chunk)
+                            .eq("dope_session_id", dope_session_id)
+                            .eq("user_id", user_id)
+                            .execute()
+                        )
+                        saved = response.data or []
+                    except Exception as e:
+                        print(f"Error bulk updating DOPE measurements: {e}")
+                        for measurement_id in chunk:
+                            results[measurement_id]["error"] = str(e)
+                        continue
+
+                saved_by_id = {record["id"]: record for record in saved}
+                for measurement_id in chunk:
+                    record = saved_by_id.get(measurement_id)
+                    if record is None:
+                        results[measurement_id]["error"] = (
+                            "Measurement not found in session")
+                        continue
+                    results[measurement_id]["success"] = True
+                    updated.append(DopeMeasurementModel.from_supabase_record(record))
+
+        if updated and not is_mock:
+            dope_session_cache.invalidate(user_id)
+            dope_measurement_cache.patch_measurements(
+                user_id, dope_session_id, updated)
+            self._refresh_summaries_after_write([dope_session_id], user_id)
+
+        updated_count = sum(1 for r in results.values() if r["success"])
+        return {
+            "updated_count": updated_count,
+            "failed_count": len(results) - updated_count,
+            "results": list(results.values()),
+            "measurements": updated,
+        }
+
     def delete_measurement(self, measurement_id: str, user_id: str) -> bool:
         """Delete a DOPE measurement"""
         if not self.supabase or str(type(self.supabase).__name__) == "MagicMock":
@@ -285,6 +624,11 @@ class DopeService:
                 .eq("user_id", user_id)
                 .execute()
             )
+            self.invalidate_cache(user_id)
+            deleted_from = [
+                record.get("dope_session_id") for record in response.data or []
+            ]
+            self._expire_summaries_after_write(deleted_from, user_id)
             return len(response.data) > 0
 
         except Exception as e:
@@ -336,6 +680,7 @@ class DopeService:
 
             response = (self.supabase.table(
                 "dope_sessions").insert(insert_data).execute())
+            self.invalidate_cache(user_id)
 
             if response.data:
                 new_session_id = response.data[0]["id"]
@@ -421,6 +766,7 @@ class DopeService:
                 .eq("user_id", user_id)
                 .execute()
             )
+            self.invalidate_cache(user_id)
 
             if response.data and len(response.data) > 0:
                 # Return the updated session with all joined data
@@ -457,6 +803,7 @@ class DopeService:
                 .eq("user_id", user_id)
                 .execute()
             )
+            self.invalidate_cache(user_id)
 
             # Return True if the session was successfully deleted
             return len(session_response.data) > 0
@@ -465,347 +812,414 @@ class DopeService:
             print(f"Error deleting DOPE session: {e}")
             return False
 
-    def delete_sessions_bulk(self, session_ids: List[str], user_id: str) -> Dict[str, Any]:
-        """Delete multiple DOPE sessions and all associated measurements"""
+    def delete_sessions_bulk(
+        self,
+        session_ids: List[str],
+        user_id: str,
+        chunk_size: int = ID_CHUNK_SIZE,
+    ) -> Dict[str, Any]:
+        """Delete multiple DOPE sessions and all associated measurements
+
+        Each chunk of IDs is deleted with two set-based statements (measurements,
+        then sessions) instead of two round trips per session. The IDs returned
+        by the session delete determine the exact outcome for every ID.
+        """
+        unique_ids = list(dict.fromkeys(session_ids))
+        results: Dict[str, Dict[str, Any]] = {
+            session_id: {"id": session_id, "success": False, "error": None}
+            for session_id in unique_ids
+        }
+
         if not self.supabase or str(type(self.supabase).__name__) == "MagicMock":
             # Mock implementation
-            return {"deleted_count": len(session_ids), "failed_sessions": []}
-
-        deleted_count = 0
-        failed_sessions = []
-
-        for session_id in session_ids:
-            try:
-                if self.delete_session(session_id, user_id):
-                    deleted_count += 1
-                else:
-                    failed_sessions.append(session_id)
-            except Exception as e:
-                print(f"Error deleting session {session_id}: {e}")
-                failed_sessions.append(session_id)
-
+            for result in results.values():
+                result["success"] = True
+        else:
+            for chunk in chunked(unique_ids, chunk_size):
+                try:
+                    # Delete measurements first - there is no cascade on the FK
+                    (
+                        self.supabase.table("dope_measurements")
+                        .delete()
+                        .in_("dope_session_id", chunk)
+                        .eq("user_id", user_id)
+                        .execute()
+                    )
+                    session_response = (
+                        self.supabase.table("dope_sessions")
+                        .delete()
+                        .in_("id", chunk)
+                        .eq("user_id", user_id)
+                        .execute()
+                    )
+                except Exception as e:
+                    print(f"Error bulk deleting DOPE sessions: {e}")
+                    for session_id in chunk:
+                        results[session_id]["error"] = str(e)
+                    continue
+
+                deleted_ids = {row.get("id") for row in session_response.data or []}
+                for session_id in chunk:
+                    if session_id in deleted_ids:
+                        results[session_id]["success"] = True
+                    else:
+                        results[session_id]["error"] = "Session not found"
+
+            self.invalidate_cache(user_id)
+
+        failed_sessions = [r["id"] for r in results.values() if not r["success"]]
         return {
-            "deleted_count": deleted_count,
+            "deleted_count": len(unique_ids) - len(failed_sessions),
             "failed_sessions": failed_sessions,
-            "total_requested": len(session_ids)
+            "total_requested": len(session_ids),
+            "results": list(results.values()),
         }
 
     def search_sessions(
             self,
             user_id: str,
-            search_term: str) -> List[DopeSessionModel]:
-        """Search DOPE sessions by text across multiple fields"""
-        if not self.supabase or str(
-                type(self.supabase).__name__) == "MagicMock":
-            # Mock implementation
-            all_sessions = self._get_mock_sessions(user_id)
-            search_lower = search_term.lower()
-            filtered_sessions = []
-
-            for session in all_sessions:
-                if (
-                    search_lower in session.session_name.lower()
-                    or search_lower in session.cartridge_make.lower()
-                    or search_lower in session.cartridge_model.lower()
-                    or search_lower in session.bullet_make.lower()
-                    or search_lower in session.bullet_model.lower()
-                    or (
-                        session.range_name
-                        and search_lower in session.range_name.lower()
-                    )
-                    or (session.notes and search_lower in session.notes.lower())
-                ):
-                    filtered_sessions.append(session)
-
-            return filtered_sessions
-
-        try:
-            # Use text search with PostgreSQL's ilike operator across joined
-            # tables
-            response = (
-                self.supabase.table("dope_sessions")
-                .select(
-                    """
-                    *,
-                    cartridges!cartridge_id (
-                        make, model, cartridge_type,
-                        bullets!bullet_id (
-                            manufacturer, model, weight_grains,
-                            bullet_diameter_groove_mm, bore_diameter_land_mm,
-                            bullet_length_mm, ballistic_coefficient_g1,
-                            ballistic_coefficient_g7, sectional_density,
-                            min_req_twist_rate_in_per_rev, pref_twist_rate_in_per_rev,
-                            data_source_name, data_source_url
-                        )
-                    ),
-                    rifles!rifle_id (
-                        name, barrel_length, barrel_twist_ratio,
-                        sight_offset, trigger, scope
-                    ),
-                    ranges_submissions!range_submission_id (
-                        range_name, range_description, display_name, distance_m,
-                        start_lat, start_lon, end_lat, end_lon,
-                        start_altitude_m, end_altitude_m,
-                        azimuth_deg, elevation_angle_deg
-                    ),
-                    weather_source!weather_source_id (
-                        name, source_type, make, device_name,
-                        model, serial_number
-                    )
-                """
-                )
-                .eq("user_id", user_id)
-                .or_(
-                    f"session_name.ilike.%{search_term}%,"
-                    f"notes.ilike.%{search_term}%,"
-                    f"range_name.ilike.%{search_term}%"
-                )
-                .order("created_at", desc=True)
-                .execute()
-            )
-
-            if response.data:
-                sessions = []
-                for record in response.data:
-                    session_data = self._flatten_joined_record(record)
-                    sessions.append(
-                        DopeSessionModel.from_supabase_record(session_data))
-
-                # Additional filtering on joined data that can't be done in the
-                # SQL query
-                if search_term:
-                    search_lower = search_term.lower()
-                    filtered_sessions = []
-                    for session in sessions:
-                        if (
-                            search_lower in session.session_name.lower()
-                            or (
-                                session.cartridge_make
-                                and search_lower in session.cartridge_make.lower()
-                            )
-                            or (
-                                session.cartridge_model
-                                and search_lower in session.cartridge_model.lower()
-                            )
-                            or (
-                                session.bullet_make
-                                and search_lower in session.bullet_make.lower()
-                            )
-                            or (
-                                session.bullet_model
-                                and search_lower in session.bullet_model.lower()
-                            )
-                            or (
-                                session.range_name
-                                and search_lower in session.range_name.lower()
-                            )
-                            or (session.notes and search_lower in session.notes.lower())
-                        ):
-                            filtered_sessions.append(session)
-                    return filtered_sessions
-
-                return sessions
-            return []
-
-        except Exception as e:
-            print(f"Error searching DOPE sessions: {e}")
-            # Fallback to mock data
-            all_sessions = self._get_mock_sessions(user_id)
-            search_lower = search_term.lower()
-            filtered_sessions = []
-
-            for session in all_sessions:
-                if (
-                    search_lower in session.session_name.lower()
-                    or search_lower in session.cartridge_make.lower()
-                    or search_lower in session.cartridge_model.lower()
-                    or search_lower in session.bullet_make.lower()
-                    or search_lower in session.bullet_model.lower()
-                    or (
-                        session.range_name
-                        and search_lower in session.range_name.lower()
-                    )
-                    or (session.notes and search_lower in session.notes.lower())
-                ):
-                    filtered_sessions.append(session)
+            search_term: str,
+            search_fields: Optional[List[str]] = None) -> List[DopeSessionModel]:
+        """Search DOPE sessions by text across session and joined fields"""
+        sessions, version = self._get_sessions_versioned(user_id)
+        if not tokenize(search_term):
+            return sessions
 
-            return filtered_sessions
+        ranked_ids = search_index_registry.search(
+            user_id, sessions, search_term, fields=search_fields, version=version
+        )
+        sessions_by_id = {session.id: session for session in sessions}
+        return [sessions_by_id[session_id] for session_id in ranked_ids]
+
+    def search_session_ids(
+        self,
+        user_id: str,
+        search_term: str,
+        search_fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[str]:
+        """Return ranked IDs of sessions matching a search, for pagination"""
+        sessions, version = self._get_sessions_versioned(user_id)
+        return search_index_registry.search(
+            user_id,
+            sessions,
+            search_term,
+            fields=search_fields,
+            limit=limit,
+            offset=offset,
+            version=version,
+        )
 
     def filter_sessions(
         self, user_id: str, filters: Dict[str, Any]
     ) -> List[DopeSessionModel]:
         """Filter DOPE sessions based on various criteria"""
+        return self._filter_sessions_versioned(user_id, filters)[0]
+
+    def _filter_sessions_versioned(
+        self, user_id: str, filters: Dict[str, Any]
+    ) -> Tuple[List[DopeSessionModel], Optional[int]]:
+        """Filter sessions and return the session cache revision they came from"""
         if not self.supabase or str(type(self.supabase).__name__) == "MagicMock":
             # Mock implementation using filter helper
             all_sessions = self._get_mock_sessions(user_id)
-            return DopeSessionFilter(all_sessions).apply_all_filters(filters).get_results()
+            return self._apply_filters(user_id, all_sessions, filters), None
 
         try:
-            # Get all sessions with database-level filtering where possible
-            sessions = self._get_sessions_with_db_filters(user_id, filters)
-            
-            # Apply remaining filters using the filter helper
-            return DopeSessionFilter(sessions).apply_all_filters(filters).get_results()
+            # Filter the cached joined session list in memory so filtering
+            # never costs an extra join query
+            sessions, version = self._get_sessions_versioned(user_id)
+            return self._apply_filters(user_id, sessions, filters, version), version
 
         except Exception as e:
             print(f"Error filtering DOPE sessions: {e}")
             # Fallback to mock implementation
             all_sessions = self._get_mock_sessions(user_id)
-            return DopeSessionFilter(all_sessions).apply_all_filters(filters).get_results()
+            filtered = DopeSessionFilter(all_sessions).apply_all_filters(filters)
+            return filtered.get_results(), None
+
+    def get_sessions_page(
+        self,
+        user_id: str,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_column: str = "Start Time",
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+        page_size: int = 50,
+        columns: Optional[List[str]] = None,
+    ) -> DopeSessionPage:
+        """Get one sorted page of filtered sessions plus the total count
+
+        With the session list cached, the page is cut from it in memory. On a
+        cache miss, unfiltered pages sorted by a plain view column are
+        fetched with a keyset query (``limit`` plus ``count="exact"``), so
+        first paint does not load every session.
+        """
+        filters = filters or {}
+        is_mock = not self.supabase or str(
+            type(self.supabase).__name__) == "MagicMock"
+        if (
+            not is_mock
+            and not make_filter_key(filters)
+            and sort_column in SESSION_TABLE_VIEW_COLUMNS
+            and dope_session_cache.get_sessions(user_id) is None
+        ):
+            try:
+                return self._query_sessions_page(
+                    user_id, sort_column, ascending, cursor, page_size, columns)
+            except ValueError:
+                raise
+            except Exception as e:
+                print(f"Error fetching DOPE sessions page: {e}")
+
+        sessions, version = self._filter_sessions_versioned(user_id, filters)
+        return session_pager.page(
+            user_id,
+            sessions,
+            sort_column=sort_column,
+            ascending=ascending,
+            cursor=cursor,
+            page_size=page_size,
+            columns=columns,
+            version=(
+                None if version is None else (version, make_filter_key(filters))
+            ),
+        )
+
+    def _query_sessions_page(
+        self,
+        user_id: str,
+        sort_column: str,
+        ascending: bool,
+        cursor: Optional[str],
+        page_size: int,
+        columns: Optional[List[str]],
+    ) -> DopeSessionPage:
+        """Fetch one page of sessions and its position from dope_sessions_flat
+
+        The first page is one query; later pages add a head count of all the
+        user's sessions to place the page.
+        """
+        validate_page_request(sort_column, columns)
+        page_size = max(1, int(page_size))
+        decoded = resolve_cursor(cursor, sort_column, ascending)
+        backwards = bool(decoded) and decoded["direction"] == "prev"
+        view_column = SESSION_TABLE_VIEW_COLUMNS[sort_column]
 
-    def _get_sessions_with_db_filters(self, user_id: str, filters: Dict[str, Any]) -> List[DopeSessionModel]:
-        """Get sessions with database-level filtering applied"""
-        # Start with base query
         query = (
-            self.supabase.table("dope_sessions")
-            .select(
-                """
-                *,
-                cartridges!cartridge_id (
-                    make, model, cartridge_type,
-                    bullets!bullet_id (
-                        manufacturer, model, weight_grains,
-                        bullet_diameter_groove_mm, bore_diameter_land_mm,
-                        bullet_length_mm, ballistic_coefficient_g1,
-                        ballistic_coefficient_g7, sectional_density,
-                        min_req_twist_rate_in_per_rev, pref_twist_rate_in_per_rev,
-                        data_source_name, data_source_url
-                    )
-                ),
-                rifles!rifle_id (
-                    name, barrel_length, barrel_twist_ratio,
-                    sight_offset, trigger, scope
-                ),
-                ranges_submissions!range_submission_id (
-                    range_name, range_description, display_name, distance_m,
-                    start_lat, start_lon, end_lat, end_lon,
-                    start_altitude_m, end_altitude_m,
-                    azimuth_deg, elevation_angle_deg
-                ),
-                weather_source!weather_source_id (
-                    name, source_type, make, device_name,
-                    model, serial_number
-                )
-            """
-            )
+            self.supabase.table("dope_sessions_flat")
+            .select(",".join(DOPE_SESSION_FLAT_COLUMNS), count="exact")
             .eq("user_id", user_id)
         )
+        if decoded:
+            query = query.or_(keyset_condition(
+                sort_column, ascending, decoded["key"], decoded["direction"]))
+        # A previous page is read in reverse order from its end boundary
+        descending = ascending == backwards
+        response = (
+            query.order(view_column, desc=descending, nullsfirst=backwards)
+            .order("id", desc=descending)
+            .limit(page_size)
+            .execute()
+        )
+        sessions = [
+            DopeSessionModel.from_flat_record(record) for record in response.data or []
+        ]
+        matching = response.count or 0
+
+        if not decoded:
+            total, offset = matching, 0
+        else:
+            total = (
+                self.supabase.table("dope_sessions_flat")
+                .select("id", count="exact")
+                .eq("user_id", user_id)
+                .limit(1)
+                .execute()
+                .count
+                or 0
+            )
+            if backwards:
+                sessions.reverse()
+                offset = max(0, matching - page_size)
+            else:
+                offset = max(0, total - matching)
 
-        # Apply database-level filters (status field removed)
-
-        if filters.get("date_from"):
-            query = query.gte("created_at", filters["date_from"].isoformat())
-        if filters.get("date_to"):
-            query = query.lte("created_at", filters["date_to"].isoformat())
-
-        # Execute query
-        response = query.order("created_at", desc=True).execute()
+        return build_page(
+            sessions, sort_column, ascending, total, offset, page_size, columns)
 
-        if response.data:
-            sessions = []
-            for record in response.data:
-                session_data = self._flatten_joined_record(record)
-                sessions.append(DopeSessionModel.from_supabase_record(session_data))
-            return sessions
-        
-        return []
+    def _apply_filters(
+        self,
+        user_id: str,
+        sessions: List[DopeSessionModel],
+        filters: Dict[str, Any],
+        version: Optional[int] = None,
+    ) -> List[DopeSessionModel]:
+        """Apply field filters via the session frame and search via the index"""
+        search_term = filters.get("search")
+        if not search_term or not tokenize(search_term):
+            return session_frame_cache.filter(user_id, sessions, filters, version)
+
+        field_filters = {k: v for k, v in filters.items() if k != "search"}
+        filtered = session_frame_cache.filter(
+            user_id, sessions, field_filters, version)
+        matching_ids = set(
+            search_index_registry.search(
+                user_id, sessions, search_term, version=version)
+        )
+        return [session for session in filtered if session.id in matching_ids]
 
-    def get_unique_values(self, user_id: str, field_name: str) -> List[str]:
-        """Get unique values for a specific field for autocomplete filters"""
+    def get_filter_facets(self, user_id: str) -> DopeFacets:
+        """Get distinct values, counts and numeric ranges for all filter fields"""
         if not self.supabase or str(
                 type(self.supabase).__name__) == "MagicMock":
             # Mock implementation
-            all_sessions = self._get_mock_sessions(user_id)
-            values = set()
+            index = DopeFacetIndex()
+            index.sync(self._get_mock_sessions(user_id))
+            return index.snapshot()
 
-            for session in all_sessions:
-                value = getattr(session, field_name, None)
-                if value and isinstance(value, str) and value.strip():
-                    values.add(value)
+        return facet_registry.get_facets(
+            user_id, self.get_sessions_for_user(user_id))
 
-            return sorted(list(values))
-
-        try:
-            # Get all sessions and extract unique values from the flattened data
-            # This is more efficient than querying each field separately since
-            # we need JOIN data
-            sessions = self.get_sessions_for_user(user_id)
-            values = set()
-
-            for session in sessions:
-                value = getattr(session, field_name, None)
-                if value and isinstance(value, str) and value.strip():
-                    values.add(value)
-
-            return sorted(list(values))
-
-        except Exception as e:
-            print(f"Error getting unique values for {field_name}: {e}")
-            # Fallback to mock implementation
-            all_sessions = self._get_mock_sessions(user_id)
-            values = set()
+    def get_unique_values(self, user_id: str, field_name: str) -> List[str]:
+        """Get unique values for a specific field for autocomplete filters"""
+        if field_name in FACET_TEXT_FIELDS:
+            return self.get_filter_facets(user_id).values_for(field_name)
 
-            for session in all_sessions:
-                value = getattr(session, field_name, None)
-                if value and isinstance(value, str) and value.strip():
-                    values.add(value)
+        # Fields outside the facet index are collected from the session list
+        values = set()
+        for session in self.get_sessions_for_user(user_id):
+            value = getattr(session, field_name, None)
+            if value and isinstance(value, str) and value.strip():
+                values.add(value)
 
-            return sorted(list(values))
+        return sorted(list(values))
 
     def get_session_statistics(self, user_id: str) -> Dict[str, Any]:
-        """Get statistics about user's DOPE sessions"""
-        # TODO: Replace with actual Supabase aggregation queries
+        """Get statistics about user's DOPE sessions
+
+        Aggregated in the database by the ``dope_session_statistics`` function
+        (one row regardless of session count) and cached per user until the
+        next write.
+        """
+        if not self.supabase or str(type(self.supabase).__name__) == "MagicMock":
+            return self._statistics_from_sessions(self._get_mock_sessions(user_id))
 
-        # Mock implementation
-        sessions = self._get_mock_sessions(user_id)
+        cached = dope_statistics_cache.get(user_id)
+        if cached is not None:
+            return dict(cached)
 
-        total_sessions = len(sessions)
-        active_sessions = len(sessions)  # No status field in new schema
+        try:
+            response = self.supabase.rpc(
+                "dope_session_statistics", {"p_user_id": user_id}
+            ).execute()
+            data = response.data or {}
+            row = data[0] if isinstance(data, list) and data else data
+            statistics = self._format_statistics(
+                total_sessions=row.get("total_sessions") or 0,
+                unique_cartridge_types=row.get("unique_cartridge_types") or 0,
+                unique_bullet_makes=row.get("unique_bullet_makes") or 0,
+                unique_ranges=row.get("unique_ranges") or 0,
+                distance_min_m=row.get("distance_min_m"),
+                distance_max_m=row.get("distance_max_m"),
+                distance_avg_m=row.get("distance_avg_m"),
+            )
+        except Exception as e:
+            print(f"Error aggregating DOPE session statistics: {e}")
+            # Fall back to aggregating the (cached) session list
+            return self._statistics_from_sessions(self.get_sessions_for_user(user_id))
 
-        cartridge_types = set(
-            s.cartridge_type for s in sessions if s.cartridge_type)
-        bullet_makes = set(s.bullet_make for s in sessions if s.bullet_make)
-        ranges = set(s.range_name for s in sessions if s.range_name)
+        dope_statistics_cache.put(user_id, statistics)
+        return dict(statistics)
 
+    def _statistics_from_sessions(
+        self, sessions: List[DopeSessionModel]
+    ) -> Dict[str, Any]:
+        """Aggregate session statistics in memory (mock data and fallback)"""
         distances = [s.range_distance_m for s in sessions if s.range_distance_m]
-        avg_distance = sum(distances) / len(distances) if distances else 0
+        return self._format_statistics(
+            total_sessions=len(sessions),
+            unique_cartridge_types=len(
+                {s.cartridge_type for s in sessions if s.cartridge_type}),
+            unique_bullet_makes=len(
+                {s.bullet_make for s in sessions if s.bullet_make}),
+            unique_ranges=len({s.range_name for s in sessions if s.range_name}),
+            distance_min_m=min(distances) if distances else None,
+            distance_max_m=max(distances) if distances else None,
+            distance_avg_m=sum(distances) / len(distances) if distances else None,
+        )
 
+    @staticmethod
+    def _format_statistics(
+        total_sessions: int,
+        unique_cartridge_types: int,
+        unique_bullet_makes: int,
+        unique_ranges: int,
+        distance_min_m: Optional[float],
+        distance_max_m: Optional[float],
+        distance_avg_m: Optional[float],
+    ) -> Dict[str, Any]:
+        active_sessions = total_sessions  # No status field in new schema
+        has_distances = distance_min_m is not None and distance_max_m is not None
         return {
             "total_sessions": total_sessions,
             "active_sessions": active_sessions,
-            "archived_sessions": total_sessions -
-            active_sessions,
-            "unique_cartridge_types": len(cartridge_types),
-            "unique_bullet_makes": len(bullet_makes),
-            "unique_ranges": len(ranges),
-            "average_distance_m": round(
-                avg_distance,
-                1),
+            "archived_sessions": total_sessions - active_sessions,
+            "unique_cartridge_types": unique_cartridge_types,
+            "unique_bullet_makes": unique_bullet_makes,
+            "unique_ranges": unique_ranges,
+            "average_distance_m": round(float(distance_avg_m or 0), 1),
             "distance_range": (
-                f"{min(distances)}-{max(distances)}m" if distances else "No data"),
+                f"{distance_min_m}-{distance_max_m}m" if has_distances else "No data"),
         }
 
+    def get_unused_chrono_sessions(
+        self, user_id: str, limit: int = UNUSED_CHRONO_PAGE_SIZE, offset: int = 0
+    ) -> List[ChronographSession]:
+        """Get chronograph sessions not referenced by any DOPE session
+
+        A single anti-join query: chrono_sessions embeds its dope_sessions and
+        keeps rows where that embed is null, newest first, one page at a time.
+        """
+        if not self.supabase or str(
+                type(self.supabase).__name__) == "MagicMock":
+            return []
+
+        try:
+            response = (
+                self.supabase.table("chrono_sessions")
+                .select(
+                    ",".join(UNUSED_CHRONO_SESSION_COLUMNS)
+                    + ",dope_sessions!chrono_session_id(id)"
+                )
+                .eq("user_id", user_id)
+                .is_("dope_sessions", "null")
+                .order("datetime_local", desc=True)
+                .order("id")
+                .range(offset, offset + limit - 1)
+                .execute()
+            )
+            return ChronographSession.from_supabase_records(response.data or [])
+        except Exception as e:
+            raise Exception(f"Error fetching unused chronograph sessions: {str(e)}")
+
     def get_edit_dropdown_options(self, user_id: str) -> Dict[str, List[Dict[str, Any]]]:
-        """Get all dropdown options needed for editing a DOPE session"""
-        from cartridges.service import CartridgeService
-        from chronograph.service import ChronographService
-        from mapping.submission.submission_model import SubmissionModel
-        from rifles.service import RifleService
-        from weather.service import WeatherService
-
-        # Initialize services
-        chrono_service = ChronographService(self.supabase)
-        rifle_service = RifleService(self.supabase)
-        cartridge_service = CartridgeService(self.supabase)
-        weather_service = WeatherService(self.supabase)
-        submission_model = SubmissionModel()
-
-        # Fetch all options
-        chrono_sessions = chrono_service.get_sessions_for_user(user_id)
-        rifles = rifle_service.get_rifles_for_user(user_id)
-        cartridges = cartridge_service.get_cartridges_for_user(user_id)
-        weather_sources = weather_service.get_sources_for_user(user_id)
-        ranges = submission_model.get_user_ranges(user_id, self.supabase)
+        """Get all dropdown options needed for editing a DOPE session
+
+        Sources are read concurrently and memoized per user (see dope.options).
+        """
+        options = options_loader.load(self.supabase, user_id, sources=EDIT_OPTION_SOURCES)
+        if options.errors:
+            raise Exception(
+                "; ".join(f"{name}: {error}" for name, error in options.errors.items())
+            )
+
+        chrono_sessions = options.get("chrono_sessions")
+        rifles = options.get("rifles")
+        cartridges = options.get("cartridges")
+        weather_sources = options.get("weather_sources")
+        ranges = options.get("ranges")
 
         return {
             "chrono_sessions": [
@@ -979,97 +1393,6 @@ class DopeService:
 
         return mock_sessions
 
-    def _flatten_joined_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
-        """Flatten a joined Supabase record into a format compatible with DopeSessionModel"""
-        flattened = record.copy()
-
-        # Extract cartridge data
-        if "cartridges" in record and record["cartridges"]:
-            cartridge = record["cartridges"]
-            flattened["cartridge_make"] = cartridge.get("make")
-            flattened["cartridge_model"] = cartridge.get("model")
-            flattened["cartridge_type"] = cartridge.get("cartridge_type")
-
-            # Extract bullet data from within cartridge
-            if "bullets" in cartridge and cartridge["bullets"]:
-                bullet = cartridge["bullets"]
-                flattened["bullet_make"] = bullet.get("manufacturer")
-                flattened["bullet_model"] = bullet.get("model")
-                flattened["bullet_weight"] = str(
-                    bullet.get("weight_grains", ""))
-                flattened["bullet_length_mm"] = str(
-                    bullet.get("bullet_length_mm", ""))
-                flattened["ballistic_coefficient_g1"] = str(
-                    bullet.get("ballistic_coefficient_g1", "")
-                )
-                flattened["ballistic_coefficient_g7"] = str(
-                    bullet.get("ballistic_coefficient_g7", "")
-                )
-                flattened["sectional_density"] = str(
-                    bullet.get("sectional_density", "")
-                )
-                flattened["bullet_diameter_groove_mm"] = str(
-                    bullet.get("bullet_diameter_groove_mm", "")
-                )
-                flattened["bore_diameter_land_mm"] = str(
-                    bullet.get("bore_diameter_land_mm", "")
-                )
-
-            # Remove the nested cartridges object
-            del flattened["cartridges"]
-
-        # Extract rifle data
-        if "rifles" in record and record["rifles"]:
-            rifle = record["rifles"]
-            flattened["rifle_name"] = rifle.get("name")
-            flattened["rifle_barrel_length_cm"] = rifle.get("barrel_length")
-            flattened["rifle_barrel_twist_in_per_rev"] = rifle.get(
-                "barrel_twist_ratio")
-            del flattened["rifles"]
-
-        # Extract range data
-        if "ranges_submissions" in record and record["ranges_submissions"]:
-            range_data = record["ranges_submissions"]
-            flattened["range_name"] = range_data.get("range_name")
-            flattened["range_description"] = range_data.get("range_description")
-            flattened["range_display_name"] = range_data.get("display_name")
-            # Map start coordinates to lat/lon for model compatibility
-            flattened["lat"] = range_data.get("start_lat")
-            flattened["lon"] = range_data.get("start_lon")
-            flattened["end_lat"] = range_data.get("end_lat")
-            flattened["end_lon"] = range_data.get("end_lon")
-            flattened["start_altitude"] = range_data.get("start_altitude_m")
-            flattened["range_distance_m"] = range_data.get("distance_m")
-            flattened["azimuth_deg"] = range_data.get("azimuth_deg")
-            flattened["elevation_angle_deg"] = range_data.get("elevation_angle_deg")
-
-            # Generate location hyperlink with single pushpin at lat/lon
-            start_lat = range_data.get("start_lat")
-            start_lon = range_data.get("start_lon")
-
-            if start_lat and start_lon:
-                # Google Maps URL with single marker at the location
-                flattened["location_hyperlink"] = f"https://maps.google.com/?q={start_lat},{start_lon}"
-            else:
-                flattened["location_hyperlink"] = None
-
-            del flattened["ranges_submissions"]
-
-        # Extract weather source data
-        if "weather_source" in record and record["weather_source"]:
-            weather_source = record["weather_source"]
-            flattened["weather_source_name"] = weather_source.get("name")
-            del flattened["weather_source"]
-
-        # Extract chronograph session data
-        if "chrono_sessions" in record and record["chrono_sessions"]:
-            chrono_session = record["chrono_sessions"]
-            flattened["chrono_session_name"] = chrono_session.get("session_name")
-            flattened["datetime_local"] = chrono_session.get("datetime_local")
-            del flattened["chrono_sessions"]
-
-        return flattened
-
     def _get_weather_for_timestamp(self, weather_source_id: str, timestamp: datetime) -> Optional[Dict[str, Any]]:
         """Get weather data for a specific timestamp from weather_measurements table"""
         try:
@@ -1162,10 +1485,28 @@ class DopeService:
                 }
                 dope_measurement_records.append(dope_record)
 
-            # Insert all DOPE measurements in batch
+            # Upsert on client-generated ids so a retried batch that already
+            # committed is rewritten, not duplicated
             if dope_measurement_records:
-                self.supabase.table("dope_measurements").insert(
-                    dope_measurement_records).execute()
+                for record in dope_measurement_records:
+                    record["id"] = str(uuid.uuid4())
+                result = BulkWriter().write(
+                    dope_measurement_records,
+                    lambda batch: self.supabase.table("dope_measurements")
+                    .upsert(batch, on_conflict="id")
+                    .execute()
+                    .data,
+                )
+                if not result.succeeded:
+                    # All or nothing: remove the batches that were written
+                    written_ids = [record["id"] for record in result.returned]
+                    for chunk in chunked(written_ids, ID_CHUNK_SIZE):
+                        self.supabase.table("dope_measurements").delete().in_(
+                            "id", chunk
+                        ).execute()
+                    raise Exception("; ".join(result.errors))
+                self.invalidate_cache(user_id)
+                self._refresh_summaries_after_write([dope_session_id], user_id)
 
         except Exception as e:
             raise Exception(
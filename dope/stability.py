@@ -0,0 +1,167 @@
+"""
+Cached bullet stability index per rifle.
+
+The create wizard's rifle and cartridge pickers badge bullets a rifle cannot
+stabilize. ``BulletStabilityIndexer`` rates the whole bullet catalog against
+a rifle's twist with one vectorized Miller calculation and memoizes the
+result per (rifle, twist, conditions) in a bounded LRU. The catalog is
+admin-maintained and changes rarely, so a TTL bounds staleness; the catalog
+is only read on a miss.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, TypeVar
+
+import numpy as np
+import pandas as pd
+
+from ballistics.models import parse_twist_in_per_rev
+from ballistics.stability import (
+    MILLER_REFERENCE_PRESSURE_HPA,
+    MILLER_REFERENCE_TEMPERATURE_C,
+    MILLER_REFERENCE_VELOCITY_MPS,
+    miller_stability,
+    stability_status,
+)
+from bullets.models import BulletModel
+
+from .cache import UserLRUCache
+
+T = TypeVar("T")
+
+STABILITY_BADGES = {"stable": "", "marginal": "⚠️ ", "unstable": "❌ ", "unknown": ""}
+
+
+@dataclass(frozen=True)
+class RifleStabilityIndex:
+    """Stability of every catalog bullet in one rifle, indexed by bullet id"""
+
+    rifle_id: Optional[str]
+    twist_in_per_rev: Optional[float]
+    frame: pd.DataFrame  # index bullet_id; columns stability_factor, status
+
+    def status(self, bullet_id: Optional[str]) -> str:
+        if bullet_id is None or bullet_id not in self.frame.index:
+            return "unknown"
+        return self.frame.at[bullet_id, "status"]
+
+    def stability_factor(self, bullet_id: Optional[str]) -> Optional[float]:
+        if bullet_id is None or bullet_id not in self.frame.index:
+            return None
+        sg = self.frame.at[bullet_id, "stability_factor"]
+        return float(sg) if pd.notna(sg) else None
+
+    def badge(self, bullet_id: Optional[str]) -> str:
+        """Display prefix for a bullet ("" when stable or unknown)"""
+        return STABILITY_BADGES[self.status(bullet_id)]
+
+    def counts(self) -> Dict[str, int]:
+        counts = self.frame["status"].value_counts()
+        return {status: int(counts.get(status, 0)) for status in STABILITY_BADGES}
+
+    def filter_stabilized(
+        self, items: Iterable[T], bullet_id: Callable[[T], Optional[str]]
+    ) -> List[T]:
+        """Drop items whose bullet is marginal or unstable in this rifle"""
+        return [
+            item
+            for item in items
+            if self.status(bullet_id(item)) not in ("marginal", "unstable")
+        ]
+
+
+def catalog_stability(
+    bullets: Sequence[BulletModel],
+    twist_in_per_rev: Optional[float],
+    muzzle_velocity_mps: float = MILLER_REFERENCE_VELOCITY_MPS,
+    temperature_c: float = MILLER_REFERENCE_TEMPERATURE_C,
+    pressure_hpa: float = MILLER_REFERENCE_PRESSURE_HPA,
+) -> pd.DataFrame:
+    """Miller stability factor and status of each bullet for one twist"""
+
+    def column(name):
+        return np.array(
+            [getattr(b, name) if getattr(b, name) is not None else np.nan for b in bullets],
+            dtype=float,
+        )
+
+    twist = np.nan if twist_in_per_rev is None else twist_in_per_rev
+    sg = miller_stability(
+        column("weight_grains"),
+        column("bullet_diameter_groove_mm"),
+        column("bullet_length_mm"),
+        twist,
+        muzzle_velocity_mps,
+        temperature_c,
+        pressure_hpa,
+    )
+    return pd.DataFrame(
+        {
+            "stability_factor": sg,
+            "status": stability_status(
+                sg, twist, column("min_req_twist_rate_in_per_rev")
+            ),
+        },
+        index=pd.Index([b.id for b in bullets], name="bullet_id"),
+    )
+
+
+def _rifle_field(rifle, name: str):
+    """Read a field from a RifleModel or a rifle record dict"""
+    if isinstance(rifle, dict):
+        return rifle.get(name)
+    return getattr(rifle, name, None)
+
+
+class BulletStabilityIndexer:
+    """Bounded, process-wide memo of per-rifle stability indexes"""
+
+    def __init__(self, max_rifles: int = 128, ttl_seconds: Optional[float] = 3600.0):
+        self._indexes: UserLRUCache[RifleStabilityIndex] = UserLRUCache(
+            max_entries=max_rifles, ttl_seconds=ttl_seconds
+        )
+
+    @property
+    def hits(self) -> int:
+        return self._indexes.hits
+
+    @property
+    def misses(self) -> int:
+        return self._indexes.misses
+
+    def index_for_rifle(
+        self,
+        rifle,
+        load_bullets: Callable[[], Sequence[BulletModel]],
+        muzzle_velocity_mps: float = MILLER_REFERENCE_VELOCITY_MPS,
+        temperature_c: float = MILLER_REFERENCE_TEMPERATURE_C,
+        pressure_hpa: float = MILLER_REFERENCE_PRESSURE_HPA,
+    ) -> RifleStabilityIndex:
+        """Cached index for a rifle; ``load_bullets`` is called only on a miss
+
+        Velocity is rounded to 10 m/s, temperature to 1 C and pressure to
+        1 hPa, so similar conditions share an index.
+        """
+        rifle_id = _rifle_field(rifle, "id")
+        twist = parse_twist_in_per_rev(_rifle_field(rifle, "barrel_twist_ratio"))
+        conditions = (
+            float(round(muzzle_velocity_mps, -1)),
+            float(round(temperature_c)),
+            float(round(pressure_hpa)),
+        )
+
+        def build() -> RifleStabilityIndex:
+            return RifleStabilityIndex(
+                rifle_id=rifle_id,
+                twist_in_per_rev=twist,
+                frame=catalog_stability(load_bullets(), twist, *conditions),
+            )
+
+        return self._indexes.get_or_load((rifle_id, twist, *conditions), build)
+
+    def clear(self) -> None:
+        self._indexes.invalidate()
+
+
+# Process-wide indexer shared by every page
+bullet_stability_indexer = BulletStabilityIndexer()
@@ -0,0 +1,129 @@
+"""
+Per-session DOPE summaries.
+
+``dope_session_summary`` holds one narrow row per DOPE session: shot count,
+velocity average/SD/extreme spread, median shot weather, the cold-bore
+first-shot velocity and the refresh time. The DOPE service refreshes a
+session's row whenever its measurements are written, so list views and
+statistics read these rows instead of every shot. ``summarize_measurements``
+computes the rows for many sessions at once from a measurement frame (see
+``dope.frames``) with grouped aggregates.
+"""
+
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence
+
+import pandas as pd
+
+from .models import DopeSessionSummaryModel
+
+# Columns selected when listing summaries
+SUMMARY_COLUMNS = (
+    "dope_session_id",
+    "user_id",
+    "shot_count",
+    "speed_mps_avg",
+    "speed_mps_sd",
+    "speed_mps_min",
+    "speed_mps_max",
+    "speed_mps_es",
+    "temperature_c_median",
+    "pressure_hpa_median",
+    "humidity_pct_median",
+    "cold_bore_first_shot_mps",
+    "first_shot_at",
+    "last_shot_at",
+    "updated_at",
+)
+
+
+def _optional_float(value) -> Optional[float]:
+    return None if value is None or pd.isna(value) else float(value)
+
+
+def _optional_datetime(value) -> Optional[datetime]:
+    return None if value is None or pd.isna(value) else value.to_pydatetime()
+
+
+def summarize_measurements(
+    frame: pd.DataFrame,
+    session_ids: Sequence[str],
+    user_id: str,
+    refreshed_at: Optional[datetime] = None,
+) -> List[DopeSessionSummaryModel]:
+    """Summarize a measurement frame into one row per requested session
+
+    Sessions without measurements get a row with shot_count 0.
+
+    Args:
+        frame: Measurement frame from ``build_measurement_frame``
+        session_ids: Sessions to summarize (in output order)
+        user_id: Owner written to every summary row
+        refreshed_at: Refresh timestamp (defaults to now, UTC)
+    """
+    refreshed_at = refreshed_at or datetime.now(timezone.utc)
+    shots = frame[frame["dope_session_id"].isin(list(session_ids))]
+    grouped = shots.groupby("dope_session_id", observed=True)
+
+    stats = grouped["speed_mps"].agg(["count", "mean", "std", "min", "max"])
+    weather = grouped[["temperature_c", "pressure_hpa", "humidity_pct"]].median()
+    times = grouped["datetime_shot"].agg(["min", "max"])
+
+    cold = shots[shots["cold_bore"].fillna(False).astype(bool)]
+    cold_first = (
+        cold.sort_values("shot_number", kind="stable")
+        .drop_duplicates("dope_session_id")
+        .set_index("dope_session_id")["speed_mps"]
+    )
+
+    table = pd.concat(
+        [
+            stats,
+            weather.add_suffix("_median"),
+            times.rename(columns={"min": "first_shot_at", "max": "last_shot_at"}),
+            cold_first.rename("cold_bore_first_shot_mps"),
+        ],
+        axis=1,
+    )
+    rows: Dict[str, dict] = table.to_dict("index")
+
+    summaries = []
+    for session_id in dict.fromkeys(session_ids):
+        row = rows.get(session_id)
+        if row is None:
+            summaries.append(
+                DopeSessionSummaryModel(
+                    dope_session_id=session_id,
+                    user_id=user_id,
+                    updated_at=refreshed_at,
+                )
+            )
+            continue
+        speed_min = _optional_float(row["min"])
+        speed_max = _optional_float(row["max"])
+        summaries.append(
+            DopeSessionSummaryModel(
+                dope_session_id=session_id,
+                user_id=user_id,
+                shot_count=int(row["count"]),
+                speed_mps_avg=_optional_float(row["mean"]),
+                speed_mps_sd=_optional_float(row["std"]),
+                speed_mps_min=speed_min,
+                speed_mps_max=speed_max,
+                speed_mps_es=(
+                    speed_max - speed_min
+                    if speed_min is not None and speed_max is not None
+                    else None
+                ),
+                temperature_c_median=_optional_float(row["temperature_c_median"]),
+                pressure_hpa_median=_optional_float(row["pressure_hpa_median"]),
+                humidity_pct_median=_optional_float(row["humidity_pct_median"]),
+                cold_bore_first_shot_mps=_optional_float(
+                    row["cold_bore_first_shot_mps"]
+                ),
+                first_shot_at=_optional_datetime(row["first_shot_at"]),
+                last_shot_at=_optional_datetime(row["last_shot_at"]),
+                updated_at=refreshed_at,
+            )
+        )
+    return summaries
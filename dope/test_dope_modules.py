@@ -1057,7 +1057,9 @@ class TestDopeViewPage(unittest.TestCase):
             bullet_weight="77",
         )
 
-        sessions = [session]
+        from dope.pagination import DopeSessionPager
+
+        page = DopeSessionPager().page("test-user", [session])
 
         with patch("streamlit.dataframe") as mock_dataframe, patch(
             "streamlit.button"
@@ -1066,7 +1068,7 @@ class TestDopeViewPage(unittest.TestCase):
         ) as mock_session_state:
 
             # Mock session state
-            mock_session_state.dope_view = {}
+            mock_session_state.dope_view = {"filters": {}}
 
             # Mock DataFrame creation
             mock_df_instance = MagicMock()
@@ -1078,7 +1080,7 @@ class TestDopeViewPage(unittest.TestCase):
             mock_dataframe.return_value = mock_selection
 
             # Should not raise exceptions
-            render_sessions_table(sessions)
+            render_sessions_table(page, MagicMock(), "test-user")
 
             # Verify DataFrame was created with session data
             self.assertGreaterEqual(mock_df.call_count, 1)
@@ -2015,5 +2017,2084 @@ class TestDopeSessionCreationFlow(unittest.TestCase):
                 self.assertEqual(new_session.speed_mps_max, 855.2)
 
 
+class TestDopeSessionFrame(unittest.TestCase):
+    """Test the columnar single-pass DOPE session filter engine"""
+
+    def setUp(self):
+        from dope.service import DopeService
+
+        self.test_user_id = "google-oauth2|111273793361054745867"
+        self.sessions = DopeService(None).get_sessions_for_user(self.test_user_id)
+
+    def test_mask_matches_chained_filters(self):
+        """Test that the single mask gives the same result as chained filters"""
+        from dope.filters import DopeSessionFilter, DopeSessionFrame
+
+        filter_sets = [
+            {},
+            {"cartridge_type": "223 Remington"},
+            {"rifle_name": "Not Defined"},
+            {"distance_range": (50, 250), "temperature_range": (-10, 23)},
+            {"bullet_weight_range": (60, 100), "bullet_make": "Sierra"},
+            {"humidity_range": (50.0, 100.0), "wind_speed_range": (0.0, 3.0)},
+        ]
+        frame = DopeSessionFrame(self.sessions)
+
+        for filters in filter_sets:
+            expected = (
+                DopeSessionFilter(list(self.sessions))
+                .apply_all_filters_chained(filters)
+                .get_results()
+            )
+            self.assertEqual(
+                [s.id for s in frame.select(filters)],
+                [s.id for s in expected],
+                f"Mismatch for filters {filters}",
+            )
+
+    def test_search_filter_uses_lowercase_text(self):
+        """Test that the search filter is case-insensitive across text fields"""
+        from dope.filters import DopeSessionFrame
+
+        frame = DopeSessionFrame(self.sessions)
+        results = frame.select({"search": "FEDERAL"})
+
+        self.assertGreater(len(results), 0)
+        for session in results:
+            self.assertEqual(session.cartridge_make, "Federal")
+
+    def test_search_filter_matches_index_prefix_rule(self):
+        """Test that the frame and the search index return the same sessions"""
+        from dope.filters import DopeSessionFrame
+        from dope.search import DopeSearchIndex
+
+        frame = DopeSessionFrame(self.sessions)
+        index = DopeSearchIndex()
+        index.sync(self.sessions)
+
+        # "edera" is inside "Federal" but starts no token, so neither matches it
+        for query in ["edera", "fed", "FEDERAL sierra", "223 rem", "zzz"]:
+            expected = set(index.search(query))
+            actual = {s.id for s in frame.select({"search": query})}
+            self.assertEqual(actual, expected, f"Mismatch for query {query!r}")
+
+        self.assertEqual(frame.select({"search": "edera"}), [])
+        self.assertGreater(len(frame.select({"search": "fed"})), 0)
+
+    def test_date_filter_handles_timezone_aware_values(self):
+        """Test that aware and naive datetimes can be compared in the mask"""
+        from datetime import datetime, timedelta, timezone
+
+        from dope.filters import DopeSessionFrame
+        from dope.models import DopeSessionModel
+
+        now = datetime(2025, 8, 10, 12, 0, 0)
+        sessions = [
+            DopeSessionModel(id="a", datetime_local=now.replace(tzinfo=timezone.utc)),
+            DopeSessionModel(id="b", datetime_local=now - timedelta(days=10)),
+            DopeSessionModel(id="c", datetime_local=None),
+        ]
+        results = DopeSessionFrame(sessions).select(
+            {"date_from": now - timedelta(days=1)}
+        )
+        self.assertEqual([s.id for s in results], ["a"])
+
+    def test_bullet_weight_range_skips_missing_weights(self):
+        """Test that empty or 0 bullet weights never match a weight range"""
+        from dope.filters import DopeSessionFilter, DopeSessionFrame
+        from dope.models import DopeSessionModel
+
+        sessions = [
+            DopeSessionModel(id="a", bullet_weight="140"),
+            DopeSessionModel(id="b", bullet_weight="0"),
+            DopeSessionModel(id="c", bullet_weight=""),
+            DopeSessionModel(id="d", bullet_weight=None),
+        ]
+        filters = {"bullet_weight_range": (0.0, 200.0)}
+
+        expected = DopeSessionFilter(list(sessions)).apply_all_filters(filters)
+        self.assertEqual([s.id for s in expected.get_results()], ["a"])
+        self.assertEqual(
+            [s.id for s in DopeSessionFrame(sessions).select(filters)], ["a"])
+
+    def test_cache_reuses_frame_until_data_changes(self):
+        """Test that frames are cached per user and data version"""
+        from dope.filters import DopeSessionFrameCache
+
+        cache = DopeSessionFrameCache(max_frames=2)
+        frame = cache.get_frame(self.test_user_id, self.sessions)
+        self.assertIs(cache.get_frame(self.test_user_id, self.sessions), frame)
+
+        self.sessions[0].temperature_c_median = 40.0
+        self.assertIsNot(cache.get_frame(self.test_user_id, self.sessions), frame)
+
+        results = cache.filter(
+            self.test_user_id, self.sessions, {"temperature_range": (35.0, 45.0)}
+        )
+        self.assertEqual([s.id for s in results], [self.sessions[0].id])
+
+    def test_cache_keys_on_session_cache_revision(self):
+        """Test a revision keys the frame without fingerprinting the sessions"""
+        from dope.cache import DopeSessionCache
+        from dope.filters import DopeSessionFrameCache
+
+        session_cache = DopeSessionCache()
+        session_cache.put_sessions(self.test_user_id, self.sessions)
+        sessions, revision = session_cache.get_versioned(self.test_user_id)
+        cache = DopeSessionFrameCache()
+        frame = cache.get_frame(self.test_user_id, sessions, revision)
+
+        with patch("dope.filters.sessions_data_version") as fingerprint:
+            self.assertIs(cache.get_frame(self.test_user_id, sessions, revision), frame)
+            cache.filter(self.test_user_id, sessions, {}, revision)
+        fingerprint.assert_not_called()
+
+        session_cache.put_sessions(self.test_user_id, sessions)
+        _, new_revision = session_cache.get_versioned(self.test_user_id)
+        self.assertNotEqual(new_revision, revision)
+        self.assertIsNot(
+            cache.get_frame(self.test_user_id, sessions, new_revision), frame)
+
+    def test_cache_is_bounded_and_invalidates_per_user(self):
+        """Test LRU eviction and per-user invalidation"""
+        from dope.filters import DopeSessionFrameCache
+
+        cache = DopeSessionFrameCache(max_frames=1)
+        cache.filter("user_a", self.sessions, {})
+        cache.filter("user_b", self.sessions, {})
+        self.assertEqual(len(cache._frames), 1)
+
+        cache.invalidate("user_b")
+        self.assertEqual(len(cache._frames), 0)
+        self.assertEqual(len(cache._results), 1)
+
+
+class TestDopeSearchIndex(unittest.TestCase):
+    """Test the incremental inverted search index for DOPE sessions"""
+
+    def setUp(self):
+        from dope.models import DopeSessionModel
+
+        self.sessions = [
+            DopeSessionModel(
+                id="s1",
+                session_name="Hornady ELD test",
+                cartridge_make="Hornady",
+                bullet_make="Hornady",
+                bullet_model="ELD Match",
+                range_name="Pine Valley Range",
+            ),
+            DopeSessionModel(
+                id="s2",
+                session_name="Cold morning",
+                bullet_make="Sierra",
+                bullet_model="MatchKing",
+                range_display_name="Hornady Ridge",
+            ),
+            DopeSessionModel(
+                id="s3",
+                session_name="Zero check",
+                rifle_name="Tikka T3x",
+                notes="Switched to sierra after lot change",
+            ),
+        ]
+
+    def test_search_ranks_by_field_weight(self):
+        """Test that matches in heavier fields rank first"""
+        from dope.search import DopeSearchIndex
+
+        index = DopeSearchIndex()
+        index.sync(self.sessions)
+
+        self.assertEqual(index.search("hornady"), ["s1", "s2"])
+        self.assertEqual(index.search("sierra"), ["s2", "s3"])
+
+    def test_search_supports_prefix_and_all_terms(self):
+        """Test prefix matching and AND semantics across query terms"""
+        from dope.search import DopeSearchIndex
+
+        index = DopeSearchIndex()
+        index.sync(self.sessions)
+
+        self.assertEqual(index.search("tik"), ["s3"])
+        self.assertEqual(index.search("match sier"), ["s2"])
+        self.assertEqual(index.search("hornady zero"), [])
+        self.assertEqual(index.search("sierra", fields=["notes"]), ["s3"])
+
+    def test_search_pagination_returns_ids(self):
+        """Test limit/offset over ranked IDs"""
+        from dope.search import DopeSearchIndex
+
+        index = DopeSearchIndex()
+        index.sync(self.sessions)
+
+        self.assertEqual(index.search("hornady", limit=1), ["s1"])
+        self.assertEqual(index.search("hornady", limit=1, offset=1), ["s2"])
+
+    def test_sync_is_incremental(self):
+        """Test that only changed sessions are re-indexed and removals applied"""
+        from dope.search import DopeSearchIndex
+
+        index = DopeSearchIndex()
+        self.assertEqual(index.sync(self.sessions), 3)
+        self.assertEqual(index.sync(self.sessions), 0)
+
+        self.sessions[2].notes = "Now shooting Berger"
+        self.assertEqual(index.sync(self.sessions), 1)
+        self.assertEqual(index.search("sierra"), ["s2"])
+        self.assertEqual(index.search("berger"), ["s3"])
+
+        self.assertEqual(index.sync(self.sessions[:1]), 2)
+        self.assertEqual(len(index), 1)
+        self.assertEqual(index.search("berger"), [])
+
+    def test_sync_skips_an_already_synced_revision(self):
+        """Test that a repeated session cache revision is not re-checked"""
+        from dope.search import DopeSearchIndex
+
+        index = DopeSearchIndex()
+        self.assertEqual(index.sync(self.sessions, version=1), 3)
+
+        with patch("dope.search._document_signature") as signature:
+            self.assertEqual(index.sync(self.sessions, version=1), 0)
+        signature.assert_not_called()
+
+        self.assertEqual(index.sync(self.sessions[:1], version=2), 2)
+
+    def test_service_search_includes_joined_text(self):
+        """Test that service search finds text only present on joined tables"""
+        from dope.service import DopeService
+
+        service = DopeService(None)
+        user_id = "google-oauth2|111273793361054745867"
+
+        results = service.search_sessions(user_id, "300 win")
+        self.assertEqual([s.id for s in results], ["session_005"])
+
+        ids = service.search_session_ids(user_id, "sierra", limit=2)
+        self.assertEqual(len(ids), 2)
+
+        filtered = service.filter_sessions(
+            user_id, {"search": "sierra", "rifle_name": "AR-15 SPR"}
+        )
+        self.assertTrue(filtered)
+        for session in filtered:
+            self.assertEqual(session.rifle_name, "AR-15 SPR")
+            self.assertEqual(session.bullet_make, "Sierra")
+
+
+class _FakeSupabase:
+    """Stand-in client that exercises the real (non-mock) service code paths"""
+
+    def __init__(self):
+        self.table = MagicMock()
+
+
+def _flat_session_row(**values):
+    """A dope_sessions_flat row with every read model column present"""
+    from dope.models import DOPE_SESSION_FLAT_COLUMNS
+
+    row = dict.fromkeys(DOPE_SESSION_FLAT_COLUMNS)
+    row.update(values)
+    return row
+
+
+class TestDopeSessionCache(unittest.TestCase):
+    """Test the per-user DOPE session cache and its write-through invalidation"""
+
+    def setUp(self):
+        from dope.cache import dope_session_cache
+        from dope.service import DopeService
+
+        dope_session_cache.invalidate()
+        self.addCleanup(dope_session_cache.invalidate)
+        self.supabase = _FakeSupabase()
+        self.service = DopeService(self.supabase)
+        self.user_id = "auth0|cache-user"
+
+        response = MagicMock()
+        response.data = [
+            _flat_session_row(
+                id="s1",
+                user_id=self.user_id,
+                session_name="Cached session",
+                rifle_name="Tikka",
+            )
+        ]
+        (
+            self.supabase.table.return_value.select.return_value.eq.return_value
+            .order.return_value.execute.return_value
+        ) = response
+
+    def _select_calls(self):
+        return self.supabase.table.return_value.select.call_count
+
+    def test_repeated_reads_use_one_query(self):
+        """Test that sessions, unique values and filters share one join query"""
+        sessions = self.service.get_sessions_for_user(self.user_id)
+        self.assertEqual([s.id for s in sessions], ["s1"])
+
+        self.service.get_unique_values(self.user_id, "rifle_name")
+        self.service.get_unique_values(self.user_id, "session_name")
+        self.service.filter_sessions(self.user_id, {"rifle_name": "Tikka"})
+        self.service.get_sessions_for_user(self.user_id)
+
+        self.assertEqual(self._select_calls(), 1)
+
+    def test_writes_invalidate_user_entry(self):
+        """Test that session and measurement writes drop the cached list"""
+        from dope.cache import dope_session_cache
+
+        self.service.get_sessions_for_user(self.user_id)
+        dope_session_cache.put_sessions("auth0|other-user", [])
+
+        self.service.delete_measurement("m1", self.user_id)
+        self.assertIsNone(dope_session_cache.get_sessions(self.user_id))
+        self.assertEqual(dope_session_cache.get_sessions("auth0|other-user"), [])
+
+        self.service.get_sessions_for_user(self.user_id)
+        self.service.delete_session("s1", self.user_id)
+        self.service.get_sessions_for_user(self.user_id)
+        self.assertEqual(self._select_calls(), 3)
+
+    def test_cache_is_bounded_lru_with_ttl(self):
+        """Test LRU eviction and TTL expiry of cache entries"""
+        from dope.cache import DopeSessionCache
+
+        now = [0.0]
+        cache = DopeSessionCache(max_entries=2, ttl_seconds=10)
+        cache._clock = lambda: now[0]
+
+        cache.put_sessions("a", [])
+        cache.put_sessions("b", [])
+        cache.get_sessions("a")
+        cache.put_sessions("c", [])
+        self.assertIsNone(cache.get_sessions("b"))
+        self.assertEqual(cache.get_sessions("a"), [])
+
+        now[0] = 11.0
+        self.assertIsNone(cache.get_sessions("a"))
+        self.assertEqual(len(cache), 1)
+
+
+class TestDopeFacetIndex(unittest.TestCase):
+    """Test the incremental facet index used by DOPE filter widgets"""
+
+    def setUp(self):
+        from dope.models import DopeSessionModel
+
+        self.Model = DopeSessionModel
+        self.sessions = [
+            DopeSessionModel(
+                id="s1",
+                rifle_name="Tikka T3x",
+                bullet_make="Hornady",
+                range_distance_m=100.0,
+                bullet_weight="140",
+            ),
+            DopeSessionModel(
+                id="s2",
+                rifle_name="Tikka T3x",
+                bullet_make="Sierra",
+                range_distance_m=600.0,
+            ),
+            DopeSessionModel(id="s3", rifle_name="  ", range_distance_m=None),
+        ]
+
+    def test_snapshot_values_counts_and_ranges(self):
+        """Test distinct values, counts and numeric ranges from one sync"""
+        from dope.facets import DopeFacetIndex
+
+        index = DopeFacetIndex()
+        self.assertEqual(index.sync(self.sessions), 3)
+        facets = index.snapshot()
+
+        self.assertEqual(facets.total_sessions, 3)
+        self.assertEqual(facets.values_for("rifle_name"), ["Tikka T3x"])
+        self.assertEqual(facets.count_for("rifle_name", "Tikka T3x"), 2)
+        self.assertEqual(facets.values_for("bullet_make"), ["Hornady", "Sierra"])
+        self.assertEqual(facets.range_for("range_distance_m"), (100.0, 600.0))
+        self.assertEqual(facets.range_for("bullet_weight"), (140.0, 140.0))
+        self.assertIsNone(facets.range_for("wind_speed_mps_median"))
+        self.assertEqual(facets.values_for("unknown_field"), [])
+
+    def test_sync_is_incremental(self):
+        """Test that only changed and removed sessions update the counts"""
+        from dope.facets import DopeFacetIndex
+
+        index = DopeFacetIndex()
+        index.sync(self.sessions)
+        self.assertEqual(index.sync(self.sessions), 0)
+
+        changed = self.Model(
+            id="s2", rifle_name="Bergara B14", range_distance_m=800.0
+        )
+        self.assertEqual(index.sync([self.sessions[0], changed]), 2)
+        facets = index.snapshot()
+
+        self.assertEqual(facets.values_for("rifle_name"), ["Bergara B14", "Tikka T3x"])
+        self.assertEqual(facets.count_for("rifle_name", "Tikka T3x"), 1)
+        self.assertEqual(facets.values_for("bullet_make"), ["Hornady"])
+        self.assertEqual(facets.range_for("range_distance_m"), (100.0, 800.0))
+
+    def test_in_place_mutation_is_counted_correctly(self):
+        """Test that a session mutated in place is re-counted from its old values"""
+        from dope.facets import DopeFacetIndex
+
+        index = DopeFacetIndex()
+        index.sync(self.sessions)
+        self.sessions[0].bullet_make = "Berger"
+        index.sync(self.sessions)
+
+        self.assertEqual(
+            index.snapshot().values_for("bullet_make"), ["Berger", "Sierra"]
+        )
+
+    def test_service_serves_unique_values_from_facets(self):
+        """Test that the service builds facets and unique values from mock data"""
+        from dope.service import DopeService
+
+        service = DopeService(MagicMock())
+        user_id = "google-oauth2|111273793361054745867"
+        facets = service.get_filter_facets(user_id)
+
+        self.assertGreater(facets.total_sessions, 0)
+        for field in ("rifle_name", "cartridge_type", "bullet_make"):
+            self.assertEqual(
+                service.get_unique_values(user_id, field), facets.values_for(field)
+            )
+
+
+class TestDopeSessionPager(unittest.TestCase):
+    """Test keyset pagination of the DOPE sessions table"""
+
+    def setUp(self):
+        from datetime import datetime, timedelta
+
+        from dope.models import DopeSessionModel
+        from dope.pagination import DopeSessionPager
+
+        base = datetime(2024, 1, 1, 8, 0)
+        self.sessions = [
+            DopeSessionModel(
+                id=f"s{i:02d}",
+                session_name=f"Session {i}",
+                start_time=base + timedelta(days=i),
+                range_distance_m=float(100 * (i % 4)) if i % 5 else None,
+            )
+            for i in range(10)
+        ]
+        self.pager = DopeSessionPager()
+
+    def _walk(self, **kwargs):
+        ids, cursor = [], None
+        while True:
+            page = self.pager.page(
+                "user", self.sessions, cursor=cursor, page_size=3, **kwargs
+            )
+            ids.extend(s.id for s in page.sessions)
+            if not page.has_next:
+                return ids, page
+            cursor = page.next_cursor
+
+    def test_pages_cover_sorted_sessions_once(self):
+        """Test that following next cursors visits every session in order"""
+        ids, last_page = self._walk()
+        self.assertEqual(ids, [f"s{i:02d}" for i in reversed(range(10))])
+        self.assertEqual(last_page.total_count, 10)
+        self.assertEqual(last_page.offset, 9)
+
+        ids, _ = self._walk(sort_column="Distance (m)", ascending=True)
+        # Missing distances (None and 0) sort last
+        self.assertEqual(ids[-4:], ["s00", "s04", "s05", "s08"])
+        self.assertEqual(len(set(ids)), 10)
+
+    def test_prev_cursor_and_projected_rows(self):
+        """Test previous page navigation and visible column projection"""
+        first = self.pager.page(
+            "user", self.sessions, page_size=4, columns=["Session Name"]
+        )
+        second = self.pager.page(
+            "user", self.sessions, page_size=4, cursor=first.next_cursor
+        )
+        back = self.pager.page(
+            "user", self.sessions, page_size=4, cursor=second.prev_cursor
+        )
+
+        self.assertFalse(first.has_prev)
+        self.assertEqual(first.rows[0], {"Session Name": "Session 9"})
+        self.assertEqual(second.offset, 4)
+        self.assertEqual(
+            [s.id for s in back.sessions], [s.id for s in first.sessions]
+        )
+
+    def test_cursor_survives_deleted_boundary_row(self):
+        """Test that a page cursor still resolves after its row is deleted"""
+        first = self.pager.page("user", self.sessions, page_size=3)
+        remaining = [s for s in self.sessions if s.id != first.sessions[-1].id]
+        second = self.pager.page(
+            "user", remaining, page_size=3, cursor=first.next_cursor
+        )
+        self.assertEqual([s.id for s in second.sessions], ["s06", "s05", "s04"])
+
+    def test_invalid_arguments(self):
+        """Test that unknown columns and malformed cursors are rejected"""
+        with self.assertRaises(ValueError):
+            self.pager.page("user", self.sessions, sort_column="Nope")
+        with self.assertRaises(ValueError):
+            self.pager.page("user", self.sessions, columns=["Nope"])
+        with self.assertRaises(ValueError):
+            self.pager.page("user", self.sessions, cursor="not-a-cursor")
+
+    def test_keyset_condition_mirrors_in_memory_order(self):
+        """Test the PostgREST filter for rows after/before a page boundary"""
+        import pandas as pd
+
+        from dope.pagination import keyset_condition
+
+        start = pd.Timestamp("2025-06-12 08:20:00.120000").value
+        self.assertEqual(
+            keyset_condition("Start Time", False, (float(start), "s1"), "next"),
+            'start_time.lt."2025-06-12T08:20:00.120000+00:00",'
+            'and(start_time.eq."2025-06-12T08:20:00.120000+00:00",id.lt."s1"),'
+            "start_time.is.null",
+        )
+        self.assertEqual(
+            keyset_condition("Temperature (°C)", True, (21.5, "s1"), "prev"),
+            'temperature_c_median.lt."21.5",'
+            'and(temperature_c_median.eq."21.5",id.lt."s1")',
+        )
+        self.assertEqual(
+            keyset_condition("Temperature (°C)", True, (None, "s1"), "next"),
+            'and(temperature_c_median.is.null,id.gt."s1")',
+        )
+
+    def test_service_fetches_one_page_on_cache_miss(self):
+        """Test an uncached, unfiltered page is a limited keyset query with a count"""
+        from dope.cache import dope_session_cache
+        from dope.service import DopeService
+
+        dope_session_cache.invalidate()
+        self.addCleanup(dope_session_cache.invalidate)
+        supabase = _FakeSupabase()
+        query = supabase.table.return_value.select.return_value.eq.return_value
+        ordered = query.order.return_value.order.return_value
+        ordered.limit.return_value.execute.return_value = MagicMock(
+            data=[
+                _flat_session_row(id="s9", start_time="2024-01-10T08:00:00+00"),
+                _flat_session_row(id="s8", start_time="2024-01-09T08:00:00+00"),
+            ],
+            count=10,
+        )
+        service = DopeService(supabase)
+
+        page = service.get_sessions_page("user", {}, page_size=2)
+
+        self.assertEqual([s.id for s in page.sessions], ["s9", "s8"])
+        self.assertEqual((page.total_count, page.offset), (10, 0))
+        self.assertTrue(page.has_next)
+        self.assertEqual(
+            supabase.table.return_value.select.call_args.kwargs, {"count": "exact"})
+        query.order.assert_called_once_with("start_time", desc=True, nullsfirst=False)
+        ordered.limit.assert_called_once_with(2)
+        query.or_.assert_not_called()
+
+        # The next page adds the keyset predicate and a head count
+        query.or_.return_value = query
+        query.limit.return_value.execute.return_value = MagicMock(count=10)
+        ordered.limit.return_value.execute.return_value = MagicMock(
+            data=[_flat_session_row(id="s7", start_time="2024-01-08T08:00:00+00")],
+            count=8,
+        )
+        second = service.get_sessions_page(
+            "user", {}, page_size=2, cursor=page.next_cursor)
+
+        self.assertIn('id.lt."s8"', query.or_.call_args.args[0])
+        self.assertEqual((second.total_count, second.offset), (10, 2))
+        self.assertEqual([s.id for s in second.sessions], ["s7"])
+        self.assertTrue(second.has_prev)
+
+    def test_service_page_uses_filters(self):
+        """Test the service pages over filtered mock sessions"""
+        from dope.service import DopeService
+
+        service = DopeService(MagicMock())
+        user_id = "google-oauth2|111273793361054745867"
+        all_sessions = service.filter_sessions(user_id, {})
+        page = service.get_sessions_page(user_id, {}, page_size=2)
+
+        self.assertEqual(page.total_count, len(all_sessions))
+        self.assertEqual(len(page.sessions), min(2, len(all_sessions)))
+
+
+class TestDopeMeasurementBulkUpdate(unittest.TestCase):
+    """Test vectorized measurement diffs and the chunked bulk update"""
+
+    def setUp(self):
+        from dope.cache import dope_measurement_cache, dope_session_cache
+        from dope.service import DopeService
+
+        dope_measurement_cache.invalidate()
+        dope_session_cache.invalidate()
+        self.addCleanup(dope_measurement_cache.invalidate)
+        self.addCleanup(dope_session_cache.invalidate)
+
+        self.user_id = "auth0|bulk-user"
+        self.records = [
+            {
+                "id": f"m{i}",
+                "dope_session_id": "ds1",
+                "user_id": self.user_id,
+                "shot_number": i,
+                "speed_mps": 800.0 + i,
+                "elevation_adjustment": None,
+            }
+            for i in range(1, 6)
+        ]
+        self.supabase = _FakeSupabase()
+        select_response = MagicMock()
+        select_response.data = self.records
+        (
+            self.supabase.table.return_value.select.return_value.eq.return_value
+            .eq.return_value.order.return_value.execute.return_value
+        ) = select_response
+
+        self.upserts = []
+        self.updates = []
+
+        def upsert(rows, on_conflict=None):
+            self.upserts.append((rows, on_conflict))
+            statement = MagicMock()
+            statement.execute.return_value.data = rows
+            return statement
+
+        def update(fields):
+            statement = MagicMock()
+
+            def in_(column, ids):
+                self.updates.append((fields, list(ids)))
+                rows = [
+                    {**record, **fields}
+                    for record in self.records if record["id"] in ids
+                ]
+                statement.eq.return_value.eq.return_value.execute.return_value.data = rows
+                return statement
+
+            statement.in_.side_effect = in_
+            return statement
+
+        self.supabase.table.return_value.upsert.side_effect = upsert
+        self.supabase.table.return_value.update.side_effect = update
+        self.service = DopeService(self.supabase)
+
+    def test_diff_measurement_frames(self):
+        """Test that only changed cells are returned, ignoring blanks and float noise"""
+        import numpy as np
+        import pandas as pd
+
+        from dope.bulk import diff_measurement_frames
+
+        index = pd.Index(["m1", "m2", "m3"])
+        original = pd.DataFrame(
+            {
+                "speed_mps": [800.0, 801.0, np.nan],
+                "elevation_adjustment": ["", "1.5", None],
+                "shot_notes": [None, "ok", ""],
+                "unrelated": [1, 2, 3],
+            },
+            index=index,
+        )
+        edited = original.copy()
+        edited.loc["m1", "speed_mps"] = 800.0 + 1e-9
+        edited.loc["m2", "elevation_adjustment"] = "1.50"
+        edited.loc["m3", "shot_notes"] = None
+        edited.loc["m1", "elevation_adjustment"] = 2.25
+        edited.loc["m3", "speed_mps"] = 799.5
+        edited.loc["m2", "shot_notes"] = "flyer"
+        edited.loc["m2", "unrelated"] = 9
+
+        self.assertEqual(
+            diff_measurement_frames(original, edited),
+            {
+                "m1": {"elevation_adjustment": "2.25"},
+                "m2": {"shot_notes": "flyer"},
+                "m3": {"speed_mps": 799.5},
+            },
+        )
+
+    def test_bulk_update_sends_only_changed_columns(self):
+        """Test grouped partial updates, per-row results and in-place cache patching"""
+        self.service.get_measurements_for_dope_session("ds1", self.user_id)
+        changes = {
+            "m1": {"elevation_adjustment": "1.2"},
+            "m2": {"elevation_adjustment": "1.2"},
+            "m3": {"elevation_adjustment": "1.2"},
+            "m5": {"windage_adjustment": "0.3"},
+            "missing": {"shot_notes": "x"},
+        }
+
+        result = self.service.update_measurements_bulk(
+            "ds1", changes, self.user_id, chunk_size=2
+        )
+
+        self.assertEqual(result["updated_count"], 4)
+        self.assertEqual(result["failed_count"], 1)
+        self.assertEqual(
+            {r["id"]: r["success"] for r in result["results"]},
+            {"m1": True, "m2": True, "m3": True, "m5": True, "missing": False},
+        )
+        # One statement per shared change set and ID chunk
+        self.assertEqual(
+            [ids for _, ids in self.updates],
+            [["m1", "m2"], ["m3"], ["m5"], ["missing"]],
+        )
+        # Untouched columns are never written back from the cache
+        fields, _ = self.updates[0]
+        self.assertEqual(set(fields), {"elevation_adjustment", "updated_at"})
+        self.assertEqual(fields["elevation_adjustment"], "1.2")
+        # The session summary is refreshed once after the write
+        self.assertEqual(
+            [conflict for _, conflict in self.upserts], ["dope_session_id"]
+        )
+
+        measurements = self.service.get_measurements_for_dope_session(
+            "ds1", self.user_id
+        )
+        full_selects = [
+            c for c in self.supabase.table.return_value.select.call_args_list
+            if c.args == ("*",)
+        ]
+        self.assertEqual(len(full_selects), 1)
+        self.assertEqual(measurements[0].elevation_adjustment, "1.2")
+        self.assertEqual(measurements[0].speed_mps, 801.0)
+        self.assertEqual(measurements[4].windage_adjustment, "0.3")
+        self.assertIsNone(measurements[3].elevation_adjustment)
+
+    def test_failed_chunk_reports_each_row(self):
+        """Test that a failing statement marks every row of its chunk as failed"""
+        self.supabase.table.return_value.update.side_effect = Exception("timeout")
+
+        result = self.service.update_measurements_bulk(
+            "ds1", {"m1": {"shot_notes": "a"}, "m2": {"shot_notes": "b"}},
+            self.user_id,
+        )
+
+        self.assertEqual(result["updated_count"], 0)
+        self.assertEqual(
+            [r["error"] for r in result["results"]], ["timeout", "timeout"]
+        )
+
+    def test_view_save_uses_one_bulk_call(self):
+        """Test that the grid save converts units and issues one bulk update"""
+        import pandas as pd
+
+        from dope.models import DopeMeasurementModel
+        from dope.view.view_page import _save_measurement_changes
+
+        measurements = [
+            DopeMeasurementModel(id=f"m{i}", dope_session_id="ds1",
+                                 user_id=self.user_id, shot_number=i)
+            for i in range(1, 4)
+        ]
+        original = pd.DataFrame(
+            {
+                "Shot #": [1, 2, 3],
+                "Velocity (fps)": ["2650.0", "2655.0", "2660.0"],
+                "Elevation Offset": ["", "", ""],
+            }
+        )
+        edited = original.copy()
+        edited["Elevation Offset"] = ["", "4.1", "4.3"]
+        edited.loc[0, "Velocity (fps)"] = "2700.0"
+
+        api = MagicMock()
+        api.update_measurements_bulk.return_value = {"results": []}
+        with patch("streamlit.success"), patch("streamlit.error"), patch(
+            "streamlit.rerun"
+        ):
+            _save_measurement_changes(
+                original, edited, measurements, api, "Imperial"
+            )
+
+        api.update_measurements_bulk.assert_called_once()
+        session_id, changes, user_id = api.update_measurements_bulk.call_args[0]
+        self.assertEqual((session_id, user_id), ("ds1", self.user_id))
+        self.assertEqual(set(changes), {"m1", "m2", "m3"})
+        self.assertAlmostEqual(changes["m1"]["speed_mps"], 2700.0 * 0.3048)
+        self.assertEqual(changes["m2"], {"elevation_adjustment": "4.1"})
+
+
+class TestDopeBulkDelete(unittest.TestCase):
+    """Test set-based, chunked bulk deletion of DOPE sessions"""
+
+    def setUp(self):
+        from dope.service import DopeService
+
+        self.supabase = _FakeSupabase()
+        self.service = DopeService(self.supabase)
+        self.user_id = "auth0|delete-user"
+        self.statements = []
+
+        def table(name):
+            query = MagicMock()
+
+            def delete():
+                statement = MagicMock()
+
+                def in_(column, values):
+                    self.statements.append((name, column, list(values)))
+                    filtered = MagicMock()
+                    # Pretend every ID except "missing" exists and is owned
+                    filtered.eq.return_value.execute.return_value.data = [
+                        {"id": v} for v in values if v != "missing"
+                    ]
+                    return filtered
+
+                statement.in_.side_effect = in_
+                return statement
+
+            query.delete.side_effect = delete
+            return query
+
+        self.supabase.table = MagicMock(side_effect=table)
+
+    def test_two_statements_per_chunk_with_exact_outcomes(self):
+        """Test chunking, statement count and per-ID results"""
+        ids = ["a", "b", "missing", "c", "a"]
+        result = self.service.delete_sessions_bulk(ids, self.user_id, chunk_size=2)
+
+        self.assertEqual(
+            self.statements,
+            [
+                ("dope_measurements", "dope_session_id", ["a", "b"]),
+                ("dope_sessions", "id", ["a", "b"]),
+                ("dope_measurements", "dope_session_id", ["missing", "c"]),
+                ("dope_sessions", "id", ["missing", "c"]),
+            ],
+        )
+        self.assertEqual(result["deleted_count"], 3)
+        self.assertEqual(result["failed_sessions"], ["missing"])
+        self.assertEqual(result["total_requested"], 5)
+        self.assertEqual(
+            [(r["id"], r["success"]) for r in result["results"]],
+            [("a", True), ("b", True), ("missing", False), ("c", True)],
+        )
+
+    def test_failed_chunk_marks_only_its_ids(self):
+        """Test that a statement error fails its chunk but not the others"""
+        from dope.service import DopeService
+
+        supabase = _FakeSupabase()
+
+        def in_(column, values):
+            if "a" in values:
+                raise Exception("boom")
+            filtered = MagicMock()
+            filtered.eq.return_value.execute.return_value.data = [{"id": "c"}]
+            return filtered
+
+        supabase.table.return_value.delete.return_value.in_.side_effect = in_
+        result = DopeService(supabase).delete_sessions_bulk(
+            ["a", "b", "c"], self.user_id, chunk_size=2
+        )
+
+        self.assertEqual(result["failed_sessions"], ["a", "b"])
+        self.assertEqual(result["results"][0]["error"], "boom")
+        self.assertEqual(result["deleted_count"], 1)
+
+
+class TestDopeMeasurementFrame(unittest.TestCase):
+    """Test typed, session-joined measurement frames"""
+
+    def setUp(self):
+        from dope.models import DopeSessionModel
+
+        self.user_id = "auth0|frame-user"
+        self.sessions = [
+            DopeSessionModel(
+                id="ds1",
+                user_id=self.user_id,
+                session_name="Cold morning",
+                cartridge_type="6.5 Creedmoor",
+                bullet_weight="140",
+                range_distance_m=300.0,
+                temperature_c_median=2.0,
+            ),
+            DopeSessionModel(
+                id="ds2",
+                user_id=self.user_id,
+                session_name="Warm afternoon",
+                cartridge_type="308 Winchester",
+                bullet_weight="175",
+                range_distance_m=600.0,
+                temperature_c_median=28.0,
+            ),
+        ]
+        self.records = [
+            {"id": "m3", "dope_session_id": "ds2", "shot_number": 1,
+             "datetime_shot": "2025-06-01T14:00:00+00:00", "speed_mps": 790.0,
+             "elevation_adjustment": "1.5", "clean_bore": "no", "cold_bore": "No"},
+            {"id": "m2", "dope_session_id": "ds1", "shot_number": 2,
+             "datetime_shot": "2025-01-10T08:01:00", "speed_mps": "812.5",
+             "elevation_adjustment": "n/a", "clean_bore": " Yes ", "cold_bore": None},
+            {"id": "m1", "dope_session_id": "ds1", "shot_number": 1,
+             "datetime_shot": "2025-01-10T08:00:00", "speed_mps": 810.0,
+             "elevation_adjustment": "2", "clean_bore": "clean", "cold_bore": "cold"},
+        ]
+
+    def test_decode_bore_condition(self):
+        """Test bore-condition text decoding to nullable booleans"""
+        import pandas as pd
+
+        from dope.frames import decode_bore_condition
+
+        decoded = decode_bore_condition(
+            pd.Series(["Yes", "fouled", "", None, "maybe", "COLD"])
+        )
+        self.assertEqual(str(decoded.dtype), "boolean")
+        self.assertEqual(decoded.tolist()[:2], [True, False])
+        self.assertTrue(decoded[2:5].isna().all())
+        self.assertTrue(decoded[5])
+
+    def test_build_frame_types_order_and_join(self):
+        """Test dtype normalization, ordering and session attribute join"""
+        from dope.frames import build_measurement_frame
+
+        frame = build_measurement_frame(self.records, self.sessions)
+
+        self.assertEqual(frame["id"].tolist(), ["m1", "m2", "m3"])
+        self.assertEqual(str(frame["shot_number"].dtype), "Int64")
+        self.assertEqual(frame["speed_mps"].dtype.kind, "f")
+        self.assertEqual(frame["speed_mps"].tolist(), [810.0, 812.5, 790.0])
+        self.assertEqual(str(frame["datetime_shot"].dt.tz), "UTC")
+        self.assertEqual(frame["elevation_adjustment"].iloc[0], 2.0)
+        self.assertTrue(frame["elevation_adjustment"].isna().iloc[1])
+        self.assertEqual(frame["clean_bore"].tolist(), [True, True, False])
+        self.assertTrue(frame["cold_bore"].isna().iloc[1])
+        self.assertEqual(frame["bullet_weight"].tolist(), [140.0, 140.0, 175.0])
+        self.assertEqual(
+            frame["session_name"].tolist(),
+            ["Cold morning", "Cold morning", "Warm afternoon"],
+        )
+        self.assertEqual(frame.groupby("cartridge_type")["speed_mps"].count().sum(), 3)
+
+    def test_empty_frame_keeps_columns_and_dtypes(self):
+        """Test that no records still yields a typed frame"""
+        from dope.frames import (
+            MEASUREMENT_FRAME_SOURCE_COLUMNS,
+            SESSION_FRAME_COLUMNS,
+            build_measurement_frame,
+        )
+
+        frame = build_measurement_frame([], [])
+        self.assertTrue(frame.empty)
+        self.assertEqual(
+            list(frame.columns),
+            list(MEASUREMENT_FRAME_SOURCE_COLUMNS) + list(SESSION_FRAME_COLUMNS),
+        )
+        self.assertEqual(str(frame["clean_bore"].dtype), "boolean")
+        self.assertEqual(frame["speed_mps"].dtype.kind, "f")
+
+    def test_service_loads_sessions_in_chunked_in_queries(self):
+        """Test one in_ query per chunk and filtering to owned sessions"""
+        from dope.service import DopeService
+
+        supabase = _FakeSupabase()
+        queried = []
+
+        def in_(column, values):
+            queried.append((column, list(values)))
+            statement = MagicMock()
+            statement.eq.return_value.execute.return_value.data = [
+                r for r in self.records if r["dope_session_id"] in values
+            ]
+            return statement
+
+        supabase.table.return_value.select.return_value.in_.side_effect = in_
+        service = DopeService(supabase)
+        with patch.object(
+            service, "get_sessions_for_user", return_value=self.sessions
+        ):
+            frame = service.get_measurement_frame(
+                ["ds1", "ds2", "foreign", "ds1"], self.user_id, chunk_size=1
+            )
+
+        self.assertEqual(
+            queried, [("dope_session_id", ["ds1"]), ("dope_session_id", ["ds2"])]
+        )
+        self.assertEqual(len(frame), 3)
+        select_columns = supabase.table.return_value.select.call_args[0][0]
+        self.assertIn("speed_mps", select_columns)
+        self.assertNotIn("*", select_columns)
+
+    def test_service_mock_mode_uses_mock_measurements(self):
+        """Test the mock data path returns a joined frame"""
+        from dope.service import DopeService
+
+        service = DopeService(None)
+        user_id = "google-oauth2|111273793361054745867"
+        frame = service.get_measurement_frame(["session_001"], user_id)
+
+        self.assertFalse(frame.empty)
+        self.assertTrue((frame["dope_session_id"] == "session_001").all())
+        self.assertTrue(frame["session_name"].notna().all())
+
+
+class TestDopeAnalyticsEngine(unittest.TestCase):
+    """Test vectorized velocity regressions, binning and memoization"""
+
+    def setUp(self):
+        import numpy as np
+
+        from dope.cache import dope_measurement_cache
+        from dope.frames import build_measurement_frame
+        from dope.models import DopeSessionModel
+
+        self.addCleanup(dope_measurement_cache.invalidate)
+        self.user_id = "auth0|analytics-user"
+        self.sessions = [
+            DopeSessionModel(
+                id=f"ds{i}",
+                user_id=self.user_id,
+                cartridge_type="6.5 Creedmoor",
+                rifle_id="rifle-1",
+                cartridge_id=cartridge_id,
+                cartridge_make="Hornady",
+                cartridge_model=model,
+                temperature_c_median=median,
+            )
+            for i, (cartridge_id, model, median) in enumerate(
+                [("c1", "ELD-M", 10.0), ("c2", "ELD-X", 20.0), ("c3", "A-Tip", 0.0)]
+            )
+        ]
+        rng = np.random.default_rng(7)
+        records = []
+        # c1: exactly 1 m/s per °C; c2: 2 m/s per °C with noise
+        for shot, temp in enumerate(np.arange(0.0, 30.0, 1.0), start=1):
+            records.append({"id": f"a{shot}", "dope_session_id": "ds0",
+                            "shot_number": shot, "temperature_c": temp,
+                            "speed_mps": 800.0 + temp})
+            records.append({"id": f"b{shot}", "dope_session_id": "ds1",
+                            "shot_number": shot, "temperature_c": temp,
+                            "speed_mps": 780.0 + 2 * temp + rng.normal(0, 1.0)})
+        # Missing shot temperature falls back to the session median
+        records.append({"id": "b99", "dope_session_id": "ds1", "shot_number": 99,
+                        "temperature_c": None, "speed_mps": 820.0})
+        self.frame = build_measurement_frame(records, self.sessions)
+
+    def test_t_critical_values(self):
+        """Test t critical values against tabulated 95% values"""
+        import numpy as np
+
+        from dope.analytics.engine import t_critical_95
+
+        values = t_critical_95([1, 5, 10, 30, 0])
+        self.assertAlmostEqual(values[0], 12.706, places=3)
+        self.assertAlmostEqual(values[1], 2.571, places=3)
+        self.assertAlmostEqual(values[2], 2.228, places=2)
+        self.assertAlmostEqual(values[3], 2.042, places=2)
+        self.assertTrue(np.isnan(values[4]))
+
+    def test_regressions_per_cartridge_and_sensitivity_units(self):
+        """Test grouped fits, confidence bands and fps/°F conversion"""
+        from dope.analytics.engine import (
+            ALL_CARTRIDGES,
+            AnalyticsSelection,
+            compute_analytics,
+        )
+
+        result = compute_analytics(
+            AnalyticsSelection("6.5 Creedmoor", "rifle-1"), self.frame
+        )
+        exact = result.regression("temperature_c", "c1")
+        self.assertAlmostEqual(exact.slope, 1.0, places=9)
+        self.assertAlmostEqual(exact.intercept, 800.0, places=6)
+        self.assertAlmostEqual(exact.sensitivity, 3.28084 / 1.8, places=6)
+        self.assertAlmostEqual(exact.r_squared, 1.0, places=9)
+
+        noisy = result.regression("temperature_c", "c2")
+        self.assertEqual(noisy.n, 31)
+        self.assertLess(noisy.slope_ci[0], noisy.slope)
+        self.assertGreater(noisy.slope_ci[1], noisy.slope)
+        self.assertAlmostEqual(noisy.slope, 2.0, delta=0.2)
+        self.assertTrue((noisy.band_lower <= noisy.fit).all())
+        self.assertTrue((noisy.band_upper >= noisy.fit).all())
+        self.assertEqual(len(noisy.x), 50)
+
+        self.assertEqual(result.regression("temperature_c", ALL_CARTRIDGES).n, 61)
+        # No pressure readings at all -> no fits, but empty-safe bins
+        self.assertEqual(result.regressions["pressure_hpa"], {})
+        self.assertTrue(result.bins["pressure_hpa"].empty)
+        self.assertEqual(result.group_labels["c1"], "Hornady ELD-M")
+
+    def test_binned_aggregates(self):
+        """Test shot counts and means per temperature bin"""
+        from dope.analytics.engine import AnalyticsSelection, compute_analytics
+
+        result = compute_analytics(
+            AnalyticsSelection("6.5 Creedmoor", "rifle-1"), self.frame
+        )
+        bins = result.bins["temperature_c"]
+        c1 = bins[bins["group"] == "c1"]
+        self.assertEqual(c1["shots"].tolist(), [5] * 6)
+        self.assertEqual(c1["bin_center"].tolist()[0], 2.5)
+        self.assertAlmostEqual(c1["speed_mps_mean"].iloc[0], 802.0)
+        # The fallback shot (median 20 °C) lands in the 20-25 bin
+        c2 = bins[bins["group"] == "c2"].set_index("bin_start")
+        self.assertEqual(c2.loc[20.0, "shots"], 6)
+
+    def test_analyze_memoizes_until_data_changes(self):
+        """Test one frame load per selection and data version"""
+        from dope.analytics.engine import AnalyticsSelection, DopeAnalyticsEngine
+        from dope.cache import dope_measurement_cache
+
+        api = MagicMock()
+        api.get_sessions_for_user.return_value = self.sessions
+        api.get_measurement_frame.return_value = self.frame
+        engine = DopeAnalyticsEngine()
+        selection = AnalyticsSelection("6.5 Creedmoor", "rifle-1", ("c2", "c1"))
+
+        first = engine.analyze(api, self.user_id, selection)
+        second = engine.analyze(
+            api, self.user_id, AnalyticsSelection("6.5 Creedmoor", "rifle-1", ("c1", "c2"))
+        )
+        self.assertIs(first, second)
+        api.get_measurement_frame.assert_called_once_with(["ds0", "ds1"], self.user_id)
+
+        dope_measurement_cache.invalidate_user(self.user_id)
+        engine.analyze(api, self.user_id, selection)
+        self.assertEqual(api.get_measurement_frame.call_count, 2)
+
+    def test_measurement_revision_bumps_on_writes(self):
+        """Test that patches bump the revision even when nothing is cached"""
+        from dope.cache import DopeMeasurementCache
+
+        cache = DopeMeasurementCache()
+        before = cache.revision("u1")
+        cache.patch_measurements("u1", "ds1", [])
+        self.assertNotEqual(cache.revision("u1"), before)
+        self.assertEqual(cache.revision("u2"), (0, 0))
+        cache.invalidate()
+        self.assertEqual(cache.revision("u2"), (1, 0))
+
+
+class TestDopeSessionSummary(unittest.TestCase):
+    """Test per-session summaries and their maintenance"""
+
+    def setUp(self):
+        from dope.cache import dope_summary_cache
+
+        dope_summary_cache.invalidate()
+        self.addCleanup(dope_summary_cache.invalidate)
+        self.user_id = "auth0|summary-user"
+        self.records = [
+            {"id": "m1", "dope_session_id": "ds1", "shot_number": 1,
+             "datetime_shot": "2025-03-01T10:00:00+00:00", "speed_mps": 800.0,
+             "temperature_c": 10.0, "pressure_hpa": 1000.0, "cold_bore": "no"},
+            {"id": "m2", "dope_session_id": "ds1", "shot_number": 2,
+             "datetime_shot": "2025-03-01T10:01:00+00:00", "speed_mps": 806.0,
+             "temperature_c": 12.0, "pressure_hpa": 1002.0, "cold_bore": "yes"},
+            {"id": "m3", "dope_session_id": "ds1", "shot_number": 3,
+             "datetime_shot": "2025-03-01T10:02:00+00:00", "speed_mps": 803.0,
+             "temperature_c": 20.0, "pressure_hpa": 1001.0, "cold_bore": "cold"},
+        ]
+
+    def test_summarize_measurements(self):
+        """Test statistics, medians, cold-bore shot and empty sessions"""
+        from dope.frames import build_measurement_frame
+        from dope.summary import summarize_measurements
+
+        frame = build_measurement_frame(self.records, [])
+        summary, empty = summarize_measurements(frame, ["ds1", "ds2"], self.user_id)
+
+        self.assertEqual(summary.shot_count, 3)
+        self.assertAlmostEqual(summary.speed_mps_avg, 803.0)
+        self.assertAlmostEqual(summary.speed_mps_sd, 3.0)
+        self.assertEqual(summary.speed_mps_es, 6.0)
+        self.assertEqual(summary.temperature_c_median, 12.0)
+        self.assertEqual(summary.pressure_hpa_median, 1001.0)
+        self.assertIsNone(summary.humidity_pct_median)
+        self.assertEqual(summary.cold_bore_first_shot_mps, 806.0)
+        self.assertEqual(summary.last_shot_at.minute, 2)
+        self.assertEqual(summary.user_id, self.user_id)
+
+        self.assertEqual(empty.dope_session_id, "ds2")
+        self.assertEqual(empty.shot_count, 0)
+        self.assertIsNone(empty.speed_mps_avg)
+        self.assertIsNotNone(empty.updated_at)
+
+    def test_summary_model_round_trip(self):
+        """Test to_dict/from_supabase_record symmetry"""
+        from dope.frames import build_measurement_frame
+        from dope.models import DopeSessionSummaryModel
+        from dope.summary import summarize_measurements
+
+        (summary,) = summarize_measurements(
+            build_measurement_frame(self.records, []), ["ds1"], self.user_id
+        )
+        restored = DopeSessionSummaryModel.from_supabase_record(summary.to_dict())
+        self.assertEqual(restored, summary)
+
+    def _service(self, stored=None):
+        from dope.service import DopeService
+
+        supabase = _FakeSupabase()
+        self.upserts = []
+
+        def table(name):
+            query = MagicMock()
+            if name == "dope_session_summary":
+                query.select.return_value.eq.return_value.execute.return_value.data = (
+                    stored or []
+                )
+
+                def upsert(rows, on_conflict=None):
+                    self.upserts.append((rows, on_conflict))
+                    return MagicMock()
+
+                query.upsert.side_effect = upsert
+            else:
+                query.select.return_value.in_.return_value.eq.return_value.execute.return_value.data = [
+                    dict(r, user_id=self.user_id) for r in self.records
+                ]
+            return query
+
+        supabase.table = MagicMock(side_effect=table)
+        return DopeService(supabase)
+
+    def test_get_summaries_backfills_missing_rows_once(self):
+        """Test lazy backfill, one narrow read and cached repeats"""
+        stored = [{"dope_session_id": "ds0", "user_id": self.user_id, "shot_count": 7}]
+        service = self._service(stored)
+
+        summaries = service.get_session_summaries(self.user_id, ["ds0", "ds1"])
+        self.assertEqual(summaries["ds0"].shot_count, 7)
+        self.assertEqual(summaries["ds1"].shot_count, 3)
+        self.assertEqual(len(self.upserts), 1)
+        self.assertEqual(self.upserts[0][1], "dope_session_id")
+        self.assertEqual([r["dope_session_id"] for r in self.upserts[0][0]], ["ds1"])
+
+        calls = service.supabase.table.call_count
+        again = service.get_session_summaries(self.user_id, ["ds0", "ds1"])
+        self.assertEqual(service.supabase.table.call_count, calls)
+        self.assertEqual(again["ds1"].speed_mps_es, 6.0)
+
+    def test_single_row_write_expires_summary(self):
+        """Test a one-shot edit deletes the summary row instead of recomputing it"""
+        service = self._service()
+        build_table = service.supabase.table.side_effect
+        queries = []
+
+        def table(name):
+            query = build_table(name)
+            queries.append((name, query))
+            if name == "dope_measurements":
+                query.update.return_value.eq.return_value.eq.return_value.execute.return_value.data = [
+                    dict(self.records[0], id="m1", dope_session_id="ds1", user_id=self.user_id)
+                ]
+            return query
+
+        service.supabase.table.side_effect = table
+        service.update_measurement("m1", {"shot_notes": "windy"}, self.user_id)
+
+        self.assertEqual(
+            [name for name, _ in queries], ["dope_measurements", "dope_session_summary"])
+        queries[1][1].delete.return_value.in_.assert_called_once_with(
+            "dope_session_id", ["ds1"])
+        queries[0][1].select.assert_not_called()
+        self.assertEqual(self.upserts, [])
+
+        # The next read backfills the expired session in one refresh
+        summaries = service.get_session_summaries(self.user_id, ["ds1"])
+        self.assertEqual(summaries["ds1"].shot_count, 3)
+        self.assertEqual(len(self.upserts), 1)
+
+    def test_refresh_failure_does_not_fail_write(self):
+        """Test that summary errors are swallowed on the write path"""
+        service = self._service()
+        with patch.object(
+            service, "refresh_session_summaries", side_effect=Exception("down")
+        ):
+            service._refresh_summaries_after_write(["ds1"], self.user_id)
+
+    def test_summary_fetch_failure_falls_back_to_measurements(self):
+        """Test that an unreadable summary table does not fail the read"""
+        service = self._service()
+        build_table = service.supabase.table.side_effect
+
+        def table(name):
+            query = build_table(name)
+            if name == "dope_session_summary":
+                query.select.return_value.eq.return_value.execute.side_effect = (
+                    Exception('relation "dope_session_summary" does not exist')
+                )
+            return query
+
+        service.supabase.table.side_effect = table
+        summaries = service.get_session_summaries(self.user_id, ["ds1", "ds2"])
+
+        self.assertEqual(summaries["ds1"].shot_count, 3)
+        self.assertAlmostEqual(summaries["ds1"].speed_mps_avg, 803.0)
+        self.assertEqual(summaries["ds2"].shot_count, 0)
+        self.assertEqual(self.upserts, [])
+
+    def test_backfill_failure_uses_cached_measurements(self):
+        """Test that a failed backfill summarizes cached measurements in memory"""
+        from dope.cache import dope_measurement_cache
+        from dope.models import DopeMeasurementModel
+
+        dope_measurement_cache.invalidate()
+        self.addCleanup(dope_measurement_cache.invalidate)
+        dope_measurement_cache.put_measurements(
+            self.user_id,
+            "ds1",
+            DopeMeasurementModel.from_supabase_records(
+                [dict(r, user_id=self.user_id) for r in self.records]
+            ),
+        )
+        stored = [{"dope_session_id": "ds0", "user_id": self.user_id, "shot_count": 7}]
+        service = self._service(stored)
+
+        with patch.object(
+            service, "refresh_session_summaries", side_effect=Exception("down")
+        ):
+            summaries = service.get_session_summaries(self.user_id, ["ds0", "ds1"])
+
+        self.assertEqual(summaries["ds0"].shot_count, 7)
+        self.assertEqual(summaries["ds1"].shot_count, 3)
+        self.assertEqual(summaries["ds1"].speed_mps_es, 6.0)
+        self.assertNotIn(
+            "dope_measurements",
+            [c.args[0] for c in service.supabase.table.call_args_list],
+        )
+
+    def test_mock_mode_summaries(self):
+        """Test summaries computed from mock measurements"""
+        from dope.service import DopeService
+
+        user_id = "google-oauth2|111273793361054745867"
+        summaries = DopeService(None).get_session_summaries(user_id)
+        self.assertEqual(summaries["session_001"].shot_count, 10)
+        self.assertEqual(summaries["session_005"].shot_count, 0)
+
+
+class TestDopeSessionStatistics(unittest.TestCase):
+    """Test database-aggregated, cached session statistics"""
+
+    def setUp(self):
+        from dope.cache import dope_statistics_cache
+        from dope.service import DopeService
+
+        dope_statistics_cache.invalidate()
+        self.addCleanup(dope_statistics_cache.invalidate)
+        self.user_id = "auth0|stats-user"
+        self.supabase = _FakeSupabase()
+        self.supabase.rpc = MagicMock()
+        self.supabase.rpc.return_value.execute.return_value.data = [
+            {
+                "total_sessions": 1200,
+                "unique_cartridge_types": 3,
+                "unique_bullet_makes": 2,
+                "unique_ranges": 4,
+                "distance_min_m": 91.44,
+                "distance_max_m": 1000.0,
+                "distance_avg_m": 412.345,
+            }
+        ]
+        self.service = DopeService(self.supabase)
+
+    def test_single_rpc_row_mapped_to_statistics(self):
+        """Test the aggregate row maps to the existing statistics keys"""
+        stats = self.service.get_session_statistics(self.user_id)
+
+        self.supabase.rpc.assert_called_once_with(
+            "dope_session_statistics", {"p_user_id": self.user_id}
+        )
+        self.supabase.table.assert_not_called()
+        self.assertEqual(
+            stats,
+            {
+                "total_sessions": 1200,
+                "active_sessions": 1200,
+                "archived_sessions": 0,
+                "unique_cartridge_types": 3,
+                "unique_bullet_makes": 2,
+                "unique_ranges": 4,
+                "average_distance_m": 412.3,
+                "distance_range": "91.44-1000.0m",
+            },
+        )
+
+    def test_cached_until_write_invalidation(self):
+        """Test repeat reads hit the cache and writes invalidate it"""
+        self.service.get_session_statistics(self.user_id)
+        self.service.get_session_statistics(self.user_id)
+        self.assertEqual(self.supabase.rpc.call_count, 1)
+
+        self.service.invalidate_cache(self.user_id)
+        self.service.get_session_statistics(self.user_id)
+        self.assertEqual(self.supabase.rpc.call_count, 2)
+
+    def test_no_sessions_and_rpc_failure_fallback(self):
+        """Test empty aggregates and the in-memory fallback"""
+        from dope.models import DopeSessionModel
+
+        self.supabase.rpc.return_value.execute.return_value.data = [
+            {"total_sessions": 0, "unique_cartridge_types": 0,
+             "unique_bullet_makes": 0, "unique_ranges": 0}
+        ]
+        stats = self.service.get_session_statistics(self.user_id)
+        self.assertEqual(stats["distance_range"], "No data")
+        self.assertEqual(stats["average_distance_m"], 0.0)
+
+        self.service.invalidate_cache(self.user_id)
+        self.supabase.rpc.side_effect = Exception("function missing")
+        sessions = [
+            DopeSessionModel(id="a", cartridge_type="308", range_distance_m=100.0),
+            DopeSessionModel(id="b", cartridge_type="308", range_distance_m=300.0),
+        ]
+        with patch.object(self.service, "get_sessions_for_user", return_value=sessions):
+            stats = self.service.get_session_statistics(self.user_id)
+        self.assertEqual(stats["total_sessions"], 2)
+        self.assertEqual(stats["unique_cartridge_types"], 1)
+        self.assertEqual(stats["average_distance_m"], 200.0)
+
+
+class TestDopeOptionsLoader(unittest.TestCase):
+    """Test concurrent, memoized loading of DOPE dropdown options"""
+
+    def setUp(self):
+        from dope.options import DopeOptionsLoader
+
+        self.loader = DopeOptionsLoader(timeout_seconds=2.0)
+        self.user_id = "auth0|options-user"
+
+    def test_sources_are_read_concurrently_and_memoized(self):
+        """Test every reader runs at once and a complete result is reused"""
+        import threading
+
+        barrier = threading.Barrier(3, timeout=1.0)
+        calls = []
+
+        def reader(value):
+            def read():
+                calls.append(value)
+                barrier.wait()
+                return [value]
+
+            return read
+
+        readers = {name: reader(name) for name in ("rifles", "cartridges", "ranges")}
+        options = self.loader.load(None, self.user_id, readers=readers)
+        self.assertEqual(options.errors, {})
+        self.assertEqual(options.get("rifles"), ["rifles"])
+
+        again = self.loader.load(None, self.user_id, readers=readers)
+        self.assertEqual(again.values, options.values)
+        self.assertEqual(len(calls), 3)
+
+        self.loader.invalidate(self.user_id)
+        barrier.reset()
+        self.loader.load(None, self.user_id, readers=readers)
+        self.assertEqual(len(calls), 6)
+
+    def test_failures_and_timeouts_are_reported_not_memoized(self):
+        """Test a failing or slow source leaves the others loaded"""
+        import threading
+
+        release = threading.Event()
+        self.addCleanup(release.set)
+        self.loader.timeout_seconds = 0.05
+
+        def fail():
+            raise RuntimeError("rifles down")
+
+        readers = {
+            "rifles": fail,
+            "cartridges": lambda: [{"id": "c1"}],
+            "ranges": lambda: release.wait(1.0) and [],
+        }
+        options = self.loader.load(None, self.user_id, readers=readers)
+        self.assertEqual(options.get("cartridges"), [{"id": "c1"}])
+        self.assertEqual(options.get("rifles"), [])
+        self.assertEqual(options.error_for("rifles"), "rifles down")
+        self.assertIn("Timed out", options.error_for("ranges"))
+
+        release.set()
+        readers["rifles"] = lambda: [{"id": "r1"}]
+        readers["ranges"] = lambda: []
+        retried = self.loader.load(None, self.user_id, readers=readers)
+        self.assertEqual(retried.errors, {})
+        self.assertEqual(retried.get("rifles"), [{"id": "r1"}])
+
+    def test_only_requested_sources_are_read(self):
+        """Test a single-source load reads and memoizes just that source"""
+        calls = []
+
+        def reader(name):
+            def read():
+                calls.append(name)
+                return [name]
+
+            return read
+
+        readers = {name: reader(name) for name in ("rifles", "chrono_sessions")}
+        options = self.loader.load(
+            None, self.user_id, sources=("rifles",), readers=readers)
+        self.assertEqual(options.values, {"rifles": ["rifles"]})
+        self.assertEqual(calls, ["rifles"])
+
+        self.loader.load(None, self.user_id, sources=("rifles",), readers=readers)
+        self.assertEqual(calls, ["rifles"])
+        both = self.loader.load(None, self.user_id, readers=readers)
+        self.assertEqual(both.get("chrono_sessions"), ["chrono_sessions"])
+        self.assertEqual(calls, ["rifles", "chrono_sessions"])
+
+    def test_wizard_option_requests_only_its_source(self):
+        """Test _get_option asks the loader for its own source only"""
+        from dope.create.business import DopeCreateBusiness
+        from dope.options import DopeSourceOptions
+
+        business = DopeCreateBusiness.__new__(DopeCreateBusiness)
+        business.supabase = None
+        loaded = DopeSourceOptions(values={"rifles": [{"id": "r1"}]})
+        with patch(
+            "dope.create.business.options_loader.load", return_value=loaded
+        ) as load:
+            self.assertEqual(business._get_option(self.user_id, "rifles"), [{"id": "r1"}])
+        load.assert_called_once_with(None, self.user_id, sources=("rifles",))
+
+    def test_service_raises_on_failed_source(self):
+        """Test get_edit_dropdown_options names the failed sources"""
+        from dope.options import DopeSourceOptions
+        from dope.service import DopeService
+
+        service = DopeService(_FakeSupabase())
+        failed = DopeSourceOptions(
+            values={"rifles": []}, errors={"rifles": "rifles down"}
+        )
+        with patch("dope.service.options_loader.load", return_value=failed):
+            with self.assertRaises(Exception) as ctx:
+                service.get_edit_dropdown_options(self.user_id)
+        self.assertIn("rifles: rifles down", str(ctx.exception))
+
+
+class TestDopeUnusedChronoSessions(unittest.TestCase):
+    """Test the anti-join query for chrono sessions not used by DOPE"""
+
+    def test_single_paged_anti_join_query(self):
+        """Test one narrow, paged query that filters out referenced sessions"""
+        from dope.service import UNUSED_CHRONO_SESSION_COLUMNS, DopeService
+
+        supabase = _FakeSupabase()
+        query = supabase.table.return_value
+        for method in ("select", "eq", "is_", "order", "range"):
+            getattr(query, method).return_value = query
+        query.execute.return_value.data = [
+            {
+                "id": "chrono-1",
+                "user_id": "auth0|wizard-user",
+                "tab_name": "308 Win",
+                "session_name": "Morning",
+                "datetime_local": "2025-06-01T08:00:00",
+                "uploaded_at": "2025-06-01T12:00:00",
+                "shot_count": 10,
+                "avg_speed_mps": 820.5,
+                "dope_sessions": None,
+            }
+        ]
+
+        sessions = DopeService(supabase).get_unused_chrono_sessions(
+            "auth0|wizard-user", limit=25, offset=50
+        )
+
+        self.assertEqual([s.id for s in sessions], ["chrono-1"])
+        self.assertEqual(sessions[0].shot_count, 10)
+        supabase.table.assert_called_once_with("chrono_sessions")
+        selected = query.select.call_args[0][0]
+        self.assertNotIn("*", selected)
+        for column in UNUSED_CHRONO_SESSION_COLUMNS:
+            self.assertIn(column, selected.split(","))
+        self.assertIn("dope_sessions!chrono_session_id(id)", selected)
+        query.is_.assert_called_once_with("dope_sessions", "null")
+        query.eq.assert_called_once_with("user_id", "auth0|wizard-user")
+        query.range.assert_called_once_with(50, 74)
+
+    def test_errors_are_wrapped(self):
+        """Test query failures surface through the wizard business layer"""
+        from dope.create.business import DopeCreateBusiness
+
+        supabase = _FakeSupabase()
+        supabase.table.side_effect = Exception("connection lost")
+        business = DopeCreateBusiness(supabase)
+
+        with self.assertRaises(Exception) as ctx:
+            business.get_unused_chrono_sessions("auth0|wizard-user")
+        self.assertIn("Error loading chronograph sessions", str(ctx.exception))
+        self.assertIn("connection lost", str(ctx.exception))
+
+
+class TestDopeSessionReadModel(unittest.TestCase):
+    """Test reads from the dope_sessions_flat view"""
+
+    def setUp(self):
+        from dope.cache import dope_session_cache
+        from dope.service import DopeService
+
+        dope_session_cache.invalidate()
+        self.addCleanup(dope_session_cache.invalidate)
+        self.supabase = _FakeSupabase()
+        self.service = DopeService(self.supabase)
+        self.user_id = "auth0|flat-user"
+        self.row = _flat_session_row(
+            id="s1",
+            user_id=self.user_id,
+            session_name="Flat session",
+            datetime_local="2025-08-10T14:00:46+00:00",
+            start_time="2025-08-10T14:00:46+00:00",
+            end_time="2025-08-10T15:30:00+00:00",
+            rifle_name="Tikka T3x",
+            bullet_weight="168.00",
+            range_distance_m=300.0,
+            location_hyperlink="https://maps.google.com/?q=45.1,-122.3",
+            created_at="2025-08-10T16:00:00.123456+00:00",
+        )
+
+    def test_from_flat_record_converts_only_timestamps(self):
+        """Test the fast constructor keeps values and parses ISO timestamps"""
+        from datetime import timezone
+
+        from dope.models import DopeSessionModel
+
+        session = DopeSessionModel.from_flat_record(self.row)
+        self.assertEqual(session.rifle_name, "Tikka T3x")
+        self.assertEqual(session.bullet_weight, "168.00")
+        self.assertEqual(session.range_distance_m, 300.0)
+        self.assertEqual(session.start_time.tzinfo, timezone.utc)
+        self.assertEqual(session.end_time.hour, 15)
+        self.assertEqual(session.created_at.microsecond, 123456)
+        self.assertIsNone(session.updated_at)
+
+    def test_from_flat_record_accepts_postgrest_timestamp_forms(self):
+        """Test "Z", "+00" and trimmed fractional seconds parse on every Python"""
+        from datetime import timezone
+
+        from dope.models import DopeSessionModel
+
+        session = DopeSessionModel.from_flat_record(
+            {
+                **self.row,
+                "start_time": "2025-06-12T08:20:00.12+00",
+                "end_time": "2025-06-12T09:20:00Z",
+                "created_at": "2025-06-12 08:20:00.1+00",
+            }
+        )
+        self.assertEqual(session.start_time.microsecond, 120000)
+        self.assertEqual(session.start_time.tzinfo, timezone.utc)
+        self.assertEqual(session.end_time.hour, 9)
+        self.assertEqual(session.end_time.tzinfo, timezone.utc)
+        self.assertEqual(session.created_at.microsecond, 100000)
+
+    def test_service_reads_flat_view(self):
+        """Test list and single reads select the model columns from the view"""
+        from dope.models import DOPE_SESSION_FLAT_COLUMNS
+
+        query = self.supabase.table.return_value
+        query.select.return_value.eq.return_value.order.return_value.execute.return_value.data = [
+            self.row
+        ]
+        (
+            query.select.return_value.eq.return_value.eq.return_value.single
+            .return_value.execute.return_value.data
+        ) = self.row
+
+        sessions = self.service.get_sessions_for_user(self.user_id)
+        session = self.service.get_session_by_id("s1", self.user_id)
+
+        self.assertEqual([s.id for s in sessions], ["s1"])
+        self.assertEqual(session.location_hyperlink, self.row["location_hyperlink"])
+        self.assertEqual(
+            [c.args for c in self.supabase.table.call_args_list],
+            [("dope_sessions_flat",), ("dope_sessions_flat",)],
+        )
+        for call in query.select.call_args_list:
+            self.assertEqual(call.args[0].split(","), list(DOPE_SESSION_FLAT_COLUMNS))
+
+
+class TestDopeExport(unittest.TestCase):
+    """Test streaming ZIP and Parquet export of sessions with measurements"""
+
+    def setUp(self):
+        from dope.models import DopeSessionModel
+        from dope.service import DopeService
+
+        self.user_id = "auth0|export-user"
+        self.sessions = [
+            DopeSessionModel(id=f"ds{i}", user_id=self.user_id,
+                             session_name=f"Session {i}", cartridge_type="308")
+            for i in range(1, 4)
+        ]
+        self.records = {
+            "ds1": [{"id": "m1", "dope_session_id": "ds1", "shot_number": 1,
+                     "speed_mps": 800.0, "datetime_shot": "2025-06-01T08:00:00+00:00"},
+                    {"id": "m2", "dope_session_id": "ds1", "shot_number": 2,
+                     "speed_mps": 805.0, "datetime_shot": "2025-06-01T08:01:00+00:00"}],
+            "ds3": [{"id": "m3", "dope_session_id": "ds3", "shot_number": 1,
+                     "speed_mps": 790.0, "cold_bore": "yes"}],
+        }
+        self.service = DopeService(_FakeSupabase())
+        self.fetched = []
+
+        def fetch(session_ids, user_id, chunk_size):
+            self.fetched.append(list(session_ids))
+            return [r for sid in session_ids for r in self.records.get(sid, [])]
+
+        patch.object(
+            self.service, "get_sessions_for_user", return_value=self.sessions
+        ).start()
+        patch.object(
+            self.service, "_fetch_measurement_records", side_effect=fetch
+        ).start()
+        self.addCleanup(patch.stopall)
+
+    def test_zip_has_csv_per_session_and_streams_in_chunks(self):
+        """Test one query per session chunk and one shot CSV per session"""
+        import io
+        import zipfile
+
+        import pandas as pd
+
+        buffer = io.BytesIO()
+        counts = self.service.export_sessions(
+            ["ds3", "ds1", "ds2", "other"], self.user_id, buffer, "zip", chunk_size=2
+        )
+
+        self.assertEqual(counts, {"sessions": 3, "shots": 3})
+        self.assertEqual(self.fetched, [["ds3", "ds1"], ["ds2"]])
+        with zipfile.ZipFile(io.BytesIO(buffer.getvalue())) as archive:
+            self.assertEqual(
+                sorted(archive.namelist()),
+                ["Session_1_ds1.csv", "Session_2_ds2.csv", "Session_3_ds3.csv",
+                 "sessions.csv"],
+            )
+            shots = pd.read_csv(archive.open("Session_1_ds1.csv"))
+            empty = pd.read_csv(archive.open("Session_2_ds2.csv"))
+            sessions = pd.read_csv(archive.open("sessions.csv"))
+        self.assertEqual(shots["speed_mps"].tolist(), [800.0, 805.0])
+        self.assertEqual(len(empty), 0)
+        self.assertIn("shot_number", empty.columns)
+        self.assertEqual(sessions["id"].tolist(), ["ds3", "ds1", "ds2"])
+
+    def test_parquet_writes_one_row_group_per_chunk(self):
+        """Test a single Parquet file of session-joined shots"""
+        import io
+
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            self.skipTest("pyarrow not installed")
+
+        buffer = io.BytesIO()
+        counts = self.service.export_sessions(
+            ["ds1", "ds2", "ds3"], self.user_id, buffer, "parquet", chunk_size=2
+        )
+
+        self.assertEqual(counts, {"sessions": 3, "shots": 3})
+        parquet = pq.ParquetFile(io.BytesIO(buffer.getvalue()))
+        self.assertEqual(parquet.metadata.num_row_groups, 2)
+        table = parquet.read().to_pandas()
+        self.assertEqual(table["id"].tolist(), ["m1", "m2", "m3"])
+        self.assertEqual(table["session_name"].tolist()[-1], "Session 3")
+        self.assertEqual(table["cold_bore"].tolist()[-1], True)
+
+    def test_unknown_format_is_rejected(self):
+        """Test unsupported export formats raise ValueError"""
+        import io
+
+        with self.assertRaises(ValueError):
+            self.service.export_sessions(["ds1"], self.user_id, io.BytesIO(), "xlsx")
+
+
+class TestDopeCard(unittest.TestCase):
+    """Test the cached DOPE card generator"""
+
+    def setUp(self):
+        from dope.card import DopeCardGenerator
+        from dope.models import DopeSessionModel
+
+        self.generator = DopeCardGenerator(max_cards=4)
+        self.session = DopeSessionModel(
+            id="ds1",
+            speed_mps_avg=823.4,
+            ballistic_coefficient_g7="0.243",
+            rifle_sight_offset="1.5 inches",
+            temperature_c_median=15.0,
+            barometric_pressure_hpa_median=1013.25,
+            relative_humidity_pct_median=0.0,
+        )
+
+    def test_density_altitude_and_fallbacks(self):
+        """Test density altitude from median weather, range altitude, then sea level"""
+        from dope.card import session_density_altitude_m
+
+        self.assertAlmostEqual(session_density_altitude_m(self.session), 0.0, delta=1.0)
+        self.session.barometric_pressure_hpa_median = None
+        self.session.start_altitude = 1500.0
+        self.assertEqual(session_density_altitude_m(self.session), 1500.0)
+        self.session.start_altitude = None
+        self.assertEqual(session_density_altitude_m(self.session), 0.0)
+
+    def test_cache_hits_within_buckets(self):
+        """Test that small velocity and weather changes reuse the cached card"""
+        from ballistics.models import BallisticProfile
+
+        card = self.generator.card_for_session(self.session)
+        self.session.speed_mps_avg = 823.9
+        self.session.temperature_c_median = 15.3
+        self.assertIs(self.generator.card_for_session(self.session), card)
+        self.assertEqual((self.generator.hits, self.generator.misses), (1, 1))
+
+        key = self.generator.card_key(
+            BallisticProfile(823.4, 0.243, sight_height_m=0.0381), 0.0
+        )
+        self.assertEqual(key.muzzle_velocity_mps, 824.0)
+        self.assertEqual(key.sight_height_mm, 38.1)
+
+    def test_cache_misses_across_buckets(self):
+        """Test that a new velocity, air, zero or grid computes a new card"""
+        card = self.generator.card_for_session(self.session)
+        self.session.speed_mps_avg = 830.0
+        faster = self.generator.card_for_session(self.session)
+        self.session.temperature_c_median = 35.0
+        thinner = self.generator.card_for_session(self.session)
+        rezeroed = self.generator.card_for_session(self.session, zero_distance_m=200.0)
+        self.assertEqual(self.generator.misses, 4)
+        self.assertLess(faster.elevation(800.0), card.elevation(800.0))
+        self.assertLess(thinner.elevation(800.0), faster.elevation(800.0))
+        self.assertAlmostEqual(float(rezeroed.elevation(200.0)), 0.0, places=2)
+
+    def test_missing_load_data(self):
+        """Test that sessions without a BC raise ValueError"""
+        self.session.ballistic_coefficient_g7 = None
+        with self.assertRaises(ValueError):
+            self.generator.card_for_session(self.session)
+
+    def test_card_distances_for(self):
+        """Test the grid covers every shot and grows in 100 m steps"""
+        from dope.card import card_distances_for
+
+        grid = card_distances_for([None, 300.0, 1040.0])
+        self.assertEqual((grid[0], grid[-1], len(grid)), (25.0, 1100.0, 44))
+        self.assertEqual(card_distances_for([])[-1], 1000.0)
+
+    def test_predicted_elevation_in_shots_table(self):
+        """Test predicted holds interpolate at shot distances and skip short ones"""
+        from dope.view.view_page import _predicted_elevation
+
+        card = self.generator.card_for_session(self.session)
+        mil = _predicted_elevation(card, 550.0, "mil")
+        moa = _predicted_elevation(card, 550.0, "moa")
+        self.assertGreater(mil, 0.0)
+        self.assertAlmostEqual(moa / mil, 3.4377, places=2)
+        self.assertEqual(_predicted_elevation(card, 20.0, "mil"), "")
+        self.assertEqual(_predicted_elevation(None, 550.0, "mil"), "")
+
+    def test_predicted_windage_uses_median_crosswind(self):
+        """Test windage holds scale the card's drift by the session crosswind"""
+        from dope.card import session_crosswind_mps
+        from dope.view.view_page import _predicted_windage
+
+        self.assertIsNone(session_crosswind_mps(self.session))
+        self.session.wind_speed_mps_median = 4.0
+        self.session.wind_direction_deg_median = 270.0
+        self.session.azimuth_deg = 0.0
+        self.assertAlmostEqual(session_crosswind_mps(self.session), 4.0)
+        self.session.wind_direction_deg_median = 0.0
+        self.assertAlmostEqual(session_crosswind_mps(self.session), 0.0)
+        self.session.wind_direction_deg_median = 120.0
+        self.session.azimuth_deg = 90.0
+        self.assertAlmostEqual(session_crosswind_mps(self.session), -2.0)
+
+        card = self.generator.card_for_session(self.session)
+        mil = _predicted_windage(card, 550.0, 4.0, "mil")
+        self.assertAlmostEqual(mil, round(float(card.windage(550.0, 4.0, "mil")), 2))
+        self.assertLess(mil, 0.0)  # Hold left for a left-to-right wind
+        self.assertAlmostEqual(_predicted_windage(card, 550.0, -4.0, "mil"), -mil)
+        self.assertEqual(_predicted_windage(card, 550.0, None, "mil"), "")
+        self.assertEqual(_predicted_windage(card, 20.0, 4.0, "mil"), "")
+
+
+class TestDopeTruing(unittest.TestCase):
+    """Test truing a rifle and cartridge from recorded elevation adjustments"""
+
+    def setUp(self):
+        import numpy as np
+
+        from ballistics.models import BallisticProfile
+        from dope.cache import dope_measurement_cache
+        from dope.frames import build_measurement_frame
+        from dope.models import DopeSessionModel
+
+        self.addCleanup(dope_measurement_cache.invalidate)
+        self.user_id = "auth0|truing-user"
+        self.sessions = [
+            DopeSessionModel(
+                id=f"ds{i}", user_id=self.user_id, cartridge_type="6.5 Creedmoor",
+                rifle_id="rifle-1", cartridge_id="c1", bullet_id="b1",
+                speed_mps_avg=823.0, ballistic_coefficient_g7="0.243",
+                rifle_sight_offset="1.5 inches", temperature_c_median=temp,
+                barometric_pressure_hpa_median=1013.25,
+            )
+            for i, temp in enumerate((5.0, 25.0))
+        ]
+        # Holds a 805 m/s, 0.255 G7 load needs in each session's air
+        true_load = BallisticProfile(muzzle_velocity_mps=805.0, ballistic_coefficient=0.255)
+        grid = np.arange(300.0, 1001.0, 100.0)
+        records = []
+        for session in self.sessions:
+            card = self.card_for(true_load, grid, session.temperature_c_median)
+            for shot, (distance, hold) in enumerate(zip(grid, card), start=1):
+                records.append({"id": f"{session.id}-{shot}",
+                                "dope_session_id": session.id, "shot_number": shot,
+                                "distance_m": distance, "elevation_adjustment": f"{hold:.4f}"})
+        # No distance: not an observation
+        records.append({"id": "x", "dope_session_id": "ds0", "shot_number": 99,
+                        "elevation_adjustment": "1.0"})
+        self.frame = build_measurement_frame(records, self.sessions)
+
+    @staticmethod
+    def card_for(profile, grid, temperature_c):
+        from ballistics.atmosphere import air_density, speed_of_sound
+        from ballistics.card import compute_dope_card
+
+        card = compute_dope_card(
+            profile, grid, float(air_density(temperature_c, 1013.25)),
+            float(speed_of_sound(temperature_c)),
+        )
+        return card.elevation(grid)
+
+    def test_observations_use_shot_then_session_air(self):
+        """Test observation rows, median weather fill and standard-air fallback"""
+        from dope.analytics.truing import truing_observations
+
+        observations = truing_observations(self.frame)
+        self.assertEqual(len(observations), 16)
+        cold, warm = observations.groupby("dope_session_id")["air_density_kg_m3"].first()
+        self.assertGreater(cold, warm)
+
+        frame = self.frame.assign(temperature_c_median=float("nan"), start_altitude=1000.0)
+        observations = truing_observations(frame)
+        self.assertAlmostEqual(observations["air_density_kg_m3"].iloc[0], 1.1117, places=3)
+
+    def test_compute_truing_recovers_load(self):
+        """Test fitting effective MV and BC across sessions"""
+        from dope.analytics.truing import compute_truing
+
+        result = compute_truing(self.sessions, self.frame)
+        self.assertEqual(result.initial_profile.muzzle_velocity_mps, 823.0)
+        self.assertAlmostEqual(result.profile.muzzle_velocity_mps, 805.0, delta=1.0)
+        self.assertAlmostEqual(result.profile.ballistic_coefficient, 0.255, delta=0.002)
+        self.assertLess(result.rms_residual, 0.001)
+        self.assertEqual(result.unit, "mil")
+
+    def test_mixed_bullets_and_missing_load(self):
+        """Test truing refuses mixed bullets and sessions without a BC"""
+        from dope.analytics.truing import compute_truing
+
+        with self.assertRaises(ValueError):
+            mixed = self.frame.assign(bullet_id="b1")
+            mixed.loc[0, "bullet_id"] = "b2"
+            compute_truing(self.sessions, mixed)
+        for session in self.sessions:
+            session.ballistic_coefficient_g7 = None
+        with self.assertRaises(ValueError):
+            compute_truing(self.sessions, self.frame)
+
+    def test_engine_memoizes_truing(self):
+        """Test the analytics engine reuses the fit until measurements change"""
+        from dope.analytics.engine import AnalyticsSelection, DopeAnalyticsEngine
+        from dope.cache import dope_measurement_cache
+
+        dope_api = MagicMock()
+        dope_api.get_sessions_for_user.return_value = self.sessions
+        dope_api.get_measurement_frame.return_value = self.frame
+        engine = DopeAnalyticsEngine()
+        selection = AnalyticsSelection("6.5 Creedmoor", "rifle-1", ("c1",))
+
+        first = engine.true_profile(dope_api, self.user_id, selection)
+        self.assertIs(engine.true_profile(dope_api, self.user_id, selection), first)
+        self.assertEqual(dope_api.get_measurement_frame.call_count, 1)
+
+        dope_measurement_cache.invalidate_user(self.user_id)
+        engine.true_profile(dope_api, self.user_id, selection)
+        self.assertEqual(dope_api.get_measurement_frame.call_count, 2)
+
+
+class TestBulletStabilityIndex(unittest.TestCase):
+    """Test the cached per-rifle bullet stability index"""
+
+    def setUp(self):
+        from bullets.models import BulletModel
+        from dope.stability import BulletStabilityIndexer
+        from rifles.models import RifleModel
+
+        def bullet(bullet_id, weight, length, min_twist=None):
+            return BulletModel(
+                id=bullet_id, user_id="admin", manufacturer="Test", model=bullet_id,
+                weight_grains=weight, bullet_diameter_groove_mm=6.71,
+                bore_diameter_land_mm=6.5, bullet_length_mm=length,
+                min_req_twist_rate_in_per_rev=min_twist,
+            )
+
+        self.bullets = [
+            bullet("short", 120.0, 30.0),
+            bullet("long", 147.0, 38.0),
+            bullet("no-length", 140.0, None, min_twist=8.0),
+            bullet("no-data", 140.0, None),
+        ]
+        self.load_bullets = MagicMock(return_value=self.bullets)
+        self.indexer = BulletStabilityIndexer(max_rifles=4)
+        self.rifle = RifleModel(id="r1", user_id="u1", name="Test", cartridge_type="6.5 Creedmoor",
+                                barrel_twist_ratio="1:9")
+
+    def test_index_rates_catalog(self):
+        """Test statuses, factors and badges for a 1:9 barrel"""
+        index = self.indexer.index_for_rifle(self.rifle, self.load_bullets)
+        self.assertEqual(index.twist_in_per_rev, 9.0)
+        self.assertEqual(index.status("short"), "stable")
+        self.assertIn(index.status("long"), ("marginal", "unstable"))
+        self.assertEqual(index.status("no-length"), "unstable")
+        self.assertEqual(index.status("no-data"), "unknown")
+        self.assertEqual(index.status("missing"), "unknown")
+        self.assertIsNone(index.stability_factor("no-length"))
+        self.assertGreater(index.stability_factor("short"), 1.5)
+        self.assertEqual(index.badge("short"), "")
+        self.assertNotEqual(index.badge("long"), "")
+
+    def test_index_is_cached_per_rifle_twist_and_conditions(self):
+        """Test the catalog is read once per rifle until the twist changes"""
+        first = self.indexer.index_for_rifle(self.rifle, self.load_bullets)
+        self.assertIs(self.indexer.index_for_rifle(self.rifle, self.load_bullets), first)
+        self.assertEqual(self.load_bullets.call_count, 1)
+
+        self.rifle.barrel_twist_ratio = "1:7.5"
+        faster = self.indexer.index_for_rifle(self.rifle, self.load_bullets)
+        self.assertEqual(faster.status("long"), "stable")
+        self.indexer.index_for_rifle(self.rifle, self.load_bullets, temperature_c=-10.0)
+        self.assertEqual(self.load_bullets.call_count, 3)
+        self.assertEqual((self.indexer.hits, self.indexer.misses), (1, 3))
+
+    def test_filter_stabilized_and_dict_rifles(self):
+        """Test filtering cartridges by bullet and rifle records given as dicts"""
+        from types import SimpleNamespace
+
+        index = self.indexer.index_for_rifle({"id": "r2", "barrel_twist_ratio": "1:9"},
+                                             self.load_bullets)
+        cartridges = [SimpleNamespace(bullet_id=b) for b in ("short", "long", "no-data")]
+        kept = index.filter_stabilized(cartridges, lambda c: c.bullet_id)
+        self.assertEqual([c.bullet_id for c in kept], ["short", "no-data"])
+        self.assertEqual(sum(index.counts().values()), 4)
+
+
 if __name__ == "__main__":
     unittest.main()
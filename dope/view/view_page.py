@@ -5,8 +5,10 @@ Comprehensive interface for viewing, filtering, searching, and managing DOPE ses
 Displays all session data in a sortable table with advanced filtering capabilities.
 """
 
+import math
 import os
 import sys
+import tempfile
 import time
 from datetime import datetime
 from typing import Any, Dict, List
@@ -15,7 +17,17 @@ import pandas as pd
 import streamlit as st
 
 from dope.api import DopeAPI
-from dope.models import DopeSessionModel
+from dope.bulk import diff_measurement_frames
+from dope.card import (
+    card_distances_for,
+    dope_card_generator,
+    session_crosswind_mps,
+)
+from dope.facets import DopeFacets
+from dope.filters import make_filter_key
+from dope.models import DopeSessionModel, DopeSessionSummaryModel
+from dope.options import options_loader
+from dope.pagination import SESSION_TABLE_COLUMNS, DopeSessionPage
 from supabase import create_client
 from utils.ui_formatters import (
     format_energy,
@@ -49,6 +61,18 @@ sys.path.append(
     os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 )
 
+# Streaming export formats offered on the view page (see dope.export)
+EXPORT_FORMAT_LABELS = {"zip": "ZIP (CSV per session)", "parquet": "Parquet"}
+EXPORT_MIME_TYPES = {"zip": "application/zip", "parquet": "application/octet-stream"}
+
+# Sessions table columns read from the per-session summaries (see dope.summary)
+SUMMARY_TABLE_COLUMNS = {
+    "Shots": "shot_count",
+    "Avg Speed (m/s)": "speed_mps_avg",
+    "SD (m/s)": "speed_mps_sd",
+    "ES (m/s)": "speed_mps_es",
+}
+
 
 def render_view_page():
     """Render the comprehensive DOPE view page with filtering and session management"""
@@ -108,17 +132,26 @@ def render_view_page():
         with col2:
             if st.button("🔄 Refresh", help="Reload data from database"):
                 st.cache_data.clear()
+                dope_api.invalidate_cache(user_id)
                 st.rerun()
 
         # Advanced Filters Section (on main page)
         render_main_page_filters(dope_api, user_id)
 
-        # Get filtered sessions
-        sessions = get_filtered_sessions(
+        # Table view options are applied before the page is fetched
+        _init_table_settings()
+        with st.expander(
+            "⚙️ View Options",
+            expanded=st.session_state.dope_view["table_settings"]["show_view_options"],
+        ):
+            _render_table_controls()
+
+        # Fetch only the visible page of filtered, sorted sessions
+        page = get_sessions_page(
             dope_api, user_id, st.session_state.dope_view["filters"]
         )
 
-        if not sessions:
+        if not page.total_count:
             st.info(
                 "No DOPE sessions found matching your filters. Try adjusting the filters or create a new session."
             )
@@ -127,18 +160,26 @@ def render_view_page():
                 st.rerun()
             return
 
-        # Display session statistics
-        # render_session_statistics(sessions)
+        # Display session statistics over every filtered session
+        filtered_sessions = get_filtered_sessions(
+            dope_api, user_id, st.session_state.dope_view["filters"]
+        )
+        render_session_statistics(
+            filtered_sessions,
+            get_session_summaries(
+                dope_api, user_id, [s.id for s in filtered_sessions]
+            ),
+        )
 
         # Render main data table
-        render_sessions_table(sessions)
+        render_sessions_table(page, dope_api, user_id)
 
         # Show session details if one is selected
         if st.session_state.dope_view["selected_session_id"]:
             selected_session = next(
                 (
                     s
-                    for s in sessions
+                    for s in page.sessions
                     if s.id == st.session_state.dope_view["selected_session_id"]
                 ),
                 None,
@@ -191,17 +232,16 @@ def render_main_page_filters(dope_api: DopeAPI, user_id: str):
 
         st.divider()
 
-        # Get unique values for filters
+        # Get distinct values, counts and ranges for all filters in one call
         try:
-            rifle_names = dope_api.get_unique_values(user_id, "rifle_name")
-            cartridge_types = dope_api.get_unique_values(user_id, "cartridge_type")
-            cartridge_makes = dope_api.get_unique_values(user_id, "cartridge_make")
-            bullet_makes = dope_api.get_unique_values(user_id, "bullet_make")
-            range_names = dope_api.get_unique_values(user_id, "range_name")
+            facets = dope_api.get_filter_facets(user_id)
         except Exception:
-            rifle_names = cartridge_types = cartridge_makes = bullet_makes = (
-                range_names
-            ) = []
+            facets = DopeFacets()
+        rifle_names = facets.values_for("rifle_name")
+        cartridge_types = facets.values_for("cartridge_type")
+        cartridge_makes = facets.values_for("cartridge_make")
+        bullet_makes = facets.values_for("bullet_make")
+        range_names = facets.values_for("range_name")
 
         # Filter sections in columns
         col1, col2, col3 = st.columns(3)
@@ -253,6 +293,7 @@ def render_main_page_filters(dope_api: DopeAPI, user_id: str):
                 rifle_name = st.selectbox(
                     "Rifle Name",
                     options=["All", "Not Defined"] + rifle_names,
+                    format_func=lambda v: _facet_option_label(facets, "rifle_name", v),
                     key="rifle_name_selectbox",
                 )
 
@@ -277,6 +318,7 @@ def render_main_page_filters(dope_api: DopeAPI, user_id: str):
                 range_name = st.selectbox(
                     "Range Name",
                     options=["All", "Not Defined"] + range_names,
+                    format_func=lambda v: _facet_option_label(facets, "range_name", v),
                     key="range_name_selectbox",
                 )
 
@@ -286,17 +328,20 @@ def render_main_page_filters(dope_api: DopeAPI, user_id: str):
                 elif "range_name" in st.session_state.dope_view["filters"]:
                     del st.session_state.dope_view["filters"]["range_name"]
 
-            # Distance filter
+            # Distance filter (widened to cover the user's longest distance)
+            distance_bounds = _slider_bounds(
+                facets, "range_distance_m", (0, 1000), step=25
+            )
             distance_range = st.slider(
                 "Distance (meters)",
-                min_value=0,
-                max_value=1000,
+                min_value=distance_bounds[0],
+                max_value=distance_bounds[1],
                 value=st.session_state.dope_view["filters"].get(
-                    "distance_range", (0, 1000)
+                    "distance_range", distance_bounds
                 ),
                 step=25,
             )
-            if distance_range != (0, 1000):
+            if distance_range != distance_bounds:
                 st.session_state.dope_view["filters"]["distance_range"] = distance_range
             elif "distance_range" in st.session_state.dope_view["filters"]:
                 del st.session_state.dope_view["filters"]["distance_range"]
@@ -319,6 +364,7 @@ def render_main_page_filters(dope_api: DopeAPI, user_id: str):
                 cartridge_make = st.selectbox(
                     "Cartridge Make",
                     options=["All", "Not Defined"] + cartridge_makes,
+                    format_func=lambda v: _facet_option_label(facets, "cartridge_make", v),
                     key="cartridge_make_selectbox",
                 )
 
@@ -344,6 +390,7 @@ def render_main_page_filters(dope_api: DopeAPI, user_id: str):
                 cartridge_type = st.selectbox(
                     "Cartridge Type",
                     options=["All", "Not Defined"] + cartridge_types,
+                    format_func=lambda v: _facet_option_label(facets, "cartridge_type", v),
                     key="cartridge_type_selectbox",
                 )
 
@@ -370,6 +417,7 @@ def render_main_page_filters(dope_api: DopeAPI, user_id: str):
                 bullet_make = st.selectbox(
                     "Bullet Make",
                     options=["All", "Not Defined"] + bullet_makes,
+                    format_func=lambda v: _facet_option_label(facets, "bullet_make", v),
                     key="bullet_make_selectbox",
                 )
 
@@ -379,17 +427,18 @@ def render_main_page_filters(dope_api: DopeAPI, user_id: str):
                 elif "bullet_make" in st.session_state.dope_view["filters"]:
                     del st.session_state.dope_view["filters"]["bullet_make"]
 
-            # Bullet weight range
+            # Bullet weight range (widened to cover the user's bullets)
+            weight_bounds = _slider_bounds(facets, "bullet_weight", (50, 300), step=5)
             weight_range = st.slider(
                 "Bullet Weight (grains)",
-                min_value=50,
-                max_value=300,
+                min_value=weight_bounds[0],
+                max_value=weight_bounds[1],
                 value=st.session_state.dope_view["filters"].get(
-                    "bullet_weight_range", (50, 300)
+                    "bullet_weight_range", weight_bounds
                 ),
                 step=5,
             )
-            if weight_range != (50, 300):
+            if weight_range != weight_bounds:
                 st.session_state.dope_view["filters"][
                     "bullet_weight_range"
                 ] = weight_range
@@ -538,27 +587,85 @@ def render_main_page_filters(dope_api: DopeAPI, user_id: str):
                 del st.session_state.dope_view["filters"]["wind_speed_range"]
 
 
+def _facet_option_label(facets: DopeFacets, field_name: str, value: str) -> str:
+    """Label a filter dropdown option with its session count"""
+    count = facets.count_for(field_name, value)
+    return f"{value} ({count})" if count else value
+
+
+def _slider_bounds(
+    facets: DopeFacets, field_name: str, default: tuple, step: int
+) -> tuple:
+    """Widen default slider bounds to cover the user's data range on step multiples"""
+    data_range = facets.range_for(field_name)
+    if not data_range:
+        return default
+    low = min(default[0], int(math.floor(data_range[0] / step) * step))
+    high = max(default[1], int(math.ceil(data_range[1] / step) * step))
+    return (low, high)
+
+
 def get_filtered_sessions(
     dope_api: DopeAPI, user_id: str, filters: Dict[str, Any]
 ) -> List[DopeSessionModel]:
     """Get sessions with applied filters"""
     try:
-        # Start with all sessions
-        if filters.get("search"):
-            sessions = dope_api.search_sessions(user_id, filters["search"])
-        else:
-            sessions = dope_api.get_sessions_for_user(user_id)
-
-        # Apply filters
-        sessions = dope_api.filter_sessions(user_id, filters)
-
-        return sessions
+        # Search text and all field filters are evaluated in one pass
+        return dope_api.filter_sessions(user_id, filters)
     except Exception as e:
         st.error(f"Error filtering sessions: {str(e)}")
         return []
 
 
-def render_session_statistics(sessions: List[DopeSessionModel]):
+def get_session_summaries(
+    dope_api: DopeAPI, user_id: str, session_ids: List[str]
+) -> Dict[str, DopeSessionSummaryModel]:
+    """Get per-session summaries (shot counts and velocity statistics)"""
+    try:
+        return dope_api.get_session_summaries(user_id, session_ids)
+    except Exception as e:
+        st.warning(f"Session summaries unavailable: {str(e)}")
+        return {}
+
+
+def get_sessions_page(
+    dope_api: DopeAPI, user_id: str, filters: Dict[str, Any]
+) -> DopeSessionPage:
+    """Get the current table page, restarting at page one when the query changes"""
+    settings = st.session_state.dope_view["table_settings"]
+    query_key = (
+        make_filter_key(filters),
+        settings["sort_column"],
+        settings["sort_ascending"],
+        settings["page_size"],
+    )
+    if settings.get("query_key") != query_key:
+        settings["query_key"] = query_key
+        settings["cursor"] = None
+
+    try:
+        return dope_api.get_sessions_page(
+            user_id,
+            filters,
+            sort_column=settings["sort_column"],
+            ascending=settings["sort_ascending"],
+            cursor=settings["cursor"],
+            page_size=settings["page_size"],
+            columns=[
+                c for c in settings["visible_columns"]
+                if c in _get_all_available_columns()
+            ],
+        )
+    except Exception as e:
+        st.error(f"Error loading sessions: {str(e)}")
+        settings["cursor"] = None
+        return DopeSessionPage()
+
+
+def render_session_statistics(
+    sessions: List[DopeSessionModel],
+    summaries: Dict[str, DopeSessionSummaryModel],
+):
     """Display session statistics"""
     total_sessions = len(sessions)
 
@@ -566,108 +673,40 @@ def render_session_statistics(sessions: List[DopeSessionModel]):
     unique_cartridges = len(set(s.cartridge_type for s in sessions if s.cartridge_type))
     unique_rifles = len(set(s.rifle_name for s in sessions if s.rifle_name))
     unique_ranges = len(set(s.range_name for s in sessions if s.range_name))
+    # Shot counts come from the summary rows, not from every measurement
+    total_shots = sum(
+        summaries[s.id].shot_count or 0 for s in sessions if s.id in summaries
+    )
 
-    col1, col2, col3, col4 = st.columns(4)
+    col1, col2, col3, col4, col5 = st.columns(5)
 
     with col1:
         st.metric("Total Sessions", total_sessions)
     with col2:
-        st.metric("Cartridge Types", unique_cartridges)
+        st.metric("Total Shots", total_shots)
     with col3:
-        st.metric("Rifles Used", unique_rifles)
+        st.metric("Cartridge Types", unique_cartridges)
     with col4:
+        st.metric("Rifles Used", unique_rifles)
+    with col5:
         st.metric("Ranges Visited", unique_ranges)
 
 
-def render_sessions_table(sessions: List[DopeSessionModel]):
-    """Render the main sessions data table with sorting, column visibility, and pagination"""
-    if not sessions:
+def render_sessions_table(page: DopeSessionPage, dope_api: DopeAPI, user_id: str):
+    """Render one page of the sessions table with selection, navigation and bulk actions"""
+    if not page.sessions:
         return
 
-    # Initialize table state in session state
-    if "table_settings" not in st.session_state.dope_view:
-        st.session_state.dope_view["table_settings"] = {
-            "sort_column": "Start Time",
-            "sort_ascending": False,  # Default: newest first
-            "visible_columns": _get_default_visible_columns(),
-            "page_size": 50,
-            "current_page": 0,
-            "show_view_options": False,
-        }
+    df_display = pd.DataFrame(page.rows)
 
-    # Render table controls in expander
-    with st.expander(
-        "⚙️ View Options",
-        expanded=st.session_state.dope_view["table_settings"]["show_view_options"],
-    ):
-        _render_table_controls(len(sessions))
-
-    # Convert sessions to DataFrame for display
-    df_data = []
-    for session in sessions:
-        row = {
-            "Session Name": session.session_name or "Unnamed Session",
-            "Start Time": (
-                session.start_time.strftime("%Y-%m-%d %H:%M")
-                if session.start_time
-                else "N/A"
-            ),
-            "End Time": (
-                session.end_time.strftime("%Y-%m-%d %H:%M")
-                if session.end_time
-                else "N/A"
-            ),
-            "Duration": (
-                str(session.end_time - session.start_time)
-                if session.start_time and session.end_time
-                else "N/A"
-            ),
-            "Rifle": session.rifle_name or "Unknown",
-            "Cartridge": (
-                f"{session.cartridge_make} {session.cartridge_model}"
-                if session.cartridge_make
-                else "Unknown"
-            ),
-            "Cartridge Type": session.cartridge_type or "Unknown",
-            "Bullet": (
-                f"{session.bullet_make} {session.bullet_model}"
-                if session.bullet_make
-                else "Unknown"
-            ),
-            "Bullet Weight (gr)": (
-                float(session.bullet_weight) if session.bullet_weight else None
-            ),
-            "Distance (m)": (
-                session.range_distance_m if session.range_distance_m else None
-            ),
-            "Range": session.range_name or "Unknown",
-            "Temperature (°C)": (
-                session.temperature_c_median
-                if session.temperature_c_median is not None
-                else None
-            ),
-            "Humidity (%)": (
-                session.relative_humidity_pct_median
-                if session.relative_humidity_pct_median is not None
-                else None
-            ),
-            "Wind Speed (m/s)": (
-                session.wind_speed_mps_median
-                if session.wind_speed_mps_median is not None
-                else None
-            ),
-            "Notes": (
-                (session.notes[:50] + "...")
-                if session.notes and len(session.notes) > 50
-                else (session.notes or "")
-            ),
-        }
-        df_data.append(row)
-
-    df = pd.DataFrame(df_data)
-
-    # Apply sorting and pagination
-    df_display = _apply_table_sorting_and_pagination(df)
+    # Shot counts and velocity statistics from the per-session summaries
+    summaries = get_session_summaries(
+        dope_api, user_id, [s.id for s in page.sessions]
+    )
+    for column, field in SUMMARY_TABLE_COLUMNS.items():
+        df_display[column] = [
+            getattr(summaries.get(s.id), field, None) for s in page.sessions
+        ]
 
     # Configure column display
     column_config = {
@@ -688,6 +727,16 @@ def render_sessions_table(sessions: List[DopeSessionModel]):
         "Humidity (%)": st.column_config.NumberColumn("Humidity (%)", width="small"),
         "Wind Speed (m/s)": st.column_config.NumberColumn("Wind (m/s)", width="small"),
         "Notes": st.column_config.TextColumn("Notes", width="large"),
+        "Shots": st.column_config.NumberColumn("Shots", width="small"),
+        "Avg Speed (m/s)": st.column_config.NumberColumn(
+            "Avg (m/s)", width="small", format="%.1f"
+        ),
+        "SD (m/s)": st.column_config.NumberColumn(
+            "SD (m/s)", width="small", format="%.1f"
+        ),
+        "ES (m/s)": st.column_config.NumberColumn(
+            "ES (m/s)", width="small", format="%.1f"
+        ),
     }
 
     # Only show column config for visible columns
@@ -703,18 +752,13 @@ def render_sessions_table(sessions: List[DopeSessionModel]):
         selection_mode="multi-row",
     )
 
-    # Handle row selection (adjust for pagination) - use first selected row for details
+    # Handle row selection (rows map onto the page's sessions) - use first selected row for details
     selected_session_ids = []
     if selected_rows.selection.rows:
         # Get all selected session IDs
         for selected_idx in selected_rows.selection.rows:
-            actual_session_idx = (
-                st.session_state.dope_view["table_settings"]["current_page"]
-                * st.session_state.dope_view["table_settings"]["page_size"]
-                + selected_idx
-            )
-            if actual_session_idx < len(sessions):
-                selected_session_ids.append(sessions[actual_session_idx].id)
+            if selected_idx < len(page.sessions):
+                selected_session_ids.append(page.sessions[selected_idx].id)
 
         # Use first selected row for details view
         if selected_session_ids:
@@ -725,19 +769,26 @@ def render_sessions_table(sessions: List[DopeSessionModel]):
         # Clear selection if no rows selected
         st.session_state.dope_view["selected_session_id"] = None
 
+    _render_page_navigation(page)
+
     # Bulk actions and export functionality
     col1, col2, col3 = st.columns([2, 1, 1])
 
     with col1:
         if st.button("📥 Export All to CSV"):
-            export_sessions_to_csv(sessions)
+            # Export covers every filtered session, not just the visible page
+            export_sessions_to_csv(
+                dope_api.filter_sessions(
+                    user_id, st.session_state.dope_view["filters"]
+                )
+            )
 
     # Show bulk actions if multiple sessions are selected
     if len(selected_session_ids) > 1:
         with col2:
             if st.button(f"📥 Export Selected ({len(selected_session_ids)})"):
                 selected_sessions = [
-                    s for s in sessions if s.id in selected_session_ids
+                    s for s in page.sessions if s.id in selected_session_ids
                 ]
                 export_sessions_to_csv(selected_sessions)
 
@@ -749,10 +800,12 @@ def render_sessions_table(sessions: List[DopeSessionModel]):
                 st.session_state.dope_view["bulk_delete_ids"] = selected_session_ids
                 st.rerun()
 
+    render_measurement_export(dope_api, user_id, selected_session_ids)
+
     # Handle bulk delete confirmation
     if st.session_state.dope_view.get("bulk_delete_ids"):
         render_bulk_delete_confirmation_modal(
-            sessions, st.session_state.dope_view["bulk_delete_ids"]
+            page.sessions, st.session_state.dope_view["bulk_delete_ids"]
         )
 
 
@@ -775,7 +828,9 @@ def render_session_details(session: DopeSessionModel, dope_api: DopeAPI, user_id
 
     with col1:
         if st.button("✏️ Edit"):
-            # Toggle edit mode for this session
+            # Toggle edit mode for this session; dropdown options are
+            # loaded fresh once and reused for the life of the edit
+            options_loader.invalidate(user_id)
             st.session_state.dope_view["edit_session"] = session.id
             st.rerun()
 
@@ -1157,21 +1212,19 @@ def render_bulk_delete_confirmation_modal(
                 dope_api = DopeAPI(supabase)
                 user_id = st.session_state.user.get("id")
 
-                # Perform bulk deletion
-                success_count = 0
-                failed_sessions = []
-
-                for session in selected_sessions:
-                    try:
-                        success = dope_api.delete_session(session.id, user_id)
-                        if success:
-                            success_count += 1
-                        else:
-                            failed_sessions.append(session.session_name or "Unnamed")
-                    except Exception as e:
-                        failed_sessions.append(
-                            f"{session.session_name or 'Unnamed'} (Error: {str(e)})"
-                        )
+                # Perform bulk deletion (set-based, chunked)
+                result = dope_api.delete_sessions_bulk(
+                    [session.id for session in selected_sessions], user_id
+                )
+                success_count = result["deleted_count"]
+                names = {
+                    s.id: s.session_name or "Unnamed" for s in selected_sessions
+                }
+                failed_sessions = [
+                    f"{names.get(r['id'], r['id'])} (Error: {r['error']})"
+                    for r in result["results"]
+                    if not r["success"]
+                ]
 
                 # Show results
                 if success_count > 0:
@@ -1562,6 +1615,62 @@ def render_weather_info_tab(session: DopeSessionModel):
         )
 
 
+def render_measurement_export(
+    dope_api: DopeAPI, user_id: str, selected_session_ids: List[str]
+):
+    """Render the sessions-with-shots export (selected rows, else all filtered)"""
+    with st.expander("📦 Export Sessions with Shot Measurements"):
+        export_format = st.radio(
+            "Format",
+            options=list(EXPORT_FORMAT_LABELS),
+            format_func=EXPORT_FORMAT_LABELS.get,
+            horizontal=True,
+            key="dope_export_format",
+        )
+        scope = (
+            f"{len(selected_session_ids)} selected sessions"
+            if selected_session_ids
+            else "all filtered sessions"
+        )
+        if st.button(f"Prepare export ({scope})"):
+            session_ids = selected_session_ids or [
+                s.id
+                for s in dope_api.filter_sessions(
+                    user_id, st.session_state.dope_view["filters"]
+                )
+            ]
+            export_sessions_with_measurements(
+                dope_api, user_id, session_ids, export_format
+            )
+
+
+def export_sessions_with_measurements(
+    dope_api: DopeAPI, user_id: str, session_ids: List[str], export_format: str
+):
+    """Stream sessions and their shots to a temporary file and offer it for download"""
+    try:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        with tempfile.TemporaryFile() as export_file:
+            counts = dope_api.export_sessions(
+                session_ids, user_id, export_file, export_format
+            )
+            export_file.seek(0)
+            st.download_button(
+                label=f"📥 Download {EXPORT_FORMAT_LABELS[export_format]}",
+                data=export_file.read(),
+                file_name=f"dope_sessions_{timestamp}.{export_format}",
+                mime=EXPORT_MIME_TYPES[export_format],
+                help="Download sessions with their shot measurements",
+            )
+
+        st.success(
+            f"✅ Prepared {counts['sessions']} sessions with {counts['shots']} shots for download"
+        )
+
+    except Exception as e:
+        st.error(f"Error exporting sessions: {str(e)}")
+
+
 def export_sessions_to_csv(sessions: List[DopeSessionModel]):
     """Export sessions to CSV format"""
     try:
@@ -1595,6 +1704,25 @@ def export_sessions_to_csv(sessions: List[DopeSessionModel]):
         st.error(f"Error exporting sessions: {str(e)}")
 
 
+def _predicted_elevation(dope_card, distance_m, unit: str):
+    """Predicted elevation hold at a shot's distance, or "" if unavailable"""
+    if dope_card is None or not distance_m or distance_m < dope_card.distance_m[0]:
+        return ""
+    return round(float(dope_card.elevation(distance_m, unit)), 2)
+
+
+def _predicted_windage(dope_card, distance_m, crosswind_mps, unit: str):
+    """Predicted windage hold at a shot's distance, or "" if unavailable"""
+    if (
+        dope_card is None
+        or crosswind_mps is None
+        or not distance_m
+        or distance_m < dope_card.distance_m[0]
+    ):
+        return ""
+    return round(float(dope_card.windage(distance_m, crosswind_mps, unit)), 2)
+
+
 def render_shots_tab(session: DopeSessionModel, dope_api: DopeAPI):
     """Render shots/measurements tab"""
     try:
@@ -1653,6 +1781,16 @@ def render_shots_tab(session: DopeSessionModel, dope_api: DopeAPI):
             else:
                 st.metric("Chrono Session", "❌ None")
 
+        # Predicted holds from the cached DOPE card for this load and weather
+        try:
+            dope_card = dope_card_generator.card_for_session(
+                session,
+                distances_m=card_distances_for(m.distance_m for m in measurements),
+            )
+        except ValueError:
+            dope_card = None  # No average velocity or BC to predict from
+        crosswind_mps = session_crosswind_mps(session)
+
         # Create measurements table using metric data and convert for display
         df_data = []
         for measurement in measurements:
@@ -1736,7 +1874,19 @@ def render_shots_tab(session: DopeSessionModel, dope_api: DopeAPI):
                 velocity_header: velocity_display,
                 "Distance (m)": measurement.distance_m or "",
                 "Elevation Offset": measurement.elevation_adjustment or "",
+                "Pred. Elev (MIL)": _predicted_elevation(
+                    dope_card, measurement.distance_m, "mil"
+                ),
+                "Pred. Elev (MOA)": _predicted_elevation(
+                    dope_card, measurement.distance_m, "moa"
+                ),
                 "Windage Offset": measurement.windage_adjustment or "",
+                "Pred. Wind (MIL)": _predicted_windage(
+                    dope_card, measurement.distance_m, crosswind_mps, "mil"
+                ),
+                "Pred. Wind (MOA)": _predicted_windage(
+                    dope_card, measurement.distance_m, crosswind_mps, "moa"
+                ),
                 wind_speed_header: wind_speed_display,
                 "Wind Direction (°)": wind_direction_display,
                 temperature_header: temperature_display,
@@ -1794,9 +1944,21 @@ def render_shots_tab(session: DopeSessionModel, dope_api: DopeAPI):
             "Elevation Offset": st.column_config.NumberColumn(
                 "Elevation Offset", width="small", format="%.2f"
             ),
+            "Pred. Elev (MIL)": st.column_config.NumberColumn(
+                "Pred. Elev (MIL)", width="small", format="%.2f", disabled=True
+            ),
+            "Pred. Elev (MOA)": st.column_config.NumberColumn(
+                "Pred. Elev (MOA)", width="small", format="%.2f", disabled=True
+            ),
             "Windage Offset": st.column_config.NumberColumn(
                 "Windage Offset", width="small", format="%.2f"
             ),
+            "Pred. Wind (MIL)": st.column_config.NumberColumn(
+                "Pred. Wind (MIL)", width="small", format="%.2f", disabled=True
+            ),
+            "Pred. Wind (MOA)": st.column_config.NumberColumn(
+                "Pred. Wind (MOA)", width="small", format="%.2f", disabled=True
+            ),
             wind_speed_header: st.column_config.NumberColumn(
                 wind_speed_header, width="small", format="%.1f"
             ),
@@ -2148,225 +2310,124 @@ def _save_measurement_changes(
     """
     Save changes made to measurement data back to the database.
 
+    Both grids are converted to metric field columns, diffed column-wise and
+    saved with one bulk update instead of one update per changed shot.
+
     Args:
         original_df: Original DataFrame before edits
         edited_df: Modified DataFrame with user edits
-        measurements: List of DopeMeasurementModel objects
+        measurements: List of DopeMeasurementModel objects (same row order)
         dope_api: DopeAPI instance for database operations
         user_unit_system: "Imperial" or "Metric" for unit conversions
     """
     try:
-        # Find which rows have changed
-        changes_made = []
+        row_count = min(len(measurements), len(original_df), len(edited_df))
+        if row_count == 0:
+            return
+        measurement_ids = [m.id for m in measurements[:row_count]]
 
-        for index, (orig_row, edited_row) in enumerate(
-            zip(original_df.itertuples(), edited_df.itertuples())
-        ):
-            # Compare each row to find changes
-            if orig_row != edited_row:
-                # Get the corresponding measurement
-                if index < len(measurements):
-                    measurement = measurements[index]
-
-                    # Convert edited values back to metric units for storage
-                    update_data = _convert_edited_row_to_metric(
-                        edited_row, original_df.columns, user_unit_system
-                    )
+        changes = diff_measurement_frames(
+            _display_frame_to_metric(
+                original_df.iloc[:row_count], measurement_ids, user_unit_system
+            ),
+            _display_frame_to_metric(
+                edited_df.iloc[:row_count], measurement_ids, user_unit_system
+            ),
+        )
+        if not changes:
+            return
 
-                    # Only include fields that actually changed
-                    changed_fields = {}
-                    for col_name, new_value in update_data.items():
-                        # Get original value for comparison
-                        orig_value = getattr(measurement, col_name, None)
-
-                        # Compare values (handle None, empty strings, and type differences)
-                        if _values_different(orig_value, new_value):
-                            changed_fields[col_name] = new_value
-
-                    if changed_fields:
-                        # Save changes to database
-                        try:
-                            dope_api.update_measurement(
-                                measurement.id, changed_fields, measurement.user_id
-                            )
-                            changes_made.append(f"Shot #{measurement.shot_number}")
-                        except Exception as e:
-                            st.error(
-                                f"Failed to save changes for Shot #{measurement.shot_number}: {str(e)}"
-                            )
+        result = dope_api.update_measurements_bulk(
+            measurements[0].dope_session_id, changes, measurements[0].user_id
+        )
+
+        shot_numbers = {m.id: m.shot_number for m in measurements}
+        saved = [r for r in result["results"] if r["success"]]
+        for failure in (r for r in result["results"] if not r["success"]):
+            st.error(
+                f"Failed to save changes for Shot #{shot_numbers.get(failure['id'])}: {failure['error']}"
+            )
 
-        if changes_made:
-            st.success(f"✅ Saved changes for: {', '.join(changes_made)}")
-            # Refresh the page to show updated data
+        if saved:
+            st.success(
+                "✅ Saved changes for: "
+                + ", ".join(f"Shot #{shot_numbers.get(r['id'])}" for r in saved)
+            )
+            # The cached measurement list was patched, so this does not refetch
             st.rerun()
 
     except Exception as e:
         st.error(f"Error saving measurement changes: {str(e)}")
 
 
-def _convert_edited_row_to_metric(
-    edited_row, column_names, user_unit_system: str
-) -> dict:
+def _display_frame_to_metric(
+    df: pd.DataFrame, measurement_ids: List[str], user_unit_system: str
+) -> pd.DataFrame:
     """
-    Convert edited row values from display units back to metric units for database storage.
+    Convert a shots grid from display units to metric measurement fields.
 
     Args:
-        edited_row: Edited row data from pandas DataFrame
-        column_names: List of column names
+        df: Shots grid with display column names
+        measurement_ids: Measurement IDs for the grid rows, in order
         user_unit_system: "Imperial" or "Metric"
 
     Returns:
-        Dict of field names to metric values
+        DataFrame indexed by measurement ID with measurement field columns
     """
-    update_data = {}
-
-    # Create a mapping from column names to values
-    row_data = {}
-    for i, col_name in enumerate(column_names):
-        if i + 1 < len(edited_row):  # +1 because itertuples includes index
-            row_data[col_name] = edited_row[i + 1]
-
-    # Convert velocity
-    velocity_col = (
-        "Velocity (fps)" if user_unit_system == "Imperial" else "Velocity (m/s)"
-    )
-    if velocity_col in row_data and row_data[velocity_col]:
-        try:
-            velocity_val = float(row_data[velocity_col])
-            if user_unit_system == "Imperial":
-                update_data["speed_mps"] = fps_to_mps(velocity_val)
-            else:
-                update_data["speed_mps"] = velocity_val
-        except (ValueError, TypeError):
-            pass
+    imperial = user_unit_system == "Imperial"
 
-    # Convert energy
-    energy_col = "Energy (ft·lb)" if user_unit_system == "Imperial" else "Energy (J)"
-    if energy_col in row_data and row_data[energy_col]:
-        try:
-            energy_val = float(row_data[energy_col])
-            if user_unit_system == "Imperial":
-                update_data["ke_j"] = ftlb_to_joules(energy_val)
-            else:
-                update_data["ke_j"] = energy_val
-        except (ValueError, TypeError):
-            pass
-
-    # Convert power factor
-    if "Power Factor" in row_data and row_data["Power Factor"]:
-        try:
-            pf_val = float(row_data["Power Factor"])
-            if user_unit_system == "Imperial":
-                # Power factor in display is grain*ft/s, convert to kg*m/s
-                update_data["power_factor_kgms"] = grainft_to_kgms(pf_val)
-            else:
-                update_data["power_factor_kgms"] = pf_val
-        except (ValueError, TypeError):
-            pass
-
-    # Convert temperature
-    temp_col = (
-        "Temperature (°F)" if user_unit_system == "Imperial" else "Temperature (°C)"
-    )
-    if temp_col in row_data and row_data[temp_col]:
-        try:
-            temp_val = float(row_data[temp_col])
-            if user_unit_system == "Imperial":
-                update_data["temperature_c"] = fahrenheit_to_celsius(temp_val)
-            else:
-                update_data["temperature_c"] = temp_val
-        except (ValueError, TypeError):
-            pass
-
-    # Convert pressure
-    pressure_col = (
-        "Pressure (inHg)" if user_unit_system == "Imperial" else "Pressure (hPa)"
-    )
-    if pressure_col in row_data and row_data[pressure_col]:
-        try:
-            pressure_val = float(row_data[pressure_col])
-            if user_unit_system == "Imperial":
-                update_data["pressure_hpa"] = inhg_to_hpa(pressure_val)
-            else:
-                update_data["pressure_hpa"] = pressure_val
-        except (ValueError, TypeError):
-            pass
-
-    # Handle fields that don't need unit conversion
-    direct_fields = {
+    # Display column -> (field, converter for imperial display values)
+    converted_columns = {
+        ("Velocity (fps)" if imperial else "Velocity (m/s)"): (
+            "speed_mps", fps_to_mps
+        ),
+        ("Energy (ft·lb)" if imperial else "Energy (J)"): ("ke_j", ftlb_to_joules),
+        "Power Factor": ("power_factor_kgms", grainft_to_kgms),
+        ("Temperature (°F)" if imperial else "Temperature (°C)"): (
+            "temperature_c", fahrenheit_to_celsius
+        ),
+        ("Pressure (inHg)" if imperial else "Pressure (hPa)"): (
+            "pressure_hpa", inhg_to_hpa
+        ),
+    }
+    direct_columns = {
         "Shot #": "shot_number",
         "Distance (m)": "distance_m",
         "Elevation Adjustment": "elevation_adjustment",
+        "Elevation Offset": "elevation_adjustment",
         "Windage Adjustment": "windage_adjustment",
+        "Windage Offset": "windage_adjustment",
         "Humidity (%)": "humidity_pct",
         "Clean Bore": "clean_bore",
         "Cold Bore": "cold_bore",
         "Notes": "shot_notes",
     }
 
-    for display_name, field_name in direct_fields.items():
-        if display_name in row_data and row_data[display_name] != "":
-            value = row_data[display_name]
-            # Convert numeric fields to appropriate types
-            if field_name in [
-                "shot_number",
-                "distance_m",
-                "elevation_adjustment",
-                "windage_adjustment",
-                "humidity_pct",
-            ]:
-                try:
-                    update_data[field_name] = float(value) if value else None
-                except (ValueError, TypeError):
-                    update_data[field_name] = None
-            else:
-                update_data[field_name] = value
-
-    return update_data
+    metric = pd.DataFrame(index=pd.Index(measurement_ids, name="id"))
+    for display_name, (field_name, to_metric) in converted_columns.items():
+        if display_name in df.columns:
+            values = pd.to_numeric(
+                df[display_name], errors="coerce"
+            ).to_numpy()
+            metric[field_name] = to_metric(values) if imperial else values
+    for display_name, field_name in direct_columns.items():
+        if display_name in df.columns:
+            metric[field_name] = df[display_name].to_numpy()
 
+    return metric
 
-def _values_different(orig_value, new_value) -> bool:
-    """
-    Compare two values to determine if they're different, handling None, empty strings, and type differences.
 
-    Args:
-        orig_value: Original value from model
-        new_value: New value from edited table
-
-    Returns:
-        True if values are different and should be updated
-    """
-    # Handle None values
-    if orig_value is None and (new_value is None or new_value == "" or new_value == 0):
-        return False
-
-    if new_value is None and (
-        orig_value is None or orig_value == "" or orig_value == 0
-    ):
-        return False
-
-    # Handle empty strings
-    if orig_value == "" and (new_value == "" or new_value is None):
-        return False
-
-    # Handle numeric comparisons with tolerance for floating point
-    if isinstance(orig_value, (int, float)) and isinstance(new_value, (int, float)):
-        return abs(orig_value - new_value) > 1e-6
-
-    # Try to convert to same types for comparison
-    try:
-        if isinstance(orig_value, (int, float)) and isinstance(new_value, str):
-            new_value = float(new_value)
-            return abs(orig_value - new_value) > 1e-6
-
-        if isinstance(new_value, (int, float)) and isinstance(orig_value, str):
-            orig_value = float(orig_value)
-            return abs(orig_value - new_value) > 1e-6
-    except (ValueError, TypeError):
-        pass
-
-    # String comparison
-    return str(orig_value) != str(new_value)
+def _init_table_settings():
+    """Initialize sessions table state in session state"""
+    if "table_settings" not in st.session_state.dope_view:
+        st.session_state.dope_view["table_settings"] = {
+            "sort_column": "Start Time",
+            "sort_ascending": False,  # Default: newest first
+            "visible_columns": _get_default_visible_columns(),
+            "page_size": 50,
+            "cursor": None,  # None = first page
+            "show_view_options": False,
+        }
 
 
 def _get_default_visible_columns() -> List[str]:
@@ -2384,31 +2445,15 @@ def _get_default_visible_columns() -> List[str]:
 
 def _get_all_available_columns() -> List[str]:
     """Get all available columns for visibility toggle"""
-    return [
-        "Session Name",
-        "Start Time",
-        "End Time",
-        "Duration",
-        "Rifle",
-        "Cartridge",
-        "Cartridge Type",
-        "Bullet",
-        "Bullet Weight (gr)",
-        "Distance (m)",
-        "Range",
-        "Temperature (°C)",
-        "Humidity (%)",
-        "Wind Speed (m/s)",
-        "Notes",
-    ]
+    return list(SESSION_TABLE_COLUMNS)
 
 
-def _render_table_controls(total_sessions: int):
-    """Render table sorting, column visibility, and pagination controls"""
+def _render_table_controls():
+    """Render table sorting, column visibility, and page size controls"""
     settings = st.session_state.dope_view["table_settings"]
 
     # Table controls in columns
-    control_col1, control_col2, control_col3, control_col4 = st.columns([2, 2, 2, 1])
+    control_col1, control_col2, control_col3 = st.columns([2, 2, 2])
 
     with control_col1:
         # Sorting controls
@@ -2475,88 +2520,38 @@ def _render_table_controls(total_sessions: int):
             settings["visible_columns"] = new_visible
 
     with control_col3:
-        # Pagination controls
-        st.write("**Pagination:**")
-        page_col1, page_col2 = st.columns([1, 2])
-
-        with page_col1:
-            page_size = st.selectbox(
-                "Per page",
-                options=[25, 50, 100, 200],
-                index=[25, 50, 100, 200].index(settings["page_size"]),
-                key="page_size_select",
-                label_visibility="collapsed",
-            )
-            settings["page_size"] = page_size
-
-        with page_col2:
-            # Calculate pagination
-            total_pages = max(1, (total_sessions + page_size - 1) // page_size)
-            current_page = min(settings["current_page"], total_pages - 1)
-
-            if total_pages > 1:
-                new_page = (
-                    st.number_input(
-                        f"Page (1-{total_pages})",
-                        min_value=1,
-                        max_value=total_pages,
-                        value=current_page + 1,
-                        key="page_number_input",
-                        label_visibility="collapsed",
-                    )
-                    - 1
-                )
-                settings["current_page"] = new_page
-            else:
-                settings["current_page"] = 0
-                st.write("Page 1 of 1")
-
-    with control_col4:
-        # Pagination navigation buttons
-        if total_sessions > settings["page_size"]:
-            st.write("**Navigate:**")
-            nav_col1, nav_col2 = st.columns(2)
-
-            with nav_col1:
-                if st.button("◀️", disabled=(current_page == 0), key="prev_page"):
-                    settings["current_page"] = max(0, current_page - 1)
-                    st.rerun()
-
-            with nav_col2:
-                if st.button(
-                    "▶️", disabled=(current_page >= total_pages - 1), key="next_page"
-                ):
-                    settings["current_page"] = min(total_pages - 1, current_page + 1)
-                    st.rerun()
+        # Page size (navigation is rendered below the table)
+        st.write("**Rows per page:**")
+        page_size = st.selectbox(
+            "Per page",
+            options=[25, 50, 100, 200],
+            index=[25, 50, 100, 200].index(settings["page_size"]),
+            key="page_size_select",
+            label_visibility="collapsed",
+        )
+        settings["page_size"] = page_size
 
-    # Show pagination info
-    start_idx = settings["current_page"] * settings["page_size"]
-    end_idx = min(start_idx + settings["page_size"], total_sessions)
-    if total_sessions > settings["page_size"]:
-        st.caption(f"Showing {start_idx + 1}-{end_idx} of {total_sessions} sessions")
 
+def _render_page_navigation(page: DopeSessionPage):
+    """Render previous/next page buttons for the keyset-paginated table"""
+    if not page.has_prev and not page.has_next:
+        return
 
-def _apply_table_sorting_and_pagination(df: pd.DataFrame) -> pd.DataFrame:
-    """Apply sorting and pagination to the DataFrame"""
     settings = st.session_state.dope_view["table_settings"]
+    start_idx = page.offset + 1
+    end_idx = page.offset + len(page.sessions)
 
-    # Apply sorting
-    if settings["sort_column"] in df.columns:
-        df = df.sort_values(
-            by=settings["sort_column"], ascending=settings["sort_ascending"]
-        ).reset_index(drop=True)
+    nav_col1, nav_col2, nav_col3 = st.columns([4, 1, 1])
 
-    # Apply column visibility
-    visible_columns = settings["visible_columns"]
-    columns_to_show = visible_columns
+    with nav_col1:
+        st.caption(f"Showing {start_idx}-{end_idx} of {page.total_count} sessions")
 
-    # Filter to only existing columns
-    columns_to_show = [col for col in columns_to_show if col in df.columns]
-    df = df[columns_to_show]
-
-    # Apply pagination
-    start_idx = settings["current_page"] * settings["page_size"]
-    end_idx = start_idx + settings["page_size"]
-    df_page = df.iloc[start_idx:end_idx].copy()
+    with nav_col2:
+        if st.button("◀️", disabled=not page.has_prev, key="prev_page"):
+            settings["cursor"] = page.prev_cursor
+            st.rerun()
 
-    return df_page
+    with nav_col3:
+        if st.button("▶️", disabled=not page.has_next, key="next_page"):
+            settings["cursor"] = page.next_cursor
+            st.rerun()
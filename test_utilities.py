@@ -347,5 +347,87 @@ class TestScriptExecutability(unittest.TestCase):
                         )
 
 
+
+class TestBulkWriter(unittest.TestCase):
+    """Test the shared concurrent bulk writer"""
+
+    def setUp(self):
+        from utils.bulk_writer import BulkWriter
+
+        self.rows = [{"id": i, "notes": "x" * 40} for i in range(100)]
+        self.writer = BulkWriter(max_batch_bytes=600, max_in_flight=3, sleep=lambda s: None)
+
+    def test_batches_are_sized_by_payload_bytes(self):
+        """Test batches stay under the byte limit and oversized rows go alone"""
+        import json
+
+        batches = self.writer.plan_batches(self.rows)
+        self.assertEqual(sum(len(b) for b in batches), 100)
+        for batch in batches:
+            self.assertLessEqual(len(json.dumps(batch)), 600)
+        wide = [{"id": 0, "notes": "x" * 1000}, {"id": 1}]
+        self.assertEqual([len(b) for b in self.writer.plan_batches(wide)], [1, 1])
+
+    def test_writes_concurrently_and_keeps_batch_order(self):
+        """Test bounded concurrency, per-batch progress and ordered results"""
+        import threading
+        import time
+
+        lock = threading.Lock()
+        state = {"in_flight": 0, "peak": 0}
+        progress = []
+
+        def write(batch):
+            with lock:
+                state["in_flight"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+            time.sleep(0.005)
+            with lock:
+                state["in_flight"] -= 1
+            return [{"id": row["id"]} for row in batch]
+
+        result = self.writer.write(self.rows, write, progress.append)
+        self.assertEqual(result.rows_written, 100)
+        self.assertEqual([r["id"] for r in result.returned], list(range(100)))
+        self.assertLessEqual(state["peak"], 3)
+        self.assertGreater(state["peak"], 1)
+        self.assertEqual(len(progress), result.batches)
+        self.assertEqual(progress[-1].rows_done, 100)
+        self.assertTrue(result.succeeded)
+
+    def test_retries_transient_failures_only(self):
+        """Test transient errors are retried and permanent ones fail the batch"""
+        attempts = {}
+
+        def write(batch):
+            first = batch[0]["id"]
+            attempts[first] = attempts.get(first, 0) + 1
+            if first == 0 and attempts[first] < 3:
+                raise Exception("503 Service Unavailable")
+            if first == batch_ids[1]:
+                raise Exception("duplicate key value violates unique constraint")
+            return batch
+
+        batch_ids = [b[0]["id"] for b in self.writer.plan_batches(self.rows)]
+        result = self.writer.write(self.rows, write)
+        self.assertEqual(attempts[0], 3)
+        self.assertEqual(attempts[batch_ids[1]], 1)
+        self.assertEqual(result.retries, 2)
+        self.assertGreater(result.rows_failed, 0)
+        self.assertEqual(result.rows_written + result.rows_failed, 100)
+        self.assertEqual(len(result.errors), 1)
+        self.assertFalse(result.succeeded)
+
+    def test_transient_error_detection(self):
+        """Test classification of network, timeout and HTTP status errors"""
+        from utils.bulk_writer import is_transient_error
+
+        self.assertTrue(is_transient_error(TimeoutError()))
+        self.assertTrue(is_transient_error(Exception("HTTP 429 Too Many Requests")))
+        self.assertTrue(is_transient_error(Exception("Server disconnected without sending a response")))
+        self.assertFalse(is_transient_error(Exception("400 Bad Request: invalid input syntax")))
+        self.assertFalse(is_transient_error(ValueError("bad row")))
+
+
 if __name__ == "__main__":
     unittest.main()
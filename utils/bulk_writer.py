@@ -0,0 +1,230 @@
+"""
+Concurrent, adaptive bulk writer for Supabase inserts.
+
+Imports write thousands of rows. ``BulkWriter`` splits rows into batches
+sized by their JSON payload (so wide weather rows and narrow shot rows both
+make requests of similar size), keeps a bounded number of batch writes in
+flight on a thread pool, and retries transient failures (timeouts,
+connection errors, 429 and 5xx responses) with exponential backoff and
+jitter. Progress is reported once per finished batch on the calling thread,
+so callbacks may update Streamlit widgets.
+
+The writer only schedules writes; the caller supplies ``write_batch``, which
+sends one batch (e.g. an ``insert`` or ``upsert``) and returns what the
+database returned for it.
+"""
+
+import json
+import random
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# Payload bytes per request; PostgREST and proxies accept far more, but
+# smaller requests retry cheaply and keep progress moving
+DEFAULT_MAX_BATCH_BYTES = 256 * 1024
+DEFAULT_MAX_BATCH_ROWS = 1000
+DEFAULT_MAX_IN_FLIGHT = 4
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_SECONDS = 0.5
+DEFAULT_MAX_BACKOFF_SECONDS = 8.0
+
+_TRANSIENT_STATUS = re.compile(r"\b(408|425|429|500|502|503|504)\b")
+_TRANSIENT_TEXT = (
+    "timeout",
+    "timed out",
+    "temporarily",
+    "connection",
+    "connect error",
+    "remote protocol",
+    "server disconnected",
+    "too many requests",
+    "service unavailable",
+    "bad gateway",
+)
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Whether a failed write is worth retrying
+
+    Matches network and timeout exception types and messages, and
+    HTTP 408/425/429/5xx status codes in the message. Constraint violations
+    and other client errors are permanent.
+    """
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    name = type(error).__name__.lower()
+    if "timeout" in name or "network" in name or "connect" in name:
+        return True
+    message = str(error).lower()
+    return bool(_TRANSIENT_STATUS.search(message)) or any(
+        text in message for text in _TRANSIENT_TEXT
+    )
+
+
+def _payload_bytes(row: Dict[str, Any]) -> int:
+    return len(json.dumps(row, default=str).encode("utf-8")) + 1
+
+
+@dataclass
+class BulkProgress:
+    """Progress after one finished batch"""
+
+    batches_done: int
+    batches_total: int
+    rows_done: int  # rows in finished batches, written or failed
+    rows_total: int
+    rows_failed: int
+
+
+@dataclass
+class BulkWriteResult:
+    """Outcome of a bulk write; ``returned`` keeps batch order"""
+
+    rows_total: int = 0
+    rows_written: int = 0
+    rows_failed: int = 0
+    batches: int = 0
+    retries: int = 0
+    returned: List[Any] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> bool:
+        return self.rows_failed == 0
+
+
+class BulkWriter:
+    """Write rows in payload-sized batches with bounded concurrency and retries"""
+
+    def __init__(
+        self,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        max_batch_rows: int = DEFAULT_MAX_BATCH_ROWS,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+        max_backoff_seconds: float = DEFAULT_MAX_BACKOFF_SECONDS,
+        is_transient: Callable[[BaseException], bool] = is_transient_error,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.max_batch_bytes = max(1, int(max_batch_bytes))
+        self.max_batch_rows = max(1, int(max_batch_rows))
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.max_retries = max(0, int(max_retries))
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.is_transient = is_transient
+        self._sleep = sleep
+
+    def plan_batches(self, rows: Sequence[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Greedily group consecutive rows under the byte and row limits
+
+        A single row larger than the byte limit is sent on its own.
+        """
+        batches: List[List[Dict[str, Any]]] = []
+        current: List[Dict[str, Any]] = []
+        current_bytes = 0
+        for row in rows:
+            size = _payload_bytes(row)
+            if current and (
+                current_bytes + size > self.max_batch_bytes
+                or len(current) >= self.max_batch_rows
+            ):
+                batches.append(current)
+                current, current_bytes = [], 0
+            current.append(row)
+            current_bytes += size
+        if current:
+            batches.append(current)
+        return batches
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self.max_backoff_seconds, self.backoff_seconds * (2 ** attempt))
+        return delay * random.uniform(0.5, 1.0)
+
+    def _write_with_retries(self, write_batch, batch):
+        """Run one batch write; returns (returned value, retries used)"""
+        attempt = 0
+        while True:
+            try:
+                return write_batch(batch), attempt
+            except Exception as e:
+                if attempt >= self.max_retries or not self.is_transient(e):
+                    raise
+                self._sleep(self._backoff(attempt))
+                attempt += 1
+
+    def write(
+        self,
+        rows: Sequence[Dict[str, Any]],
+        write_batch: Callable[[List[Dict[str, Any]]], Any],
+        on_progress: Optional[Callable[[BulkProgress], None]] = None,
+    ) -> BulkWriteResult:
+        """Write all rows; failed batches are counted, not raised
+
+        Args:
+            rows: Row dicts to write
+            write_batch: Sends one batch and returns the database's rows
+                (a list is appended to ``returned``; None is ignored)
+            on_progress: Called on this thread after every finished batch
+
+        Returns:
+            BulkWriteResult: Counts, returned rows and error messages
+        """
+        batches = self.plan_batches(rows)
+        result = BulkWriteResult(rows_total=len(rows), batches=len(batches))
+        if not batches:
+            return result
+
+        returned: Dict[int, Any] = {}
+        done_batches = done_rows = 0
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_in_flight, len(batches)),
+            thread_name_prefix="bulk-writer",
+        ) as executor:
+            pending = {}
+            next_batch = 0
+            while next_batch < len(batches) or pending:
+                # Keep at most max_in_flight batch writes outstanding
+                while next_batch < len(batches) and len(pending) < self.max_in_flight:
+                    future = executor.submit(
+                        self._write_with_retries, write_batch, batches[next_batch]
+                    )
+                    pending[future] = next_batch
+                    next_batch += 1
+
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    index = pending.pop(future)
+                    size = len(batches[index])
+                    try:
+                        value, retries = future.result()
+                        returned[index] = value
+                        result.rows_written += size
+                        result.retries += retries
+                    except Exception as e:
+                        result.rows_failed += size
+                        result.errors.append(f"Batch {index + 1}: {str(e)}")
+                    done_batches += 1
+                    done_rows += size
+                    if on_progress is not None:
+                        on_progress(
+                            BulkProgress(
+                                batches_done=done_batches,
+                                batches_total=len(batches),
+                                rows_done=done_rows,
+                                rows_total=len(rows),
+                                rows_failed=result.rows_failed,
+                            )
+                        )
+
+        for index in sorted(returned):
+            value = returned[index]
+            if isinstance(value, list):
+                result.returned.extend(value)
+            elif value is not None:
+                result.returned.append(value)
+        return result
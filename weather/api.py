@@ -34,7 +34,7 @@ from datetime import datetime
 from typing import List, Optional
 
 from .models import WeatherMeasurement, WeatherSource
-from .service import WeatherService
+from .service import MEASUREMENT_NATURAL_KEY, WeatherService
 
 
 class WeatherAPI:
@@ -454,7 +454,9 @@ class WeatherAPI:
             user_id: User identifier
 
         Returns:
-            List of created WeatherMeasurement objects
+            List of created WeatherMeasurement objects. Measurements whose
+            source and timestamp are already stored are skipped and not
+            returned, so re-importing overlapping data is idempotent.
 
         Raises:
             Exception: If batch creation fails
@@ -475,6 +477,8 @@ class WeatherAPI:
             ...     batch_data, "user-123"
             ... )
         """
+        if not measurements_data:
+            return []
         try:
             # Prepare batch insert data with generated fields
             insert_batch = []
@@ -487,17 +491,19 @@ class WeatherAPI:
                 insert_data["uploaded_at"] = uploaded_at
                 insert_batch.append(insert_data)
 
-            # Batch insert into database
+            # Batch upsert; rows already stored for the same source and
+            # timestamp are skipped by the database
             response = (
                 self._supabase.table("weather_measurements")
-                .insert(insert_batch)
+                .upsert(
+                    insert_batch,
+                    on_conflict=MEASUREMENT_NATURAL_KEY,
+                    ignore_duplicates=True,
+                )
                 .execute()
             )
 
-            if not response.data:
-                raise Exception("Failed to create measurements batch - no data returned")
-
-            return WeatherMeasurement.from_supabase_records(response.data)
+            return WeatherMeasurement.from_supabase_records(response.data or [])
 
         except Exception as e:
             raise Exception(f"Error creating measurements batch: {str(e)}")
@@ -1,8 +1,16 @@
+import hashlib
+import io
+import threading
 from datetime import datetime, timezone
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
+from ballistics.atmosphere import atmosphere, station_pressure_hpa
+from utils.bulk_writer import BulkWriter
+
+from .models import WeatherImportCheckpoint
 from .service import WeatherService
 
 # Configuration for field mappings
@@ -59,6 +67,18 @@ CSV_HEADERS_ROW = 3
 CSV_UNITS_ROW = 4
 CSV_DATA_START_ROW = 5
 
+# Kestrel LiNK writes FORMATTED DATE_TIME in 12-hour format ("yyyy-MM-dd
+# hh:mm:ss a" in the units row); values in neither format fall back to
+# pandas' per-value parser
+KESTREL_TIMESTAMP_FORMATS = ("%Y-%m-%d %I:%M:%S %p", "%Y-%m-%d %H:%M:%S")
+
+# Shared by both processing modes; batches are sized by payload bytes
+measurement_writer = BulkWriter()
+
+# Data rows per import chunk; a checkpoint is saved after each chunk
+IMPORT_CHUNK_ROWS = 5000
+SCAN_BLOCK_BYTES = 1024 * 1024
+
 
 def fahrenheit_to_celsius(f_temp):
     """Convert Fahrenheit to Celsius"""
@@ -116,6 +136,16 @@ def mps_to_mph(mps):
     return mps / 0.44704
 
 
+# Numeric field type -> (metric column suffix, {detected unit: converter});
+# a None converter stores the value as-is
+UNIT_CONVERSIONS = {
+    "temperature": ("_c", {"fahrenheit": fahrenheit_to_celsius, "celsius": None}),
+    "pressure": ("_hpa", {"inhg": inhg_to_hpa, "hpa": None}),
+    "altitude": ("_m", {"feet": feet_to_meters, "meters": None}),
+    "wind_speed": ("_mps", {"mph": mph_to_mps, "mps": None}),
+}
+
+
 def load_kestrel_units_mapping(supabase):
     """Load the Kestrel units mapping from Supabase table"""
     try:
@@ -151,7 +181,7 @@ def _detect_metric_unit(unit):
 
 
 def _parse_kestrel_file_structure(lines):
-    """Parse Kestrel CSV file structure and extract metadata and data"""
+    """Parse Kestrel CSV metadata, headers and units (the first five rows)"""
     try:
         # Parse metadata from first 3 rows using constants
         device_name = (
@@ -174,24 +204,179 @@ def _parse_kestrel_file_structure(lines):
         headers = [h.strip() for h in lines[CSV_HEADERS_ROW].split(",")]
         units_row = [u.strip() for u in lines[CSV_UNITS_ROW].split(",")]
 
-        # Process data rows starting from CSV_DATA_START_ROW
-        data_rows = []
-        for i in range(CSV_DATA_START_ROW, len(lines)):
-            line = lines[i].strip()
-            if line:  # Skip empty lines
-                row_data = [cell.strip() for cell in line.split(",")]
-
-                # Check if we have data in the first column (timestamp)
-                if len(row_data) > 0 and row_data[0] and row_data[0] != "nan":
-                    data_rows.append(row_data)
-
-        return device_name, device_model, serial_number, headers, units_row, data_rows
+        return device_name, device_model, serial_number, headers, units_row
 
     except (IndexError, ValueError) as e:
         st.error(f"Error parsing CSV structure: {e}")
         return None
 
 
+def scan_kestrel_file(stream):
+    """SHA-256 and line count of an uploaded file, read in blocks
+
+    The hash identifies the file for import checkpoints; the line count
+    bounds the number of data rows for progress. Rewinds the stream.
+    """
+    digest = hashlib.sha256()
+    lines = 0
+    last_block = b""
+    stream.seek(0)
+    for block in iter(lambda: stream.read(SCAN_BLOCK_BYTES), b""):
+        digest.update(block)
+        lines += block.count(b"\n")
+        last_block = block
+    if last_block and not last_block.endswith(b"\n"):
+        lines += 1
+    stream.seek(0)
+    return digest.hexdigest(), lines
+
+
+def open_kestrel_text(stream):
+    """Wrap a binary Kestrel file as text and read its metadata lines
+
+    Returns:
+        tuple: (text stream positioned at the first data row, the five
+        metadata, header and units lines)
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    lines = [text.readline().rstrip("\r\n") for _ in range(CSV_DATA_START_ROW)]
+    return text, lines
+
+
+def _read_kestrel_csv(source, headers, skiprows=0, chunksize=None):
+    """Read Kestrel data rows as strings, columns numbered like ``headers``"""
+    return pd.read_csv(
+        source,
+        skiprows=skiprows,
+        header=None,
+        names=range(len(headers)),
+        dtype=str,
+        keep_default_na=False,
+        index_col=False,
+        skip_blank_lines=True,
+        chunksize=chunksize,
+    )
+
+
+def _clean_kestrel_rows(data):
+    """Strip every value and drop rows without a timestamp"""
+    data = data.apply(lambda column: column.str.strip())
+    timestamps = data[0]
+    return data[(timestamps != "") & (timestamps != "nan")]
+
+
+def read_kestrel_data(content, headers):
+    """Read the data rows of a Kestrel CSV into a frame of stripped strings
+
+    Columns are numbered like ``headers`` (and ``column_units``). Rows
+    without a timestamp in the first column are dropped.
+    """
+    data = _read_kestrel_csv(io.StringIO(content), headers, skiprows=CSV_DATA_START_ROW)
+    return _clean_kestrel_rows(data).reset_index(drop=True)
+
+
+def iter_kestrel_chunks(text, headers, start_row=0, chunk_rows=None):
+    """Stream the data rows of a Kestrel CSV in chunks of stripped strings
+
+    ``text`` must be positioned at the first data row (see
+    ``open_kestrel_text``). Rows before ``start_row`` are read but not
+    returned, so an import resumes after its last committed row.
+
+    Yields:
+        tuple: (data rows read so far, frame of the chunk's rows)
+    """
+    rows_read = 0
+    for chunk in _read_kestrel_csv(
+        text, headers, chunksize=chunk_rows or IMPORT_CHUNK_ROWS
+    ):
+        first_row = rows_read
+        rows_read += len(chunk)
+        if rows_read <= start_row:
+            continue
+        yield rows_read, _clean_kestrel_rows(chunk.iloc[max(0, start_row - first_row):])
+
+
+def parse_kestrel_timestamps(values):
+    """Parse timestamp strings to ISO 8601, None where unparseable
+
+    Parses the whole column with each of ``KESTREL_TIMESTAMP_FORMATS``; only
+    values in another format go through pandas' per-value parser.
+    """
+    values = pd.Series(values, dtype=object)
+    parsed = pd.Series(pd.NaT, index=values.index, dtype="datetime64[ns]")
+    for timestamp_format in KESTREL_TIMESTAMP_FORMATS:
+        missing = parsed.isna()
+        if not missing.any():
+            break
+        parsed[missing] = pd.to_datetime(
+            values[missing], format=timestamp_format, errors="coerce")
+    iso = pd.Series(
+        np.datetime_as_string(parsed.to_numpy(), unit="s"), index=values.index, dtype=object
+    )
+    iso[parsed.isna()] = None
+    for index in values.index[parsed.isna()]:
+        fallback = pd.to_datetime(values[index], errors="coerce")
+        if not pd.isna(fallback):
+            iso[index] = fallback.isoformat()
+    return iso
+
+
+def _convert_column(field_type, values, column_unit):
+    """Convert one raw column; returns (db column suffix, values) or None"""
+    if field_type == "text":
+        return "", values.where(values != "", None)
+    numbers = pd.to_numeric(values, errors="coerce").astype(float)
+    if field_type in UNIT_CONVERSIONS:
+        suffix, converters = UNIT_CONVERSIONS[field_type]
+        if column_unit not in converters:
+            return None
+        converter = converters[column_unit]
+        return suffix, converter(numbers) if converter else numbers
+    if field_type in ["percentage", "degrees"] or column_unit == "no_conversion":
+        return "", numbers
+    return None
+
+
+def build_measurement_records(data, headers, column_units, user, source_id, file_name):
+    """Convert a Kestrel data frame into weather_measurements records
+
+    Every mapped column is converted to its metric database field in one
+    vectorized step using the detected ``column_units``. Unparseable numbers
+    become None; rows whose timestamp cannot be parsed are skipped.
+
+    Returns:
+        tuple: (list of batch-ready dicts, number of rows skipped)
+    """
+    columns = {"measurement_timestamp": parse_kestrel_timestamps(data[0])}
+    for i, header in enumerate(headers):
+        if header == "FORMATTED DATE_TIME" or header not in FIELD_MAPPINGS or i not in data:
+            continue
+        field_config = FIELD_MAPPINGS[header]
+        converted = _convert_column(
+            field_config["type"], data[i], column_units.get(i, "unknown")
+        )
+        if converted is not None:
+            suffix, values = converted
+            columns[field_config["db_field"] + suffix] = values
+
+    frame = pd.DataFrame(columns, index=data.index)
+    frame = frame[frame["measurement_timestamp"].notna()]
+    frame.insert(0, "user_id", user["id"])
+    frame.insert(1, "weather_source_id", source_id)
+    frame.insert(3, "uploaded_at", datetime.now(timezone.utc).isoformat())
+    frame.insert(4, "file_path", file_name)
+
+    # Zip per-column lists (NaN as None) into dicts; DataFrame.to_dict is
+    # several times slower on wide frames
+    values = [
+        frame[name].astype(object).where(frame[name].notna(), None).tolist()
+        for name in frame.columns
+    ]
+    keys = list(frame.columns)
+    records = [dict(zip(keys, row)) for row in zip(*values)]
+    return records, len(data) - len(frame)
+
+
 def detect_column_units(headers, units_row, supabase):
     """Detect unit type for each column using Kestrel units mapping and actual CSV units"""
     # Load the mapping from Supabase
@@ -224,6 +409,195 @@ def detect_column_units(headers, units_row, supabase):
     return column_units
 
 
+class KestrelImportJob:
+    """Chunked, resumable import of one Kestrel file into a weather source
+
+    Data rows are streamed in chunks of ``chunk_rows``. Each chunk is
+    converted, written with ``measurement_writer`` and then checkpointed
+    (rows committed and file hash) in weather_import_checkpoints. A chunk is
+    committed only when all of its batches are written, so after a crash or
+    reload the import restarts at the first uncommitted chunk; measurement
+    writes are idempotent, so re-sending part of a chunk stores nothing twice.
+    The checkpoint is deleted once the whole file is imported.
+
+    Checkpoints are best effort. If they cannot be read or saved (e.g. the
+    table is missing), the rows are still imported, ``resumable`` is cleared
+    and ``error`` explains why, even when ``status`` ends up "completed".
+    """
+
+    def __init__(
+            self,
+            text,
+            headers,
+            column_units,
+            user,
+            source_id,
+            file_name,
+            file_hash,
+            rows_total,
+            weather_service,
+            chunk_rows=IMPORT_CHUNK_ROWS):
+        self.text = text
+        self.headers = headers
+        self.column_units = column_units
+        self.user = user
+        self.source_id = source_id
+        self.file_name = file_name
+        self.file_hash = file_hash
+        self.rows_total = max(rows_total, 0)  # upper bound: lines after the header
+        self.weather_service = weather_service
+        self.chunk_rows = chunk_rows
+        self.checkpoint = None
+        self.resumed_from = 0
+        self.status = "pending"  # pending, running, completed or failed
+        self.error = None
+        self.resumable = True
+
+    @property
+    def key(self):
+        return (self.user["id"], self.source_id, self.file_hash)
+
+    @property
+    def progress(self):
+        """Fraction of data rows committed"""
+        if not self.checkpoint or not self.rows_total:
+            return 0.0
+        return min(self.checkpoint.rows_committed / self.rows_total, 1.0)
+
+    def _checkpoint_failed(self, action, error):
+        """Carry on without checkpoints after a checkpoint read or write fails"""
+        print(f"Weather import checkpoint could not be {action}: {error}")
+        self.resumable = False
+        self.error = (
+            f"Import progress could not be {action} ({error}), so this import "
+            "cannot be resumed if it stops.")
+
+    def _save_checkpoint(self, checkpoint):
+        if not self.resumable:
+            return
+        try:
+            self.weather_service.save_import_checkpoint(checkpoint)
+        except Exception as e:
+            self._checkpoint_failed("saved", e)
+
+    def _load_checkpoint(self):
+        try:
+            checkpoint = self.weather_service.get_import_checkpoint(*self.key)
+        except Exception as e:
+            self._checkpoint_failed("loaded", e)
+            checkpoint = None
+        if checkpoint is None:
+            checkpoint = WeatherImportCheckpoint(
+                user_id=self.user["id"],
+                weather_source_id=self.source_id,
+                file_hash=self.file_hash,
+                file_path=self.file_name,
+            )
+            # Record the import before the first chunk so it can be resumed
+            self._save_checkpoint(checkpoint)
+        return checkpoint
+
+    def _delete_checkpoint(self):
+        try:
+            self.weather_service.delete_import_checkpoint(*self.key)
+        except Exception as e:
+            # The rows are all stored; a stale checkpoint only re-offers Resume
+            print(f"Weather import checkpoint could not be deleted: {e}")
+
+    def run(self, on_chunk=None):
+        """Import every uncommitted chunk; returns the final checkpoint
+
+        Args:
+            on_chunk: Called with the checkpoint after each committed chunk
+
+        Raises:
+            Exception: If a chunk cannot be written; the checkpoint keeps the
+                last committed row
+        """
+        self.status = "running"
+        try:
+            checkpoint = self.checkpoint = self._load_checkpoint()
+            self.resumed_from = checkpoint.rows_committed
+            for rows_read, data in iter_kestrel_chunks(
+                    self.text, self.headers, checkpoint.rows_committed, self.chunk_rows):
+                records, skipped = build_measurement_records(
+                    data, self.headers, self.column_units, self.user,
+                    self.source_id, self.file_name)
+                backfill_density_altitude(records)
+                result = measurement_writer.write(
+                    records, self.weather_service.create_measurements_batch)
+                if not result.succeeded:
+                    raise Exception(
+                        f"Error importing rows {checkpoint.rows_committed + 1}-{rows_read}: "
+                        f"{result.errors[0]}")
+
+                checkpoint.rows_committed = rows_read
+                checkpoint.inserted += len(result.returned)
+                checkpoint.duplicates += result.rows_written - len(result.returned)
+                checkpoint.skipped += skipped
+                self._save_checkpoint(checkpoint)
+                if on_chunk is not None:
+                    on_chunk(checkpoint)
+
+            self._delete_checkpoint()
+            self.status = "completed"
+            return checkpoint
+        except Exception as e:
+            self.status = "failed"
+            self.error = f"{e} ({self.error})" if self.error else str(e)
+            raise
+
+
+# Background imports by (user id, source id, file hash). They run on worker
+# threads of the server process, so they survive the browser disconnecting.
+_background_imports = {}
+_background_imports_lock = threading.Lock()
+
+
+def _run_background_import(job):
+    try:
+        job.run()
+    except Exception as e:
+        print(f"Background weather import failed: {e}")
+
+
+def start_background_import(job):
+    """Run a job on a worker thread unless the same file is already importing
+
+    Returns:
+        KestrelImportJob: The job now importing the file
+    """
+    with _background_imports_lock:
+        running = _background_imports.get(job.key)
+        if running is not None and running.status in ("pending", "running"):
+            return running
+        _background_imports[job.key] = job
+    threading.Thread(
+        target=_run_background_import,
+        args=(job,),
+        name="weather-import",
+        daemon=True,
+    ).start()
+    return job
+
+
+def get_background_imports(user_id, source_id):
+    """Background imports of a user into a source, running or finished"""
+    with _background_imports_lock:
+        return [
+            job
+            for key, job in _background_imports.items()
+            if key[:2] == (user_id, source_id)
+        ]
+
+
+def dismiss_background_import(job):
+    """Forget a finished background import once its results are shown"""
+    with _background_imports_lock:
+        if _background_imports.get(job.key) is job:
+            del _background_imports[job.key]
+
+
 def render_weather_import_tab(user, supabase, bucket):
     """Render weather import wizard"""
     st.header("Weather Data Import Wizard")
@@ -398,6 +772,14 @@ def render_file_upload(
         st.info(
             "🔄 Background mode: You can navigate away during import. Check back later for results.")
 
+    render_unfinished_imports(
+        user,
+        supabase,
+        bucket,
+        weather_service,
+        selected_meter_id,
+        processing_mode)
+
     # Upload and parse CSV
     uploaded_file = st.file_uploader(
         "Upload Kestrel CSV File", type=["csv"], key="weather_upload"
@@ -459,327 +841,310 @@ def render_file_upload(
                     st.error(f"❌ Error uploading weather file: {upload_error}")
                     return
 
-            # Read the file as text and parse manually
-            uploaded_file.seek(0)
-            content = uploaded_file.getvalue().decode("utf-8")
-            lines = content.strip().split("\n")
+            import_kestrel_file(
+                file_bytes,
+                file_name,
+                processing_mode,
+                user,
+                supabase,
+                weather_service,
+                selected_meter_id)
 
-            if len(lines) < 6:
-                st.error(
-                    "❌ Invalid weather file format. File must have metadata, headers, units, and data rows."
-                )
-                return
+        except Exception as e:
+            st.error(f"❌ Error processing weather file: {e}")
 
-            # Parse file structure
-            parsed_data = _parse_kestrel_file_structure(lines)
-            if not parsed_data:
-                st.error("❌ Failed to parse file structure.")
-                return
 
-            device_name, device_model, serial_number, headers, units_row, data_rows = parsed_data
+def import_kestrel_file(
+        file_bytes,
+        file_name,
+        processing_mode,
+        user,
+        supabase,
+        weather_service,
+        source_id):
+    """Parse a Kestrel file's header and import its rows in checkpointed chunks
+
+    The data rows are streamed from ``file_bytes`` chunk by chunk. A file
+    with an unfinished checkpoint resumes after its last committed row.
+    """
+    stream = io.BytesIO(file_bytes)
+    file_hash, line_count = scan_kestrel_file(stream)
+
+    # Each rerun of the page sees the same upload; import it once per session
+    started = st.session_state.setdefault("weather_import_started", set())
+    if (source_id, file_hash) in started:
+        st.info("ℹ️ This file has already been imported. Upload another file to continue.")
+        return
 
-            # Detect units for each column using the mapping
-            column_units = detect_column_units(headers, units_row, supabase)
-            recognized_units = [
-                u for u in column_units.values() if u not in [
-                    'unknown', 'timestamp']]
-            st.info(
-                f"🔍 Detected units for {len(recognized_units)} columns using Kestrel mapping")
+    text, lines = open_kestrel_text(stream)
+    if line_count <= CSV_DATA_START_ROW or not lines[CSV_UNITS_ROW]:
+        st.error(
+            "❌ Invalid weather file format. File must have metadata, headers, units, and data rows."
+        )
+        return
 
-            if not data_rows:
-                st.warning("⚠️ No data rows found in weather file.")
-                st.info(
-                    f"Debug: Found {len(lines)} total lines, expected data starting from line 6"
-                )
-                st.info(
-                    f"Debug: Device info - Name: {device_name}, Model: {device_model}, Serial: {serial_number}"
-                )
-                return
+    # Parse file structure
+    parsed_data = _parse_kestrel_file_structure(lines)
+    if not parsed_data:
+        st.error("❌ Failed to parse file structure.")
+        return
 
-            # Update selected meter with device info from CSV
-            try:
-                weather_service.update_source_with_device_info(
-                    selected_meter_id,
-                    user["id"],
-                    device_name,
-                    device_model,
-                    serial_number,
-                )
-                source_id = selected_meter_id
-            except Exception as e:
-                st.error(
-                    f"❌ Failed to update weather meter with device info: {e}")
-                return
-
-            # Process measurements in batches
-            if processing_mode == "Background":
-                process_weather_data_background(
-                    data_rows,
-                    headers,
-                    column_units,
-                    user,
-                    source_id,
-                    file_name,
-                    weather_service)
-            else:
-                process_weather_data_realtime(
-                    data_rows,
-                    headers,
-                    column_units,
-                    user,
-                    source_id,
-                    file_name,
-                    weather_service)
+    device_name, device_model, serial_number, headers, units_row = parsed_data
 
-        except Exception as e:
-            st.error(f"❌ Error processing weather file: {e}")
+    # Detect units for each column using the mapping
+    column_units = detect_column_units(headers, units_row, supabase)
+    recognized_units = [
+        u for u in column_units.values() if u not in [
+            'unknown', 'timestamp']]
+    st.info(
+        f"🔍 Detected units for {len(recognized_units)} columns using Kestrel mapping")
 
+    # Update selected meter with device info from CSV
+    try:
+        weather_service.update_source_with_device_info(
+            source_id,
+            user["id"],
+            device_name,
+            device_model,
+            serial_number,
+        )
+    except Exception as e:
+        st.error(
+            f"❌ Failed to update weather meter with device info: {e}")
+        return
 
-def process_weather_data_realtime(
-        data_rows,
+    job = KestrelImportJob(
+        text,
         headers,
         column_units,
         user,
         source_id,
         file_name,
-        weather_service):
-    """Process weather data with real-time progress updates"""
-    valid_measurements = 0
-    skipped_measurements = 0
-    total_rows = len(data_rows)
-
-    # Show processing message and create progress bar
-    st.info("🔄 **Processing weather measurements...**")
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-
-    # Process in batches of 50 records
-    batch_size = 50
-    batch_data = []
+        file_hash,
+        line_count - CSV_DATA_START_ROW,
+        weather_service)
+    started.add((source_id, file_hash))
+    if processing_mode == "Background":
+        process_weather_data_background(job, user, source_id, weather_service)
+    else:
+        process_weather_data_realtime(job, user, source_id, weather_service)
 
-    for row_index, row_data in enumerate(data_rows):
-        try:
-            measurement_data = process_single_measurement(
-                row_data, headers, column_units, user, source_id, file_name)
-            if measurement_data:
-                batch_data.append(measurement_data)
-
-                # Process batch when it reaches batch_size or is the last
-                # record
-                if len(batch_data) >= batch_size or row_index == len(
-                        data_rows) - 1:
-                    try:
-                        weather_service.create_measurements_batch(batch_data)
-                        valid_measurements += len(batch_data)
-                        batch_data = []  # Clear batch
-                    except Exception as batch_error:
-                        st.warning(f"Batch processing error: {batch_error}")
-                        skipped_measurements += len(batch_data)
-                        batch_data = []
-            else:
-                skipped_measurements += 1
 
-        except Exception as e:
-            skipped_measurements += 1
+def render_unfinished_imports(
+        user,
+        supabase,
+        bucket,
+        weather_service,
+        source_id,
+        processing_mode):
+    """Show background imports and resumable imports for a weather source"""
+    for job in get_background_imports(user["id"], source_id):
+        name = job.file_name.rsplit("/", 1)[-1]
+        if job.status in ("pending", "running"):
+            committed = job.checkpoint.rows_committed if job.checkpoint else 0
+            st.info(
+                f"🔄 Importing {name} in the background: {committed} of about {job.rows_total} rows saved")
+            st.progress(job.progress)
+            if st.button("🔄 Refresh", key=f"refresh_import_{job.file_hash}"):
+                st.rerun()
+            continue
 
-        # Update progress bar and status
-        progress = (row_index + 1) / total_rows
-        progress_bar.progress(progress)
-        status_text.text(
-            f"Processing record {row_index + 1} of {total_rows} - {valid_measurements} processed, {skipped_measurements} skipped")
+        if job.status == "completed":
+            st.write(f"**Background import of {name} finished**")
+            if job.error:
+                st.warning(f"⚠️ {job.error}")
+            show_import_results(
+                job.checkpoint.inserted,
+                job.checkpoint.skipped,
+                source_id,
+                user,
+                weather_service,
+                job.checkpoint.duplicates)
+        else:
+            st.error(f"❌ Background import of {name} stopped: {job.error}")
+        dismiss_background_import(job)
 
-    # Clear progress indicators
-    progress_bar.empty()
-    status_text.empty()
+    try:
+        checkpoints = weather_service.get_unfinished_imports(user["id"], source_id)
+    except Exception as e:
+        st.warning(f"⚠️ Could not load unfinished imports: {e}")
+        return
 
-    # Show final results
-    show_import_results(
-        valid_measurements,
-        skipped_measurements,
-        source_id,
-        user,
-        weather_service)
+    active = {job.file_hash for job in get_background_imports(user["id"], source_id)}
+    for checkpoint in checkpoints:
+        if checkpoint.file_hash in active:
+            continue
+        st.warning(
+            f"⏸️ Import of {checkpoint.file_name()} stopped after {checkpoint.rows_committed} rows "
+            f"({checkpoint.inserted} measurements saved)."
+        )
+        col1, col2 = st.columns(2)
+        with col1:
+            resume = st.button(
+                "▶️ Resume Import", key=f"resume_import_{checkpoint.file_hash}", type="primary")
+        with col2:
+            discard = st.button(
+                "🗑️ Discard", key=f"discard_import_{checkpoint.file_hash}")
+
+        if discard:
+            weather_service.delete_import_checkpoint(
+                user["id"], source_id, checkpoint.file_hash)
+            st.rerun()
+        if resume:
+            resume_kestrel_import(
+                checkpoint,
+                processing_mode,
+                user,
+                supabase,
+                bucket,
+                weather_service,
+                source_id)
 
 
-def process_weather_data_background(
-        data_rows,
-        headers,
-        column_units,
+def resume_kestrel_import(
+        checkpoint,
+        processing_mode,
         user,
-        source_id,
-        file_name,
-        weather_service):
-    """Process weather data in background with batched commits"""
-
-    # Store processing state in session
-    if "weather_import_state" not in st.session_state:
-        st.session_state.weather_import_state = {
-            "status": "starting",
-            "total_rows": len(data_rows),
-            "processed": 0,
-            "skipped": 0,
-            "current_batch": 0
-        }
-
-    state = st.session_state.weather_import_state
-
-    if state["status"] == "starting":
-        st.info("🔄 **Starting background processing...**")
-        state["status"] = "processing"
+        supabase,
+        bucket,
+        weather_service,
+        source_id):
+    """Download the stored file of an unfinished import and continue it
 
-        # Process all data in larger batches
-        batch_size = 100
-        total_batches = (len(data_rows) + batch_size - 1) // batch_size
+    The stored file may have been replaced since the import started. Its
+    hash is checked against the checkpoint first; on a mismatch the stale
+    checkpoint is discarded instead of resuming at a row of another file.
+    """
+    try:
+        file_bytes = supabase.storage.from_(bucket).download(checkpoint.file_path)
+    except Exception as e:
+        st.error(f"❌ Could not download {checkpoint.file_name()} to resume: {e}")
+        return
 
-        for batch_num in range(total_batches):
-            start_idx = batch_num * batch_size
-            end_idx = min(start_idx + batch_size, len(data_rows))
-            batch_rows = data_rows[start_idx:end_idx]
+    file_hash, _ = scan_kestrel_file(io.BytesIO(file_bytes))
+    if file_hash != checkpoint.file_hash:
+        try:
+            weather_service.delete_import_checkpoint(
+                user["id"], source_id, checkpoint.file_hash)
+        except Exception as e:
+            st.error(f"❌ Could not discard the import of {checkpoint.file_name()}: {e}")
+            return
+        st.warning(
+            f"⚠️ {checkpoint.file_name()} has changed since its import started, so it "
+            "cannot be resumed. The unfinished import was discarded; upload the file "
+            "again to import it from the start.")
+        return
 
-            batch_data = []
-            batch_skipped = 0
+    st.session_state.setdefault("weather_import_started", set()).discard(
+        (source_id, checkpoint.file_hash))
+    import_kestrel_file(
+        file_bytes,
+        checkpoint.file_path,
+        processing_mode,
+        user,
+        supabase,
+        weather_service,
+        source_id)
 
-            for row_data in batch_rows:
-                try:
-                    measurement_data = process_single_measurement(
-                        row_data, headers, column_units, user, source_id, file_name)
-                    if measurement_data:
-                        batch_data.append(measurement_data)
-                    else:
-                        batch_skipped += 1
-                except BaseException:
-                    batch_skipped += 1
-
-            # Commit batch to database
-            if batch_data:
-                try:
-                    weather_service.create_measurements_batch(batch_data)
-                    state["processed"] += len(batch_data)
-                except Exception as e:
-                    state["skipped"] += len(batch_data)
-
-            state["skipped"] += batch_skipped
-            state["current_batch"] = batch_num + 1
-
-        state["status"] = "completed"
-        st.rerun()
 
-    elif state["status"] == "processing":
-        st.info(
-            f"🔄 Processing batch {state['current_batch']}... ({state['processed']} processed, {state['skipped']} skipped)")
+def process_weather_data_realtime(job, user, source_id, weather_service):
+    """Run an import job with per-chunk progress updates"""
 
-    elif state["status"] == "completed":
-        show_import_results(
-            state["processed"],
-            state["skipped"],
-            source_id,
-            user,
-            weather_service)
-        # Clear state for next import
-        del st.session_state.weather_import_state
+    # Show processing message and create progress bar
+    st.info("🔄 **Processing weather measurements...**")
+    progress_bar = st.progress(0)
+    status_text = st.empty()
 
+    def report(checkpoint):
+        progress_bar.progress(job.progress)
+        status_text.text(
+            f"Saved {checkpoint.rows_committed} of about {job.rows_total} rows - "
+            f"{checkpoint.inserted} new, {checkpoint.duplicates} already imported")
 
-def _safe_float(value, default=None):
-    """Helper function to safely convert to float"""
     try:
-        if pd.isna(value) or value == "" or value is None:
-            return default
-        return float(value)
-    except (ValueError, TypeError):
-        return default
-
-
-def _process_field_by_type(field_config, raw_value, column_unit, base_field):
-    """Process field based on its type and unit"""
-    field_data = {}
-    field_type = field_config["type"]
-
-    if field_type == "temperature":
-        if column_unit == "fahrenheit":
-            # Convert imperial to metric and store only metric
-            if raw_value is not None:
-                field_data[f"{base_field}_c"] = fahrenheit_to_celsius(raw_value)
-        elif column_unit == "celsius":
-            # Store metric directly
-            field_data[f"{base_field}_c"] = raw_value
-
-    elif field_type == "pressure":
-        if column_unit == "inhg":
-            # Convert imperial to metric and store only metric
-            if raw_value is not None:
-                field_data[f"{base_field}_hpa"] = inhg_to_hpa(raw_value)
-        elif column_unit == "hpa":
-            # Store metric directly
-            field_data[f"{base_field}_hpa"] = raw_value
-
-    elif field_type == "altitude":
-        if column_unit == "feet":
-            # Convert imperial to metric and store only metric
-            if raw_value is not None:
-                field_data[f"{base_field}_m"] = feet_to_meters(raw_value)
-        elif column_unit == "meters":
-            # Store metric directly
-            field_data[f"{base_field}_m"] = raw_value
-
-    elif field_type == "wind_speed":
-        if column_unit == "mph":
-            # Convert imperial to metric and store only metric
-            if raw_value is not None:
-                field_data[f"{base_field}_mps"] = mph_to_mps(raw_value)
-        elif column_unit == "mps":
-            # Store metric directly
-            field_data[f"{base_field}_mps"] = raw_value
-
-    elif field_type in ["percentage", "degrees"] or column_unit == "no_conversion":
-        field_data[base_field] = raw_value
-
-    elif field_type == "text":
-        # For text fields, don't convert to float
-        field_data[base_field] = raw_value if raw_value else None
-
-    return field_data
-
-
-def process_single_measurement(row_data, headers, column_units, user, source_id, file_name):
-    """Process a single measurement row and return measurement data"""
-    # Parse timestamp (first column)
-    timestamp_str = row_data[0]
-    if not timestamp_str:
-        return None
+        checkpoint = job.run(report)
+    except Exception as e:
+        st.session_state.weather_import_started.discard((source_id, job.file_hash))
+        progress_bar.empty()
+        status_text.empty()
+        committed = job.checkpoint.rows_committed if job.checkpoint else 0
+        st.error(f"❌ {job.error}")
+        if job.resumable:
+            st.info(
+                f"⏸️ The first {committed} rows are saved. Upload the file again or "
+                "press Resume to continue from there.")
+        else:
+            st.info(
+                f"⏸️ The first {committed} rows are saved. Upload the file again to "
+                "import the rest; rows already imported are skipped.")
+        return
 
-    # Parse timestamp
-    measurement_timestamp = pd.to_datetime(timestamp_str).isoformat()
+    if job.resumed_from:
+        st.info(f"▶️ Resumed after row {job.resumed_from}")
+    if job.error:
+        st.warning(f"⚠️ {job.error}")
 
-    # Create measurement record with base fields
-    measurement_data = {
-        "user_id": user["id"],
-        "weather_source_id": source_id,
-        "measurement_timestamp": measurement_timestamp,
-        "uploaded_at": datetime.now(timezone.utc).isoformat(),
-        "file_path": file_name,
-    }
+    # Clear progress indicators
+    progress_bar.empty()
+    status_text.empty()
 
-    # Process each data column using field mappings
-    for i, header in enumerate(headers):
-        if i < len(row_data) and header != "FORMATTED DATE_TIME":
-            value = row_data[i]
+    # Show final results
+    show_import_results(
+        checkpoint.inserted,
+        checkpoint.skipped,
+        source_id,
+        user,
+        weather_service,
+        checkpoint.duplicates)
 
-            if header in FIELD_MAPPINGS:
-                field_config = FIELD_MAPPINGS[header]
-                base_field = field_config["db_field"]
-                column_unit = column_units.get(i, "unknown")
 
-                # Handle text fields differently (don't convert to float)
-                if field_config["type"] == "text":
-                    raw_value = value if value else None
-                else:
-                    raw_value = _safe_float(value)
+def process_weather_data_background(job, user, source_id, weather_service):
+    """Run an import job on a worker thread that outlives the page"""
+    start_background_import(job)
+    st.info(
+        "🔄 **Import started in the background.** You can navigate away; "
+        "progress is saved after every chunk and shown here when you return.")
+    if st.button("🔄 Refresh", key="refresh_background_import"):
+        st.rerun()
 
-                # Process field based on type
-                field_data = _process_field_by_type(field_config, raw_value, column_unit, base_field)
-                measurement_data.update(field_data)
 
-    return measurement_data
+def backfill_density_altitude(measurements):
+    """Fill missing density_altitude_m in place from temperature, pressure and RH
+
+    Station pressure is used when present; otherwise barometric pressure is
+    reduced to the station altitude (or used as-is if the altitude is
+    unknown). Density altitudes logged by the device are kept.
+
+    Returns:
+        int: Number of measurements backfilled
+    """
+    if not measurements:
+        return 0
+    columns = [
+        "temperature_c",
+        "relative_humidity_pct",
+        "barometric_pressure_hpa",
+        "station_pressure_hpa",
+        "altitude_m",
+        "density_altitude_m",
+    ]
+    frame = pd.DataFrame.from_records(measurements).reindex(columns=columns)
+    frame = frame.apply(pd.to_numeric, errors="coerce")
+    pressure = frame["station_pressure_hpa"].fillna(
+        pd.Series(
+            station_pressure_hpa(
+                frame["barometric_pressure_hpa"], frame["altitude_m"].fillna(0.0)
+            ),
+            index=frame.index,
+        )
+    )
+    derived = atmosphere(
+        frame["temperature_c"], pressure, frame["relative_humidity_pct"]
+    ).density_altitude_m
+    missing = frame["density_altitude_m"].isna().to_numpy() & np.isfinite(derived)
+    for position in np.flatnonzero(missing):
+        measurements[position]["density_altitude_m"] = float(derived[position])
+    return int(missing.sum())
 
 
 def show_import_results(
@@ -787,8 +1152,13 @@ def show_import_results(
         skipped_measurements,
         source_id,
         user,
-        weather_service):
+        weather_service,
+        duplicate_measurements=0):
     """Display import results"""
+    if duplicate_measurements > 0:
+        st.info(
+            f"ℹ️ {duplicate_measurements} measurements were already imported for this source and were not added again"
+        )
     if skipped_measurements > 0:
         st.warning(
             f"⚠️ Processed {valid_measurements} weather measurements, skipped {skipped_measurements} rows"
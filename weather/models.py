@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional
 
 import pandas as pd
@@ -199,3 +199,60 @@ class WeatherMeasurement:
                 self.location_coordinates,
             ]
         )
+
+
+@dataclass
+class WeatherImportCheckpoint:
+    """Progress of a chunked Kestrel import, saved after each committed chunk
+
+    Every data row before ``rows_committed`` is stored. A checkpoint is
+    identified by user, source and the SHA-256 of the file, so the same file
+    resumes where it stopped even under another name.
+    """
+
+    user_id: str
+    weather_source_id: str
+    file_hash: str
+    file_path: Optional[str] = None
+    rows_committed: int = 0  # data rows read, including skipped rows
+    inserted: int = 0
+    duplicates: int = 0
+    skipped: int = 0
+    updated_at: Optional[datetime] = None
+
+    @classmethod
+    def from_supabase_record(cls, record: dict) -> "WeatherImportCheckpoint":
+        """Create a WeatherImportCheckpoint from a Supabase record"""
+        return cls(
+            user_id=record["user_id"],
+            weather_source_id=record["weather_source_id"],
+            file_hash=record["file_hash"],
+            file_path=record.get("file_path"),
+            rows_committed=record.get("rows_committed") or 0,
+            inserted=record.get("inserted") or 0,
+            duplicates=record.get("duplicates") or 0,
+            skipped=record.get("skipped") or 0,
+            updated_at=(
+                pd.to_datetime(record["updated_at"])
+                if record.get("updated_at")
+                else None
+            ),
+        )
+
+    def to_dict(self) -> dict:
+        """Record for upserting into weather_import_checkpoints"""
+        return {
+            "user_id": self.user_id,
+            "weather_source_id": self.weather_source_id,
+            "file_hash": self.file_hash,
+            "file_path": self.file_path,
+            "rows_committed": self.rows_committed,
+            "inserted": self.inserted,
+            "duplicates": self.duplicates,
+            "skipped": self.skipped,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+    def file_name(self) -> str:
+        """Uploaded file name without the storage folders"""
+        return (self.file_path or "").rsplit("/", 1)[-1]
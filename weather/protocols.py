@@ -316,7 +316,9 @@ class WeatherAPIProtocol(Protocol):
             user_id: User identifier
 
         Returns:
-            List of created WeatherMeasurement objects
+            List of created WeatherMeasurement objects. Measurements whose
+            source and timestamp are already stored are skipped and not
+            returned, so re-importing overlapping data is idempotent.
 
         Raises:
             Exception: If batch creation fails
@@ -1,6 +1,12 @@
 from typing import List, Optional
 
-from .models import WeatherMeasurement, WeatherSource
+from .models import WeatherImportCheckpoint, WeatherMeasurement, WeatherSource
+
+# Natural key of a weather measurement (UNIQUE constraint on the table)
+MEASUREMENT_NATURAL_KEY = "weather_source_id,measurement_timestamp"
+
+# One checkpoint per user, source and file content
+IMPORT_CHECKPOINT_KEY = "user_id,weather_source_id,file_hash"
 
 
 class WeatherService:
@@ -218,18 +224,27 @@ class WeatherService:
 
     def create_measurements_batch(
             self, measurements_data: List[dict]) -> List[str]:
-        """Create multiple weather measurements in a single batch"""
+        """Create multiple weather measurements in a single batch upsert
+
+        Rows whose (weather_source_id, measurement_timestamp) is already
+        stored are skipped by the database (ON CONFLICT DO NOTHING), so
+        re-importing an overlapping export adds no duplicates. Returns the
+        ids of the rows actually inserted.
+        """
+        if not measurements_data:
+            return []
         try:
             response = (
                 self.supabase.table("weather_measurements")
-                .insert(measurements_data)
+                .upsert(
+                    measurements_data,
+                    on_conflict=MEASUREMENT_NATURAL_KEY,
+                    ignore_duplicates=True,
+                )
                 .execute()
             )
 
-            if not response.data:
-                raise Exception("Failed to create measurements batch")
-
-            return [record["id"] for record in response.data]
+            return [record["id"] for record in response.data or []]
 
         except Exception as e:
             raise Exception(f"Error creating measurements batch: {str(e)}")
@@ -322,3 +337,71 @@ class WeatherService:
 
         except Exception as e:
             raise Exception(f"Error creating/getting weather source: {str(e)}")
+
+    # Import Checkpoints
+
+    def get_import_checkpoint(
+        self, user_id: str, source_id: str, file_hash: str
+    ) -> Optional[WeatherImportCheckpoint]:
+        """Get the checkpoint of an unfinished import of a file, if any"""
+        try:
+            response = (
+                self.supabase.table("weather_import_checkpoints")
+                .select("*")
+                .eq("user_id", user_id)
+                .eq("weather_source_id", source_id)
+                .eq("file_hash", file_hash)
+                .execute()
+            )
+
+            if not response.data:
+                return None
+
+            return WeatherImportCheckpoint.from_supabase_record(response.data[0])
+
+        except Exception as e:
+            raise Exception(f"Error fetching import checkpoint: {str(e)}")
+
+    def get_unfinished_imports(
+        self, user_id: str, source_id: str
+    ) -> List[WeatherImportCheckpoint]:
+        """Get checkpoints of imports into a source that did not finish"""
+        try:
+            response = (
+                self.supabase.table("weather_import_checkpoints")
+                .select("*")
+                .eq("user_id", user_id)
+                .eq("weather_source_id", source_id)
+                .order("updated_at", desc=True)
+                .execute()
+            )
+
+            return [
+                WeatherImportCheckpoint.from_supabase_record(record)
+                for record in response.data or []
+            ]
+
+        except Exception as e:
+            raise Exception(f"Error fetching unfinished imports: {str(e)}")
+
+    def save_import_checkpoint(self, checkpoint: WeatherImportCheckpoint) -> None:
+        """Create or advance the checkpoint of an import"""
+        try:
+            self.supabase.table("weather_import_checkpoints").upsert(
+                checkpoint.to_dict(), on_conflict=IMPORT_CHECKPOINT_KEY
+            ).execute()
+
+        except Exception as e:
+            raise Exception(f"Error saving import checkpoint: {str(e)}")
+
+    def delete_import_checkpoint(
+        self, user_id: str, source_id: str, file_hash: str
+    ) -> None:
+        """Delete the checkpoint of a finished or abandoned import"""
+        try:
+            self.supabase.table("weather_import_checkpoints").delete().eq(
+                "user_id", user_id
+            ).eq("weather_source_id", source_id).eq("file_hash", file_hash).execute()
+
+        except Exception as e:
+            raise Exception(f"Error deleting import checkpoint: {str(e)}")
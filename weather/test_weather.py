@@ -6,15 +6,24 @@ from unittest.mock import MagicMock, Mock, patch
 import pandas as pd
 
 from weather.import_tab import (
+    KestrelImportJob,
+    backfill_density_altitude,
+    build_measurement_records,
     celsius_to_fahrenheit,
     fahrenheit_to_celsius,
     feet_to_meters,
     inhg_to_hpa,
+    iter_kestrel_chunks,
     meters_to_feet,
     mph_to_mps,
+    open_kestrel_text,
+    parse_kestrel_timestamps,
+    read_kestrel_data,
     render_weather_import_tab,
+    resume_kestrel_import,
+    scan_kestrel_file,
 )
-from weather.models import WeatherMeasurement, WeatherSource
+from weather.models import WeatherImportCheckpoint, WeatherMeasurement, WeatherSource
 from weather.service import WeatherService
 
 # Add the root directory to the path so we can import our modules
@@ -406,6 +415,7 @@ class TestWeatherServiceAdvanced(unittest.TestCase):
         batch_data = [self.sample_measurement_data] * 3
         batch_ids = [f"measurement-{i}" for i in range(3)]
         mock_response.data = [{"id": id} for id in batch_ids]
+        self.mock_supabase.table.return_value.upsert.return_value.execute.return_value = mock_response
 
         created_ids = self.weather_service.create_measurements_batch(
             batch_data)
@@ -549,15 +559,35 @@ class TestWeatherServiceAdvanced(unittest.TestCase):
 
         mock_response = MagicMock()
         mock_response.data = [{"id": f"measurement-{i}"} for i in range(100)]
-        self.mock_supabase.table.return_value.insert.return_value.execute.return_value = mock_response
+        self.mock_supabase.table.return_value.upsert.return_value.execute.return_value = mock_response
 
         created_ids = self.weather_service.create_measurements_batch(
             large_batch)
         self.assertEqual(len(created_ids), 100)
 
         # Verify single batch call was made
-        self.mock_supabase.table.return_value.insert.assert_called_once_with(
-            large_batch)
+        self.mock_supabase.table.return_value.upsert.assert_called_once_with(
+            large_batch,
+            on_conflict="weather_source_id,measurement_timestamp",
+            ignore_duplicates=True)
+
+    def test_batch_upsert_skips_already_stored_measurements(self):
+        """Test re-imported rows are ignored server-side and not reported as created"""
+        batch = [
+            {**self.sample_measurement_data, "measurement_timestamp": f"2023-12-01T{i:02d}:00:00"}
+            for i in range(3)
+        ]
+        mock_response = MagicMock()
+        mock_response.data = [{"id": "measurement-2"}]
+        self.mock_supabase.table.return_value.upsert.return_value.execute.return_value = mock_response
+
+        self.assertEqual(self.weather_service.create_measurements_batch(batch), ["measurement-2"])
+        mock_response.data = []
+        self.assertEqual(self.weather_service.create_measurements_batch(batch), [])
+
+        self.mock_supabase.reset_mock()
+        self.assertEqual(self.weather_service.create_measurements_batch([]), [])
+        self.mock_supabase.table.assert_not_called()
 
 
 class TestWeatherModelsAdvanced(unittest.TestCase):
@@ -764,6 +794,263 @@ class TestWeatherUtilityFunctions(unittest.TestCase):
         self.assertAlmostEqual(mph_to_mps(60), 26.82, places=1)
         self.assertIsNone(mph_to_mps(None))
 
+    def test_backfill_density_altitude(self):
+        """Test density altitude is derived only where the device did not log it"""
+        measurements = [
+            # Standard day at sea level
+            {"temperature_c": 15.0, "station_pressure_hpa": 1013.25},
+            # Altimeter pressure reduced to a 1000 m station on a standard day
+            {"temperature_c": 8.5, "barometric_pressure_hpa": 1013.25, "altitude_m": 1000.0},
+            {"temperature_c": 30.0, "barometric_pressure_hpa": 1000.0, "density_altitude_m": 1500.0},
+            {"temperature_c": None, "barometric_pressure_hpa": 1000.0},
+        ]
+        self.assertEqual(backfill_density_altitude(measurements), 2)
+        self.assertAlmostEqual(measurements[0]["density_altitude_m"], 0.0, delta=1.0)
+        self.assertAlmostEqual(measurements[1]["density_altitude_m"], 1000.0, delta=5.0)
+        self.assertEqual(measurements[2]["density_altitude_m"], 1500.0)
+        self.assertNotIn("density_altitude_m", measurements[3])
+        self.assertEqual(backfill_density_altitude([]), 0)
+
+
+class TestKestrelCsvParsing(unittest.TestCase):
+    """Test the columnar Kestrel CSV parser"""
+
+    HEADERS = [
+        "FORMATTED DATE_TIME", "Temperature", "Relative Humidity", "Barometric Pressure",
+        "Altitude", "Wind Speed", "Compass True Direction", "Data Type", "Notes", "Unmapped",
+    ]
+    COLUMN_UNITS = {
+        0: "timestamp", 1: "fahrenheit", 2: "no_conversion", 3: "inhg", 4: "feet",
+        5: "mph", 6: "no_conversion", 7: "unknown", 8: "unknown", 9: "unknown",
+    }
+
+    def _content(self, rows):
+        return "\n".join([
+            "Device Name,Range Kestrel", "Device Model,5700", "Serial Number,K123",
+            ",".join(self.HEADERS), "yyyy-MM-dd hh:mm:ss a,°F,%,inHg,ft,mph,Deg,,,",
+            *rows, "",
+        ])
+
+    def _records(self, rows):
+        data = read_kestrel_data(self._content(rows), self.HEADERS)
+        return build_measurement_records(
+            data, self.HEADERS, self.COLUMN_UNITS, {"id": "user-1"}, "source-1", "a/kestrel/x.csv"
+        )
+
+    def test_converts_columns_to_metric_records(self):
+        """Test unit conversion, text fields and base fields of each record"""
+        records, skipped = self._records([
+            "2024-08-31 09:39:22, 68.0 ,40.5,29.92,1000,10,270,Live,  first shot ,x",
+        ])
+        self.assertEqual(skipped, 0)
+        record = records[0]
+        self.assertEqual(record["user_id"], "user-1")
+        self.assertEqual(record["weather_source_id"], "source-1")
+        self.assertEqual(record["file_path"], "a/kestrel/x.csv")
+        self.assertEqual(record["measurement_timestamp"], "2024-08-31T09:39:22")
+        self.assertAlmostEqual(record["temperature_c"], 20.0)
+        self.assertEqual(record["relative_humidity_pct"], 40.5)
+        self.assertAlmostEqual(record["barometric_pressure_hpa"], 1013.21, places=1)
+        self.assertAlmostEqual(record["altitude_m"], 304.8)
+        self.assertAlmostEqual(record["wind_speed_mps"], 4.4704)
+        self.assertEqual(record["compass_true_deg"], 270.0)
+        self.assertEqual(record["data_type"], "Live")
+        self.assertEqual(record["notes"], "first shot")
+        self.assertNotIn("Unmapped", record)
+
+    def test_missing_values_and_bad_rows(self):
+        """Test blanks and junk become None and rows without a valid timestamp are dropped"""
+        records, skipped = self._records([
+            "2024-08-31 09:39:22,--,,29.92,,10,270,,,",
+            ",68.0,40,29.92,1000,10,270,Live,,",
+            "not a time,68.0,40,29.92,1000,10,270,Live,,",
+            "",
+            "2024-08-31T09:40:00.5,68.0,40,29.92,1000,10,270,Live,,",
+        ])
+        self.assertEqual((len(records), skipped), (2, 1))
+        self.assertIsNone(records[0]["temperature_c"])
+        self.assertIsNone(records[0]["relative_humidity_pct"])
+        self.assertIsNone(records[0]["altitude_m"])
+        self.assertIsNone(records[0]["notes"])
+        self.assertEqual(records[1]["measurement_timestamp"], "2024-08-31T09:40:00.500000")
+
+    def test_unknown_units_are_not_stored(self):
+        """Test numeric columns with an unrecognized unit are left out"""
+        data = read_kestrel_data(self._content(["2024-08-31 09:39:22,68,40,29.92,1000,10,270,,,"]),
+                                 self.HEADERS)
+        records, _ = build_measurement_records(
+            data, self.HEADERS, {**self.COLUMN_UNITS, 1: "unknown"}, {"id": "u"}, "s", "f"
+        )
+        self.assertNotIn("temperature_c", records[0])
+
+    def test_timestamps_parse_in_one_pass(self):
+        """Test the Kestrel format and the per-value fallback"""
+        parsed = parse_kestrel_timestamps(["2024-01-02 03:04:05", "2024-01-02T03:04:05+00:00", "x"])
+        self.assertEqual(parsed.tolist(),
+                         ["2024-01-02T03:04:05", "2024-01-02T03:04:05+00:00", None])
+
+
+class TestKestrelChunkedImport(unittest.TestCase):
+    """Test the streamed, checkpointed Kestrel import job"""
+
+    HEADERS = TestKestrelCsvParsing.HEADERS
+    COLUMN_UNITS = TestKestrelCsvParsing.COLUMN_UNITS
+
+    def setUp(self):
+        rows = [f"2024-08-31 09:{m:02d}:00,68,40,29.92,1000,10,270,Live,," for m in range(10)]
+        rows.insert(4, ",68,40,29.92,1000,10,270,Live,,")
+        rows.insert(7, "bad,68,40,29.92,1000,10,270,Live,,")
+        self.file_bytes = TestKestrelCsvParsing._content(self, rows).encode("utf-8")
+        self.service = MagicMock()
+        self.service.get_import_checkpoint.return_value = None
+        self.saved = []
+        self.service.save_import_checkpoint.side_effect = (
+            lambda checkpoint: self.saved.append(checkpoint.rows_committed))
+        self.service.create_measurements_batch.side_effect = (
+            lambda batch: [f"id-{r['measurement_timestamp']}" for r in batch])
+
+    def _job(self, chunk_rows=5):
+        import io
+
+        file_hash, lines = scan_kestrel_file(io.BytesIO(self.file_bytes))
+        text, header_lines = open_kestrel_text(io.BytesIO(self.file_bytes))
+        self.assertEqual(header_lines[3].split(","), self.HEADERS)
+        return KestrelImportJob(
+            text, self.HEADERS, self.COLUMN_UNITS, {"id": "user-1"}, "source-1",
+            "a/kestrel/x.csv", file_hash, lines - 5, self.service, chunk_rows=chunk_rows)
+
+    def test_scan_hashes_and_counts_lines(self):
+        """Test the file hash and line count come from one block-wise pass"""
+        import hashlib
+        import io
+
+        file_hash, lines = scan_kestrel_file(io.BytesIO(self.file_bytes))
+        self.assertEqual(file_hash, hashlib.sha256(self.file_bytes).hexdigest())
+        self.assertEqual(lines, 17)
+
+    def test_chunks_resume_after_start_row(self):
+        """Test chunks report rows read and skip committed rows"""
+        import io
+
+        text, _ = open_kestrel_text(io.BytesIO(self.file_bytes))
+        chunks = list(iter_kestrel_chunks(text, self.HEADERS, start_row=7, chunk_rows=5))
+        self.assertEqual([rows for rows, _ in chunks], [10, 12])
+        self.assertEqual(chunks[0][1][0].tolist(), ["bad", "2024-08-31 09:06:00", "2024-08-31 09:07:00"])
+
+    def test_job_checkpoints_each_chunk_and_finishes(self):
+        """Test one checkpoint per committed chunk and cleanup at the end"""
+        checkpoint = self._job().run()
+        self.assertEqual(self.saved, [0, 5, 10, 12])
+        self.assertEqual((checkpoint.inserted, checkpoint.skipped, checkpoint.duplicates), (10, 1, 0))
+        self.service.delete_import_checkpoint.assert_called_once_with(
+            "user-1", "source-1", checkpoint.file_hash)
+
+    def test_failed_chunk_keeps_checkpoint_and_resumes(self):
+        """Test a failed chunk stops the job and a rerun resumes after the last commit"""
+        def fail_second_chunk(batch):
+            if batch[0]["measurement_timestamp"] == "2024-08-31T09:04:00":
+                raise Exception("400 Bad Request")
+            return [r["measurement_timestamp"] for r in batch]
+
+        self.service.create_measurements_batch.side_effect = fail_second_chunk
+        job = self._job()
+        with self.assertRaises(Exception):
+            job.run()
+        self.assertEqual((job.status, job.checkpoint.rows_committed), ("failed", 5))
+        self.service.delete_import_checkpoint.assert_not_called()
+
+        self.service.get_import_checkpoint.return_value = job.checkpoint
+        self.service.create_measurements_batch.side_effect = (
+            lambda batch: [r["measurement_timestamp"] for r in batch])
+        resumed = self._job()
+        checkpoint = resumed.run()
+        self.assertEqual(resumed.resumed_from, 5)
+        self.assertEqual(checkpoint.rows_committed, 12)
+        self.assertEqual(checkpoint.inserted, 10)
+        sent = [r["measurement_timestamp"] for call in
+                self.service.create_measurements_batch.call_args_list[-2:] for r in call[0][0]]
+        self.assertEqual(sent[0], "2024-08-31T09:04:00")
+
+    def test_checkpoint_errors_do_not_fail_the_import(self):
+        """Test a missing checkpoint table leaves a completed, non-resumable import"""
+        self.service.get_import_checkpoint.side_effect = Exception(
+            'relation "weather_import_checkpoints" does not exist')
+        self.service.save_import_checkpoint.side_effect = Exception("404 Not Found")
+        self.service.delete_import_checkpoint.side_effect = Exception("404 Not Found")
+
+        job = self._job()
+        checkpoint = job.run()
+
+        self.assertEqual(job.status, "completed")
+        self.assertFalse(job.resumable)
+        self.assertIn("cannot be resumed", job.error)
+        self.assertEqual((checkpoint.rows_committed, checkpoint.inserted), (12, 10))
+        # No further checkpoint writes once saving is known to fail
+        self.service.save_import_checkpoint.assert_not_called()
+
+    def test_failed_checkpoint_save_stops_checkpointing_only(self):
+        """Test a checkpoint write failing mid-import keeps importing rows"""
+        def save(checkpoint):
+            if checkpoint.rows_committed == 5:
+                raise Exception("503 Service Unavailable")
+            self.saved.append(checkpoint.rows_committed)
+
+        self.service.save_import_checkpoint.side_effect = save
+        job = self._job()
+        checkpoint = job.run()
+
+        self.assertEqual((job.status, checkpoint.rows_committed), ("completed", 12))
+        self.assertEqual(self.saved, [0])
+        self.assertFalse(job.resumable)
+        self.assertIn("503 Service Unavailable", job.error)
+
+    def test_resume_discards_checkpoint_of_a_changed_file(self):
+        """Test a stored file that no longer matches its checkpoint is not resumed"""
+        checkpoint = WeatherImportCheckpoint(
+            "user-1", "source-1", "stale-hash", "user-1/kestrel/x.csv", 5, 5, 0, 0)
+        supabase = MagicMock()
+        supabase.storage.from_.return_value.download.return_value = self.file_bytes
+
+        with patch("weather.import_tab.st") as st, \
+                patch("weather.import_tab.import_kestrel_file") as import_file:
+            resume_kestrel_import(
+                checkpoint, "Real-time", {"id": "user-1"}, supabase, "bucket",
+                self.service, "source-1")
+
+        import_file.assert_not_called()
+        self.service.delete_import_checkpoint.assert_called_once_with(
+            "user-1", "source-1", "stale-hash")
+        self.assertIn("has changed", st.warning.call_args[0][0])
+
+    def test_resume_continues_a_matching_file(self):
+        """Test a stored file with the checkpoint's hash is imported again"""
+        import hashlib
+
+        checkpoint = WeatherImportCheckpoint(
+            "user-1", "source-1", hashlib.sha256(self.file_bytes).hexdigest(),
+            "user-1/kestrel/x.csv", 5, 5, 0, 0)
+        supabase = MagicMock()
+        supabase.storage.from_.return_value.download.return_value = self.file_bytes
+
+        with patch("weather.import_tab.st") as st, \
+                patch("weather.import_tab.import_kestrel_file") as import_file:
+            st.session_state = {}
+            resume_kestrel_import(
+                checkpoint, "Real-time", {"id": "user-1"}, supabase, "bucket",
+                self.service, "source-1")
+
+        import_file.assert_called_once()
+        self.service.delete_import_checkpoint.assert_not_called()
+
+    def test_checkpoint_record_round_trip(self):
+        """Test checkpoints serialize for upsert and load from Supabase"""
+        checkpoint = WeatherImportCheckpoint("u", "s", "abc", "u@x/kestrel/log.csv", 5000, 4990, 3, 7)
+        record = checkpoint.to_dict()
+        self.assertEqual(record["rows_committed"], 5000)
+        restored = WeatherImportCheckpoint.from_supabase_record(record)
+        self.assertEqual((restored.rows_committed, restored.skipped), (5000, 7))
+        self.assertEqual(restored.file_name(), "log.csv")
+
 
 class TestWeatherIntegrationAdvanced(unittest.TestCase):
     """Advanced integration tests for weather module"""
@@ -811,7 +1098,7 @@ class TestWeatherIntegrationAdvanced(unittest.TestCase):
         batch_response = MagicMock()
         batch_response.data = [{"id": f"int-measurement-{i}"}
                                for i in range(10)]
-        self.mock_supabase.table.return_value.insert.return_value.execute.return_value = batch_response
+        self.mock_supabase.table.return_value.upsert.return_value.execute.return_value = batch_response
 
         measurement_ids = self.weather_service.create_measurements_batch(
             measurements)
@@ -986,7 +1273,7 @@ class TestWeatherIntegrationAdvanced(unittest.TestCase):
                         "measurement_timestamp": f"2023-12-01T{i:02d}:00:00Z"} for i in range(50)]
 
         # Simulate partial failure in batch insert
-        self.mock_supabase.table.return_value.insert.return_value.execute.side_effect = Exception(
+        self.mock_supabase.table.return_value.upsert.return_value.execute.side_effect = Exception(
             "Batch insert failed at record 25")
 
         with self.assertRaises(Exception) as context:
@@ -156,7 +156,7 @@ class TestWeatherUIIntegration(unittest.TestCase):
                     **data,
                     "uploaded_at": datetime.now().isoformat()
                 })
-            self.mock_supabase.table.return_value.insert.return_value.execute.return_value.data = mock_records
+            self.mock_supabase.table.return_value.upsert.return_value.execute.return_value.data = mock_records
 
             result = self.weather_api.create_measurements_batch(batch_data, self.test_user_id)
 